@@ -6,7 +6,7 @@ import sys
 import argparse
 import time
 import struct
-from pyrf24 import RF24, RF24_PA_LOW
+from pyrf24 import RF24, RF24_PA_LOW, RX_RECORD_SIZE
 
 ########### USER CONFIGURATION ###########
 # See https://github.com/TMRh20/RF24/blob/master/pyRF24/readme.md
@@ -90,19 +90,21 @@ def slave(timeout=10):
     for pipe_n, addr in enumerate(addresses):
         radio.open_rx_pipe(pipe_n, addr)
     radio.listen = True  # put base station into RX mode
-    start_timer = time.monotonic()  # start timer
-    while time.monotonic() - start_timer < timeout:
-        has_payload, pipe_number = radio.available_pipe()
-        if has_payload:
-            length = radio.payload_size  # grab the payload length
-            # unpack payload
-            node_id, payload_id = struct.unpack("<ii", radio.read(radio.payload_size))
-            # show the pipe number that received the payload
-            print(
-                f"Received {length} bytes on pipe {pipe_number} from node {node_id}.",
-                f"PayloadID: {payload_id}",
-            )
-            start_timer = time.monotonic()  # reset timer with every payload
+    # a native thread drains the RX FIFO into a separate queue for each pipe
+    with radio.start_multiceiver() as base_station:
+        while base_station.wait(timeout * 1000):
+            # take up to 8 payloads from each pipe, so a busy node can't starve others
+            records = base_station.take_all(max_per_pipe=8)
+            for offset in range(0, len(records), RX_RECORD_SIZE):
+                pipe_number, length = records[offset], records[offset + 1]
+                # unpack payload
+                node_id, payload_id = struct.unpack_from("<ii", records, offset + 16)
+                # show the pipe number that received the payload
+                print(
+                    f"Received {length} bytes on pipe {pipe_number} from node {node_id}.",
+                    f"PayloadID: {payload_id}",
+                )
+        print("dropped payloads per pipe:", base_station.dropped)
     radio.listen = False
 
 
@@ -52,35 +52,17 @@ def scan(timeout: int = 30):
     print("\n" + "~" * 126)
 
     signals = [0] * 126  # store the signal count for each channel
-    curr_channel = 0
     start_timer = time.monotonic()  # start the timer
     while time.monotonic() - start_timer < timeout:
-        radio.channel = curr_channel
-        radio.listen = 1  # start a RX session
-        time.sleep(0.00013)  # wait 130 microseconds
-        found_signal = radio.rpd
-        radio.listen = 0  # end the RX session
-        found_signal = found_signal or radio.rpd or radio.available()
-
-        # count signal as interference
-        signals[curr_channel] += found_signal
-        # clear the RX FIFO if a signal was detected/captured
-        if found_signal:
-            radio.flush_rx()  # flush the RX FIFO because it asserts the RPD flag
-        curr_channel = curr_channel + 1 if curr_channel < 125 else 0
+        # sweep all channels (natively) & count detected signals as interference
+        for channel, found in enumerate(radio.scan(range(126), dwell_us=130)):
+            signals[channel] += found
 
         # output the signal counts per channel
-        sig_cnt = signals[curr_channel]
-        print(
-            ("%X" % min(15, sig_cnt)) if sig_cnt else "-",
-            sep="",
-            end="" if curr_channel < 125 else "\r",
-        )
-    # finish printing results and end with a new line
-    while curr_channel < len(signals) - 1:
-        curr_channel += 1
-        sig_cnt = signals[curr_channel]
-        print(("%X" % min(15, sig_cnt)) if sig_cnt else "-", sep="", end="")
+        for sig_cnt in signals:
+            print(("%X" % min(15, sig_cnt)) if sig_cnt else "-", sep="", end="")
+        print("", end="\r")
+    # end with a new line
     print("")
 
 
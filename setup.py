@@ -75,8 +75,8 @@ class CMakeBuild(build_ext):
 
 setup_args = dict(
     zip_safe=False,
-    packages=["pyrf24"],
-    package_dir={"pyrf24": "src/pyrf24"},
+    packages=["pyrf24", "pyrf24.bench"],
+    package_dir={"pyrf24": "src/pyrf24", "pyrf24.bench": "src/pyrf24/bench"},
     package_data={"pyrf24": ["rf24.pyi", "rf24_network.pyi", "rf24_mesh.pyi"]},
 )
 
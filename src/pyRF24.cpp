@@ -1,43 +1,602 @@
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <fcntl.h>
+#include <functional>
+#include <memory>
+#include <linux/gpio.h>
+#include <mutex>
+#include <poll.h>
+#include <string.h>
+#include <sys/eventfd.h>
+#include <sys/ioctl.h>
+#include <system_error>
+#include <thread>
+#include <time.h>
+#include <unistd.h>
+#include <vector>
 #include <pybind11/pybind11.h>
 #include <RF24.h>
 #include <nRF24L01.h>
+#if defined(RF24_SIM)
+    #include "sim/air.h"
+#endif
 
 namespace py = pybind11;
 
-void throw_ba_exception(void)
+/**
+ * Get a view of a python object's buffer (without copying the data).
+ *
+ * Any object that supports python's buffer protocol is accepted (like `bytes`, `bytearray`,
+ * `memoryview`, `array.array` or a numpy array) as long as the data is C-contiguous.
+ * The object cannot be resized while the returned `py::buffer_info` is alive, so its data
+ * can be accessed while the GIL is released.
+ */
+py::buffer_info get_buffer(py::buffer buf, bool writable = false)
 {
-    PyErr_SetString(PyExc_TypeError, "buf parameter must be bytes or bytearray");
-    py::error_already_set();
+    py::buffer_info info = buf.request(writable);
+    if (!PyBuffer_IsContiguous(info.view(), 'C'))
+        throw py::value_error("buffer must be C-contiguous");
+    return info;
 }
 
-char* get_bytes_or_bytearray_str(py::object buf)
+/** The length (in bytes) of a buffer's data. */
+size_t get_buffer_len(const py::buffer_info& info)
 {
-    PyObject* py_ba;
-    py_ba = buf.ptr();
-    if (PyByteArray_Check(py_ba))
-        return PyByteArray_AsString(py_ba);
-    else if (PyBytes_Check(py_ba))
-        return PyBytes_AsString(py_ba);
-    else
-        throw_ba_exception();
+    return static_cast<size_t>(info.size * info.itemsize);
+}
 
-    return NULL;
+/** The length (in bytes) of a buffer's data, truncated to the maximum payload length (32 bytes). */
+uint8_t get_payload_len(const py::buffer_info& info)
+{
+    return static_cast<uint8_t>(rf24_min(get_buffer_len(info), static_cast<size_t>(32)));
 }
 
-int get_bytes_or_bytearray_ln(py::object buf)
+/** The size (in bytes) of a record written by `RF24Wrapper::read_all()`. */
+#define RX_RECORD_SIZE 48
+/** The offset of the payload within a record written by `RF24Wrapper::read_all()`. */
+#define RX_RECORD_PAYLOAD 16
+
+/**
+ * The registers in a configuration snapshot, in order (see `RF24Wrapper::get_config()`). The
+ * 40-bit address registers are stored as 5 bytes (LSB first) regardless of the address width.
+ */
+static const uint8_t CONFIG_REGISTERS[] = {NRF_CONFIG, EN_AA, EN_RXADDR, SETUP_AW, SETUP_RETR, RF_CH, RF_SETUP, RX_ADDR_P0, RX_ADDR_P1, RX_ADDR_P2, RX_ADDR_P3, RX_ADDR_P4, RX_ADDR_P5, TX_ADDR, RX_PW_P0, RX_PW_P1, RX_PW_P2, RX_PW_P3, RX_PW_P4, RX_PW_P5, DYNPD, FEATURE};
+
+/** The offsets of the registers in a configuration snapshot (see `CONFIG_REGISTERS`). */
+enum ConfigOffset : uint8_t
 {
-    PyObject* py_ba;
-    py_ba = buf.ptr();
-    if (PyByteArray_Check(py_ba))
-        return PyByteArray_Size(py_ba);
-    else if (PyBytes_Check(py_ba))
-        return PyBytes_Size(py_ba);
-    else
-        throw_ba_exception();
+    CFG_CONFIG = 0,
+    CFG_EN_AA,
+    CFG_EN_RXADDR,
+    CFG_SETUP_AW,
+    CFG_SETUP_RETR,
+    CFG_RF_CH,
+    CFG_RF_SETUP,
+    CFG_RX_ADDR_P0,
+    CFG_RX_ADDR_P1 = CFG_RX_ADDR_P0 + 5,
+    CFG_RX_ADDR_P2 = CFG_RX_ADDR_P1 + 5,
+    CFG_TX_ADDR = CFG_RX_ADDR_P2 + 4,
+    CFG_RX_PW_P0 = CFG_TX_ADDR + 5,
+    CFG_DYNPD = CFG_RX_PW_P0 + 6,
+    CFG_FEATURE
+};
+
+/** The size (in bytes) of a configuration snapshot (see `RF24Wrapper::get_config()`). */
+#define CONFIG_SNAPSHOT_SIZE 34
+static_assert(CFG_FEATURE + 1 == CONFIG_SNAPSHOT_SIZE, "CONFIG_SNAPSHOT_SIZE does not match CONFIG_REGISTERS");
+
+/** The size (in bytes) of a register in a configuration snapshot. */
+inline uint8_t config_register_size(uint8_t reg)
+{
+    return reg == RX_ADDR_P0 || reg == RX_ADDR_P1 || reg == TX_ADDR ? 5 : 1;
+}
+
+/** The shortest interval (in microseconds) between polls when no IRQ pin is attached. */
+#define IRQ_POLL_MIN_US 50
+/** The longest interval (in microseconds) between polls when no IRQ pin is attached. */
+#define IRQ_POLL_MAX_US 5000
+
+/** The maximum time (in milliseconds) that an `RxDrainer` waits before checking if it was stopped. */
+#define RX_WORKER_WAIT_MS 10
+/** The number of RX pipes (a `Multiceiver` keeps a separate queue for each of them). */
+#define RX_PIPES 6
+/** The maximum number of queued payloads that a `GroupRadio` transmits at a time. */
+#define GROUP_TX_BATCH 32
+
+/** The number of ACK payloads (per pipe) taken from a source in advance (see `RF24Wrapper::set_ack_payload_source()`). */
+#define ACK_STAGE_DEPTH 8
+
+/** The number of data bytes in each payload of a stream (see `RF24Wrapper::send_stream()`). */
+#define STREAM_CHUNK 30
+/** The maximum number of chunks that are sent ahead of the first chunk not yet received. */
+#define STREAM_WINDOW 64
+/** The number of payloads sent before a chunk reported missing is sent again. */
+#define STREAM_RESEND_LAG 8
+/** The header of the payload that starts a stream (data payloads use 15 bit sequence numbers). */
+#define STREAM_START 0xFFFE
+/** The header of the payload that ends a stream. */
+#define STREAM_END 0xFFFF
+/** The size of the reports that a stream's receiver sends in ACK payloads. */
+#define STREAM_REPORT_SIZE 10
+/** The flag in a report that tells the sender the whole stream was received. */
+#define STREAM_COMPLETE 1
+/** The number of bytes read from (or written to) a python file object at a time. */
+#define STREAM_IO_SIZE 4096
+
+/** The registers that are mirrored by a radio's register shadow (see `RF24Wrapper::resync()`). */
+static const uint8_t SHADOW_REGISTERS[] = {NRF_CONFIG, EN_AA, EN_RXADDR, SETUP_AW, SETUP_RETR, RF_CH, RF_SETUP, DYNPD, FEATURE};
+
+/** The current time (in nanoseconds) of the same clock that python's `time.monotonic_ns()` uses. */
+uint64_t monotonic_ns()
+{
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return static_cast<uint64_t>(now.tv_sec) * 1000000000ULL + static_cast<uint64_t>(now.tv_nsec);
+}
+
+/**
+ * A scope guard for anything that talks to the radio over the SPI bus.
+ *
+ * The GIL is released first (so other python threads keep running), then the radio's
+ * lock is acquired (so other python threads cannot interleave SPI transactions on the
+ * same radio). Members are destroyed in reverse order; the lock is released before the
+ * GIL is re-acquired.
+ *
+ * .. warning:: Do not touch any python objects while this guard is in scope.
+ */
+class SpiTransaction
+{
+public:
+    explicit SpiTransaction(std::mutex& spi_mutex) : release(), lock(spi_mutex)
+    {
+    }
+
+private:
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock;
+};
+
+/**
+ * Adapt a C++ method (that only takes and returns C++ types) to be called within a
+ * `SpiTransaction`. The ``Wrapper`` class must implement ``std::mutex& get_spi_mutex()``.
+ */
+template<typename Wrapper, typename Return, typename Class, typename... Args>
+std::function<Return(Wrapper&, Args...)> spi_call(Return (Class::*method)(Args...))
+{
+    return [method](Wrapper& self, Args... args) -> Return {
+        SpiTransaction transaction(self.get_spi_mutex());
+        return (self.*method)(args...);
+    };
+}
+
+template<typename Wrapper, typename Return, typename Class, typename... Args>
+std::function<Return(const Wrapper&, Args...)> spi_call(Return (Class::*method)(Args...) const)
+{
+    return [method](const Wrapper& self, Args... args) -> Return {
+        SpiTransaction transaction(self.get_spi_mutex());
+        return (self.*method)(args...);
+    };
+}
+
+/** The number of histogram buckets per power of 2 (each bucket spans at most 25% of its values). */
+#define STATS_SUB_BUCKETS 4
+/** The number of histogram buckets (enough for durations up to 2^40 ns, about 18 minutes). */
+#define STATS_BUCKETS (40 * STATS_SUB_BUCKETS)
+
+/** The measurements of one instrumented method (see `RadioStats`). */
+struct MethodStats
+{
+    uint64_t calls;
+    uint64_t failures;
+    uint64_t payload_bytes;
+    uint64_t retransmits;
+    uint64_t total_ns;
+    uint64_t lock_wait_ns;
+    uint64_t min_ns;
+    uint64_t max_ns;
+    uint64_t histogram[STATS_BUCKETS];
+};
+
+/**
+ * Opt-in instrumentation of a radio's most frequently called methods.
+ *
+ * Every call records its duration (including the time spent waiting for the radio's lock) in
+ * an HDR-style histogram: each power of 2 is split into `STATS_SUB_BUCKETS` linear buckets.
+ * Recording only takes a lock that is private to this object, so it never contends with SPI
+ * transactions. When disabled, an instrumented call costs one relaxed atomic load.
+ */
+class RadioStats
+{
+public:
+    enum Method
+    {
+        WRITE,
+        WRITE_FAST,
+        TX_STANDBY,
+        AVAILABLE,
+        READ,
+        METHOD_COUNT
+    };
+
+    RadioStats() : enabled(false)
+    {
+        clear();
+    }
+
+    bool is_enabled() const
+    {
+        return enabled.load(std::memory_order_relaxed);
+    }
+
+    void set_enabled(bool enable)
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (enable && !enabled.load(std::memory_order_relaxed))
+            clear();
+        enabled.store(enable, std::memory_order_relaxed);
+    }
+
+    void record(Method method, uint64_t total_ns, uint64_t lock_wait_ns, bool success, size_t payload_bytes, uint8_t retransmits)
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        MethodStats& stats = methods[method];
+        stats.calls++;
+        if (!success)
+            stats.failures++;
+        stats.payload_bytes += payload_bytes;
+        stats.retransmits += retransmits;
+        stats.total_ns += total_ns;
+        stats.lock_wait_ns += lock_wait_ns;
+        stats.min_ns = rf24_min(stats.min_ns, total_ns);
+        stats.max_ns = rf24_max(stats.max_ns, total_ns);
+        stats.histogram[bucket(total_ns)]++;
+    }
+
+    /** Get all measurements as a `dict`, optionally resetting them in the same step. */
+    py::dict snapshot(bool reset)
+    {
+        static const char* const names[METHOD_COUNT] = {"write", "write_fast", "tx_standby", "available", "read"};
+        MethodStats copy[METHOD_COUNT];
+        uint64_t now = monotonic_ns();
+        uint64_t elapsed;
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            memcpy(copy, methods, sizeof(methods));
+            elapsed = now - since;
+            if (reset)
+                clear();
+        }
+        py::dict result;
+        result["enabled"] = is_enabled();
+        result["elapsed_ns"] = elapsed;
+        for (int i = 0; i < METHOD_COUNT; ++i)
+            result[names[i]] = to_dict(copy[i]);
+        return result;
+    }
+
+private:
+    std::atomic<bool> enabled;
+    std::mutex mutex;
+    MethodStats methods[METHOD_COUNT];
+    /** When the measurements were last reset. */
+    uint64_t since;
+
+    void clear()
+    {
+        memset(methods, 0, sizeof(methods));
+        for (MethodStats& stats : methods)
+            stats.min_ns = UINT64_MAX;
+        since = monotonic_ns();
+    }
+
+    static size_t bucket(uint64_t ns)
+    {
+        if (ns < STATS_SUB_BUCKETS)
+            return static_cast<size_t>(ns);
+        int msb = 63 - __builtin_clzll(ns);
+        size_t index = static_cast<size_t>(msb - 1) * STATS_SUB_BUCKETS + ((ns >> (msb - 2)) & (STATS_SUB_BUCKETS - 1));
+        return rf24_min(index, static_cast<size_t>(STATS_BUCKETS - 1));
+    }
+
+    /** The smallest duration that is too long for a bucket. */
+    static uint64_t bucket_limit(size_t index)
+    {
+        if (index < STATS_SUB_BUCKETS)
+            return index + 1;
+        int shift = static_cast<int>(index / STATS_SUB_BUCKETS) - 1;
+        return static_cast<uint64_t>(STATS_SUB_BUCKETS + 1 + index % STATS_SUB_BUCKETS) << shift;
+    }
+
+    /** The duration (in nanoseconds) that a fraction of the calls did not exceed. */
+    static uint64_t percentile(const MethodStats& stats, double fraction)
+    {
+        uint64_t rank = static_cast<uint64_t>(fraction * static_cast<double>(stats.calls) + 0.5);
+        uint64_t seen = 0;
+        for (size_t i = 0; i < STATS_BUCKETS; ++i) {
+            seen += stats.histogram[i];
+            if (seen && seen >= rank)
+                return rf24_min(bucket_limit(i) - 1, stats.max_ns);
+        }
+        return stats.max_ns;
+    }
+
+    static py::dict to_dict(const MethodStats& stats)
+    {
+        py::dict result;
+        result["calls"] = stats.calls;
+        result["failures"] = stats.failures;
+        result["payload_bytes"] = stats.payload_bytes;
+        result["retransmits"] = stats.retransmits;
+        result["total_ns"] = stats.total_ns;
+        result["lock_wait_ns"] = stats.lock_wait_ns;
+        result["min_ns"] = stats.calls ? stats.min_ns : 0;
+        result["max_ns"] = stats.max_ns;
+        result["mean_ns"] = stats.calls ? stats.total_ns / stats.calls : 0;
+        result["p50_ns"] = percentile(stats, 0.5);
+        result["p90_ns"] = percentile(stats, 0.9);
+        result["p99_ns"] = percentile(stats, 0.99);
+        result["p999_ns"] = percentile(stats, 0.999);
+        py::list histogram;
+        for (size_t i = 0; i < STATS_BUCKETS; ++i) {
+            if (stats.histogram[i])
+                histogram.append(py::make_tuple(bucket_limit(i), stats.histogram[i]));
+        }
+        result["histogram"] = histogram;
+        return result;
+    }
+};
+
+/**
+ * A scope guard that measures one call of an instrumented method (see `RadioStats`).
+ *
+ * It must be constructed before the method's `SpiTransaction` and destroyed after it, so the
+ * measurement is recorded while the GIL is held (but the radio's lock is not).
+ */
+class StatsScope
+{
+public:
+    StatsScope(RadioStats& _stats, RadioStats::Method _method)
+        : stats(_stats.is_enabled() ? &_stats : nullptr), method(_method), start(stats ? monotonic_ns() : 0), lock_wait_ns(0), success(true), payload_bytes(0), retransmits(0)
+    {
+    }
+
+    ~StatsScope()
+    {
+        if (stats)
+            stats->record(method, monotonic_ns() - start, lock_wait_ns, success, payload_bytes, retransmits);
+    }
+
+    /** Is this call being measured? */
+    bool active() const
+    {
+        return stats != nullptr;
+    }
+
+    /** Mark the end of waiting for the radio's lock. */
+    void locked()
+    {
+        if (stats)
+            lock_wait_ns = monotonic_ns() - start;
+    }
 
-    return 0;
+    /** Record the outcome of the call. */
+    void result(bool _success, size_t _payload_bytes = 0, uint8_t _retransmits = 0)
+    {
+        success = _success;
+        payload_bytes = _payload_bytes;
+        retransmits = _retransmits;
+    }
+
+private:
+    RadioStats* stats;
+    RadioStats::Method method;
+    uint64_t start;
+    uint64_t lock_wait_ns;
+    bool success;
+    size_t payload_bytes;
+    uint8_t retransmits;
+};
+
+/** Read a little-endian `uint32_t`. */
+inline uint32_t load_u32(const uint8_t* data)
+{
+    return static_cast<uint32_t>(data[0]) | static_cast<uint32_t>(data[1]) << 8 | static_cast<uint32_t>(data[2]) << 16 | static_cast<uint32_t>(data[3]) << 24;
+}
+
+/** Write a little-endian `uint32_t`. */
+inline void store_u32(uint8_t* data, uint32_t value)
+{
+    for (int i = 0; i < 4; ++i)
+        data[i] = static_cast<uint8_t>(value >> (8 * i));
 }
 
+/**
+ * The data sent by `RF24Wrapper::send_stream()`.
+ *
+ * An object that supports python's buffer protocol (like `bytes` or a `mmap`) is read without
+ * copying or holding the GIL. A file object (anything with a ``read()`` method) or an iterable
+ * of buffers is read in blocks, and the GIL is only acquired to fetch the next block.
+ */
+class StreamSource
+{
+public:
+    explicit StreamSource(py::object source) : has_view(false), offset(0)
+    {
+        if (py::isinstance<py::buffer>(source)) {
+            view = get_buffer(source.cast<py::buffer>());
+            has_view = true;
+        }
+        else if (py::hasattr(source, "read"))
+            reader = source.attr("read");
+        else
+            blocks = py::iter(source);
+    }
+
+    /** Copy the next ``max`` bytes to ``out``. Fewer bytes are only copied at the end of the data. */
+    size_t fill(uint8_t* out, size_t max)
+    {
+        if (has_view) {
+            size_t count = rf24_min(max, get_buffer_len(view) - offset);
+            memcpy(out, static_cast<uint8_t*>(view.ptr) + offset, count);
+            offset += count;
+            return count;
+        }
+        py::gil_scoped_acquire gil;
+        size_t count = 0;
+        while (count < max) {
+            if (offset == pending.size()) {
+                if (!next_block())
+                    break;
+                continue;
+            }
+            size_t length = rf24_min(max - count, pending.size() - offset);
+            memcpy(out + count, pending.data() + offset, length);
+            offset += length;
+            count += length;
+        }
+        return count;
+    }
+
+private:
+    bool has_view;
+    py::buffer_info view;
+    py::object reader;
+    py::iterator blocks;
+    /** The block being read (if not reading a buffer). */
+    std::string pending;
+    /** The bytes already read from `view` or `pending`. */
+    size_t offset;
+
+    /** Fetch the next block of data. Returns false at the end of the data. */
+    bool next_block()
+    {
+        py::object block;
+        if (reader) {
+            block = reader(STREAM_IO_SIZE);
+            if (block.is_none())
+                return false;
+        }
+        else {
+            if (blocks == py::iterator::sentinel())
+                return false;
+            block = py::reinterpret_borrow<py::object>(*blocks);
+            ++blocks;
+        }
+        py::buffer_info info = get_buffer(block.cast<py::buffer>());
+        pending.assign(static_cast<const char*>(info.ptr), get_buffer_len(info));
+        offset = 0;
+        return !reader || !pending.empty(); // an empty read means the end of the file
+    }
+};
+
+/**
+ * The destination of the data received by `RF24Wrapper::recv_stream()`.
+ *
+ * Chunks are written directly into a writable buffer (like a `bytearray` or a `mmap`) at their
+ * offsets, in any order. For a file object (anything with a ``write()`` method), chunks are
+ * reordered in memory and written in blocks; the GIL is only acquired to write a block.
+ */
+class StreamSink
+{
+public:
+    explicit StreamSink(py::object sink) : has_view(false), window(STREAM_WINDOW * STREAM_CHUNK), lengths()
+    {
+        if (py::isinstance<py::buffer>(sink)) {
+            view = get_buffer(sink.cast<py::buffer>(), true);
+            has_view = true;
+        }
+        else if (py::hasattr(sink, "write"))
+            writer = sink.attr("write");
+        else
+            throw py::type_error("sink must be a writable buffer or have a write() method");
+    }
+
+    /** Store a received chunk. Returns false if it does not fit in the sink's buffer. */
+    bool store(uint32_t index, const uint8_t* data, uint8_t length)
+    {
+        if (has_view) {
+            size_t position = static_cast<size_t>(index) * STREAM_CHUNK;
+            if (position + length > get_buffer_len(view))
+                return false;
+            memcpy(static_cast<uint8_t*>(view.ptr) + position, data, length);
+            return true;
+        }
+        memcpy(&window[(index % STREAM_WINDOW) * STREAM_CHUNK], data, length);
+        lengths[index % STREAM_WINDOW] = length;
+        return true;
+    }
+
+    /** Accept a chunk (after all previous chunks were accepted). */
+    void commit(uint32_t index)
+    {
+        if (has_view)
+            return;
+        pending.append(reinterpret_cast<const char*>(&window[(index % STREAM_WINDOW) * STREAM_CHUNK]), lengths[index % STREAM_WINDOW]);
+        if (pending.size() >= STREAM_IO_SIZE)
+            flush();
+    }
+
+    /** Write the accepted chunks to the file object. */
+    void flush()
+    {
+        if (pending.empty())
+            return;
+        py::gil_scoped_acquire gil;
+        writer(py::bytes(pending));
+        pending.clear();
+    }
+
+private:
+    bool has_view;
+    py::buffer_info view;
+    py::object writer;
+    /** The chunks received out of order (if not writing to a buffer). */
+    std::vector<uint8_t> window;
+    uint8_t lengths[STREAM_WINDOW];
+    /** The accepted chunks not yet written to the file object. */
+    std::string pending;
+};
+
+/**
+ * The state of a pipe's ACK payload source (see `RF24Wrapper::set_ack_payload_source()`).
+ *
+ * `source` is only used while the GIL is held. The other members are guarded by the radio's
+ * SPI mutex (the counters are atomic, so they can be read without locking it).
+ */
+struct AckSource
+{
+    enum Kind
+    {
+        /** An object with ``empty()`` and ``get_nowait()`` methods (like `queue.Queue`). */
+        QUEUE,
+        /** A `collections.deque` (payloads are taken with ``popleft()``). */
+        DEQUE,
+        /** An iterator (payloads are taken with ``next()``). */
+        ITERATOR,
+    };
+
+    /** The object that payloads are taken from (``None`` if no source is set). */
+    py::object source = py::none();
+    Kind kind = ITERATOR;
+    /** Is a source set? */
+    bool enabled = false;
+    /** Payloads taken from `source` that are not uploaded to the TX FIFO yet. */
+    std::deque<std::vector<uint8_t>> staged;
+    /** The size of `staged` (read while the GIL is held to decide how many payloads to take). */
+    std::atomic<size_t> staged_count {0};
+    /** The number of this pipe's ACK payloads in the TX FIFO. */
+    uint8_t loaded = 0;
+    /** The number of ACK payloads that were attached to a received payload. */
+    std::atomic<uint64_t> sent {0};
+    /** The number of payloads received while no ACK payload was loaded for the pipe. */
+    std::atomic<uint64_t> underruns {0};
+};
+
+/** ACK payloads taken from the sources (pipe number and payload), before they are staged. */
+typedef std::vector<std::pair<uint8_t, std::vector<uint8_t>>> AckBatch;
+
 class RF24Wrapper : public RF24
 {
 
@@ -51,12 +610,35 @@ public:
     }
 
     // needed for polymorphic recognition
-    virtual ~RF24Wrapper() = default;
+    virtual ~RF24Wrapper()
+    {
+        detach_irq();
+    }
+
+    std::mutex& get_spi_mutex() const
+    {
+        return spi_mutex;
+    }
+
+    RF24Wrapper& get_radio()
+    {
+        return *this;
+    }
+
+    bool available()
+    {
+        return observe_rx(RF24::available());
+    }
+
+    bool available(uint8_t* pipe)
+    {
+        return observe_rx(RF24::available(pipe));
+    }
 
     std::tuple<bool, uint8_t> available_pipe()
     {
         uint8_t pipe = 7;
-        bool is_available = RF24::available(&pipe);
+        bool is_available = available(&pipe);
         return std::tuple<bool, uint8_t>(is_available, pipe);
     }
 
@@ -64,1356 +646,4505 @@ public:
     {
         bool ds = 0, df = 0, dr = 0;
         RF24::whatHappened(ds, df, dr);
+        observe_rx(dr);
+        stamp_tx(ds || df);
         return std::tuple<bool, bool, bool>(ds, df, dr);
     }
 
+    bool txStandBy()
+    {
+        return stamp_tx(RF24::txStandBy(), true);
+    }
+
+    bool txStandBy(uint32_t timeout, bool startTx = false)
+    {
+        return stamp_tx(RF24::txStandBy(timeout, startTx), true);
+    }
+
+    uint64_t get_rx_timestamp()
+    {
+        return rx_timestamp;
+    }
+
+    uint64_t get_tx_timestamp()
+    {
+        return tx_timestamp;
+    }
+
+    /**
+     * The time that the RX FIFO was first observed holding a payload since the last payload
+     * was read (or the current time if it wasn't observed). The observation is cleared, so the
+     * caller must read the next payload. The SPI mutex must be locked.
+     */
+    uint64_t take_rx_timestamp()
+    {
+        uint64_t timestamp = rx_seen_ns ? rx_seen_ns : monotonic_ns();
+        rx_seen_ns = 0;
+        return timestamp;
+    }
+
+    /** Record that a transmission completed (if ``completed`` is true). Returns ``result``. */
+    bool stamp_tx(bool result, bool completed)
+    {
+        if (completed)
+            tx_timestamp = monotonic_ns();
+        return result;
+    }
+
+    bool stamp_tx(bool completed)
+    {
+        return stamp_tx(completed, completed);
+    }
+
     void open_tx_pipe(py::buffer address)
     {
-        RF24::openWritingPipe(reinterpret_cast<uint8_t*>(get_bytes_or_bytearray_str(address)));
+        uint8_t addr[5] = {0};
+        py::buffer_info info = get_buffer(address);
+        memcpy(addr, info.ptr, rf24_min(get_buffer_len(info), static_cast<size_t>(5)));
+        SpiTransaction transaction(spi_mutex);
+        RF24::openWritingPipe(addr);
     }
 
     void open_rx_pipe(uint8_t number, py::buffer address)
     {
-        RF24::openReadingPipe(number, reinterpret_cast<uint8_t*>(get_bytes_or_bytearray_str(address)));
+        uint8_t addr[5] = {0};
+        py::buffer_info info = get_buffer(address);
+        memcpy(addr, info.ptr, rf24_min(get_buffer_len(info), static_cast<size_t>(5)));
+        SpiTransaction transaction(spi_mutex);
+        RF24::openReadingPipe(number, addr);
+        invalidate_registers();
     }
 
     py::bytearray read(uint8_t length = 0)
     {
-        if (!length)
-            length = RF24::dynamic_payloads_enabled ? RF24::getDynamicPayloadSize() : RF24::getPayloadSize();
-        else
-            length = rf24_min(length, static_cast<uint8_t>(32));
-        char* payload = new char[length + 1];
-        RF24::read(payload, length);
-        payload[length] = '\0';
-        py::bytearray buf = py::bytearray(payload, length);
-        delete[] payload;
-        return buf;
+        char payload[32];
+        AckBatch acks = take_ack_payloads();
+        {
+            StatsScope scope(stats, RadioStats::READ);
+            SpiTransaction transaction(spi_mutex);
+            scope.locked();
+            stage_ack_payloads(acks);
+            uint8_t pipe = ack_sources_active ? rx_pipe() : RX_PIPES;
+            if (!length)
+                length = RF24::dynamic_payloads_enabled ? RF24::getDynamicPayloadSize() : RF24::getPayloadSize();
+            else
+                length = rf24_min(length, static_cast<uint8_t>(32));
+            rx_timestamp = take_rx_timestamp();
+            RF24::read(payload, length);
+            ack_payload_consumed(pipe);
+            scope.result(true, length);
+        }
+        return py::bytearray(payload, length);
+    }
+
+    uint8_t read_into(py::buffer buf)
+    {
+        py::buffer_info info = get_buffer(buf, true);
+        uint8_t length = get_payload_len(info);
+        AckBatch acks = take_ack_payloads();
+        StatsScope scope(stats, RadioStats::READ);
+        SpiTransaction transaction(spi_mutex);
+        scope.locked();
+        stage_ack_payloads(acks);
+        uint8_t pipe = ack_sources_active ? rx_pipe() : RX_PIPES;
+        uint8_t available = RF24::dynamic_payloads_enabled ? RF24::getDynamicPayloadSize() : RF24::getPayloadSize();
+        length = rf24_min(length, available);
+        rx_timestamp = take_rx_timestamp();
+        RF24::read(info.ptr, length);
+        ack_payload_consumed(pipe);
+        scope.result(true, length);
+        return length;
+    }
+
+    size_t read_all(py::buffer buf)
+    {
+        py::buffer_info info = get_buffer(buf, true);
+        const size_t capacity = get_buffer_len(info) / RX_RECORD_SIZE;
+        uint8_t* record = static_cast<uint8_t*>(info.ptr);
+        size_t count = 0;
+        AckBatch acks = take_ack_payloads();
+        SpiTransaction transaction(spi_mutex);
+        stage_ack_payloads(acks);
+        uint8_t pipe = 0;
+        while (count < capacity && available(&pipe)) {
+            if (read_record(record, pipe)) {
+                record += RX_RECORD_SIZE;
+                count++;
+            }
+        }
+        return count;
     }
 
     void startFastWrite(py::buffer buf, const bool multicast = false, bool startTx = true)
     {
-        RF24::startFastWrite(
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            multicast, startTx);
+        py::buffer_info info = get_buffer(buf);
+        SpiTransaction transaction(spi_mutex);
+        RF24::startFastWrite(info.ptr, get_payload_len(info), multicast, startTx);
     }
 
     bool startWrite(py::buffer buf, const bool multicast)
     {
-        return RF24::startWrite(
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            multicast);
+        py::buffer_info info = get_buffer(buf);
+        SpiTransaction transaction(spi_mutex);
+        return RF24::startWrite(info.ptr, get_payload_len(info), multicast);
     }
 
     bool writeFast(py::buffer buf, const bool multicast = false)
     {
-        return RF24::writeFast(
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            multicast);
+        py::buffer_info info = get_buffer(buf);
+        uint8_t length = get_payload_len(info);
+        StatsScope scope(stats, RadioStats::WRITE_FAST);
+        SpiTransaction transaction(spi_mutex);
+        scope.locked();
+        bool result = RF24::writeFast(info.ptr, length, multicast);
+        scope.result(result, length);
+        return result;
     }
 
     bool write(py::buffer buf, const bool multicast = false)
     {
-        return RF24::write(
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            multicast);
+        py::buffer_info info = get_buffer(buf);
+        uint8_t length = get_payload_len(info);
+        StatsScope scope(stats, RadioStats::WRITE);
+        SpiTransaction transaction(spi_mutex);
+        scope.locked();
+        bool result = stamp_tx(RF24::write(info.ptr, length, multicast), true);
+        if (scope.active()) // reading OBSERVE_TX costs an extra SPI transaction
+            scope.result(result, length, RF24::getARC());
+        return result;
     }
 
     bool writeBlocking(py::buffer buf, uint32_t timeout)
     {
-        return RF24::writeBlocking(
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            timeout);
+        py::buffer_info info = get_buffer(buf);
+        SpiTransaction transaction(spi_mutex);
+        return RF24::writeBlocking(info.ptr, get_payload_len(info), timeout);
     }
 
     bool writeAckPayload(uint8_t pipe, py::buffer buf)
     {
-        return RF24::writeAckPayload(
-            pipe,
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)));
+        py::buffer_info info = get_buffer(buf);
+        SpiTransaction transaction(spi_mutex);
+        return RF24::writeAckPayload(pipe, info.ptr, get_payload_len(info));
     }
 
-    char* sprintfDetails()
+    void set_ack_payload_source(uint8_t pipe, py::object source)
     {
-        char* debug_info = new char[870];
-        RF24::sprintfPrettyDetails(debug_info);
-        return debug_info;
+        if (pipe >= RX_PIPES)
+            throw py::value_error("pipe must be in range [0, 5]");
+        if (!source.is_none() && !RF24::ack_payloads_enabled)
+            throw std::runtime_error("ack_payloads must be enabled to set an ACK payload source");
+        AckSource& feed = ack_sources[pipe];
+        if (source.is_none())
+            feed.source = py::none();
+        else if (py::hasattr(source, "get_nowait") && py::hasattr(source, "empty")) {
+            feed.source = source;
+            feed.kind = AckSource::QUEUE;
+        }
+        else if (py::isinstance(source, py::module_::import("collections").attr("deque"))) {
+            feed.source = source;
+            feed.kind = AckSource::DEQUE;
+        }
+        else {
+            feed.source = py::iter(source);
+            feed.kind = AckSource::ITERATOR;
+        }
+        {
+            SpiTransaction transaction(spi_mutex);
+            // payloads taken from the previous source are discarded (unless they are already uploaded)
+            feed.staged.clear();
+            feed.staged_count = 0;
+            feed.enabled = !source.is_none();
+            ack_sources_active = false;
+            for (uint8_t i = 0; i < RX_PIPES; ++i)
+                ack_sources_active |= ack_sources[i].enabled;
+        }
+        refill_ack_payloads();
     }
 
-    void set_radiation(rf24_pa_dbm_e level, rf24_datarate_e speed, bool lna_enable = true)
+    /**
+     * Take payloads from the ACK payload sources (while the GIL is held) and upload as many
+     * as the TX FIFO can hold.
+     */
+    void refill_ack_payloads()
     {
-        RF24::setRadiation(level, speed, lna_enable);
+        if (!ack_sources_active)
+            return;
+        AckBatch acks = take_ack_payloads();
+        SpiTransaction transaction(spi_mutex);
+        stage_ack_payloads(acks);
+        upload_ack_payloads();
     }
 
-    /*********************************************************************************/
-    /* wrappers for python-like properties */
+    py::list get_ack_payloads_sent()
+    {
+        py::list result;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+            result.append(ack_sources[pipe].sent.load());
+        return result;
+    }
 
-    uint8_t get_address_width()
+    py::list get_ack_payload_underruns()
     {
-        return RF24::addr_width;
+        py::list result;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+            result.append(ack_sources[pipe].underruns.load());
+        return result;
     }
 
-    bool is_ack_payloads_enabled()
+    py::bytearray write_many(py::buffer buf, uint8_t stride, const bool multicast = false, uint32_t timeout_ms = 95)
     {
-        return RF24::ack_payloads_enabled;
+        if (!stride || stride > 32)
+            throw py::value_error("stride must be in range [1, 32]");
+        py::buffer_info info = get_buffer(buf);
+        const uint8_t* data = static_cast<const uint8_t*>(info.ptr);
+        const size_t length = get_buffer_len(info);
+        std::vector<std::pair<const uint8_t*, uint8_t>> payloads;
+        payloads.reserve(length / stride + 1);
+        for (size_t i = 0; i < length; i += stride)
+            payloads.emplace_back(data + i, static_cast<uint8_t>(rf24_min(length - i, static_cast<size_t>(stride))));
+        return write_payloads(payloads, multicast, timeout_ms);
     }
 
-    void toggle_ack_payloads(const bool enable)
+    py::bytearray write_many(py::sequence buffers, const bool multicast = false, uint32_t timeout_ms = 95)
     {
-        if (enable)
-            RF24::enableAckPayload();
-        else
-            RF24::disableAckPayload();
+        std::vector<py::buffer_info> views;
+        std::vector<std::pair<const uint8_t*, uint8_t>> payloads;
+        views.reserve(buffers.size());
+        payloads.reserve(buffers.size());
+        for (size_t i = 0; i < buffers.size(); ++i) {
+            py::object item = buffers[i];
+            if (!PyObject_CheckBuffer(item.ptr())) {
+                // a single buffer (without a stride) is a sequence of ints
+                throw py::type_error("buffers[" + std::to_string(i) + "] is not a bytes-like object (to split a single buffer into payloads, pass the stride argument)");
+            }
+            views.push_back(get_buffer(item.cast<py::buffer>()));
+            payloads.emplace_back(static_cast<const uint8_t*>(views.back().ptr), get_payload_len(views.back()));
+        }
+        return write_payloads(payloads, multicast, timeout_ms);
     }
 
-    bool is_dynamic_payloads_enabled()
+    void attach_irq(uint32_t pin, const std::string& chip = "/dev/gpiochip0")
     {
-        return RF24::dynamic_payloads_enabled;
+        int chip_fd = open(chip.c_str(), O_RDONLY | O_CLOEXEC);
+        if (chip_fd < 0) {
+            PyErr_SetFromErrnoWithFilename(PyExc_OSError, chip.c_str());
+            throw py::error_already_set();
+        }
+        struct gpioevent_request request;
+        memset(&request, 0, sizeof(request));
+        request.lineoffset = pin;
+        request.handleflags = GPIOHANDLE_REQUEST_INPUT;
+        request.eventflags = GPIOEVENT_REQUEST_FALLING_EDGE; // the IRQ pin is active low
+        strncpy(request.consumer_label, "pyrf24", sizeof(request.consumer_label) - 1);
+        int result = ioctl(chip_fd, GPIO_GET_LINEEVENT_IOCTL, &request);
+        int error = errno;
+        close(chip_fd);
+        if (result < 0) {
+            errno = error;
+            PyErr_SetFromErrnoWithFilename(PyExc_OSError, chip.c_str());
+            throw py::error_already_set();
+        }
+        detach_irq();
+        irq_fd = request.fd;
+        irq_fd_owned = true;
     }
 
-    void dynamic_payloads(const bool enable)
+    void detach_irq()
     {
-        if (enable)
-            RF24::enableDynamicPayloads();
-        else
-            RF24::disableDynamicPayloads();
+        if (irq_fd_owned)
+            close(irq_fd);
+        irq_fd = -1;
+        irq_fd_owned = false;
     }
 
-    bool isPowerUp()
+    int get_irq_fd()
     {
-        return read_register(NRF_CONFIG) & _BV(PWR_UP);
+        return irq_fd;
     }
 
-    void set_pa_level(rf24_pa_dbm_e level)
+    void set_irq_fd(int fd)
     {
-        RF24::setPALevel(level);
+        detach_irq();
+        irq_fd = fd;
     }
 
-    rf24_pa_dbm_e get_pa_level()
+    std::tuple<bool, bool, bool> wait_for_irq(uint32_t timeout_ms)
     {
-        uint8_t ret_val = RF24::getPALevel();
-        if (ret_val == RF24_PA_MAX)
-            return RF24_PA_MAX;
-        if (ret_val == RF24_PA_HIGH)
-            return RF24_PA_HIGH;
-        if (ret_val == RF24_PA_LOW)
-            return RF24_PA_LOW;
-        // if (ret_val == RF24_PA_MIN)
-        return RF24_PA_MIN;
+        py::gil_scoped_release release;
+        uint32_t start = millis();
+        uint32_t backoff_us = IRQ_POLL_MIN_US;
+        while (true) {
+            {
+                std::lock_guard<std::mutex> lock(spi_mutex);
+                if (read_register(NRF_STATUS) & (_BV(RX_DR) | _BV(TX_DS) | _BV(MAX_RT)))
+                    return what_happened();
+            }
+            uint32_t elapsed = millis() - start;
+            if (elapsed >= timeout_ms)
+                return std::tuple<bool, bool, bool>(false, false, false);
+            wait_for_edge(timeout_ms - elapsed, backoff_us, false);
+        }
     }
 
-    rf24_datarate_e get_data_rate()
+    bool wait_available(uint32_t timeout_ms)
     {
-        uint8_t ret_val = RF24::getDataRate();
-        if (ret_val == RF24_2MBPS)
-            return RF24_2MBPS;
-        if (ret_val == RF24_1MBPS)
-            return RF24_1MBPS;
-        // if (ret_val == RF24_250KBPS)
-        return RF24_250KBPS;
+        py::gil_scoped_release release;
+        uint32_t start = millis();
+        uint32_t backoff_us = IRQ_POLL_MIN_US;
+        while (true) {
+            bool asserted;
+            {
+                std::lock_guard<std::mutex> lock(spi_mutex);
+                if (available())
+                    return true;
+                asserted = read_register(NRF_STATUS) & (_BV(RX_DR) | _BV(TX_DS) | _BV(MAX_RT));
+            }
+            uint32_t elapsed = millis() - start;
+            if (elapsed >= timeout_ms)
+                return false;
+            wait_for_edge(timeout_ms - elapsed, backoff_us, asserted);
+        }
     }
 
-    void power(const bool enable)
+    bool is_register_cache_enabled()
     {
-        if (enable)
-            powerUp();
-        else
-            powerDown();
+        return register_cache;
     }
 
-    bool isListening()
+    void set_register_cache(const bool enable)
     {
-        return read_register(NRF_CONFIG) & _BV(PRIM_RX);
+        register_cache = enable;
+        invalidate_registers();
+        resync();
     }
 
-    void listen(const bool enable)
+    void resync()
     {
-        if (enable)
-            startListening();
-        else
-            stopListening();
+        if (!register_cache)
+            return;
+        for (uint8_t reg : SHADOW_REGISTERS) {
+            shadow[reg] = read_register(reg);
+            shadow_valid |= 1UL << reg;
+        }
     }
-};
 
-PYBIND11_MODULE(rf24, m)
-{
-    m.doc() = "A Python module that wraps all RF24 C++ library's API";
+    void invalidate_registers()
+    {
+        shadow_valid = 0;
+    }
 
-    // ********************** Enum structs
-    py::enum_<rf24_crclength_e>(m, "rf24_crclength_e")
-        .value("RF24_CRC_DISABLED", RF24_CRC_DISABLED, R"docstr(
-            to disable using CRC checksums
-        )docstr")
-        .value("RF24_CRC_8", RF24_CRC_8, R"docstr(
-            to use 8-bit checksums
-        )docstr")
-        .value("RF24_CRC_16", RF24_CRC_16, R"docstr(
-            to use 16-bit checksums
-        )docstr")
-        .export_values();
+    uint64_t get_spi_reads_saved()
+    {
+        return spi_reads_saved;
+    }
 
-    py::enum_<rf24_datarate_e>(m, "rf24_datarate_e")
-        .value("RF24_1MBPS", RF24_1MBPS, R"docstr(
-            for 1 Mbps
-        )docstr")
-        .value("RF24_2MBPS", RF24_2MBPS, R"docstr(
-            for 2 Mbps
-        )docstr")
-        .value("RF24_250KBPS", RF24_250KBPS, R"docstr(
-            for 250 kbps
-        )docstr")
-        .export_values();
+    RadioStats& get_stats()
+    {
+        return stats;
+    }
 
-    py::enum_<rf24_pa_dbm_e>(m, "rf24_pa_dbm_e")
-        .value("RF24_PA_MIN", RF24_PA_MIN, R"docstr(
-            +----------------------+--------------------+--------------------+
+    bool is_stats_enabled()
+    {
+        return stats.is_enabled();
+    }
+
+    void set_stats_enabled(const bool enable)
+    {
+        stats.set_enabled(enable);
+    }
+
+    py::dict get_stats_snapshot(bool reset = false)
+    {
+        return stats.snapshot(reset);
+    }
+
+    uint8_t getChannel()
+    {
+        return cached_register(RF_CH);
+    }
+
+    uint8_t getPALevel()
+    {
+        return (cached_register(RF_SETUP) & (_BV(RF_PWR_LOW) | _BV(RF_PWR_HIGH))) >> 1;
+    }
+
+    rf24_datarate_e getDataRate()
+    {
+        uint8_t dr = cached_register(RF_SETUP) & (_BV(RF_DR_LOW) | _BV(RF_DR_HIGH));
+        if (dr == _BV(RF_DR_LOW))
+            return RF24_250KBPS;
+        if (dr == _BV(RF_DR_HIGH))
+            return RF24_2MBPS;
+        return RF24_1MBPS;
+    }
+
+    rf24_crclength_e getCRCLength()
+    {
+        uint8_t config = cached_register(NRF_CONFIG);
+        if (config & _BV(EN_CRC) || cached_register(EN_AA))
+            return config & _BV(CRCO) ? RF24_CRC_16 : RF24_CRC_8;
+        return RF24_CRC_DISABLED;
+    }
+
+    py::object scan(py::iterable channels, uint32_t dwell_us = 130, uint32_t sweeps = 1, bool history = false)
+    {
+        if (!sweeps)
+            throw py::value_error("sweeps must be greater than 0");
+        std::vector<uint8_t> hops;
+        for (py::handle channel : channels) {
+            int number = channel.cast<int>();
+            if (number < 0 || number > 125)
+                throw py::value_error("channels must be in range [0, 125]");
+            hops.push_back(static_cast<uint8_t>(number));
+        }
+        if (hops.empty())
+            throw py::value_error("channels must not be empty");
+        const size_t count = hops.size();
+        std::vector<uint32_t> counts(count, 0);
+        std::string detected(history ? count * sweeps : 0, '\0');
+        {
+            SpiTransaction transaction(spi_mutex);
+            uint8_t original_channel = read_register(RF_CH);
+            bool was_listening = read_register(NRF_CONFIG) & _BV(PRIM_RX);
+            if (was_listening)
+                RF24::stopListening();
+            RF24::flush_rx(); // only count the payloads received during each dwell
+            for (uint32_t sweep = 0; sweep < sweeps; ++sweep) {
+                for (size_t i = 0; i < count; ++i) {
+                    RF24::setChannel(hops[i]);
+                    RF24::startListening();
+                    delayMicroseconds(dwell_us);
+                    bool found = RF24::testRPD();
+                    RF24::stopListening();
+                    found = found || RF24::testRPD() || RF24::available();
+                    if (found) {
+                        RF24::flush_rx(); // a payload in the RX FIFO keeps the RPD flag asserted
+                        counts[i]++;
+                        if (history)
+                            detected[sweep * count + i] = 1;
+                    }
+                }
+            }
+            RF24::setChannel(original_channel);
+            if (was_listening)
+                RF24::startListening();
+            invalidate_registers();
+        }
+        py::object array = py::module_::import("array").attr("array");
+        py::object result = array("I", py::bytes(reinterpret_cast<const char*>(counts.data()), count * sizeof(uint32_t)));
+        if (!history)
+            return result;
+        py::object rows = py::memoryview(py::bytearray(detected)).attr("cast")("B", py::make_tuple(sweeps, count));
+        return py::make_tuple(result, rows);
+    }
+
+    bool send_stream(py::object source, uint32_t timeout_ms = 1000)
+    {
+        if (!RF24::dynamic_payloads_enabled || !RF24::ack_payloads_enabled)
+            throw std::runtime_error("streams need dynamic_payloads and ack_payloads to be enabled");
+        StreamSource input(source);
+        const uint8_t token = ++stream_token;
+        std::vector<uint8_t> window(STREAM_WINDOW * STREAM_CHUNK);
+        uint8_t lengths[STREAM_WINDOW] = {0};
+        uint32_t last_sent[STREAM_WINDOW] = {0};
+        uint32_t sends = 0;
+        uint32_t base = 0;       // the first chunk that the receiver is missing
+        uint32_t received = 0;   // the chunks after `base` that the receiver has (1 bit each)
+        uint32_t next_chunk = 0; // the first chunk not yet read from `input`
+        uint32_t total = 0;
+        bool started = false, eof = false, complete = false;
+
+        SpiTransaction transaction(spi_mutex);
+        bool was_listening = read_register(NRF_CONFIG) & _BV(PRIM_RX);
+        if (was_listening)
+            RF24::stopListening();
+        RF24::flush_tx();
+        RF24::flush_rx(); // discard stale reports
+        bool tx_ok, tx_fail, rx_ready;
+        RF24::whatHappened(tx_ok, tx_fail, rx_ready);
+        try {
+            uint32_t progress_at = millis();
+            while (!complete && millis() - progress_at < timeout_ms) {
+                // read the receiver's reports (in ACK payloads)
+                while (RF24::available()) {
+                    uint8_t report[32];
+                    uint8_t length = RF24::getDynamicPayloadSize();
+                    if (!length)
+                        continue;
+                    RF24::read(report, length);
+                    if (length < STREAM_REPORT_SIZE || report[0] != token || load_u32(report + 2) < base)
+                        continue;
+                    if (!started || load_u32(report + 2) > base)
+                        progress_at = millis();
+                    started = true;
+                    base = load_u32(report + 2);
+                    received = load_u32(report + 6);
+                    complete = report[1] & STREAM_COMPLETE;
+                }
+                if (complete)
+                    break;
+
+                uint8_t status = read_register(NRF_STATUS);
+                if (status & _BV(MAX_RT)) {
+                    // the payloads in the TX FIFO will be reported missing
+                    RF24::flush_tx();
+                    RF24::whatHappened(tx_ok, tx_fail, rx_ready);
+                }
+                else if (status & _BV(TX_FULL))
+                    continue;
+
+                uint8_t packet[32];
+                uint8_t length = 3;
+                if (!started) {
+                    packet[0] = STREAM_START & 0xFF;
+                    packet[1] = STREAM_START >> 8;
+                    packet[2] = token;
+                }
+                else {
+                    // resend a chunk reported missing, or send a new chunk
+                    uint32_t chunk = next_chunk;
+                    for (uint32_t i = base; i < rf24_min(next_chunk, base + 33); ++i) {
+                        bool missing = i == base || !((received >> (i - base - 1)) & 1);
+                        if (missing && sends - last_sent[i % STREAM_WINDOW] > STREAM_RESEND_LAG) {
+                            chunk = i;
+                            break;
+                        }
+                    }
+                    if (chunk == next_chunk && !eof && next_chunk < base + STREAM_WINDOW) {
+                        lengths[chunk % STREAM_WINDOW] = static_cast<uint8_t>(input.fill(&window[(chunk % STREAM_WINDOW) * STREAM_CHUNK], STREAM_CHUNK));
+                        total += lengths[chunk % STREAM_WINDOW];
+                        if (lengths[chunk % STREAM_WINDOW])
+                            next_chunk++;
+                        eof = lengths[chunk % STREAM_WINDOW] < STREAM_CHUNK;
+                    }
+                    if (chunk == next_chunk && base < next_chunk)
+                        chunk = base; // nothing else to send; solicit another report
+                    if (chunk == next_chunk) {
+                        // all chunks were received
+                        packet[0] = STREAM_END & 0xFF;
+                        packet[1] = STREAM_END >> 8;
+                        store_u32(packet + 2, total);
+                        length = 6;
+                    }
+                    else {
+                        uint8_t slot = chunk % STREAM_WINDOW;
+                        packet[0] = chunk & 0xFF;
+                        packet[1] = (chunk >> 8) & 0x7F;
+                        memcpy(packet + 2, &window[slot * STREAM_CHUNK], lengths[slot]);
+                        length = static_cast<uint8_t>(lengths[slot] + 2);
+                        last_sent[slot] = sends;
+                    }
+                }
+                RF24::startFastWrite(packet, length, false);
+                sends++;
+            }
+        }
+        catch (...) {
+            RF24::flush_tx();
+            RF24::txStandBy();
+            if (was_listening)
+                RF24::startListening();
+            throw;
+        }
+        RF24::flush_tx();
+        RF24::txStandBy();
+        if (was_listening)
+            RF24::startListening();
+        return complete;
+    }
+
+    py::object recv_stream(py::object sink, uint32_t timeout_ms = 1000)
+    {
+        if (!RF24::dynamic_payloads_enabled || !RF24::ack_payloads_enabled)
+            throw std::runtime_error("streams need dynamic_payloads and ack_payloads to be enabled");
+        StreamSink output(sink);
+        bool have[STREAM_WINDOW] = {false};
+        int token = -1;    // the stream being received (-1 until a stream starts)
+        uint8_t reply = 0; // the pipe that receives the stream
+        uint32_t base = 0; // the first chunk not yet received
+        uint32_t total = 0;
+        bool ended = false, complete = false, changed = false;
+        {
+            SpiTransaction transaction(spi_mutex);
+            if (!(read_register(NRF_CONFIG) & _BV(PRIM_RX)))
+                RF24::startListening();
+            RF24::flush_tx(); // discard stale ACK payloads
+            uint32_t progress_at = millis();
+            while (!complete && millis() - progress_at < timeout_ms) {
+                uint8_t pipe = 7;
+                if (RF24::available(&pipe)) {
+                    uint8_t packet[32];
+                    uint8_t length = RF24::getDynamicPayloadSize();
+                    if (!length)
+                        continue;
+                    RF24::read(packet, length);
+                    if (length < 3)
+                        continue;
+                    uint16_t header = static_cast<uint16_t>(packet[0] | packet[1] << 8);
+                    if (header == STREAM_START) {
+                        if (packet[2] == token)
+                            continue;
+                        token = packet[2];
+                        reply = pipe;
+                        base = 0;
+                        ended = false;
+                        memset(have, 0, sizeof(have));
+                    }
+                    else if (token < 0)
+                        continue;
+                    else if (header == STREAM_END) {
+                        if (length < 6)
+                            continue;
+                        total = load_u32(packet + 2);
+                        ended = true;
+                    }
+                    else {
+                        // map the 15 bit sequence number to a chunk in the window
+                        uint32_t chunk = base + ((header - base) & 0x7FFF);
+                        if (chunk >= base + STREAM_WINDOW || have[chunk % STREAM_WINDOW])
+                            continue; // a duplicate
+                        if (!output.store(chunk, packet + 2, length - 2))
+                            throw py::value_error("the stream does not fit in the sink");
+                        have[chunk % STREAM_WINDOW] = true;
+                        while (have[base % STREAM_WINDOW]) {
+                            have[base % STREAM_WINDOW] = false;
+                            output.commit(base++);
+                        }
+                    }
+                    changed = true;
+                    progress_at = millis();
+                }
+                else if (token >= 0 && (read_register(FIFO_STATUS) & _BV(TX_EMPTY)))
+                    changed = true; // the report was sent; send it again with the next ACK
+
+                complete = ended && base >= (total + STREAM_CHUNK - 1) / STREAM_CHUNK;
+                if (changed && token >= 0) {
+                    uint8_t report[STREAM_REPORT_SIZE];
+                    report[0] = static_cast<uint8_t>(token);
+                    report[1] = complete ? STREAM_COMPLETE : 0;
+                    store_u32(report + 2, base);
+                    uint32_t bits = 0;
+                    for (uint32_t i = 0; i < 32; ++i) {
+                        if (have[(base + 1 + i) % STREAM_WINDOW])
+                            bits |= 1UL << i;
+                    }
+                    store_u32(report + 6, bits);
+                    RF24::flush_tx();
+                    // when complete, leave enough reports for the sender's retransmissions
+                    for (int copies = complete ? 3 : 1; copies > 0; --copies)
+                        RF24::writeAckPayload(reply, report, STREAM_REPORT_SIZE);
+                    changed = false;
+                }
+            }
+        }
+        output.flush();
+        if (!complete)
+            return py::none();
+        return py::int_(total);
+    }
+
+    std::string sprintfDetails()
+    {
+        char debug_info[870];
+        RF24::sprintfPrettyDetails(debug_info);
+        return std::string(debug_info);
+    }
+
+    py::bytes get_config()
+    {
+        uint8_t snapshot[CONFIG_SNAPSHOT_SIZE];
+        {
+            SpiTransaction transaction(spi_mutex);
+            read_config(snapshot);
+        }
+        return py::bytes(reinterpret_cast<char*>(snapshot), CONFIG_SNAPSHOT_SIZE);
+    }
+
+    uint8_t apply_config(py::buffer snapshot)
+    {
+        uint8_t target[CONFIG_SNAPSHOT_SIZE];
+        py::buffer_info info = get_buffer(snapshot);
+        if (get_buffer_len(info) != CONFIG_SNAPSHOT_SIZE)
+            throw py::value_error("a configuration snapshot must be " + std::to_string(CONFIG_SNAPSHOT_SIZE) + " bytes long");
+        memcpy(target, info.ptr, CONFIG_SNAPSHOT_SIZE);
+        SpiTransaction transaction(spi_mutex);
+        uint8_t changed = apply_snapshot(target);
+        invalidate_registers();
+        return changed;
+    }
+
+    void set_radiation(rf24_pa_dbm_e level, rf24_datarate_e speed, bool lna_enable = true)
+    {
+        RF24::setRadiation(level, speed, lna_enable);
+    }
+
+    /*********************************************************************************/
+    /* wrappers for python-like properties */
+
+    uint8_t get_address_width()
+    {
+        return RF24::addr_width;
+    }
+
+    bool is_ack_payloads_enabled()
+    {
+        return RF24::ack_payloads_enabled;
+    }
+
+    void toggle_ack_payloads(const bool enable)
+    {
+        if (enable)
+            RF24::enableAckPayload();
+        else
+            RF24::disableAckPayload();
+    }
+
+    bool is_dynamic_payloads_enabled()
+    {
+        return RF24::dynamic_payloads_enabled;
+    }
+
+    void dynamic_payloads(const bool enable)
+    {
+        if (enable)
+            RF24::enableDynamicPayloads();
+        else
+            RF24::disableDynamicPayloads();
+    }
+
+    bool isPowerUp()
+    {
+        return cached_register(NRF_CONFIG) & _BV(PWR_UP);
+    }
+
+    void set_pa_level(rf24_pa_dbm_e level)
+    {
+        RF24::setPALevel(level);
+    }
+
+    rf24_pa_dbm_e get_pa_level()
+    {
+        uint8_t ret_val = getPALevel();
+        if (ret_val == RF24_PA_MAX)
+            return RF24_PA_MAX;
+        if (ret_val == RF24_PA_HIGH)
+            return RF24_PA_HIGH;
+        if (ret_val == RF24_PA_LOW)
+            return RF24_PA_LOW;
+        // if (ret_val == RF24_PA_MIN)
+        return RF24_PA_MIN;
+    }
+
+    rf24_datarate_e get_data_rate()
+    {
+        uint8_t ret_val = getDataRate();
+        if (ret_val == RF24_2MBPS)
+            return RF24_2MBPS;
+        if (ret_val == RF24_1MBPS)
+            return RF24_1MBPS;
+        // if (ret_val == RF24_250KBPS)
+        return RF24_250KBPS;
+    }
+
+    void power(const bool enable)
+    {
+        if (enable)
+            powerUp();
+        else
+            powerDown();
+    }
+
+    bool isListening()
+    {
+        return cached_register(NRF_CONFIG) & _BV(PRIM_RX);
+    }
+
+    void listen(const bool enable)
+    {
+        if (enable)
+            startListening();
+        else
+            stopListening();
+    }
+
+private:
+    friend class RxDrainer;
+    friend class GroupRadio;
+
+    /** Serializes SPI transactions made from different python threads (see `SpiTransaction`). */
+    mutable std::mutex spi_mutex;
+
+    /** Is an `RxDrainer` draining this radio's RX FIFO? */
+    bool rx_worker_active = false;
+
+    /** The time that the RX FIFO was first observed holding a payload (0 if not observed). */
+    uint64_t rx_seen_ns = 0;
+    /** The `take_rx_timestamp()` of the last payload read by `read()` or `read_into()`. */
+    std::atomic<uint64_t> rx_timestamp {0};
+    /** The time that the last transmission was observed to complete. */
+    std::atomic<uint64_t> tx_timestamp {0};
+
+    /** Record the time that the RX FIFO was first observed holding a payload. Returns ``available``. */
+    bool observe_rx(bool available)
+    {
+        if (available && !rx_seen_ns)
+            rx_seen_ns = monotonic_ns();
+        return available;
+    }
+
+    /** Identifies the last stream sent (see `send_stream()`). */
+    uint8_t stream_token = static_cast<uint8_t>(monotonic_ns());
+
+    /** The ACK payload sources of each pipe (see `set_ack_payload_source()`). */
+    AckSource ack_sources[RX_PIPES];
+    /** Is an ACK payload source set for any pipe? */
+    bool ack_sources_active = false;
+
+    /**
+     * Take payloads from the ACK payload sources until each pipe has `ACK_STAGE_DEPTH`
+     * payloads staged. This must be called while the GIL is held.
+     */
+    AckBatch take_ack_payloads()
+    {
+        AckBatch acks;
+        if (!ack_sources_active)
+            return acks;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe) {
+            AckSource& feed = ack_sources[pipe];
+            size_t count = feed.staged_count;
+            while (count < ACK_STAGE_DEPTH && !feed.source.is_none()) {
+                py::object item;
+                if (feed.kind == AckSource::QUEUE) {
+                    if (feed.source.attr("empty")().cast<bool>())
+                        break;
+                    item = feed.source.attr("get_nowait")();
+                }
+                else if (feed.kind == AckSource::DEQUE) {
+                    if (!py::len(feed.source))
+                        break;
+                    item = feed.source.attr("popleft")();
+                }
+                else {
+                    PyObject* next = PyIter_Next(feed.source.ptr());
+                    if (!next) {
+                        if (PyErr_Occurred())
+                            throw py::error_already_set();
+                        feed.source = py::none(); // the iterator is exhausted
+                        break;
+                    }
+                    item = py::reinterpret_steal<py::object>(next);
+                }
+                if (!PyObject_CheckBuffer(item.ptr()))
+                    throw py::type_error("ACK payloads must be bytes-like objects");
+                py::buffer_info info = get_buffer(py::reinterpret_borrow<py::buffer>(item));
+                const uint8_t* data = static_cast<const uint8_t*>(info.ptr);
+                uint8_t length = get_payload_len(info);
+                if (length) {
+                    acks.emplace_back(pipe, std::vector<uint8_t>(data, data + length));
+                    count++;
+                }
+            }
+        }
+        return acks;
+    }
+
+    /** Stage the payloads returned by `take_ack_payloads()`. The SPI mutex must be locked. */
+    void stage_ack_payloads(AckBatch& acks)
+    {
+        for (auto& ack : acks) {
+            AckSource& feed = ack_sources[ack.first];
+            if (!feed.enabled)
+                continue; // the source was removed meanwhile
+            feed.staged.push_back(std::move(ack.second));
+            feed.staged_count++;
+        }
+    }
+
+    /**
+     * Upload staged ACK payloads until the TX FIFO is full. The pipe with the fewest ACK
+     * payloads in the TX FIFO goes first. The SPI mutex must be locked.
+     */
+    void upload_ack_payloads()
+    {
+        if (!ack_sources_active)
+            return;
+        while (true) {
+            uint8_t fifo = read_register(FIFO_STATUS);
+            if ((fifo & _BV(TX_EMPTY)) && (fifo & _BV(RX_EMPTY))) {
+                // every ACK payload was attached to a payload that was already read (or was flushed)
+                for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+                    ack_sources[pipe].loaded = 0;
+            }
+            if (fifo & _BV(FIFO_FULL))
+                return;
+            AckSource* next = NULL;
+            uint8_t next_pipe = 0;
+            for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe) {
+                AckSource& feed = ack_sources[pipe];
+                if (!feed.staged.empty() && (!next || feed.loaded < next->loaded)) {
+                    next = &feed;
+                    next_pipe = pipe;
+                }
+            }
+            if (!next)
+                return;
+            std::vector<uint8_t>& payload = next->staged.front();
+            RF24::writeAckPayload(next_pipe, payload.data(), static_cast<uint8_t>(payload.size()));
+            next->staged.pop_front();
+            next->staged_count--;
+            next->loaded++;
+        }
+    }
+
+    /** The pipe number of the payload at the top of the RX FIFO. */
+    uint8_t rx_pipe()
+    {
+        return (read_register(NRF_STATUS) >> RX_P_NO) & 0x07;
+    }
+
+    /**
+     * Account for the ACK payload that was attached to the payload just read from ``pipe``,
+     * then top up the TX FIFO. The SPI mutex must be locked.
+     */
+    void ack_payload_consumed(uint8_t pipe)
+    {
+        if (!ack_sources_active || pipe >= RX_PIPES)
+            return;
+        AckSource& feed = ack_sources[pipe];
+        if (feed.loaded) {
+            feed.loaded--;
+            feed.sent++;
+        }
+        else if (feed.enabled)
+            feed.underruns++;
+        upload_ack_payloads();
+    }
+
+    /**
+     * Fetch the next available payload (from the given ``pipe``) into a record of
+     * `RX_RECORD_SIZE` bytes (as described in `read_all()`).
+     *
+     * Returns false if a corrupt dynamic payload was discarded (nothing is written).
+     */
+    bool read_record(uint8_t* record, uint8_t pipe)
+    {
+        uint64_t timestamp = take_rx_timestamp();
+        uint8_t length = RF24::dynamic_payloads_enabled ? RF24::getDynamicPayloadSize() : RF24::getPayloadSize();
+        if (!length)
+            return false;
+        memset(record, 0, RX_RECORD_SIZE);
+        record[0] = pipe;
+        record[1] = length;
+        memcpy(record + 8, &timestamp, sizeof(timestamp));
+        RF24::read(record + RX_RECORD_PAYLOAD, length);
+        ack_payload_consumed(pipe);
+        return true;
+    }
+
+    /** Read the registers listed in `CONFIG_REGISTERS` into a snapshot. */
+    void read_config(uint8_t* snapshot)
+    {
+        uint8_t* entry = snapshot;
+        for (uint8_t reg : CONFIG_REGISTERS) {
+            if (config_register_size(reg) > 1)
+                RF24::read_register(reg, entry, 5);
+            else
+                *entry = RF24::read_register(reg);
+            entry += config_register_size(reg);
+        }
+        // bytes beyond the address width are not part of the addresses
+        const uint8_t width = static_cast<uint8_t>((snapshot[CFG_SETUP_AW] & 3) + 2);
+        if (width < 5) {
+            for (uint8_t offset : {CFG_RX_ADDR_P0, CFG_RX_ADDR_P1, CFG_TX_ADDR})
+                memset(snapshot + offset + width, 0, 5 - width);
+        }
+    }
+
+    /**
+     * Make the radio's configuration match a snapshot (see `read_config()`), using the RF24
+     * API, so the RF24 object's cached state stays consistent. Only the settings that differ
+     * are written. Returns the number of registers that differed.
+     */
+    uint8_t apply_snapshot(const uint8_t* target)
+    {
+        uint8_t current[CONFIG_SNAPSHOT_SIZE];
+        read_config(current);
+        uint8_t changed = 0;
+        uint8_t offset = 0;
+        for (uint8_t reg : CONFIG_REGISTERS) {
+            uint8_t size = config_register_size(reg);
+            changed += memcmp(target + offset, current + offset, size) != 0;
+            offset += size;
+        }
+        if (!changed)
+            return 0;
+
+        const uint8_t config_diff = target[CFG_CONFIG] ^ current[CFG_CONFIG];
+        if (config_diff & (_BV(EN_CRC) | _BV(CRCO))) {
+            if (!(target[CFG_CONFIG] & _BV(EN_CRC)))
+                RF24::disableCRC();
+            else
+                RF24::setCRCLength(target[CFG_CONFIG] & _BV(CRCO) ? RF24_CRC_16 : RF24_CRC_8);
+        }
+        if (config_diff & (_BV(MASK_RX_DR) | _BV(MASK_TX_DS) | _BV(MASK_MAX_RT)))
+            RF24::maskIRQ(target[CFG_CONFIG] & _BV(MASK_TX_DS), target[CFG_CONFIG] & _BV(MASK_MAX_RT), target[CFG_CONFIG] & _BV(MASK_RX_DR));
+        if (target[CFG_SETUP_AW] != current[CFG_SETUP_AW])
+            RF24::setAddressWidth(static_cast<uint8_t>((target[CFG_SETUP_AW] & 3) + 2));
+        if (target[CFG_SETUP_RETR] != current[CFG_SETUP_RETR])
+            RF24::setRetries(target[CFG_SETUP_RETR] >> ARD, target[CFG_SETUP_RETR] & 0x0F);
+        if (target[CFG_RF_CH] != current[CFG_RF_CH])
+            RF24::setChannel(target[CFG_RF_CH]);
+        const uint8_t rf_setup = target[CFG_RF_SETUP];
+        if ((rf_setup ^ current[CFG_RF_SETUP]) & (_BV(RF_DR_LOW) | _BV(RF_DR_HIGH)))
+            RF24::setDataRate(rf_setup & _BV(RF_DR_LOW) ? RF24_250KBPS : (rf_setup & _BV(RF_DR_HIGH) ? RF24_2MBPS : RF24_1MBPS));
+        if ((rf_setup ^ current[CFG_RF_SETUP]) & 0x07)
+            RF24::setPALevel(static_cast<uint8_t>((rf_setup >> 1) & 3), rf_setup & 1);
+
+        for (uint8_t pipe = 0; pipe < 6; ++pipe) {
+            if ((target[CFG_EN_AA] ^ current[CFG_EN_AA]) & _BV(pipe))
+                RF24::setAutoAck(pipe, target[CFG_EN_AA] & _BV(pipe));
+        }
+        // setAutoAck() may have disabled ACK payloads
+        const uint8_t feature = target[CFG_FEATURE];
+        if (feature != RF24::read_register(FEATURE) || target[CFG_DYNPD] != RF24::read_register(DYNPD)) {
+            RF24::disableDynamicPayloads();
+            // the RF24 API enables dynamic payloads on all pipes, or on pipes 0 & 1 for ACK payloads
+            if (feature & _BV(EN_DPL) && (!(feature & _BV(EN_ACK_PAY)) || target[CFG_DYNPD] & ~(_BV(DPL_P0) | _BV(DPL_P1))))
+                RF24::enableDynamicPayloads();
+            if (feature & _BV(EN_ACK_PAY))
+                RF24::enableAckPayload();
+            if (feature & _BV(EN_DYN_ACK))
+                RF24::enableDynamicAck();
+        }
+        if (memcmp(target + CFG_RX_PW_P0, current + CFG_RX_PW_P0, 6))
+            RF24::setPayloadSize(target[CFG_RX_PW_P0]); // the RF24 API uses the same size for all pipes
+
+        const uint8_t width = RF24::addr_width;
+        if (memcmp(target + CFG_TX_ADDR, current + CFG_TX_ADDR, width)) {
+            RF24::openWritingPipe(target + CFG_TX_ADDR); // this also writes pipe 0's address
+            memcpy(current + CFG_RX_ADDR_P0, target + CFG_TX_ADDR, width);
+        }
+        for (uint8_t pipe = 1; pipe < 6; ++pipe) {
+            const uint8_t offset = pipe == 1 ? static_cast<uint8_t>(CFG_RX_ADDR_P1) : static_cast<uint8_t>(CFG_RX_ADDR_P2 + pipe - 2);
+            const bool enable = target[CFG_EN_RXADDR] & _BV(pipe);
+            bool enabled = current[CFG_EN_RXADDR] & _BV(pipe);
+            // pipes 2-5 only have the LSB (they share the upper bytes of pipe 1's address)
+            const bool differs = memcmp(target + offset, current + offset, pipe == 1 ? width : 1) != 0;
+            // a disabled pipe's address is restored as well (the pipe is closed again below)
+            if ((enable && !enabled) || differs) {
+                RF24::openReadingPipe(pipe, target + offset);
+                enabled = true;
+            }
+            if (!enable && enabled)
+                RF24::closeReadingPipe(pipe);
+        }
+
+        // pipe 0 is also used to receive automatic acknowledgements in TX mode
+        const bool listen = target[CFG_CONFIG] & _BV(PRIM_RX);
+        const bool listening = current[CFG_CONFIG] & _BV(PRIM_RX);
+        const bool pipe0 = target[CFG_EN_RXADDR] & _BV(ERX_P0);
+        if (listen) {
+            // startListening() restores (or closes) pipe 0, as it was opened (or closed) here
+            if (pipe0 && (!listening || !(current[CFG_EN_RXADDR] & _BV(ERX_P0)) || memcmp(target + CFG_RX_ADDR_P0, current + CFG_RX_ADDR_P0, width)))
+                RF24::openReadingPipe(0, target + CFG_RX_ADDR_P0);
+            else if (!pipe0 && (!listening || current[CFG_EN_RXADDR] & _BV(ERX_P0)))
+                RF24::closeReadingPipe(0);
+            if (!listening)
+                RF24::startListening();
+            if (!pipe0) { // a disabled pipe's address is restored as well
+                uint8_t address[5];
+                RF24::read_register(RX_ADDR_P0, address, width);
+                if (memcmp(target + CFG_RX_ADDR_P0, address, width)) {
+                    RF24::openReadingPipe(0, target + CFG_RX_ADDR_P0);
+                    RF24::closeReadingPipe(0);
+                }
+            }
+        }
+        else {
+            if (listening)
+                RF24::stopListening();
+            uint8_t address[5];
+            RF24::read_register(RX_ADDR_P0, address, width);
+            if (memcmp(target + CFG_RX_ADDR_P0, address, width)) {
+                if (memcmp(target + CFG_RX_ADDR_P0, target + CFG_TX_ADDR, width))
+                    RF24::openReadingPipe(0, target + CFG_RX_ADDR_P0);
+                else
+                    RF24::openWritingPipe(target + CFG_TX_ADDR);
+            }
+            if (!pipe0 && (RF24::read_register(EN_RXADDR) & _BV(ERX_P0)))
+                RF24::closeReadingPipe(0);
+        }
+
+        const bool powered = RF24::read_register(NRF_CONFIG) & _BV(PWR_UP);
+        if (target[CFG_CONFIG] & _BV(PWR_UP) && !powered)
+            RF24::powerUp();
+        else if (!(target[CFG_CONFIG] & _BV(PWR_UP)) && powered)
+            RF24::powerDown();
+        return changed;
+    }
+
+    /** Are getters served from the register shadow? */
+    bool register_cache = false;
+    /** The last known values of the `SHADOW_REGISTERS` (indexed by register address). */
+    uint8_t shadow[FEATURE + 1] = {0};
+    /** A bit mask (indexed by register address) of the up-to-date `shadow` entries. */
+    uint32_t shadow_valid = 0;
+    /** The number of register reads that were served from the register shadow. */
+    std::atomic<uint64_t> spi_reads_saved {0};
+    /** The instrumentation of frequently called methods (see `get_stats_snapshot()`). */
+    RadioStats stats;
+
+    /**
+     * Read one of the `SHADOW_REGISTERS`, from the register shadow if possible. The
+     * register is fetched over SPI if the shadow is disabled or its entry was invalidated.
+     */
+    uint8_t cached_register(uint8_t reg)
+    {
+        if (register_cache && (shadow_valid & (1UL << reg))) {
+            spi_reads_saved++;
+            return shadow[reg];
+        }
+        uint8_t value = read_register(reg);
+        if (register_cache) {
+            shadow[reg] = value;
+            shadow_valid |= 1UL << reg;
+        }
+        return value;
+    }
+
+    /** A file descriptor that becomes readable when the IRQ pin is asserted (or -1). */
+    int irq_fd = -1;
+    /** Is `irq_fd` closed by `detach_irq()`? */
+    bool irq_fd_owned = false;
+
+    /**
+     * Wait up to ``timeout_ms`` for the IRQ pin to be asserted (or for ``wake_fd`` to become
+     * readable). This must be called while the GIL is released.
+     *
+     * If no `irq_fd` is configured (or the IRQ pin is already asserted, so no new edge can be
+     * detected), this sleeps instead. The sleep's interval doubles each time (starting at
+     * `IRQ_POLL_MIN_US` and capped at `IRQ_POLL_MAX_US`).
+     */
+    void wait_for_edge(uint32_t timeout_ms, uint32_t& backoff_us, bool asserted, int wake_fd = -1)
+    {
+        struct pollfd fds[2];
+        nfds_t count = 0;
+        struct timespec timeout;
+        if (irq_fd >= 0 && !asserted) {
+            fds[count++] = {irq_fd, POLLIN, 0};
+            timeout = {static_cast<time_t>(timeout_ms / 1000), static_cast<long>(timeout_ms % 1000) * 1000000L};
+        }
+        else {
+            uint32_t sleep_us = rf24_min(backoff_us, timeout_ms * 1000);
+            timeout = {static_cast<time_t>(sleep_us / 1000000), static_cast<long>(sleep_us % 1000000) * 1000L};
+            backoff_us = rf24_min(backoff_us * 2, static_cast<uint32_t>(IRQ_POLL_MAX_US));
+        }
+        if (wake_fd >= 0)
+            fds[count++] = {wake_fd, POLLIN, 0};
+        if (!count) {
+            nanosleep(&timeout, NULL);
+            return;
+        }
+        if (ppoll(fds, count, &timeout, NULL) <= 0)
+            return;
+        for (nfds_t i = 0; i < count; ++i) {
+            if (fds[i].revents & POLLIN) {
+                // consume the event (a struct gpioevent_data or an eventfd's counter)
+                char event[sizeof(struct gpioevent_data)];
+                if (::read(fds[i].fd, event, fds[i].fd == wake_fd ? sizeof(uint64_t) : sizeof(event)) < 0)
+                    return;
+            }
+        }
+    }
+
+    /**
+     * Stream the given payloads while keeping the TX FIFO as full as possible.
+     *
+     * The number of payloads that have left the TX FIFO is tracked using the TX_DS flag and the
+     * FIFO_STATUS register. Both only give a lower bound when the FIFO is neither empty nor full,
+     * so the count may lag until the next poll that can resolve it. A payload that reaches the
+     * maximum number of retries is re-sent (using REUSE_TX_PL) until it is acknowledged or
+     * ``timeout_ms`` elapses without progress. Then it is discarded and the payloads queued
+     * behind it are re-uploaded.
+     *
+     * Returns one byte per payload: the highest ARC observed while the payload was in flight,
+     * or ``0xFF`` if it could not be delivered.
+     */
+    py::bytearray write_payloads(const std::vector<std::pair<const uint8_t*, uint8_t>>& payloads, const bool multicast, uint32_t timeout_ms)
+    {
+        std::string results(payloads.size(), static_cast<char>(0xFF));
+        if (!payloads.empty()) {
+            SpiTransaction transaction(spi_mutex);
+            transmit_payloads(payloads, multicast, timeout_ms, reinterpret_cast<uint8_t*>(&results[0]));
+        }
+        return py::bytearray(results);
+    }
+
+    /**
+     * The part of `write_payloads()` that talks to the radio. The SPI mutex must be locked (no
+     * python objects are touched). ``results`` receives one byte per payload.
+     */
+    void transmit_payloads(const std::vector<std::pair<const uint8_t*, uint8_t>>& payloads, const bool multicast, uint32_t timeout_ms, uint8_t* results)
+    {
+        const size_t count = payloads.size();
+        memset(results, 0xFF, count);
+        if (!count)
+            return;
+        size_t done = 0;   // number of payloads that left the TX FIFO
+        size_t loaded = 0; // number of payloads uploaded to the TX FIFO
+        bool reusing = false;
+        uint8_t arc = 0;
+        uint32_t timer = millis();
+        // a TX_DS flag left over from before (e.g. by tx_standby()) would be counted as a payload
+        bool tx_ds = false, tx_df = false, rx_dr = false;
+        RF24::whatHappened(tx_ds, tx_df, rx_dr);
+        while (done < count) {
+            while (!reusing && loaded < count && loaded - done < 3) {
+                const std::pair<const uint8_t*, uint8_t>& payload = payloads[loaded++];
+                RF24::startFastWrite(payload.first, payload.second, multicast);
+            }
+
+            // read FIFO_STATUS before clearing the flags, so no TX_DS event goes unaccounted
+            uint8_t fifo = read_register(FIFO_STATUS);
+            RF24::whatHappened(tx_ds, tx_df, rx_dr);
+            uint8_t observed = RF24::getARC();
+            arc = rf24_max(arc, observed);
+
+            size_t finished = done + (tx_ds ? 1 : 0);
+            if (!reusing) {
+                size_t pending = loaded - done; // an upper bound
+                if (fifo & _BV(TX_EMPTY))
+                    pending = 0;
+                else if (!(fifo & _BV(TX_FULL)))
+                    pending = rf24_min(pending, static_cast<size_t>(2));
+                finished = rf24_max(finished, loaded - pending);
+            }
+
+            if (finished > done) {
+                while (done < finished)
+                    results[done++] = arc;
+                arc = 0;
+                timer = millis();
+                if (reusing) {
+                    // REUSE_TX_PL stays active until a payload is uploaded or the TX FIFO is flushed
+                    RF24::flush_tx();
+                    loaded = done;
+                    reusing = false;
+                }
+            }
+            else if (millis() - timer > timeout_ms) {
+                // give up on the payload at the top of the TX FIFO
+                RF24::flush_tx();
+                done++;
+                loaded = done;
+                reusing = false;
+                arc = 0;
+                timer = millis();
+            }
+            else if (tx_df) {
+                reusing = true;
+                RF24::reUseTX();
+            }
+        }
+        RF24::txStandBy();
+        stamp_tx(true);
+    }
+};
+
+/**
+ * A `SpiTransaction` for calls that may change the radio's configuration. The radio's register
+ * shadow is invalidated when the transaction ends (the lock is still held at that point).
+ */
+class ConfigTransaction
+{
+public:
+    explicit ConfigTransaction(RF24Wrapper& _radio) : radio(_radio), transaction(_radio.get_spi_mutex())
+    {
+    }
+
+    ~ConfigTransaction()
+    {
+        radio.invalidate_registers();
+    }
+
+private:
+    RF24Wrapper& radio;
+    SpiTransaction transaction;
+};
+
+/**
+ * Like `spi_call()`, but the call is made within a `ConfigTransaction`. The ``Wrapper`` class
+ * must implement ``RF24Wrapper& get_radio()``.
+ */
+template<typename Wrapper, typename Return, typename Class, typename... Args>
+std::function<Return(Wrapper&, Args...)> config_call(Return (Class::*method)(Args...))
+{
+    return [method](Wrapper& self, Args... args) -> Return {
+        ConfigTransaction transaction(self.get_radio());
+        return (self.*method)(args...);
+    };
+}
+
+/** Did an instrumented call succeed? (see `stats_call()`) */
+inline bool stats_success(bool result)
+{
+    return result;
+}
+
+inline bool stats_success(const std::tuple<bool, uint8_t>& result)
+{
+    return std::get<0>(result);
+}
+
+/**
+ * Like `spi_call()`, but the call is measured as a ``measured`` call (see `RadioStats`). The
+ * ``Wrapper`` class must implement ``RadioStats& get_stats()``.
+ */
+template<typename Wrapper, typename Return, typename Class, typename... Args>
+std::function<Return(Wrapper&, Args...)> stats_call(RadioStats::Method measured, Return (Class::*method)(Args...))
+{
+    return [measured, method](Wrapper& self, Args... args) -> Return {
+        StatsScope scope(self.get_stats(), measured);
+        SpiTransaction transaction(self.get_spi_mutex());
+        scope.locked();
+        Return result = (self.*method)(args...);
+        scope.result(stats_success(result));
+        return result;
+    };
+}
+
+/**
+ * A ring buffer of records (as described in `RF24Wrapper::read_all()`).
+ *
+ * The ring buffer has a single producer (an `RxDrainer` thread) and a single consumer (the
+ * python thread that calls `take()`), so it is synchronized with atomic indices only. One slot
+ * is always left empty to tell a full ring from an empty ring.
+ */
+class RecordRing
+{
+public:
+    explicit RecordRing(size_t capacity)
+        : slots(capacity + 1), ring(slots * RX_RECORD_SIZE), head(0), tail(0)
+    {
+    }
+
+    size_t get_capacity() const
+    {
+        return slots - 1;
+    }
+
+    size_t pending() const
+    {
+        size_t first = tail.load(std::memory_order_relaxed);
+        size_t last = head.load(std::memory_order_acquire);
+        return (last + slots - first) % slots;
+    }
+
+    /** The slot that the next record is written to, or NULL if the ring is full (producer only). */
+    uint8_t* reserve()
+    {
+        size_t slot = head.load(std::memory_order_relaxed);
+        if ((slot + 1) % slots == tail.load(std::memory_order_acquire))
+            return NULL;
+        return &ring[slot * RX_RECORD_SIZE];
+    }
+
+    /** Publish the record written to the slot returned by `reserve()` (producer only). */
+    void commit()
+    {
+        head.store((head.load(std::memory_order_relaxed) + 1) % slots, std::memory_order_release);
+    }
+
+    /**
+     * Move up to ``max_n`` records (``0`` moves none) into ``out``, which must have room for
+     * ``max_n`` records. Returns the number of records moved.
+     */
+    size_t take_into(uint8_t* out, size_t max_n)
+    {
+        size_t first = tail.load(std::memory_order_relaxed);
+        size_t count = rf24_min(pending(), max_n);
+        if (!count)
+            return 0;
+        size_t contiguous = rf24_min(count, slots - first);
+        memcpy(out, &ring[first * RX_RECORD_SIZE], contiguous * RX_RECORD_SIZE);
+        memcpy(out + contiguous * RX_RECORD_SIZE, &ring[0], (count - contiguous) * RX_RECORD_SIZE);
+        tail.store((first + count) % slots, std::memory_order_release);
+        return count;
+    }
+
+    /** Move up to ``max_n`` records (``0`` means all) into a new `bytearray`. */
+    py::bytearray take(size_t max_n = 0)
+    {
+        size_t count = pending();
+        if (max_n)
+            count = rf24_min(count, max_n);
+        uint8_t* out;
+        py::bytearray result = allocate(count, out);
+        if (count) // an empty bytearray has no buffer of its own
+            take_into(out, count);
+        return result;
+    }
+
+    /**
+     * Move up to ``max_each`` records (``0`` means all) from each of the ``rings`` into one
+     * `bytearray`. The rings take turns, one record at a time, until each ring's quota is
+     * exhausted.
+     */
+    static py::bytearray take_round_robin(const std::vector<RecordRing*>& rings, size_t max_each = 0)
+    {
+        std::vector<size_t> quota(rings.size());
+        size_t count = 0;
+        for (size_t i = 0; i < rings.size(); ++i) {
+            quota[i] = rings[i]->pending();
+            if (max_each)
+                quota[i] = rf24_min(quota[i], max_each);
+            count += quota[i];
+        }
+        uint8_t* out;
+        py::bytearray result = allocate(count, out);
+        while (count) {
+            for (size_t i = 0; i < rings.size(); ++i) {
+                if (!quota[i])
+                    continue;
+                out += rings[i]->take_into(out, 1) * RX_RECORD_SIZE;
+                quota[i]--;
+                count--;
+            }
+        }
+        return result;
+    }
+
+private:
+    /** Create a `bytearray` of ``count`` records (uninitialized); ``out`` is set to its contents. */
+    static py::bytearray allocate(size_t count, uint8_t*& out)
+    {
+        PyObject* result = PyByteArray_FromStringAndSize(NULL, static_cast<Py_ssize_t>(count * RX_RECORD_SIZE));
+        if (!result)
+            throw py::error_already_set();
+        out = reinterpret_cast<uint8_t*>(PyByteArray_AS_STRING(result));
+        return py::reinterpret_steal<py::bytearray>(result);
+    }
+
+private:
+    const size_t slots;
+    std::vector<uint8_t> ring;
+    /** The next slot that the producer writes to. */
+    std::atomic<size_t> head;
+    /** The next slot that the consumer reads from. */
+    std::atomic<size_t> tail;
+};
+
+/**
+ * Lets python threads wait (with the GIL released) for a notification from a native thread.
+ */
+class WakeSignal
+{
+public:
+    void notify()
+    {
+        // lock the mutex, so the notification cannot slip in between wait()'s check and its sleep
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+        }
+        condition.notify_all();
+    }
+
+    /** Wait until ``ready()`` returns true (checked after each notification) or ``timeout_ms`` elapses. */
+    template<typename Predicate>
+    bool wait(uint32_t timeout_ms, Predicate ready)
+    {
+        py::gil_scoped_release release;
+        std::unique_lock<std::mutex> lock(mutex);
+        return condition.wait_for(lock, std::chrono::milliseconds(timeout_ms), ready);
+    }
+
+private:
+    std::mutex mutex;
+    std::condition_variable condition;
+};
+
+/**
+ * The base of native threads that service a radio: they drain its RX FIFO (see `RxWorker`,
+ * `Multiceiver` and `GroupRadio`) and may transmit queued payloads (see `transmit()`).
+ *
+ * Derived classes decide where each payload's record is stored (see `reserve()`), then call
+ * `start()` at the end of their constructor and `join()` in their destructor (the thread calls
+ * their virtual methods, so it must be stopped before they are destroyed).
+ */
+class RxDrainer
+{
+public:
+    virtual ~RxDrainer()
+    {
+        join();
+        if (wake_fd >= 0)
+            close(wake_fd);
+    }
+
+    void stop()
+    {
+        {
+            py::gil_scoped_release release;
+            join();
+        }
+        if (!failure.empty())
+            throw std::runtime_error(failure);
+    }
+
+    bool is_running()
+    {
+        return running;
+    }
+
+    uint64_t get_fifo_full()
+    {
+        return fifo_full;
+    }
+
+    RF24Wrapper& get_radio()
+    {
+        return radio;
+    }
+
+    /** Interrupt the thread's wait for the IRQ pin (so that it calls `transmit()` sooner). */
+    void wake()
+    {
+        uint64_t one = 1;
+        if (::write(wake_fd, &one, sizeof(one)) < 0)
+            return; // the counter can only overflow if the thread isn't consuming it
+    }
+
+protected:
+    RF24Wrapper& radio;
+    std::atomic<bool> running;
+
+    explicit RxDrainer(RF24Wrapper& _radio)
+        : radio(_radio), running(false), fifo_full(0), wake_fd(-1)
+    {
+    }
+
+    /** Start the thread. Raises `RuntimeError` if another thread already drains the radio's RX FIFO. */
+    void start()
+    {
+        if (radio.rx_worker_active)
+            throw std::runtime_error("an RX worker is already running for this radio");
+        wake_fd = eventfd(0, EFD_CLOEXEC | EFD_NONBLOCK);
+        if (wake_fd < 0)
+            throw std::system_error(errno, std::generic_category(), "eventfd");
+        radio.rx_worker_active = true;
+        running = true;
+        thread = std::thread(&RxDrainer::run, this);
+    }
+
+    void join()
+    {
+        running = false;
+        if (thread.joinable()) {
+            thread.join();
+            radio.rx_worker_active = false;
+        }
+        stopped();
+    }
+
+    /**
+     * The slot that the record of a payload received on ``pipe`` is written to, or NULL to
+     * discard the payload. Called while the radio's SPI mutex is locked.
+     */
+    virtual uint8_t* reserve(uint8_t pipe)
+    {
+        (void)pipe;
+        return NULL;
+    }
+
+    /** Publish the record written to the slot returned by `reserve()`. */
+    virtual void commit(uint8_t pipe)
+    {
+        (void)pipe;
+    }
+
+    /** Called when a payload received on ``pipe`` was discarded because `reserve()` returned NULL. */
+    virtual void overrun(uint8_t pipe)
+    {
+        (void)pipe;
+    }
+
+    /**
+     * Fetch the payloads in the RX FIFO (using `reserve()`, `commit()` & `overrun()`). Called
+     * while the radio's SPI mutex is locked. Returns true if anything was fetched.
+     */
+    virtual bool drain()
+    {
+        bool fetched = false;
+        uint8_t pipe = 0;
+        while (radio.available(&pipe)) {
+            uint8_t* slot = reserve(pipe);
+            // payloads are fetched even if there is no room, so the RX FIFO doesn't overflow
+            if (!radio.read_record(slot ? slot : discarded, pipe))
+                continue;
+            fetched = true;
+            if (slot)
+                commit(pipe);
+            else
+                overrun(pipe);
+        }
+        return fetched;
+    }
+
+    /**
+     * Transmit queued payloads (if any). Called after `drain()` while the radio's SPI mutex is
+     * locked. Returns true if more payloads are queued (so the thread doesn't wait).
+     */
+    virtual bool transmit()
+    {
+        return false;
+    }
+
+    /** Called after payloads were fetched (the radio's SPI mutex is no longer locked). */
+    virtual void drained() {}
+
+    /** Called when the thread is stopped (or was never started). */
+    virtual void stopped() {}
+
+private:
+    std::atomic<uint64_t> fifo_full;
+    std::thread thread;
+    /** The error that stopped the thread (if any). Only read after the thread is joined. */
+    std::string failure;
+    /** An eventfd that interrupts the thread's wait (see `wake()`). */
+    int wake_fd;
+    /** The record of a payload discarded by `drain()`. */
+    uint8_t discarded[RX_RECORD_SIZE];
+
+    void run()
+    {
+        uint32_t backoff_us = IRQ_POLL_MIN_US;
+        try {
+            while (running) {
+                bool fetched, busy, asserted;
+                {
+                    std::lock_guard<std::mutex> lock(radio.spi_mutex);
+                    if (radio.rxFifoFull())
+                        fifo_full++; // the radio may have dropped payloads since the last check
+                    fetched = drain();
+                    busy = transmit();
+                    asserted = radio.read_register(NRF_STATUS) & (_BV(RX_DR) | _BV(TX_DS) | _BV(MAX_RT));
+                }
+                if (fetched) {
+                    backoff_us = IRQ_POLL_MIN_US;
+                    drained();
+                }
+                if (!busy)
+                    radio.wait_for_edge(RX_WORKER_WAIT_MS, backoff_us, asserted, wake_fd);
+            }
+        }
+        catch (const std::exception& exc) {
+            // exceptions cannot propagate out of the thread; stop() raises it instead
+            failure = exc.what();
+            running = false;
+            stopped();
+        }
+    }
+};
+
+/**
+ * A native thread that drains a radio's RX FIFO into a `RecordRing`.
+ */
+class RxWorker : public RxDrainer
+{
+public:
+    RxWorker(RF24Wrapper& _radio, size_t capacity)
+        : RxDrainer(_radio), ring(capacity), received(0), ring_overruns(0)
+    {
+        if (!capacity)
+            throw py::value_error("capacity must be greater than 0");
+        start();
+    }
+
+    ~RxWorker()
+    {
+        join();
+    }
+
+    size_t get_capacity()
+    {
+        return ring.get_capacity();
+    }
+
+    size_t pending()
+    {
+        return ring.pending();
+    }
+
+    py::bytearray take(size_t max_n = 0)
+    {
+        radio.refill_ack_payloads();
+        return ring.take(max_n);
+    }
+
+    uint64_t get_received()
+    {
+        return received;
+    }
+
+    uint64_t get_ring_overruns()
+    {
+        return ring_overruns;
+    }
+
+protected:
+    uint8_t* reserve(uint8_t pipe) override
+    {
+        (void)pipe;
+        return ring.reserve();
+    }
+
+    void commit(uint8_t pipe) override
+    {
+        (void)pipe;
+        ring.commit();
+        received++;
+    }
+
+    void overrun(uint8_t pipe) override
+    {
+        (void)pipe;
+        ring_overruns++;
+    }
+
+private:
+    RecordRing ring;
+    std::atomic<uint64_t> received;
+    std::atomic<uint64_t> ring_overruns;
+};
+
+/**
+ * A native thread that drains a radio's RX FIFO into one `RecordRing` per pipe, so a busy pipe
+ * cannot crowd out the payloads of the other pipes.
+ */
+class Multiceiver : public RxDrainer
+{
+public:
+    Multiceiver(RF24Wrapper& _radio, size_t capacity)
+        : RxDrainer(_radio)
+    {
+        if (!capacity)
+            throw py::value_error("capacity must be greater than 0");
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe) {
+            rings[pipe].reset(new RecordRing(capacity));
+            received[pipe] = 0;
+            dropped[pipe] = 0;
+        }
+        start();
+    }
+
+    ~Multiceiver()
+    {
+        join();
+    }
+
+    size_t get_capacity()
+    {
+        return rings[0]->get_capacity();
+    }
+
+    size_t pending_total()
+    {
+        size_t total = 0;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+            total += rings[pipe]->pending();
+        return total;
+    }
+
+    py::list get_pending()
+    {
+        py::list result;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+            result.append(rings[pipe]->pending());
+        return result;
+    }
+
+    py::list get_received()
+    {
+        return counters(received);
+    }
+
+    py::list get_dropped()
+    {
+        return counters(dropped);
+    }
+
+    py::bytearray take(uint8_t pipe, size_t max_n = 0)
+    {
+        radio.refill_ack_payloads();
+        return rings[check_pipe(pipe)]->take(max_n);
+    }
+
+    /**
+     * Move up to ``max_per_pipe`` records (``0`` means all) from every pipe into one `bytearray`.
+     * The pipes take turns, one record at a time, until each pipe's quota is exhausted.
+     */
+    py::bytearray take_all(size_t max_per_pipe = 0)
+    {
+        radio.refill_ack_payloads();
+        std::vector<RecordRing*> all;
+        for (std::unique_ptr<RecordRing>& ring : rings)
+            all.push_back(ring.get());
+        return RecordRing::take_round_robin(all, max_per_pipe);
+    }
+
+    void set_callback(uint8_t pipe, py::object callback)
+    {
+        if (!callback.is_none() && !PyCallable_Check(callback.ptr()))
+            throw py::type_error("callback must be callable or None");
+        callbacks[check_pipe(pipe)] = callback;
+    }
+
+    /**
+     * Call each pipe's callback with a batch of up to ``max_per_pipe`` records (``0`` means all).
+     * Returns the number of records dispatched.
+     */
+    size_t dispatch(size_t max_per_pipe = 0)
+    {
+        radio.refill_ack_payloads();
+        size_t count = 0;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe) {
+            if (!callbacks[pipe] || callbacks[pipe].is_none() || !rings[pipe]->pending())
+                continue;
+            py::bytearray records = rings[pipe]->take(max_per_pipe);
+            count += static_cast<size_t>(PyByteArray_Size(records.ptr())) / RX_RECORD_SIZE;
+            callbacks[pipe](records);
+        }
+        return count;
+    }
+
+    /** Wait (with the GIL released) until a record is pending or the thread stops. */
+    bool wait(uint32_t timeout_ms)
+    {
+        return signal.wait(timeout_ms, [this] { return pending_total() || !running; }) && pending_total();
+    }
+
+protected:
+    uint8_t* reserve(uint8_t pipe) override
+    {
+        return pipe < RX_PIPES ? rings[pipe]->reserve() : NULL;
+    }
+
+    void commit(uint8_t pipe) override
+    {
+        rings[pipe]->commit();
+        received[pipe]++;
+    }
+
+    void overrun(uint8_t pipe) override
+    {
+        if (pipe < RX_PIPES)
+            dropped[pipe]++;
+    }
+
+    void drained() override
+    {
+        signal.notify();
+    }
+
+    void stopped() override
+    {
+        signal.notify();
+    }
+
+private:
+    std::unique_ptr<RecordRing> rings[RX_PIPES];
+    std::atomic<uint64_t> received[RX_PIPES];
+    std::atomic<uint64_t> dropped[RX_PIPES];
+    py::object callbacks[RX_PIPES];
+    WakeSignal signal;
+
+    uint8_t check_pipe(uint8_t pipe)
+    {
+        if (pipe >= RX_PIPES)
+            throw py::value_error("pipe must be in range [0, 5]");
+        return pipe;
+    }
+
+    py::list counters(const std::atomic<uint64_t> (&values)[RX_PIPES])
+    {
+        py::list result;
+        for (uint8_t pipe = 0; pipe < RX_PIPES; ++pipe)
+            result.append(values[pipe].load());
+        return result;
+    }
+};
+
+/**
+ * A radio of a `RadioGroup`: a native thread that drains the radio's RX FIFO into a
+ * `RecordRing` and transmits the payloads put in its TX queue by `queue()`.
+ *
+ * The TX queue is a `RecordRing` too (a record's payload length is at offset 1). Its producer
+ * is any python thread (the GIL serializes them) and its consumer is the native thread.
+ */
+class GroupRadio : public RxDrainer
+{
+public:
+    GroupRadio(RF24Wrapper& _radio, uint8_t _index, size_t capacity, size_t tx_capacity, uint32_t _timeout_ms, WakeSignal& _signal)
+        : RxDrainer(_radio), index(_index), timeout_ms(_timeout_ms), signal(_signal), ring(capacity), tx_ring(tx_capacity), batch(GROUP_TX_BATCH * RX_RECORD_SIZE), slot(NULL), received(0), dropped(0), sent(0), failed(0), in_flight(0)
+    {
+        start();
+    }
+
+    ~GroupRadio()
+    {
+        join();
+    }
+
+    RecordRing& get_ring()
+    {
+        return ring;
+    }
+
+    /** The number of payloads that are queued (or being transmitted). */
+    size_t tx_pending()
+    {
+        return tx_ring.pending() + in_flight;
+    }
+
+    /** Put a payload in the TX queue. Returns false if the TX queue is full. */
+    bool queue(const uint8_t* payload, uint8_t length)
+    {
+        uint8_t* record = tx_ring.reserve();
+        if (!record)
+            return false;
+        record[1] = length;
+        memcpy(record + RX_RECORD_PAYLOAD, payload, length);
+        tx_ring.commit();
+        wake();
+        return true;
+    }
+
+    py::dict get_stats()
+    {
+        py::dict stats;
+        stats["received"] = received.load();
+        stats["dropped"] = dropped.load();
+        stats["fifo_full"] = get_fifo_full();
+        stats["sent"] = sent.load();
+        stats["failed"] = failed.load();
+        stats["rx_pending"] = ring.pending();
+        stats["tx_pending"] = tx_pending();
+        return stats;
+    }
+
+protected:
+    uint8_t* reserve(uint8_t pipe) override
+    {
+        (void)pipe;
+        slot = ring.reserve();
+        return slot;
+    }
+
+    void commit(uint8_t pipe) override
+    {
+        (void)pipe;
+        slot[2] = index;
+        ring.commit();
+        received++;
+    }
+
+    void overrun(uint8_t pipe) override
+    {
+        (void)pipe;
+        dropped++;
+    }
+
+    bool transmit() override
+    {
+        size_t count = rf24_min(tx_ring.pending(), static_cast<size_t>(GROUP_TX_BATCH));
+        if (!count)
+            return false;
+        in_flight = count; // before take_into(), so tx_pending() never misses a payload
+        tx_ring.take_into(batch.data(), count);
+        payloads.clear();
+        for (size_t i = 0; i < count; ++i) {
+            const uint8_t* record = &batch[i * RX_RECORD_SIZE];
+            payloads.emplace_back(record + RX_RECORD_PAYLOAD, record[1]);
+        }
+        bool listening = radio.read_register(NRF_CONFIG) & _BV(PRIM_RX);
+        if (listening)
+            radio.stopListening();
+        radio.transmit_payloads(payloads, false, timeout_ms, results);
+        if (listening)
+            radio.startListening();
+        radio.invalidate_registers();
+        for (size_t i = 0; i < count; ++i) {
+            if (results[i] == 0xFF)
+                failed++;
+            else
+                sent++;
+        }
+        in_flight = 0;
+        signal.notify();
+        return tx_ring.pending() > 0;
+    }
+
+    void drained() override
+    {
+        signal.notify();
+    }
+
+    void stopped() override
+    {
+        signal.notify();
+    }
+
+private:
+    /** The radio's index in its `RadioGroup` (written to offset 2 of each record). */
+    const uint8_t index;
+    const uint32_t timeout_ms;
+    WakeSignal& signal;
+    RecordRing ring;
+    RecordRing tx_ring;
+    /** The records taken from `tx_ring` by `transmit()`. */
+    std::vector<uint8_t> batch;
+    std::vector<std::pair<const uint8_t*, uint8_t>> payloads;
+    uint8_t results[GROUP_TX_BATCH];
+    /** The slot returned by the last call to `reserve()`. */
+    uint8_t* slot;
+    std::atomic<uint64_t> received;
+    std::atomic<uint64_t> dropped;
+    std::atomic<uint64_t> sent;
+    std::atomic<uint64_t> failed;
+    /** The number of payloads taken from `tx_ring` that `transmit()` has not finished. */
+    std::atomic<size_t> in_flight;
+};
+
+/**
+ * The part of `RadioGroup` (and ``NetworkGroup``) that doesn't depend on the kind of member.
+ *
+ * Each ``Member`` is an `RxDrainer` that implements ``tx_pending()`` and ``get_stats()``. The
+ * python objects that the members service are kept alive by the group.
+ */
+template<typename Member>
+class MemberGroup
+{
+public:
+    virtual ~MemberGroup() = default;
+
+    size_t size()
+    {
+        return members.size();
+    }
+
+    py::list get_objects()
+    {
+        return objects;
+    }
+
+    bool is_running()
+    {
+        for (const std::unique_ptr<Member>& member : members) {
+            if (!member->is_running())
+                return false;
+        }
+        return true;
+    }
+
+    size_t tx_pending()
+    {
+        size_t total = 0;
+        for (const std::unique_ptr<Member>& member : members)
+            total += member->tx_pending();
+        return total;
+    }
+
+    py::list get_stats()
+    {
+        py::list result;
+        for (const std::unique_ptr<Member>& member : members)
+            result.append(member->get_stats());
+        return result;
+    }
+
+    /** Wait until the members' TX queues are empty. Returns false if the timeout elapsed (or a thread stopped). */
+    bool flush(uint32_t timeout_ms)
+    {
+        return signal.wait(timeout_ms, [this] { return !tx_pending() || !is_running(); }) && !tx_pending();
+    }
+
+    void stop()
+    {
+        for (const std::unique_ptr<Member>& member : members)
+            member->stop();
+    }
+
+protected:
+    /** The python objects that the members service (in the same order as `members`). */
+    py::list objects;
+    WakeSignal signal;
+    std::vector<std::unique_ptr<Member>> members;
+
+    /**
+     * The index of the member that should transmit next: the given ``index`` or (if ``index``
+     * is None) the member with the fewest queued payloads. Ties are broken in turn.
+     */
+    size_t pick(py::object index)
+    {
+        if (!index.is_none()) {
+            size_t chosen = index.cast<size_t>();
+            if (chosen >= members.size())
+                throw py::index_error("index out of range");
+            return chosen;
+        }
+        size_t chosen = cursor % members.size();
+        size_t fewest = members[chosen]->tx_pending();
+        for (size_t i = 1; i < members.size() && fewest; ++i) {
+            size_t candidate = (cursor + i) % members.size();
+            size_t pending = members[candidate]->tx_pending();
+            if (pending < fewest) {
+                chosen = candidate;
+                fewest = pending;
+            }
+        }
+        cursor = chosen + 1;
+        return chosen;
+    }
+
+private:
+    size_t cursor = 0;
+};
+
+/**
+ * Services several radios, each with its own `GroupRadio` thread, so the radios transmit and
+ * receive in parallel while the GIL is held by python code.
+ */
+class RadioGroup : public MemberGroup<GroupRadio>
+{
+public:
+    RadioGroup(py::sequence radios, size_t capacity, size_t tx_capacity, uint32_t timeout_ms)
+    {
+        if (!radios.size() || radios.size() > 256)
+            throw py::value_error("a RadioGroup needs 1 to 256 radios");
+        if (!capacity || !tx_capacity)
+            throw py::value_error("capacity and tx_capacity must be greater than 0");
+        for (size_t i = 0; i < radios.size(); ++i) {
+            RF24Wrapper& radio = radios[i].cast<RF24Wrapper&>();
+            objects.append(radios[i]);
+            members.emplace_back(new GroupRadio(radio, static_cast<uint8_t>(i), capacity, tx_capacity, timeout_ms, signal));
+        }
+    }
+
+    size_t rx_pending()
+    {
+        size_t total = 0;
+        for (const std::unique_ptr<GroupRadio>& member : members)
+            total += member->get_ring().pending();
+        return total;
+    }
+
+    /** Queue a payload. Returns the index of the radio that will transmit it, or -1 if its TX queue is full. */
+    int send(py::buffer buf, py::object radio)
+    {
+        py::buffer_info info = get_buffer(buf);
+        size_t chosen = pick(radio);
+        if (!members[chosen]->queue(static_cast<const uint8_t*>(info.ptr), get_payload_len(info)))
+            return -1;
+        return static_cast<int>(chosen);
+    }
+
+    /** Queue several payloads (each one is balanced separately). Returns the number of payloads queued. */
+    size_t send_many(py::sequence buffers, py::object radio)
+    {
+        size_t count = 0;
+        for (size_t i = 0; i < buffers.size(); ++i) {
+            if (send(buffers[i].cast<py::buffer>(), radio) < 0)
+                break;
+            count++;
+        }
+        return count;
+    }
+
+    /**
+     * Move up to ``max_per_radio`` records (``0`` means all) from every radio into one
+     * `bytearray`. The radios take turns, one record at a time, until each radio's quota is
+     * exhausted.
+     */
+    py::bytearray take(size_t max_per_radio = 0)
+    {
+        std::vector<RecordRing*> rings;
+        for (const std::unique_ptr<GroupRadio>& member : members) {
+            member->get_radio().refill_ack_payloads();
+            rings.push_back(&member->get_ring());
+        }
+        return RecordRing::take_round_robin(rings, max_per_radio);
+    }
+
+    /** Wait (with the GIL released) until a record is pending or a thread stops. */
+    bool wait(uint32_t timeout_ms)
+    {
+        return signal.wait(timeout_ms, [this] { return rx_pending() || !is_running(); }) && rx_pending();
+    }
+};
+
+/**
+ * Make every extension module use the same simulated air medium.
+ *
+ * Each extension module (rf24, rf24_network & rf24_mesh) has its own copy of the driver. So,
+ * the first module imported shares its medium with the others. This does nothing unless the
+ * simulated driver (``RF24_DRIVER=sim``) is used.
+ */
+void share_sim_air()
+{
+#if defined(RF24_SIM)
+    void* shared = py::get_shared_data("pyrf24_sim_air");
+    if (shared)
+        SimAir::use(static_cast<SimAir*>(shared));
+    else
+        py::set_shared_data("pyrf24_sim_air", &SimAir::instance());
+#endif
+}
+
+PYBIND11_MODULE(rf24, m)
+{
+    m.doc() = "A Python module that wraps all RF24 C++ library's API";
+    share_sim_air();
+
+    m.attr("RX_RECORD_SIZE") = RX_RECORD_SIZE;
+    m.attr("CONFIG_SNAPSHOT_SIZE") = CONFIG_SNAPSHOT_SIZE;
+
+#if defined(RF24_SIM)
+    m.def(
+        "sim_configure", [](double loss, uint32_t latency_us, uint32_t seed) {
+            if (loss < 0 || loss > 1)
+                throw py::value_error("loss must be in range [0, 1]");
+            SimAir::instance().configure(loss, latency_us, seed);
+        },
+        R"docstr(
+        sim_configure(loss: float = 0.0, latency_us: int = 0, seed: int = 0)
+
+        Configure the air medium shared by all simulated radios.
+
+        This function only exists if the package was built with the simulated driver
+        (``RF24_DRIVER=sim``).
+
+        :param float loss: The probability that any packet (or automatic acknowledgement) is
+            lost. This must be in range [0, 1].
+        :param int latency_us: An extra delay (in microseconds) added to the time that every
+            packet (and automatic acknowledgement) spends on the air.
+        :param int seed: The seed of the pseudo-random generator that decides which packets are
+            lost. The same seed (with the same traffic) loses the same packets.
+    )docstr",
+        py::arg("loss") = 0.0, py::arg("latency_us") = 0, py::arg("seed") = 0);
+
+    m.def(
+        "sim_noop", [](bool enable) { SimAir::instance().set_noop(enable); }, R"docstr(
+        sim_noop(enable: bool)
+
+        Disconnect (or reconnect) all simulated radios from the code that drives them.
+
+        While enabled, every SPI transaction and CE pin change does nothing, and every status
+        or register read returns an idle radio's STATUS byte (``0x0E``) followed by zeros. So,
+        the time that a non-blocking method (like `RF24.available()` or `RF24.write_fast()`)
+        takes is the overhead of the Python bindings (and the RF24 C++ library). The radios'
+        states are unaffected, but anything written to a radio while enabled is lost.
+
+        This function only exists if the package was built with the simulated driver
+        (``RF24_DRIVER=sim``).
+
+        :param bool enable: `True` to make the driver do nothing, `False` to restore it.
+    )docstr",
+        py::arg("enable"));
+#endif // defined(RF24_SIM)
+
+    // ********************** Enum structs
+    py::enum_<rf24_crclength_e>(m, "rf24_crclength_e")
+        .value("RF24_CRC_DISABLED", RF24_CRC_DISABLED, R"docstr(
+            to disable using CRC checksums
+        )docstr")
+        .value("RF24_CRC_8", RF24_CRC_8, R"docstr(
+            to use 8-bit checksums
+        )docstr")
+        .value("RF24_CRC_16", RF24_CRC_16, R"docstr(
+            to use 16-bit checksums
+        )docstr")
+        .export_values();
+
+    py::enum_<rf24_datarate_e>(m, "rf24_datarate_e")
+        .value("RF24_1MBPS", RF24_1MBPS, R"docstr(
+            for 1 Mbps
+        )docstr")
+        .value("RF24_2MBPS", RF24_2MBPS, R"docstr(
+            for 2 Mbps
+        )docstr")
+        .value("RF24_250KBPS", RF24_250KBPS, R"docstr(
+            for 250 kbps
+        )docstr")
+        .export_values();
+
+    py::enum_<rf24_pa_dbm_e>(m, "rf24_pa_dbm_e")
+        .value("RF24_PA_MIN", RF24_PA_MIN, R"docstr(
+            +----------------------+--------------------+--------------------+
+            | nRF24L01 description | Si24R1 description | Si24R1 description |
+            |                      | when LNA enabled   | when LNA disabled  |
+            +======================+====================+====================+
+            |      -18 dBm         |      6 dBm         |     -12 dBm        |
+            +----------------------+--------------------+--------------------+
+        )docstr")
+        .value("RF24_PA_LOW", RF24_PA_LOW, R"docstr(
+            +----------------------+--------------------+--------------------+
+            | nRF24L01 description | Si24R1 description | Si24R1 description |
+            |                      | when LNA enabled   | when LNA disabled  |
+            +======================+====================+====================+
+            |      -12 dBm         |      0 dBm         |      -4 dBm        |
+            +----------------------+--------------------+--------------------+
+        )docstr")
+        .value("RF24_PA_HIGH", RF24_PA_HIGH, R"docstr(
+            +----------------------+--------------------+--------------------+
             | nRF24L01 description | Si24R1 description | Si24R1 description |
             |                      | when LNA enabled   | when LNA disabled  |
             +======================+====================+====================+
-            |      -18 dBm         |      6 dBm         |     -12 dBm        |
+            |      -6 dBm          |      3 dBm         |       1 dBm        |
+            +----------------------+--------------------+--------------------+
+        )docstr")
+        .value("RF24_PA_MAX", RF24_PA_MAX, R"docstr(
+            +----------------------+--------------------+--------------------+
+            | nRF24L01 description | Si24R1 description | Si24R1 description |
+            |                      | when LNA enabled   | when LNA disabled  |
+            +======================+====================+====================+
+            |      0 dBm           |      7 dBm         |       4 dBm        |
             +----------------------+--------------------+--------------------+
         )docstr")
-        .value("RF24_PA_LOW", RF24_PA_LOW, R"docstr(
-            +----------------------+--------------------+--------------------+
-            | nRF24L01 description | Si24R1 description | Si24R1 description |
-            |                      | when LNA enabled   | when LNA disabled  |
-            +======================+====================+====================+
-            |      -12 dBm         |      0 dBm         |      -4 dBm        |
-            +----------------------+--------------------+--------------------+
+        // .value("RF24_PA_ERROR", RF24_PA_ERROR)
+        .export_values();
+
+    // ******************** RF24 class  **************************
+    py::options options;
+    options.disable_function_signatures();
+    py::class_<RF24Wrapper>(m, "RF24")
+
+        // *****************************************************************************
+        // ***************************** functions that take no args & have no overloads
+
+        .def("flush_tx", spi_call<RF24Wrapper>(&RF24Wrapper::flush_tx), R"docstr(
+            flush_tx()
+
+            Flush all 3 levels of the radio's TX FIFO.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("flush_rx", spi_call<RF24Wrapper>(&RF24Wrapper::flush_rx), R"docstr(
+            flush_rx()
+
+            Flush all 3 levels of the radio's RX FIFO.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("disableCRC", config_call<RF24Wrapper>(&RF24Wrapper::disableCRC), R"docstr(
+            disableCRC()
+
+            Disable the radio's CRC feature.
+
+            .. note:: Enabling the radio's auto-ack feature will automatically enable the radio's
+                CRC feature.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("getCRCLength", spi_call<RF24Wrapper>(&RF24Wrapper::getCRCLength), R"docstr(
+            getCRCLength() -> pyrf24.rf24.rf24_crclength_e
+
+            Get the current setting of the radio's CRC Length.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("getChannel", spi_call<RF24Wrapper>(&RF24Wrapper::getChannel), R"docstr(
+            getChannel() -> int
+
+            Get the current setting of the radio's channel.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("getDataRate", spi_call<RF24Wrapper>(&RF24Wrapper::getDataRate), R"docstr(
+            getDataRate() -> pyrf24.rf24.rf24_datarate_e
+
+            Get the current setting of the radio's Data Rate.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("get_dynamic_payload_size", spi_call<RF24Wrapper>(&RF24Wrapper::getDynamicPayloadSize), R"docstr(
+            get_dynamic_payload_size() -> int
+
+            Get the Dynamic Payload Size of the next available payload in the radio's RX FIFO.
+        )docstr")
+
+        .def("getDynamicPayloadSize", spi_call<RF24Wrapper>(&RF24Wrapper::getDynamicPayloadSize), R"docstr(
+            getDynamicPayloadSize() -> int
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("getPALevel", spi_call<RF24Wrapper>(&RF24Wrapper::getPALevel), R"docstr(
+            getPALevel() -> pyrf24.rf24.rf24_pa_dbm_e
+
+            Get the current setting of the radio's Power Amplitude Level.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("getPayloadSize", &RF24Wrapper::getPayloadSize, R"docstr(
+            getPayloadSize() -> int
+
+            Configure the radio's static payload size (outgoing and incoming) for all data pipes.
+
+            :param int length: The length of static payloads used for all data pipes.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("enableAckPayload", config_call<RF24Wrapper>(&RF24Wrapper::enableAckPayload), R"docstr(
+            enableAckPayload()
+
+            Enable the radio's Ack Payload feature.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("enable_dynamic_ack", config_call<RF24Wrapper>(&RF24Wrapper::enableDynamicAck), R"docstr(
+            enable_dynamic_ack()
+
+            Enable the radio's Dynamic Ack feature.
+
+            By default the multicast parameter to `write()` is ineffective unless this
+            function is called. This design decision was made for compatibility with
+            the cheap chinese Si24R1 clones.
+        )docstr")
+
+        .def("enableDynamicAck", config_call<RF24Wrapper>(&RF24Wrapper::enableDynamicAck), R"docstr(
+            enableDynamicAck()
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("enableDynamicPayloads", config_call<RF24Wrapper>(&RF24Wrapper::enableDynamicPayloads), R"docstr(
+            enableDynamicPayloads()
+
+            Enable the radio's Dynamic Payloads feature.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("disableDynamicPayloads", config_call<RF24Wrapper>(&RF24Wrapper::disableDynamicPayloads), R"docstr(
+            disableDynamicPayloads()
+
+            Disable the radio's Dynamic Payloads feature.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("powerDown", config_call<RF24Wrapper>(&RF24Wrapper::powerDown), R"docstr(
+            powerDown()
+
+            Power down the radio.
+
+            .. important::
+                No transmissions can be received or transmitted when the radio is powered down.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("powerUp", config_call<RF24Wrapper>(&RF24Wrapper::powerUp), R"docstr(
+            powerUp()
+
+            Power up the radio.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("print_details", spi_call<RF24Wrapper>(&RF24Wrapper::printDetails), R"docstr(
+            print_details()
+
+            Print out details about the radio's configuration.
+        )docstr")
+
+        .def("printDetails", spi_call<RF24Wrapper>(&RF24Wrapper::printDetails), R"docstr(
+            printDetails()
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("print_pretty_details", spi_call<RF24Wrapper>(&RF24Wrapper::printPrettyDetails), R"docstr(
+            print_pretty_details()
+
+            Print out details about the radio's configuration. This function differs from
+            `print_details()` as the output for this function is more human-friendly/readable.
+        )docstr")
+
+        .def("printPrettyDetails", spi_call<RF24Wrapper>(&RF24Wrapper::printPrettyDetails), R"docstr(
+            printPrettyDetails()
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("sprintf_pretty_details", spi_call<RF24Wrapper>(&RF24Wrapper::sprintfDetails), R"docstr(
+            sprintf_pretty_details() -> str
+
+            Put details about the radio's configuration into a string. This function differs from
+            `print_pretty_details()` as it does not use stdout output stream.
+
+            :Returns: A string that describes the radio's details.
+        )docstr")
+
+        .def("sprintfPrettyDetails", spi_call<RF24Wrapper>(&RF24Wrapper::sprintfDetails), R"docstr(
+            sprintfPrettyDetails() -> str
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("get_config", &RF24Wrapper::get_config, R"docstr(
+            get_config() -> bytes
+
+            Take a snapshot of the radio's configuration, to be restored later with
+            `apply_config()`. This is much faster than reading each setting separately, because
+            all registers are read within a single call (without re-acquiring the radio's lock
+            or the GIL for each register).
+
+            :Returns: A `bytes` object of `CONFIG_SNAPSHOT_SIZE` bytes. These are the values of
+                the following registers (in order of their addresses): ``CONFIG``, ``EN_AA``,
+                ``EN_RXADDR``, ``SETUP_AW``, ``SETUP_RETR``, ``RF_CH``, ``RF_SETUP``,
+                ``RX_ADDR_P0`` to ``RX_ADDR_P5``, ``TX_ADDR``, ``RX_PW_P0`` to ``RX_PW_P5``,
+                ``DYNPD`` and ``FEATURE``. The ``RX_ADDR_P0``, ``RX_ADDR_P1`` and ``TX_ADDR``
+                registers take 5 bytes each (LSB first); bytes beyond the address width are 0.
+                Status registers (like ``STATUS`` and ``FIFO_STATUS``) are not included.
+
+            .. note:: While the radio is not listening, pipe 0 is used to receive automatic
+                acknowledgements, and its address is the TX address. So, take the snapshot of a
+                configuration that reads from pipe 0 while the radio is listening.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("apply_config", &RF24Wrapper::apply_config, R"docstr(
+            apply_config(snapshot: Union[bytes, bytearray, memoryview]) -> int
+
+            Restore a configuration taken with `get_config()`. Only the settings that differ from
+            the radio's current configuration are written, so switching between a few profiles
+            (like a `FakeBLE` beacon and a `RF24Network` node) is fast.
+
+            .. code-block:: python
+
+                radio.listen = True  # a network node listens
+                network_profile = radio.get_config()
+                ble.begin()  # re-configures the radio as a BLE beacon
+                ble_profile = radio.get_config()
+                radio.apply_config(network_profile)  # switch back
+                radio.apply_config(ble_profile)  # and forth
+
+            The settings are applied with the same functions that change them individually (like
+            `channel` and `open_rx_pipe()`), so the radio object's own state stays consistent. The
+            radio's mode (`listen`) and power state (`power`) are restored as well.
+
+            :param bytes,bytearray,memoryview snapshot: A configuration snapshot returned by
+                `get_config()`.
+
+            :Returns: The number of registers that differed (``0`` means nothing was written).
+
+            :raises ValueError: If the ``snapshot`` is not `CONFIG_SNAPSHOT_SIZE` bytes long.
+
+            .. note:: Some configurations cannot be set with the RF24 API. The radio uses the same
+                static payload length for all pipes (``RX_PW_P0``), and enables dynamic payloads on
+                all pipes (or only pipes 0 and 1 if only ACK payloads enabled them).
+        )docstr",
+             py::arg("snapshot"))
+
+        // *****************************************************************************
+
+        .def("reuse_tx", spi_call<RF24Wrapper>(&RF24Wrapper::reUseTX), R"docstr(
+            reuse_tx()
+
+            Re-use the 1\ :sup:`st` level of the radio's TX FIFO.
+        )docstr")
+
+        .def("reUseTX", spi_call<RF24Wrapper>(&RF24Wrapper::reUseTX), R"docstr(
+            reUseTX()
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("startListening", config_call<RF24Wrapper>(&RF24Wrapper::startListening), R"docstr(
+            startListening()
+
+            Put the radio into RX mode.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("stopListening", config_call<RF24Wrapper>(&RF24Wrapper::stopListening), R"docstr(
+            stopListening()
+
+            Put the radio into TX mode.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("stop_const_carrier", config_call<RF24Wrapper>(&RF24Wrapper::stopConstCarrier), R"docstr(
+            stop_const_carrier()
+
+            End transmitting a constant carrier wave. This function also sets the `power` to `False`
+            as recommended by the datasheet.
+        )docstr")
+
+        .def("stopConstCarrier", config_call<RF24Wrapper>(&RF24Wrapper::stopConstCarrier), R"docstr(
+            stopConstCarrier()
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("isValid", &RF24Wrapper::isValid, R"docstr(
+            isValid() -> bool
+
+            Verify the configured pin numbers are indeed valid.
+
+            :Returns: `True` if the radio's CE & CSN pins have been configured (using the
+                RF24 class' constructor or :py:meth:`~pyrf24.rf24.RF24.begin()` function)
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("isPVariant", &RF24Wrapper::isPVariant, R"docstr(
+            isPVariant() -> bool
+
+            Is the detected radio compatible with the nRF24L01+ family?
+
+            :Returns: `True` of the radio is a nRF24L01+ model (or compatible), otherwise `False`.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("testRPD", spi_call<RF24Wrapper>(&RF24Wrapper::testRPD), R"docstr(
+            testRPD() -> bool
+
+            :Returns: `True` if a signal (above -64 dbm) was detected in RX mode, otherwise `False`.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("rxFifoFull", spi_call<RF24Wrapper>(&RF24Wrapper::rxFifoFull), R"docstr(
+            rxFifoFull() -> bool
+
+            :Returns: `True` if all 3 levels of the radio's RX FIFO are occupied, otherwise `False`.
         )docstr")
-        .value("RF24_PA_HIGH", RF24_PA_HIGH, R"docstr(
-            +----------------------+--------------------+--------------------+
-            | nRF24L01 description | Si24R1 description | Si24R1 description |
-            |                      | when LNA enabled   | when LNA disabled  |
-            +======================+====================+====================+
-            |      -6 dBm          |      3 dBm         |       1 dBm        |
-            +----------------------+--------------------+--------------------+
+
+        // *****************************************************************************
+
+        .def("what_happened", spi_call<RF24Wrapper>(&RF24Wrapper::what_happened), R"docstr(
+            what_happened() -> Tuple[bool, bool, bool]
+
+            Call this function when the radio's IRQ pin is active LOW.
+
+            :Returns: a 3-tuple of boolean values in which
+
+                - index 0 represents a "data sent" event
+                - index 1 represents a "data failed" event
+                - index 2 represents a "data ready" event
+
+            .. note::
+                Calling this function also clears all status flags and resets the IRQ pin
+                to inactive high.
+            .. seealso::
+                :py:meth:`~pyrf24.rf24.RF24.mask_irq()`
         )docstr")
-        .value("RF24_PA_MAX", RF24_PA_MAX, R"docstr(
-            +----------------------+--------------------+--------------------+
-            | nRF24L01 description | Si24R1 description | Si24R1 description |
-            |                      | when LNA enabled   | when LNA disabled  |
-            +======================+====================+====================+
-            |      0 dBm           |      7 dBm         |       4 dBm        |
-            +----------------------+--------------------+--------------------+
+
+        .def("whatHappened", spi_call<RF24Wrapper>(&RF24Wrapper::what_happened), R"docstr(
+            whatHappened() -> Tuple[bool, bool, bool]
         )docstr")
-        // .value("RF24_PA_ERROR", RF24_PA_ERROR)
-        .export_values();
 
-    // ******************** RF24 class  **************************
-    py::options options;
-    options.disable_function_signatures();
-    py::class_<RF24Wrapper>(m, "RF24")
+        // *****************************************************************************
+
+        .def("available_pipe", stats_call<RF24Wrapper>(RadioStats::AVAILABLE, &RF24Wrapper::available_pipe), R"docstr(
+            available_pipe() -> Tuple[bool, int]
+
+            Similar to :py:meth:`~pyrf24.rf24.RF24.available()`, but additionally returns the pipe
+            number that received the next available payload.
+
+            :Returns: A 2-tuple in which
+
+                - index 0 is the `bool` value indicating if there is a available payload in the
+                  radio's RX FIFO.
+                - index 1 is the `int` value indicating the pipe number that received the next
+                  available in the radio's RX FIFO. If there is no payload received, then this
+                  number is set to an invalid value of 7.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("get_arc", spi_call<RF24Wrapper>(&RF24Wrapper::getARC), R"docstr(
+            get_arc() -> int
+
+            Returns automatic retransmission count (ARC_CNT)
+
+            Value resets with each new transmission. Allows roughly estimating signal strength.
+
+            :Returns: Returned values range from 0 to 15.
+        )docstr")
+
+        .def("getARC", spi_call<RF24Wrapper>(&RF24Wrapper::getARC), R"docstr(
+            getARC() -> int
+        )docstr")
+
+        // *****************************************************************************
+        // **************************************** functions that take args
+
+        .def("set_radiation", config_call<RF24Wrapper>(&RF24Wrapper::set_radiation), R"docstr(
+            set_radiation(level: rf24_pa_dbm_e, speed: rf24_datarate_e, lna_enable: bool = True)
+
+            Configure the RF_SETUP register in 1 SPI transaction.
+
+            :param rf24_pa_dbm_e level: The desired Power Amplitude level. Options are defined in the
+                `rf24_pa_dbm_e` enum.
+            :param rf24_datarate_e speed: The desired RF data rate. Options are defined in the
+                `rf24_datarate_e` enum.
+            :param bool lna_enable: A toggle for radio's that support controlling the Low Noise
+                Amplifier feature. This is always enabled by default and when not specified.
+
+            .. seealso::
+
+                - :py:meth:`~pyrf24.rf24.RF24.set_pa_level()`
+                - :py:attr:`~pyrf24.rf24.RF24.pa_level`
+                - :py:attr:`~pyrf24.rf24.RF24.data_rate`
+        )docstr",
+             py::arg("level"), py::arg("speed"), py::arg("lna_enable") = true)
+
+        .def("setRadiation", config_call<RF24Wrapper>(&RF24Wrapper::set_radiation), R"docstr(
+            setRadiation(level: rf24_pa_dbm_e, speed: rf24_datarate_e, lna_enable: bool = True)
+        )docstr",
+             py::arg("level"), py::arg("speed"), py::arg("lna_enable") = true)
+
+        // *****************************************************************************
+
+        .def("set_retries", config_call<RF24Wrapper>(&RF24Wrapper::setRetries), R"docstr(
+            set_retries(delay: int, count: int)
+
+            Configure the radio's auto-retries feature.
+
+            :param int delay: A number in the range [0, 15] used as a multiple of 250. This
+                controls the amount of time (in microseconds) the radio waits for an
+                auto-acknowledgment.
+            :param int count: A number in range [0, 15]. This is the amount of automatic retries
+                that the radio attempts when an automatic acknowledgment is not received.
+        )docstr",
+             py::arg("delay"), py::arg("count"))
+
+        .def("setRetries", config_call<RF24Wrapper>(&RF24Wrapper::setRetries), R"docstr(
+            setRetries(delay: int, count: int)
+        )docstr",
+             py::arg("delay"), py::arg("count"))
+
+        // *****************************************************************************
+
+        .def("setCRCLength", config_call<RF24Wrapper>(&RF24Wrapper::setCRCLength), R"docstr(
+            setCRCLength(length: rf24_crclength_e)
+
+            Configure the radio's CRC Length feature.
+
+            :param rf24_crclength_e length: The number of bytes used in the radio's CRC checksum.
+
+                .. seealso:: Values accepted by the parameter are predefined in the
+                    `rf24_crclength_e` enum struct.
+        )docstr",
+             py::arg("length"))
+
+        // *****************************************************************************
+
+        .def("setChannel", config_call<RF24Wrapper>(&RF24Wrapper::setChannel), R"docstr(
+            setChannel(channel: int)
+
+            Set the current setting of the radio's channel.
+        )docstr",
+             py::arg("channel"))
+
+        // *****************************************************************************
+
+        .def("setDataRate", config_call<RF24Wrapper>(&RF24Wrapper::setDataRate), R"docstr(
+            setDataRate(rate: rf24_datarate_e)
+
+            Configure the radio's Data Rate feature.
+
+            :param rf24_datarate_e rate: The speed in which the radio send out data over the air. Values
+                accepted for this parameter are pre-defined in the `rf24_datarate_e` enum struct.
+        )docstr",
+             py::arg("rate"))
+
+        // *****************************************************************************
+
+        .def("setAddressWidth", config_call<RF24Wrapper>(&RF24Wrapper::setAddressWidth), R"docstr(
+            setAddressWidth(width: int)
+
+            Configure the radio's Address Width feature.
+
+            :param int width: The number of bytes used for address' length assigned to the data
+                pipes. Accepted values are clamped to range [3, 5].
+        )docstr",
+             py::arg("width"))
+
+        // *****************************************************************************
+
+        .def("close_rx_pipe", config_call<RF24Wrapper>(&RF24Wrapper::closeReadingPipe), R"docstr(
+            close_rx_pipe(pipe: int)
+
+            Close a data pipe for receiving.
+
+            :param int pipe: The identifying data pipe number to close. Remember there are
+                only 6 data pipes (identified by the numbers 0-5).
+        )docstr",
+             py::arg("pipe"))
+
+        .def("closeReadingPipe", config_call<RF24Wrapper>(&RF24Wrapper::closeReadingPipe), R"docstr(
+            closeReadingPipe(pipe: int)
+        )docstr",
+             py::arg("pipe"))
+
+        // *****************************************************************************
+
+        .def("toggle_all_pipes", config_call<RF24Wrapper>(&RF24Wrapper::toggleAllPipes), R"docstr(
+            toggle_all_pipes(enable: bool)
+
+            Open or close all pipes with 1 SPI transaction. This does not alter the addresses assigned to
+            the data pipes (using `open_rx_pipe()` or `open_tx_pipe()`).
+
+            :param bool enable: `True` opens all data pipes for RX operation.
+                `False` closes all data pipes for RX operation.
+        )docstr",
+             py::arg("enable"))
+
+        .def("toggleAllPipes", config_call<RF24Wrapper>(&RF24Wrapper::toggleAllPipes), R"docstr(
+            toggleAllPipes(enable: bool)
+        )docstr",
+             py::arg("enable"))
+
+        // *****************************************************************************
+
+        .def("start_const_carrier", config_call<RF24Wrapper>(&RF24Wrapper::startConstCarrier), R"docstr(
+            start_const_carrier(level: rf24_pa_dbm_e, channel: int)
+
+            Start a constant carrier wave. This is used (in conjunction with `rpd`) to test the
+            radio's hardware.
+
+            :param rf24_pa_dbm_e level: The value used to configure Power Amplitude level. Accepted
+                values are pre-defined in the `rf24_pa_dbm_e` enum struct.
+            :param int channel: The  channel to broadcast on.
+        )docstr",
+             py::arg("level"), py::arg("channel"))
+
+        .def("startConstCarrier", config_call<RF24Wrapper>(&RF24Wrapper::startConstCarrier), R"docstr(
+            startConstCarrier(level: rf24_pa_dbm_e, channel: int)
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("set_pa_level", config_call<RF24Wrapper>(&RF24Wrapper::setPALevel), R"docstr(
+            set_pa_level(level: rf24_pa_dbm_e, lna_enable: bool = True)
+
+            Configure the radio's Power Amplitude Level.
+
+            :param rf24_pa_dbm_e level: The value used to configure Power Amplitude level. Accepted
+                values are pre-defined in the `rf24_pa_dbm_e` enum struct.
+            :param bool lna_enable: This parameter configures the LNA (Low Noise Amplifier)
+                feature of the radio. This feature can only be configured on non-plus models of
+                the nRF24L01 (or the Si24R1 clone).
+        )docstr",
+             py::arg("level"), py::arg("lna_enable") = true)
+
+        .def("setPALevel", config_call<RF24Wrapper>(&RF24Wrapper::setPALevel), R"docstr(
+            setPALevel(level: rf24_pa_dbm_e, lna_enable: bool = True)
+        )docstr",
+             py::arg("level"), py::arg("lna_enable") = true)
+
+        // *****************************************************************************
+
+        .def("mask_irq", config_call<RF24Wrapper>(&RF24Wrapper::maskIRQ), R"docstr(
+            mask_irq(tx_ok: bool, tx_fail: bool, rx_ready: bool)
+
+            Configure the radio's IRQ pin to go active on certain events.
+
+            .. important:: The IRQ pin is only active when LOW.
+
+            :param bool tx_ok: `True` ignores the "data sent" event, `False` reflects the
+                "data sent" event on the IRQ pin.
+            :param bool tx_fail: `True` ignores the "data failed" event, `False` reflects the
+                "data failed" event on the IRQ pin.
+            :param bool rx_ready: `True` ignores the "data ready" event, `False` reflects the
+                "data ready" event on the IRQ pin.
+        )docstr",
+             py::arg("tx_ok"), py::arg("tx_fail"), py::arg("rx_ready"))
+
+        .def("maskIRQ", config_call<RF24Wrapper>(&RF24Wrapper::maskIRQ), R"docstr(
+            maskIRQ(tx_ok: bool, tx_fail: bool, rx_ready: bool)
+        )docstr",
+             py::arg("tx_ok"), py::arg("tx_fail"), py::arg("rx_ready"))
+
+        // *****************************************************************************
+
+        .def("read", &RF24Wrapper::read, R"docstr(
+            read(length: int) -> bytearray
+
+            Fetch data from the radio's RX FIFO.
+
+            :param int length: The number of bytes to fetch from the radio's RX FIFO.
+                If this parameter is not specified, then the length of the next available payload
+                is used. The maximum number of bytes that can be fetched at once is 32 bytes.
+
+                - If the value specified by this parameter is less than the length of the next
+                  available payload, then the payload will remain in the RX FIFO.
+                - If the value specified by this parameter is greater than the length of the next
+                  available payload, then the data from the next level of the RX FIFO is returned
+                  (if any).
+                - If the value specified by this parameter is greater than the length of the last
+                  available payload, then the payload's last byte is returned repeatedly until the
+                  length value is fulfilled.
+            :Returns: A `bytearray` of the specified ``length`` containing the data from the
+                payload in the RX FIFO.
+
+            .. seealso::
+
+                - :py:attr:`~pyrf24.rf24.RF24.payload_size`
+                - :py:meth:`~pyrf24.rf24.RF24.get_dynamic_payload_size()`
+                - :py:meth:`~pyrf24.rf24.RF24.available()`
+        )docstr",
+             py::arg("length") = 0)
 
         // *****************************************************************************
-        // ***************************** functions that take no args & have no overloads
 
-        .def("flush_tx", &RF24Wrapper::flush_tx, R"docstr(
-            flush_tx()
+        .def("attach_irq", &RF24Wrapper::attach_irq, R"docstr(
+            attach_irq(pin: int, chip: str = "/dev/gpiochip0") -> None
 
-            Flush all 3 levels of the radio's TX FIFO.
+            Monitor the radio's IRQ pin, so `wait_for_irq()` and `wait_available()` can sleep
+            until the radio asserts its IRQ pin (instead of repeatedly polling the radio).
+
+            :param int pin: The GPIO line offset (of the given ``chip``) that is connected to
+                the radio's IRQ pin.
+            :param str chip: The GPIO chip's character device.
+
+            :raises OSError: If the GPIO line could not be requested.
+
+            .. note:: The radio only asserts its IRQ pin for events that are not masked
+                (see `mask_irq()`).
+        )docstr",
+             py::arg("pin"), py::arg("chip") = "/dev/gpiochip0")
+
+        // *****************************************************************************
+
+        .def("detach_irq", &RF24Wrapper::detach_irq, R"docstr(
+            detach_irq() -> None
+
+            Stop monitoring the radio's IRQ pin. This releases the GPIO line requested by
+            `attach_irq()`. Afterward, `wait_for_irq()` and `wait_available()` fall back to polling
+            the radio.
         )docstr")
 
         // *****************************************************************************
 
-        .def("flush_rx", &RF24Wrapper::flush_rx, R"docstr(
-            flush_rx()
+        .def_property("irq_fd", &RF24Wrapper::get_irq_fd, &RF24Wrapper::set_irq_fd, R"docstr(
+            The file descriptor that `wait_for_irq()` and `wait_available()` wait on. This is ``-1``
+            if no IRQ pin is monitored.
 
-            Flush all 3 levels of the radio's RX FIFO.
+            Setting this attribute to any file descriptor that becomes readable when the IRQ pin is
+            asserted (like an `os.eventfd()` used for testing) replaces the GPIO line requested by
+            `attach_irq()`. A file descriptor set this way is not closed by `detach_irq()`.
         )docstr")
 
         // *****************************************************************************
 
-        .def("disableCRC", &RF24Wrapper::disableCRC, R"docstr(
-            disableCRC()
+        .def("wait_for_irq", &RF24Wrapper::wait_for_irq, R"docstr(
+            wait_for_irq(timeout_ms: int) -> Tuple[bool, bool, bool]
 
-            Disable the radio's CRC feature.
+            Block until one of the radio's IRQ flags is set (or the ``timeout_ms`` expires).
+            Other python threads can run while waiting.
 
-            .. note:: Enabling the radio's auto-ack feature will automatically enable the radio's
-                CRC feature.
-        )docstr")
+            If an IRQ pin is monitored (see `attach_irq()`), this sleeps until the pin is asserted.
+            Otherwise, the radio is polled with an increasing interval (starting at 50 microseconds
+            and capped at 5 milliseconds).
+
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
+
+            :Returns: The IRQ flags as described by `what_happened()`. All flags are cleared. If
+                the ``timeout_ms`` expired, then all returned flags are `False`.
+        )docstr",
+             py::arg("timeout_ms"))
 
         // *****************************************************************************
 
-        .def("getCRCLength", &RF24Wrapper::getCRCLength, R"docstr(
-            getCRCLength() -> pyrf24.rf24.rf24_crclength_e
+        .def("wait_available", &RF24Wrapper::wait_available, R"docstr(
+            wait_available(timeout_ms: int) -> bool
 
-            Get the current setting of the radio's CRC Length.
-        )docstr")
+            Block until a payload is available in the radio's RX FIFO (or the ``timeout_ms``
+            expires). Other python threads can run while waiting.
+
+            This waits like `wait_for_irq()` does, but the IRQ flags are not cleared.
+
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
+
+            :Returns: The same as `available()`.
+        )docstr",
+             py::arg("timeout_ms"))
 
         // *****************************************************************************
 
-        .def("getChannel", &RF24Wrapper::getChannel, R"docstr(
-            getChannel() -> int
+        .def("read_into", &RF24Wrapper::read_into, R"docstr(
+            read_into(buf: Union[bytearray, memoryview]) -> int
 
-            Get the current setting of the radio's channel.
-        )docstr")
+            Fetch the next available payload from the radio's RX FIFO into a preallocated buffer.
+            This is like `read()`, but the payload is copied directly into ``buf`` (instead of a
+            new `bytearray` object).
+
+            :param bytearray,memoryview buf: A writable, C-contiguous buffer that the payload is
+                written to. The number of bytes fetched is the smaller of ``len(buf)`` and the
+                length of the next available payload (see `get_dynamic_payload_size()` and
+                `payload_size`). Any object that supports python's buffer protocol (like a
+                ``numpy.ndarray``) can be used.
+
+            :Returns: The number of bytes written to ``buf``.
+        )docstr",
+             py::arg("buf"))
 
         // *****************************************************************************
 
-        .def("getDataRate", &RF24Wrapper::getDataRate, R"docstr(
-            getDataRate() -> pyrf24.rf24.rf24_datarate_e
+        .def_property_readonly("rx_timestamp", &RF24Wrapper::get_rx_timestamp, R"docstr(
+            The time (in nanoseconds) that the payload last fetched by `read()` or `read_into()`
+            was observed in the radio's RX FIFO. This uses the same clock as
+            `time.monotonic_ns()`, but it is taken natively (without the jitter of the python
+            interpreter). ``0`` means no payload was fetched yet.
 
-            Get the current setting of the radio's Data Rate.
+            The payload is observed when `available()`, `available_pipe()`,
+            `wait_available()`, `wait_for_irq()` or `what_happened()` first report it (using
+            the RX_DR flag or the RX FIFO's status). If the payload wasn't observed before it
+            was fetched, then the time that it was fetched is used instead.
+
+            Each payload fetched by `read_all()` (or by an `RxWorker` or a `Multiceiver`)
+            carries the same kind of timestamp in its record.
         )docstr")
 
         // *****************************************************************************
 
-        .def("get_dynamic_payload_size", &RF24Wrapper::getDynamicPayloadSize, R"docstr(
-            get_dynamic_payload_size() -> int
+        .def("read_all", &RF24Wrapper::read_all, R"docstr(
+            read_all(buf: Union[bytearray, memoryview]) -> int
+
+            Drain the radio's RX FIFO into a preallocated buffer with a single function call.
+
+            :param bytearray,memoryview buf: A writable, C-contiguous buffer that the payloads are
+                written to. Each payload occupies a record of `RX_RECORD_SIZE` (48) bytes, so
+                ``len(buf) // RX_RECORD_SIZE`` payloads can be fetched at most. Any object that
+                supports python's buffer protocol (like a ``numpy.ndarray``) can be used.
+
+            :Returns: The number of records written to ``buf``.
+
+            Each record is laid out as follows (multi-byte values use the system's native
+            byte order):
+
+            ====== ====== ==============================================================
+            offset length description
+            ====== ====== ==============================================================
+            0      1      The pipe number that received the payload.
+            1      1      The length of the payload.
+            2      1      The index of the radio in a `RadioGroup` (otherwise zero).
+            3      5      (reserved; always zero)
+            8      8      The time (in nanoseconds) that the payload was observed in
+                          the RX FIFO (see `rx_timestamp`). This uses the same clock
+                          as `time.monotonic_ns()`.
+            16     32     The payload. Bytes beyond the payload's length are zero.
+            ====== ====== ==============================================================
+
+            A ``numpy.ndarray`` can be used as a view of the records without copying them:
+
+            .. code-block:: python
+
+                import numpy as np
+
+                rx_record = np.dtype(
+                    {
+                        "names": ["pipe", "length", "timestamp", "payload"],
+                        "formats": ["u1", "u1", "=u8", ("u1", 32)],
+                        "offsets": [0, 1, 8, 16],
+                        "itemsize": RX_RECORD_SIZE,
+                    }
+                )
+                records = np.zeros(64, dtype=rx_record)
+                count = radio.read_all(records)
+                for record in records[:count]:
+                    print(record["pipe"], bytes(record["payload"][: record["length"]]))
+        )docstr",
+             py::arg("buf"))
 
-            Get the Dynamic Payload Size of the next available payload in the radio's RX FIFO.
-        )docstr")
+        // *****************************************************************************
+        // ************************** functions that have overloads
 
-        .def("getDynamicPayloadSize", &RF24Wrapper::getDynamicPayloadSize, R"docstr(
-            getDynamicPayloadSize() -> int
-        )docstr")
+        .def(py::init<uint8_t, uint8_t, uint32_t>(), R"docstr(
+            __init__(ce_pin: int, csn_pin: int, spi_speed: int = 10000000)
+            __init__(spi_speed: int = 10000000)
+
+            Create a RF24 object.
+
+            :param int ce_pin: The pin number connected to the radio's CE pin.
+            :param int csn_pin: The pin number connected to the radio's CSN pin.
+            :param int spi_speed: The SPI bus speed (in Hz). Defaults to 10 MHz when not specified.
+        )docstr",
+             py::arg("ce_pin") = 0xFFFF, py::arg("csn_pin") = 0xFFFF, py::arg("spi_speed") = 10000000)
 
         // *****************************************************************************
 
-        .def("getPALevel", &RF24Wrapper::getPALevel, R"docstr(
-            getPALevel() -> pyrf24.rf24.rf24_pa_dbm_e
+        .def(py::init<uint32_t>(), R"docstr(
+            If it is desirable to create a RF24 object in which the pin numbers are dynamically
+            configured, the ``ce_pin`` and ``csn_pin`` parameters can be omitted.
 
-            Get the current setting of the radio's Power Amplitude Level.
+            .. important:: If dynamically configuring the pin numbers, then they must be set using
+                the overloaded :py:meth:`~pyrf24.rf24.RF24.begin()` function.
+        )docstr",
+             py::arg("spi_speed") = 10000000)
+
+        // *****************************************************************************
+
+        .def("begin", config_call<RF24Wrapper>(static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::begin)), R"docstr(
+            begin() -> bool \
+            begin(ce_pin: int, csn_pin: int) -> bool
+
+            Initialize the radio's hardware.
         )docstr")
 
         // *****************************************************************************
 
-        .def("getPayloadSize", &RF24Wrapper::getPayloadSize, R"docstr(
-            getPayloadSize() -> int
+        .def("begin", config_call<RF24Wrapper>(static_cast<bool (RF24Wrapper::*)(uint16_t, uint16_t)>(&RF24Wrapper::begin)), R"docstr(
+            If configuring the radio's CE & CSN pins dynamically, then the respective pin numbers must be passed to this function.
 
-            Configure the radio's static payload size (outgoing and incoming) for all data pipes.
+            :param int ce_pin: The pin number connected to the radio's CE pin.
+            :param int csn_pin: The pin number connected to the radio's CSN pin.
 
-            :param int length: The length of static payloads used for all data pipes.
-        )docstr")
+            :Returns: `True` if the radio was configured successfully, otherwise `False`.
+        )docstr",
+             py::arg("ce_pin"), py::arg("csn_pin"))
 
         // *****************************************************************************
 
-        .def("enableAckPayload", &RF24Wrapper::enableAckPayload, R"docstr(
-            enableAckPayload()
+        .def("available", stats_call<RF24Wrapper>(RadioStats::AVAILABLE, static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::available)), R"docstr(
+            available() -> bool
 
-            Enable the radio's Ack Payload feature.
+            Check if there is an available payload in the radio's RX FIFO.
+
+            :Returns: `True` if there is a payload in the radio's RX FIFO, otherwise `False`.
+
+            .. seealso::
+                Use :py:meth:`~pyrf24.rf24.RF24.available_pipe()` to get the pipe number that received the
+                next available payload.
         )docstr")
 
         // *****************************************************************************
 
-        .def("enable_dynamic_ack", &RF24Wrapper::enableDynamicAck, R"docstr(
-            enable_dynamic_ack()
+        .def("open_rx_pipe", &RF24Wrapper::open_rx_pipe, R"docstr(
+            open_rx_pipe(pipe_number: int, address: Union[bytearray, bytes, int])
 
-            Enable the radio's Dynamic Ack feature.
+            Open a data pipe for receiving.
 
-            By default the multicast parameter to `write()` is ineffective unless this
-            function is called. This design decision was made for compatibility with
-            the cheap chinese Si24R1 clones.
-        )docstr")
+            :param int pipe_number: The pipe number to use for receiving transmissions. This value should be in range [0, 5].
+            :param bytes,bytearray,memoryview,int address: The address assigned to the specified data pipe for receiving transmissions.
+        )docstr",
+             py::arg("pipe_number"), py::arg("address"))
 
-        .def("enableDynamicAck", &RF24Wrapper::enableDynamicAck, R"docstr(
-            enableDynamicAck()
-        )docstr")
+        .def("openReadingPipe", &RF24Wrapper::open_rx_pipe, R"docstr(
+            openReadingPipe(pipe_number: int, address: Union[bytearray, bytes, memoryview])
+        )docstr",
+             py::arg("pipe_number"), py::arg("address"))
 
         // *****************************************************************************
 
-        .def("enableDynamicPayloads", &RF24Wrapper::enableDynamicPayloads, R"docstr(
-            enableDynamicPayloads()
+        .def("open_rx_pipe", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint8_t, uint64_t)>(&RF24Wrapper::openReadingPipe)), R"docstr(
+            For backward compatibility, this function's ``address`` parameter can also take a 64-bit integer.
+        )docstr",
+             py::arg("pipe_number"), py::arg("address"))
 
-            Enable the radio's Dynamic Payloads feature.
-        )docstr")
+        .def("openReadingPipe", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint8_t, uint64_t)>(&RF24Wrapper::openReadingPipe)), R"docstr(
+            openReadingPipe(pipe_number: int, address: int)
+        )docstr",
+             py::arg("pipe_number"), py::arg("address"))
 
         // *****************************************************************************
 
-        .def("disableDynamicPayloads", &RF24Wrapper::disableDynamicPayloads, R"docstr(
-            disableDynamicPayloads()
+        .def("open_tx_pipe", &RF24Wrapper::open_tx_pipe, R"docstr(
+            open_tx_pipe(address: Union[bytearray, bytes, int])
 
-            Disable the radio's Dynamic Payloads feature.
-        )docstr")
+            Open data pipe 0 for transmitting to a specified address.
+
+            :param bytes,bytearray,memoryview,int address: The address assigned to data pipe 0 for outgoing transmissions.
+        )docstr",
+             py::arg("address"))
+
+        .def("openWritingPipe", &RF24Wrapper::open_tx_pipe, R"docstr(
+            openWritingPipe(address: Union[bytearray, bytes, memoryview])
+        )docstr",
+             py::arg("address"))
 
         // *****************************************************************************
 
-        .def("powerDown", &RF24Wrapper::powerDown, R"docstr(
-            powerDown()
+        .def("open_tx_pipe", spi_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint64_t)>(&RF24Wrapper::openWritingPipe)), R"docstr(
+            For backward compatibility, this function's ``address`` parameter can also take a 64-bit integer.
+        )docstr",
+             py::arg("address"))
 
-            Power down the radio.
+        .def("openWritingPipe", spi_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint64_t)>(&RF24Wrapper::openWritingPipe)), R"docstr(
+            openWritingPipe(address: int)
+        )docstr",
+             py::arg("address"))
 
-            .. important::
-                No transmissions can be received or transmitted when the radio is powered down.
-        )docstr")
+        // *****************************************************************************
+
+        .def("set_auto_ack", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(bool)>(&RF24Wrapper::setAutoAck)), R"docstr(
+            set_auto_ack(enable: bool) \
+            set_auto_ack(pipe_number: int, enable: bool)
+
+            Configure the radio's automatic acknowledgement feature for all data pipes or a specific data pipe.
+
+            :param bool enable: Enable/disable (`True`/`False`) the radio's auto-ack feature for all data pipes or for the specified
+                ``pipe_number``.
+            :param int pipe_number: The pipe number for which the ``enable`` parameter is about. This value must be in range [0, 5].
+        )docstr",
+             py::arg("enable"))
+
+        .def("setAutoAck", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(bool)>(&RF24Wrapper::setAutoAck)), R"docstr(
+            setAutoAck(enable: bool) \
+            setAutoAck(pipe_number: int, enable: bool)
+        )docstr",
+             py::arg("enable"))
 
         // *****************************************************************************
 
-        .def("powerUp", &RF24Wrapper::powerUp, R"docstr(
-            powerUp()
+        .def("set_auto_ack", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint8_t, bool)>(&RF24Wrapper::setAutoAck)),
+             py::arg("pipe_number"), py::arg("enable"))
 
-            Power up the radio.
-        )docstr")
+        .def("setAutoAck", config_call<RF24Wrapper>(static_cast<void (RF24Wrapper::*)(uint8_t, bool)>(&RF24Wrapper::setAutoAck)),
+             py::arg("pipe_number"), py::arg("enable"))
 
         // *****************************************************************************
 
-        .def("print_details", &RF24Wrapper::printDetails, R"docstr(
-            print_details()
+        .def("setPayloadSize", spi_call<RF24Wrapper>(&RF24Wrapper::setPayloadSize), R"docstr(
+            setPayloadSize(length: int)
 
-            Print out details about the radio's configuration.
+            Configure the radio's static payload size (outgoing and incoming) for all data pipes.
+
+            :param int length: The length of static payloads used for all data pipes.
+        )docstr",
+             py::arg("length"))
+
+        // *****************************************************************************
+
+        .def("tx_standby", stats_call<RF24Wrapper>(RadioStats::TX_STANDBY, static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::txStandBy)), R"docstr(
+            tx_standby() -> bool \
+            tx_standby(timeout: int, start_tx: bool = True) -> bool
+
+            When using `write_fast()` to fill the radio's TX FIFO, call this blocking function to allow the radio time to transmit.
+
+            The default timeout value is 95 milliseconds. Any failed transmissions will be re-attempted until successfully
+            transmitted or timeout occurs.
         )docstr")
 
-        .def("printDetails", &RF24Wrapper::printDetails, R"docstr(
-            printDetails()
-        )docstr")
+        .def("txStandBy", stats_call<RF24Wrapper>(RadioStats::TX_STANDBY, static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::txStandBy)), R"docstr(
+            txStandBy() -> bool
+        )docstr")
+
+        // *****************************************************************************
+
+        .def("tx_standby", stats_call<RF24Wrapper>(RadioStats::TX_STANDBY, static_cast<bool (RF24Wrapper::*)(uint32_t, bool)>(&RF24Wrapper::txStandBy)), R"docstr(
+            Optionally, a timeout value can be supplied to augment how long the function will block during transmission.
+
+            :param int timeout: The maximum time (in milliseconds) to allow for transmission. This value is added to the
+                default 95 milliseconds.
+            :param bool start_tx: Set this parameter to `False` if the radio's CE pin is already active. This parameter is optional.
+        )docstr",
+             py::arg("timeout"), py::arg("start_tx") = true)
+
+        .def("txStandBy", stats_call<RF24Wrapper>(RadioStats::TX_STANDBY, static_cast<bool (RF24Wrapper::*)(uint32_t, bool)>(&RF24Wrapper::txStandBy)), R"docstr(
+            txStandBy(timeout: int, start_tx: bool = True) -> bool
+        )docstr",
+             py::arg("timeout"), py::arg("start_tx") = true)
+
+        // *****************************************************************************
+
+        .def("is_fifo", spi_call<RF24Wrapper>(static_cast<bool (RF24Wrapper::*)(bool, bool)>(&RF24Wrapper::isFifo)), R"docstr(
+            is_fifo(about_tx: bool, check_empty: bool) -> bool \
+            is_fifo(about_tx: bool) -> int
+
+
+            Get information about a specified FIFO buffers.
+
+            :param bool about_tx: Ensure the returned data is about the TX FIFO. Set this to `False`
+                to make returned data describe the RX FIFO.
+            :param bool check_empty: Check if the specified FIFO is empty. Set this to `False` to
+                check if the specified FIFO is full.
+        )docstr",
+             py::arg("about_tx"), py::arg("check_empty"))
+
+        .def("isFifo", spi_call<RF24Wrapper>(static_cast<bool (RF24Wrapper::*)(bool, bool)>(&RF24Wrapper::isFifo)), R"docstr(
+            isFifo(about_tx: bool, check_empty: bool) -> bool
+        )docstr",
+             py::arg("about_tx"), py::arg("check_empty"))
+
+        // *****************************************************************************
+
+        .def("is_fifo", spi_call<RF24Wrapper>(static_cast<uint8_t (RF24Wrapper::*)(bool)>(&RF24Wrapper::isFifo)), R"docstr(
+            :Returns:
+                - A `bool` describing if the specified FIFO is empty or full.
+                - An `int` if the ``check_empty`` parameter was unspecified. In which case, the return integer is
+
+                  - ``0`` if the specified FIFO is neither full nor empty.
+                  - ``1`` if the specified FIFO is empty.
+                  - ``2`` if the specified FIFO is full.
+        )docstr",
+             py::arg("about_tx"))
+
+        .def("isFifo", spi_call<RF24Wrapper>(static_cast<uint8_t (RF24Wrapper::*)(bool)>(&RF24Wrapper::isFifo)), R"docstr(
+            isFifo(about_tx: bool) -> int
+        )docstr",
+             py::arg("about_tx"))
 
         // *****************************************************************************
+        // *********************************** functions wrapped into python object's properties
 
-        .def("print_pretty_details", &RF24Wrapper::printPrettyDetails, R"docstr(
-            print_pretty_details()
-
-            Print out details about the radio's configuration. This function differs from
-            `print_details()` as the output for this function is more human-friendly/readable.
-        )docstr")
+        .def_property("channel", spi_call<RF24Wrapper>(&RF24Wrapper::getChannel), config_call<RF24Wrapper>(&RF24Wrapper::setChannel), R"docstr(
+            This `int` attribute represents the radio's configured channel (AKA frequency). This roughly translates to frequency (in Hz).
+            So, channel 76 (the default setting) is
 
-        .def("printPrettyDetails", &RF24Wrapper::printPrettyDetails, R"docstr(
-            printPrettyDetails()
+            | 2400 MHz + 76 = 2.4076 GHz
         )docstr")
 
         // *****************************************************************************
 
-        .def("sprintf_pretty_details", &RF24Wrapper::sprintfDetails, R"docstr(
-            sprintf_pretty_details() -> str
-
-            Put details about the radio's configuration into a string. This function differs from
-            `print_pretty_details()` as it does not use stdout output stream.
-
-            :Returns: A string that describes the radio's details.
-        )docstr")
+        .def_property("pa_level", spi_call<RF24Wrapper>(&RF24Wrapper::get_pa_level), config_call<RF24Wrapper>(&RF24Wrapper::set_pa_level), R"docstr(
+            This attribute represents the radio's configured Power Amplitude level.
 
-        .def("sprintfPrettyDetails", &RF24Wrapper::sprintfDetails, R"docstr(
-            sprintfPrettyDetails() -> str
+            .. seealso:: Accepted values are defined in the `rf24_pa_dbm_e` enum struct.
         )docstr")
 
         // *****************************************************************************
 
-        .def("reuse_tx", &RF24Wrapper::reUseTX, R"docstr(
-            reuse_tx()
+        .def_property("payload_size", &RF24Wrapper::getPayloadSize, spi_call<RF24Wrapper>(&RF24Wrapper::setPayloadSize), R"docstr(
+            This `int` attribute represents the radio's static payload lengths. Maximum length is 32 bytes; minimum is 1 byte.
 
-            Re-use the 1\ :sup:`st` level of the radio's TX FIFO.
+            .. note:: This attribute is only used when the radio's `dynamic_payloads` feature is disabled
+                (which is disabled by default).
         )docstr")
 
-        .def("reUseTX", &RF24Wrapper::reUseTX, R"docstr(
-            reUseTX()
-        )docstr")
+        .def_property("payloadSize", &RF24Wrapper::getPayloadSize, spi_call<RF24Wrapper>(&RF24Wrapper::setPayloadSize))
 
         // *****************************************************************************
 
-        .def("startListening", &RF24Wrapper::startListening, R"docstr(
-            startListening()
+        .def_property("data_rate", spi_call<RF24Wrapper>(&RF24Wrapper::get_data_rate), config_call<RF24Wrapper>(&RF24Wrapper::setDataRate), R"docstr(
+            This attribute represents the radio's OTA data rate.
 
-            Put the radio into RX mode.
+            .. hint:: The units "BPS" stand for "Bits Per Second" (not Bytes per second).
+            .. seealso:: Accepted values are pre-defined in the `rf24_datarate_e` enum struct.
         )docstr")
 
         // *****************************************************************************
 
-        .def("stopListening", &RF24Wrapper::stopListening, R"docstr(
-            stopListening()
+        .def_property("crc_length", spi_call<RF24Wrapper>(&RF24Wrapper::getCRCLength), config_call<RF24Wrapper>(&RF24Wrapper::setCRCLength), R"docstr(
+            This attribute represents the radio's CRC checksum length (in bits).
 
-            Put the radio into TX mode.
+            .. seealso:: Accepted values are predefined in the `rf24_crclength_e` enum struct.
+            .. note::
+                The radio automatically uses CRC checksums when the auto-ack feature is enabled.
+                This attribute may not reflect this situation if CRC is disabled when auto-ack is enabled.
         )docstr")
 
         // *****************************************************************************
 
-        .def("stop_const_carrier", &RF24Wrapper::stopConstCarrier, R"docstr(
-            stop_const_carrier()
-
-            End transmitting a constant carrier wave. This function also sets the `power` to `False`
-            as recommended by the datasheet.
-        )docstr")
-
-        .def("stopConstCarrier", &RF24Wrapper::stopConstCarrier, R"docstr(
-            stopConstCarrier()
+        .def_property("power", spi_call<RF24Wrapper>(&RF24Wrapper::isPowerUp), config_call<RF24Wrapper>(&RF24Wrapper::power), R"docstr(
+            This `bool` attribute represents the radio's power status. `False` means the radio
+            is powered down.
         )docstr")
 
         // *****************************************************************************
 
-        .def("isValid", &RF24Wrapper::isValid, R"docstr(
-            isValid() -> bool
+        .def_property("listen", spi_call<RF24Wrapper>(&RF24Wrapper::isListening), config_call<RF24Wrapper>(&RF24Wrapper::listen), R"docstr(
+            This `bool` attribute represents the radio's primary mode (RX/TX).
 
-            Verify the configured pin numbers are indeed valid.
+            .. hint::
 
-            :Returns: `True` if the radio's CE & CSN pins have been configured (using the
-                RF24 class' constructor or :py:meth:`~pyrf24.rf24.RF24.begin()` function)
+                1. Be sure to call :py:meth:`~pyrf24.rf24.RF24.open_rx_pipe()` before
+                   setting :py:attr:`~pyrf24.rf24.RF24.listen` to `True`.
+                2. Do not call :py:meth:`~pyrf24.rf24.RF24.write()` while in RX mode, without
+                   first setting :py:attr:`~pyrf24.rf24.RF24.listen` to `False`.
+                3. Call :py:meth:`~pyrf24.rf24.RF24.available()` to check for incoming traffic,
+                   and use :py:meth:`~pyrf24.rf24.RF24.read()` to get it.
+
+            .. important::
+                If there was a call to :py:meth:`~pyrf24.rf24.RF24.open_rx_pipe()`
+                about pipe 0 prior to setting this attribute to `False`, then this attribute
+                will re-write the address that was last set to RX pipe 0.
+                This is because :py:meth:`~pyrf24.rf24.RF24.open_tx_pipe()`
+                will overwrite the address to RX pipe 0 for proper auto-ack
+                functionality.
+            .. note::
+                When the ACK payloads feature is enabled, the TX FIFO buffers are
+                flushed when changing this attribute to `True` (RX mode). This is meant to
+                discard any ACK payloads that were not appended to acknowledgment packets
+                during TX mode.
         )docstr")
 
         // *****************************************************************************
 
-        .def("isPVariant", &RF24Wrapper::isPVariant, R"docstr(
-            isPVariant() -> bool
-
-            Is the detected radio compatible with the nRF24L01+ family?
+        .def_property("dynamic_payloads", &RF24Wrapper::is_dynamic_payloads_enabled, config_call<RF24Wrapper>(&RF24Wrapper::dynamic_payloads), R"docstr(
+            This `bool` attribute represents the radio's dynamic payload length feature for all data pipes.
 
-            :Returns: `True` of the radio is a nRF24L01+ model (or compatible), otherwise `False`.
+            .. note::
+                Since `ack_payloads` requires Dynamic Payload lengths,
+                `ack_payloads` are also disabled when setting this attribute is set to `False`.
         )docstr")
 
         // *****************************************************************************
 
-        .def("testRPD", &RF24Wrapper::testRPD, R"docstr(
-            testRPD() -> bool
+        .def_property("ack_payloads", &RF24Wrapper::is_ack_payloads_enabled, config_call<RF24Wrapper>(&RF24Wrapper::toggle_ack_payloads), R"docstr(
+            This `bool` attribute represents the status of the radio's acknowledgement payload
+            feature for appending data to automatic acknowledgement packets.
 
-            :Returns: `True` if a signal (above -64 dbm) was detected in RX mode, otherwise `False`.
+            .. important::
+                To use acknowledgement payloads, the `dynamic_payloads` and auto-ack features must be enabled.
+
+                This attribute does not automatically enable the auto-ack feature
+                on pipe 0 because the auto-ack feature is enabled for all pipes by default.
+            .. seealso::
+                Review `write_ack_payload()` and `set_auto_ack()`. Use :meth:`~RF24.available()` and
+                :meth:`~RF24.read()` to fetch a received acknowledgement payload.
         )docstr")
 
         // *****************************************************************************
 
-        .def("rxFifoFull", &RF24Wrapper::rxFifoFull, R"docstr(
-            rxFifoFull() -> bool
+        .def_property("address_width", &RF24Wrapper::get_address_width, config_call<RF24Wrapper>(&RF24Wrapper::setAddressWidth), R"docstr(
+            This `int` attribute represents length of addresses used on the radio's data pipes.
+            Accepted values range [2, 5].
 
-            :Returns: `True` if all 3 levels of the radio's RX FIFO are occupied, otherwise `False`.
+            .. warning::
+                Using an address width of 2 bytes is not officially supported by the nRF24L01.
+                This ability is exposed for advanced reverse engineering purposes.
         )docstr")
 
         // *****************************************************************************
 
-        .def("what_happened", &RF24Wrapper::what_happened, R"docstr(
-            what_happened() -> Tuple[bool, bool, bool]
-
-            Call this function when the radio's IRQ pin is active LOW.
+        .def_property("register_cache", &RF24Wrapper::is_register_cache_enabled, spi_call<RF24Wrapper>(&RF24Wrapper::set_register_cache), R"docstr(
+            This `bool` attribute controls the register shadow (disabled by default).
 
-            :Returns: a 3-tuple of boolean values in which
+            When enabled, the radio's configuration registers (CONFIG, EN_AA, EN_RXADDR,
+            SETUP_AW, SETUP_RETR, RF_CH, RF_SETUP, DYNPD and FEATURE) are mirrored in memory,
+            so `listen`, `power`, `channel`, `pa_level`, `data_rate` and `crc_length` (and
+            their C++-named equivalents) are read without talking to the radio.
 
-                - index 0 represents a "data sent" event
-                - index 1 represents a "data failed" event
-                - index 2 represents a "data ready" event
+            Any function that may change the radio's configuration (including those of
+            `RF24Network` and `RF24Mesh` objects using this radio) invalidates the shadow.
+            The invalidated registers are fetched again when they are next needed.
 
-            .. note::
-                Calling this function also clears all status flags and resets the IRQ pin
-                to inactive high.
-            .. seealso::
-                :py:meth:`~pyrf24.rf24.RF24.mask_irq()`
-        )docstr")
+            Enabling the shadow calls `resync()`.
 
-        .def("whatHappened", &RF24Wrapper::what_happened, R"docstr(
-            whatHappened() -> Tuple[bool, bool, bool]
+            .. warning::
+                The shadow cannot detect changes made without this object, like a power
+                loss that resets the radio or another process using the same radio. Call
+                `resync()` after such events.
         )docstr")
 
         // *****************************************************************************
 
-        .def("available_pipe", &RF24Wrapper::available_pipe, R"docstr(
-            available_pipe() -> Tuple[bool, int]
-
-            Similar to :py:meth:`~pyrf24.rf24.RF24.available()`, but additionally returns the pipe
-            number that received the next available payload.
-
-            :Returns: A 2-tuple in which
+        .def("resync", spi_call<RF24Wrapper>(&RF24Wrapper::resync), R"docstr(
+            resync()
 
-                - index 0 is the `bool` value indicating if there is a available payload in the
-                  radio's RX FIFO.
-                - index 1 is the `int` value indicating the pipe number that received the next
-                  available in the radio's RX FIFO. If there is no payload received, then this
-                  number is set to an invalid value of 7.
+            Read all registers mirrored by the register shadow from the radio. This does
+            nothing if `register_cache` is disabled.
         )docstr")
 
         // *****************************************************************************
 
-        .def("get_arc", &RF24Wrapper::getARC, R"docstr(
-            get_arc() -> int
-
-            Returns automatic retransmission count (ARC_CNT)
-
-            Value resets with each new transmission. Allows roughly estimating signal strength.
-
-            :Returns: Returned values range from 0 to 15.
-        )docstr")
-
-        .def("getARC", &RF24Wrapper::getARC, R"docstr(
-            getARC() -> int
+        .def_property_readonly("spi_reads_saved", &RF24Wrapper::get_spi_reads_saved, R"docstr(
+            The number of register reads that were served from the register shadow (see
+            `register_cache`) instead of being made over the SPI bus.
         )docstr")
 
         // *****************************************************************************
-        // **************************************** functions that take args
-
-        .def("set_radiation", &RF24Wrapper::set_radiation, R"docstr(
-            set_radiation(level: rf24_pa_dbm_e, speed: rf24_datarate_e, lna_enable: bool = True)
-
-            Configure the RF_SETUP register in 1 SPI transaction.
-
-            :param rf24_pa_dbm_e level: The desired Power Amplitude level. Options are defined in the
-                `rf24_pa_dbm_e` enum.
-            :param rf24_datarate_e speed: The desired RF data rate. Options are defined in the
-                `rf24_datarate_e` enum.
-            :param bool lna_enable: A toggle for radio's that support controlling the Low Noise
-                Amplifier feature. This is always enabled by default and when not specified.
-
-            .. seealso::
 
-                - :py:meth:`~pyrf24.rf24.RF24.set_pa_level()`
-                - :py:attr:`~pyrf24.rf24.RF24.pa_level`
-                - :py:attr:`~pyrf24.rf24.RF24.data_rate`
-        )docstr",
-             py::arg("level"), py::arg("speed"), py::arg("lna_enable") = true)
+        .def_property("stats_enabled", &RF24Wrapper::is_stats_enabled, &RF24Wrapper::set_stats_enabled, R"docstr(
+            This `bool` attribute controls the instrumentation reported by `stats()`
+            (disabled by default). Enabling it resets all measurements.
 
-        .def("setRadiation", &RF24Wrapper::set_radiation, R"docstr(
-            setRadiation(level: rf24_pa_dbm_e, speed: rf24_datarate_e, lna_enable: bool = True)
-        )docstr",
-             py::arg("level"), py::arg("speed"), py::arg("lna_enable") = true)
+            While disabled, the instrumented functions cost no more than one atomic check.
+            While enabled, `write()` makes an extra SPI transaction (to count
+            retransmissions).
+        )docstr")
 
         // *****************************************************************************
 
-        .def("set_retries", &RF24Wrapper::setRetries, R"docstr(
-            set_retries(delay: int, count: int)
+        .def("stats", &RF24Wrapper::get_stats_snapshot, R"docstr(
+            stats(reset: bool = False) -> dict
 
-            Configure the radio's auto-retries feature.
+            Get the measurements made while `stats_enabled` is `True`.
 
-            :param int delay: A number in the range [0, 15] used as a multiple of 250. This
-                controls the amount of time (in microseconds) the radio waits for an
-                auto-acknowledgment.
-            :param int count: A number in range [0, 15]. This is the amount of automatic retries
-                that the radio attempts when an automatic acknowledgment is not received.
-        )docstr",
-             py::arg("delay"), py::arg("count"))
+            :param bool reset: Pass `True` to reset all measurements. The returned measurements
+                and the reset are one atomic step, so no call is counted twice or missed.
 
-        .def("setRetries", &RF24Wrapper::setRetries, R"docstr(
-            setRetries(delay: int, count: int)
-        )docstr",
-             py::arg("delay"), py::arg("count"))
+            :Returns: A `dict` with the following keys:
 
-        // *****************************************************************************
+                - ``"enabled"``: the value of `stats_enabled`.
+                - ``"elapsed_ns"``: the nanoseconds since the measurements were last reset.
+                - ``"write"``, ``"write_fast"``, ``"tx_standby"``, ``"available"`` and
+                  ``"read"``: a `dict` for each instrumented function. The C++-named
+                  equivalents, `available_pipe()` and `read_into()` are counted with them.
 
-        .def("setCRCLength", &RF24Wrapper::setCRCLength, R"docstr(
-            setCRCLength(length: rf24_crclength_e)
+                Each instrumented function's `dict` has the following keys:
 
-            Configure the radio's CRC Length feature.
+                - ``"calls"``: the number of calls.
+                - ``"failures"``: the number of calls that returned `False` (for ``"available"``,
+                  the calls that found no payload).
+                - ``"payload_bytes"``: the payload bytes transferred (``"write"``,
+                  ``"write_fast"`` and ``"read"`` only).
+                - ``"retransmits"``: the automatic retransmissions made (``"write"`` only).
+                - ``"total_ns"``, ``"min_ns"``, ``"max_ns"`` and ``"mean_ns"``: the durations of the
+                  calls.
+                - ``"lock_wait_ns"``: the part of ``"total_ns"`` spent waiting for other threads
+                  to finish using the radio.
+                - ``"p50_ns"``, ``"p90_ns"``, ``"p99_ns"`` and ``"p999_ns"``: the durations that
+                  50%, 90%, 99% and 99.9% of the calls did not exceed (within 25%).
+                - ``"histogram"``: a `list` of ``(limit_ns, count)`` tuples (one for every
+                  non-empty bucket) in which ``count`` calls took less than ``limit_ns``
+                  nanoseconds (and at least the previous bucket's ``limit_ns``).
 
-            :param rf24_crclength_e length: The number of bytes used in the radio's CRC checksum.
+            Durations are measured in C++ (from before the radio's lock is acquired until it is
+            released). So, the time spent in python is the difference between a call's duration
+            measured in python and the duration reported here.
 
-                .. seealso:: Values accepted by the parameter are predefined in the
-                    `rf24_crclength_e` enum struct.
+            .. note::
+                The SPI driver does not report its transactions. Use `spi_reads_saved` to see
+                the transactions avoided by the register shadow.
         )docstr",
-             py::arg("length"))
+             py::arg("reset") = false)
 
+#if defined(FAILURE_HANDLING)
         // *****************************************************************************
 
-        .def("setChannel", &RF24Wrapper::setChannel, R"docstr(
-            setChannel(channel: int)
+        .def_readwrite("failure_detected", &RF24Wrapper::failureDetected, R"docstr(
+            The number of accumulative transmission failures specific to the life
+            cycle of the `RF24` object.
+        )docstr")
 
-            Set the current setting of the radio's channel.
-        )docstr",
-             py::arg("channel"))
+        .def_readwrite("failureDetected", &RF24Wrapper::failureDetected, R"docstr(
+            The number of accumulative transmission failures specific to the life
+            cycle of the `RF24` object.
+        )docstr")
+#endif // defined (FAILURE_HANDLING)
 
         // *****************************************************************************
 
-        .def("setDataRate", &RF24Wrapper::setDataRate, R"docstr(
-            setDataRate(rate: rf24_datarate_e)
-
-            Configure the radio's Data Rate feature.
-
-            :param rf24_datarate_e rate: The speed in which the radio send out data over the air. Values
-                accepted for this parameter are pre-defined in the `rf24_datarate_e` enum struct.
-        )docstr",
-             py::arg("rate"))
+        .def_property_readonly("is_valid", &RF24Wrapper::isValid, R"docstr(
+            This read-only attribute represents if the radio's CE & CSN pins are configured properly.
+        )docstr")
 
         // *****************************************************************************
 
-        .def("setAddressWidth", &RF24Wrapper::setAddressWidth, R"docstr(
-            setAddressWidth(width: int)
-
-            Configure the radio's Address Width feature.
-
-            :param int width: The number of bytes used for address' length assigned to the data
-                pipes. Accepted values are clamped to range [3, 5].
-        )docstr",
-             py::arg("width"))
+        .def_property_readonly("is_plus_variant", &RF24Wrapper::isPVariant, R"docstr(
+            This read-only `bool` attribute represents if the detected radio is a nRF24L01+ model.
+        )docstr")
 
         // *****************************************************************************
 
-        .def("close_rx_pipe", &RF24Wrapper::closeReadingPipe, R"docstr(
-            close_rx_pipe(pipe: int)
-
-            Close a data pipe for receiving.
-
-            :param int pipe: The identifying data pipe number to close. Remember there are
-                only 6 data pipes (identified by the numbers 0-5).
-        )docstr",
-             py::arg("pipe"))
+        .def_property_readonly("rpd", spi_call<RF24Wrapper>(&RF24Wrapper::testRPD), R"docstr(
+            This read-only `bool` attribute represents if the radio detected a signal above -64 dbm in RX mode.
 
-        .def("closeReadingPipe", &RF24Wrapper::closeReadingPipe, R"docstr(
-            closeReadingPipe(pipe: int)
-        )docstr",
-             py::arg("pipe"))
+            .. hint::
+                RPD stands for "Received Power Detection". Non-plus variants of nRF24L01
+                call this attribute CD (short for "Carrier Detection") because this feature
+                was originally made available for government mandated hardware tests.
+        )docstr")
 
         // *****************************************************************************
 
-        .def("toggle_all_pipes", &RF24Wrapper::toggleAllPipes, R"docstr(
-            toggle_all_pipes(enable: bool)
+        .def_property_readonly("rx_fifo_full", spi_call<RF24Wrapper>(&RF24Wrapper::rxFifoFull), R"docstr(
+            This `bool` attribute represents if all 3 levels of the radio's RX FIFO are occupied.
+        )docstr")
 
-            Open or close all pipes with 1 SPI transaction. This does not alter the addresses assigned to
-            the data pipes (using `open_rx_pipe()` or `open_tx_pipe()`).
+        // *****************************************************************************
 
-            :param bool enable: `True` opens all data pipes for RX operation.
-                `False` closes all data pipes for RX operation.
-        )docstr",
-             py::arg("enable"))
+        .def_readwrite("cs_delay", &RF24Wrapper::csDelay, R"docstr(
+            The `int` number of microseconds used as a delay when the radio's CSN pin is made active.
+        )docstr")
 
-        .def("toggleAllPipes", &RF24Wrapper::toggleAllPipes, R"docstr(
-            toggleAllPipes(enable: bool)
-        )docstr",
-             py::arg("enable"))
+        // *****************************************************************************
+
+        .def_property_readonly("is_chip_connected", spi_call<RF24Wrapper>(&RF24Wrapper::isChipConnected), R"docstr(
+            Check if the SPI bus is working with the radio. This read-only `bool` attribute assumes that
+            :py:meth:`~pyrf24.rf24.RF24.begin()` returned `True`.
+        )docstr")
+
+        .def("isChipConnected", spi_call<RF24Wrapper>(&RF24Wrapper::isChipConnected), R"docstr(
+            isChipConnected() -> bool
+        )docstr")
 
         // *****************************************************************************
 
-        .def("start_const_carrier", &RF24Wrapper::startConstCarrier, R"docstr(
-            start_const_carrier(level: rf24_pa_dbm_e, channel: int)
+        .def_readwrite("tx_delay", &RF24Wrapper::txDelay, R"docstr(
+            The driver will delay for this duration (`int` in microseconds) when `listen` is set to `False`.
 
-            Start a constant carrier wave. This is used (in conjunction with `rpd`) to test the
-            radio's hardware.
+            When responding to payloads, faster devices like ARM(RPi) are much faster than Arduino:
 
-            :param rf24_pa_dbm_e level: The value used to configure Power Amplitude level. Accepted
-                values are pre-defined in the `rf24_pa_dbm_e` enum struct.
-            :param int channel: The  channel to broadcast on.
-        )docstr",
-             py::arg("level"), py::arg("channel"))
+            1. Arduino sends data to RPi, switches to RX mode
+            2. The RPi receives the data, switches to TX mode and sends before the Arduino radio is in RX mode
+            3. If AutoACK is disabled, this can be set as low as 0. If AutoACK enabled, set to 100uS minimum on RPi
 
-        .def("startConstCarrier", &RF24Wrapper::startConstCarrier, R"docstr(
-            startConstCarrier(level: rf24_pa_dbm_e, channel: int)
+            .. warning::
+                If set to 0, ensure 130uS delay after `listen` is set to `False` before any transmitting.
         )docstr")
 
+        .def_readwrite("txDelay", &RF24Wrapper::txDelay)
+
         // *****************************************************************************
+        // **************** functions that accept python's buffer protocol objects (bytes, bytearray)
 
-        .def("set_pa_level", &RF24Wrapper::setPALevel, R"docstr(
-            set_pa_level(level: rf24_pa_dbm_e, lna_enable: bool = True)
+        .def("start_fast_write", &RF24Wrapper::startFastWrite, R"docstr(
+            start_fast_write(buf: Union[bytearray, bytes, memoryview], multicast: bool = False, start_tx: bool = True) -> None
 
-            Configure the radio's Power Amplitude Level.
+            Write a payload to the radio's TX FIFO.
 
-            :param rf24_pa_dbm_e level: The value used to configure Power Amplitude level. Accepted
-                values are pre-defined in the `rf24_pa_dbm_e` enum struct.
-            :param bool lna_enable: This parameter configures the LNA (Low Noise Amplifier)
-                feature of the radio. This feature can only be configured on non-plus models of
-                the nRF24L01 (or the Si24R1 clone).
+            .. seealso::
+                Use `tx_standby()` to ensure the radio has had time to transmit the payload(s) from the TX FIFO.
+
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+            :param bool multicast: Set this parameter to `True` to flag the payload for
+                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
+                for the individual payload. Defaults to `False`.
+
+                .. important:: This parameter requires that the `enable_dynamic_ack()` function
+                    is called at least once prior to calling this function.
+            :param bool start_tx: Set this parameter to `True` to activate transmission. By
+                default this parameter is set to `True`. Notice this parameter controls the radio's
+                CE pin as required. Setting this parameter to `False` will only leave the radio's
+                CE pin unchanged.
         )docstr",
-             py::arg("level"), py::arg("lna_enable") = true)
+             py::arg("buf"), py::arg("multicast") = false, py::arg("start_tx") = true)
 
-        .def("setPALevel", &RF24Wrapper::setPALevel, R"docstr(
-            setPALevel(level: rf24_pa_dbm_e, lna_enable: bool = True)
+        .def("startFastWrite", &RF24Wrapper::startFastWrite, R"docstr(
+            startFastWrite(buf: Union[bytearray, bytes, memoryview], multicast: bool = False, start_tx: bool = True) -> None
         )docstr",
-             py::arg("level"), py::arg("lna_enable") = true)
+             py::arg("buf"), py::arg("multicast") = false, py::arg("start_tx") = true)
 
         // *****************************************************************************
 
-        .def("mask_irq", &RF24Wrapper::maskIRQ, R"docstr(
-            mask_irq(tx_ok: bool, tx_fail: bool, rx_ready: bool)
+        .def("start_write", &RF24Wrapper::startWrite, R"docstr(
+            start_write(buf: Union[bytearray, bytes, memoryview], multicast: bool = False) -> bool
 
-            Configure the radio's IRQ pin to go active on certain events.
+            For backward compatibility, this function is similar to `start_fast_write()`.
 
-            .. important:: The IRQ pin is only active when LOW.
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+            :param bool multicast: Set this parameter to `True` to flag the payload for
+                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
+                for the individual payload. Defaults to `False`.
 
-            :param bool tx_ok: `True` ignores the "data sent" event, `False` reflects the
-                "data sent" event on the IRQ pin.
-            :param bool tx_fail: `True` ignores the "data failed" event, `False` reflects the
-                "data failed" event on the IRQ pin.
-            :param bool rx_ready: `True` ignores the "data ready" event, `False` reflects the
-                "data ready" event on the IRQ pin.
+                .. important:: This parameter requires that the `enable_dynamic_ack()` function
+                    is called at least once prior to calling this function.
+
+            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
         )docstr",
-             py::arg("tx_ok"), py::arg("tx_fail"), py::arg("rx_ready"))
+             py::arg("buf"), py::arg("multicast") = false)
 
-        .def("maskIRQ", &RF24Wrapper::maskIRQ, R"docstr(
-            maskIRQ(tx_ok: bool, tx_fail: bool, rx_ready: bool)
+        .def("startWrite", &RF24Wrapper::startWrite, R"docstr(
+            startWrite(buf: Union[bytearray, bytes, memoryview], multicast: bool = False) -> bool
         )docstr",
-             py::arg("tx_ok"), py::arg("tx_fail"), py::arg("rx_ready"))
+             py::arg("buf"), py::arg("multicast") = false)
 
         // *****************************************************************************
 
-        .def("read", &RF24Wrapper::read, R"docstr(
-            read(length: int) -> bytearray
-
-            Fetch data from the radio's RX FIFO.
+        .def("write", &RF24Wrapper::write, R"docstr(
+            write(buf: Union[bytearray, bytes, memoryview], multicast: bool = False) -> bool
 
-            :param int length: The number of bytes to fetch from the radio's RX FIFO.
-                If this parameter is not specified, then the length of the next available payload
-                is used. The maximum number of bytes that can be fetched at once is 32 bytes.
+            Transmit a single payload.
 
-                - If the value specified by this parameter is less than the length of the next
-                  available payload, then the payload will remain in the RX FIFO.
-                - If the value specified by this parameter is greater than the length of the next
-                  available payload, then the data from the next level of the RX FIFO is returned
-                  (if any).
-                - If the value specified by this parameter is greater than the length of the last
-                  available payload, then the payload's last byte is returned repeatedly until the
-                  length value is fulfilled.
-            :Returns: A `bytearray` of the specified ``length`` containing the data from the
-                payload in the RX FIFO.
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+            :param bool multicast: Set this parameter to `True` to flag the payload for
+                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
+                for the individual payload. Defaults to `False`.
 
-            .. seealso::
+                .. important:: This parameter requires that the `enable_dynamic_ack()` function
+                    is called at least once prior to calling this function.
 
-                - :py:attr:`~pyrf24.rf24.RF24.payload_size`
-                - :py:meth:`~pyrf24.rf24.RF24.get_dynamic_payload_size()`
-                - :py:meth:`~pyrf24.rf24.RF24.available()`
+            :Returns: `True` if the payload was successfully transmitted, otherwise `False`.
         )docstr",
-             py::arg("length") = 0)
+             py::arg("buf"), py::arg("multicast") = false)
 
         // *****************************************************************************
-        // ************************** functions that have overloads
 
-        .def(py::init<uint8_t, uint8_t, uint32_t>(), R"docstr(
-            __init__(ce_pin: int, csn_pin: int, spi_speed: int = 10000000)
-            __init__(spi_speed: int = 10000000)
+        .def_property_readonly("tx_timestamp", &RF24Wrapper::get_tx_timestamp, R"docstr(
+            The time (in nanoseconds) that the last transmission was observed to complete
+            (successfully or not). This uses the same clock as `time.monotonic_ns()`, but it is
+            taken natively (without the jitter of the python interpreter). ``0`` means no
+            transmission completed yet.
 
-            Create a RF24 object.
+            This is updated by `write()`, `write_many()`, `tx_standby()`, `wait_for_irq()` and
+            `what_happened()` (when the TX_DS or MAX_RT flag is observed), and by the
+            ``write()`` methods of `RF24Network` and `RF24Mesh`.
 
-            :param int ce_pin: The pin number connected to the radio's CE pin.
-            :param int csn_pin: The pin number connected to the radio's CSN pin.
-            :param int spi_speed: The SPI bus speed (in Hz). Defaults to 10 MHz when not specified.
-        )docstr",
-             py::arg("ce_pin") = 0xFFFF, py::arg("csn_pin") = 0xFFFF, py::arg("spi_speed") = 10000000)
+            If the receiving radio uses the same clock (like a radio attached to the same
+            machine), then subtracting its `rx_timestamp` from this gives the time spent
+            acknowledging the payload, and the differences between successive timestamps give
+            the jitter.
+        )docstr")
 
         // *****************************************************************************
 
-        .def(py::init<uint32_t>(), R"docstr(
-            If it is desirable to create a RF24 object in which the pin numbers are dynamically
-            configured, the ``ce_pin`` and ``csn_pin`` parameters can be omitted.
+        .def("write_ack_payload", &RF24Wrapper::writeAckPayload, R"docstr(
+            write_ack_payload(pipe: int, buf: Union[bytearray, bytes, memoryview]) -> bool
 
-            .. important:: If dynamically configuring the pin numbers, then they must be set using
-                the overloaded :py:meth:`~pyrf24.rf24.RF24.begin()` function.
+            Load a payload into the TX FIFO to be used in the ACK packet of automatic acknowledgements.
+
+            :param int pipe: The pipe number to use for the acknowledging payload.
+
+                .. seealso:: Set the pipe's assigned address using `open_rx_pipe()`
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+
+            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
         )docstr",
-             py::arg("spi_speed") = 10000000)
+             py::arg("pipe"), py::arg("buf"))
+
+        .def("writeAckPayload", &RF24Wrapper::writeAckPayload, R"docstr(
+            writeAckPayload(pipe: int, buf: Union[bytearray, bytes, memoryview]) -> bool
+        )docstr",
+             py::arg("pipe"), py::arg("buf"))
 
         // *****************************************************************************
 
-        .def("begin", static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::begin), R"docstr(
-            begin() -> bool \
-            begin(ce_pin: int, csn_pin: int) -> bool
+        .def("set_ack_payload_source", &RF24Wrapper::set_ack_payload_source, R"docstr(
+            set_ack_payload_source(pipe: int, source: Union[queue.Queue, collections.deque, Iterable, None]) -> None
 
-            Initialize the radio's hardware.
-        )docstr")
+            Keep the TX FIFO topped up with ACK payloads for a pipe, so an ACK payload is
+            attached to every payload that the pipe receives without calling
+            `write_ack_payload()` each time.
 
-        // *****************************************************************************
+            :param int pipe: The pipe number (in range [0, 5]).
+            :param source: The object that ACK payloads (`bytes`, `bytearray`, or
+                `memoryview` objects) are taken from. It can be
 
-        .def("begin", static_cast<bool (RF24Wrapper::*)(uint16_t, uint16_t)>(&RF24Wrapper::begin), R"docstr(
-            If configuring the radio's CE & CSN pins dynamically, then the respective pin numbers must be passed to this function.
+                - a queue with ``empty()`` and ``get_nowait()`` methods (like `queue.Queue`)
+                - a `collections.deque` (payloads are taken with ``popleft()``)
+                - any other iterable (payloads are taken until it is exhausted)
+                - ``None`` to remove the pipe's source
 
-            :param int ce_pin: The pin number connected to the radio's CE pin.
-            :param int csn_pin: The pin number connected to the radio's CSN pin.
+            :raises RuntimeError: If `ack_payloads` are not enabled.
 
-            :Returns: `True` if the radio was configured successfully, otherwise `False`.
+            Up to 8 payloads per pipe are taken from the source in advance and kept natively.
+            Each time a payload is read (using `read()`, `read_into()`, `read_all()`, an
+            `RxWorker`, or a `Multiceiver`), the TX FIFO is refilled from those payloads
+            without involving python. The pipe with the fewest ACK payloads in the TX FIFO is
+            refilled first. More payloads are taken from the sources whenever `read()`,
+            `read_into()` or `read_all()` is called (or `take()`, `take_all()` or
+            `dispatch()` of an `RxWorker` or `Multiceiver`).
+
+            .. important::
+                The TX FIFO is shared by all pipes and only holds 3 payloads. Do not use
+                `write_ack_payload()` (or `recv_stream()`) while a source is set, and stop
+                listening before setting a source for a pipe that is no longer used.
+                Otherwise, the counts in `ack_payloads_sent` and `ack_payload_underruns`
+                become inaccurate.
         )docstr",
-             py::arg("ce_pin"), py::arg("csn_pin"))
+             py::arg("pipe"), py::arg("source"))
 
         // *****************************************************************************
 
-        .def("available", static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::available), R"docstr(
-            available() -> bool
-
-            Check if there is an available payload in the radio's RX FIFO.
+        .def_property_readonly("ack_payloads_sent", &RF24Wrapper::get_ack_payloads_sent, R"docstr(
+            A `list` of the number of ACK payloads (indexed by pipe number) that were taken from
+            a source set with `set_ack_payload_source()` and attached to a received payload.
+        )docstr")
 
-            :Returns: `True` if there is a payload in the radio's RX FIFO, otherwise `False`.
+        // *****************************************************************************
 
-            .. seealso::
-                Use :py:meth:`~pyrf24.rf24.RF24.available_pipe()` to get the pipe number that received the
-                next available payload.
+        .def_property_readonly("ack_payload_underruns", &RF24Wrapper::get_ack_payload_underruns, R"docstr(
+            A `list` of the number of payloads (indexed by pipe number) that were received while
+            the pipe had a source set with `set_ack_payload_source()`, but no ACK payload
+            was loaded in the TX FIFO. Those payloads were acknowledged with an empty ACK
+            packet. If this keeps increasing, then put payloads in the source sooner.
         )docstr")
 
         // *****************************************************************************
 
-        .def("open_rx_pipe", &RF24Wrapper::open_rx_pipe, R"docstr(
-            open_rx_pipe(pipe_number: int, address: Union[bytearray, bytes, int])
+        .def("write_blocking", &RF24Wrapper::writeBlocking, R"docstr(
+            write_blocking(buf: Union[bytearray, bytes, memoryview], timeout: int) -> bool
 
-            Open a data pipe for receiving.
+            A blocking function to load a payload into the radio's TX FIFO. If there is no un-occupied
+            level of the TX FIFO, this function waits until a level becomes available or the specified
+            timeout is reached.
 
-            :param int pipe_number: The pipe number to use for receiving transmissions. This value should be in range [0, 5].
-            :param bytes,bytearray,int address: The address assigned to the specified data pipe for receiving transmissions.
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+            :param int timeout: The amount of time (in milliseconds) to wait while there is no
+                available level in the TX FIFO.
+
+            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
         )docstr",
-             py::arg("pipe_number"), py::arg("address"))
+             py::arg("buf"), py::arg("timeout"))
 
-        .def("openReadingPipe", &RF24Wrapper::open_rx_pipe, R"docstr(
-            openReadingPipe(pipe_number: int, address: Union[bytearray, bytes])
+        .def("writeBlocking", &RF24Wrapper::writeBlocking, R"docstr(
+            writeBlocking(buf: Union[bytearray, bytes, memoryview], timeout: int) -> bool
         )docstr",
-             py::arg("pipe_number"), py::arg("address"))
+             py::arg("buf"), py::arg("timeout"))
 
         // *****************************************************************************
 
-        .def("open_rx_pipe", static_cast<void (RF24Wrapper::*)(uint8_t, uint64_t)>(&RF24Wrapper::openReadingPipe), R"docstr(
-            For backward compatibility, this function's ``address`` parameter can also take a 64-bit integer.
-        )docstr",
-             py::arg("pipe_number"), py::arg("address"))
+        .def("write_fast", &RF24Wrapper::writeFast, R"docstr(
+            write_fast(buf: Union[bytearray, bytes, memoryview], multicast: bool = False) -> bool
 
-        .def("openReadingPipe", static_cast<void (RF24Wrapper::*)(uint8_t, uint64_t)>(&RF24Wrapper::openReadingPipe), R"docstr(
-            openReadingPipe(pipe_number: int, address: int)
-        )docstr",
-             py::arg("pipe_number"), py::arg("address"))
+            Simply load a payload into the radio's TX FIFO and assert the radio's CE pin to activate transmission.
 
-        // *****************************************************************************
+            .. seealso::
+                Use `tx_standby()` to ensure the radio has had time to transmit the payload(s) from the TX FIFO.
 
-        .def("open_tx_pipe", &RF24Wrapper::open_tx_pipe, R"docstr(
-            open_tx_pipe(address: Union[bytearray, bytes, int])
+            :param bytes,bytearray,memoryview buf: The payload to load into the TX FIFO.
+            :param bool multicast: Set this parameter to `True` to flag the payload for
+                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
+                for the individual payload. Defaults to `False`.
 
-            Open data pipe 0 for transmitting to a specified address.
+                .. important:: This parameter requires that the `enable_dynamic_ack()` function
+                    is called at least once prior to calling this function.
 
-            :param bytes,bytearray,int address: The address assigned to data pipe 0 for outgoing transmissions.
+            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
         )docstr",
-             py::arg("address"))
+             py::arg("buf"), py::arg("multicast") = false)
 
-        .def("openWritingPipe", &RF24Wrapper::open_tx_pipe, R"docstr(
-            openWritingPipe(address: Union[bytearray, bytes])
+        .def("writeFast", &RF24Wrapper::writeFast, R"docstr(
+            writeFast(buf: Union[bytearray, bytes, memoryview], multicast: bool = False) -> bool
         )docstr",
-             py::arg("address"))
+             py::arg("buf"), py::arg("multicast") = false)
 
         // *****************************************************************************
 
-        .def("open_tx_pipe", static_cast<void (RF24Wrapper::*)(uint64_t)>(&RF24Wrapper::openWritingPipe), R"docstr(
-            For backward compatibility, this function's ``address`` parameter can also take a 64-bit integer.
+        .def("write_many", static_cast<py::bytearray (RF24Wrapper::*)(py::buffer, uint8_t, const bool, uint32_t)>(&RF24Wrapper::write_many), R"docstr(
+            write_many(buffers: Union[Sequence[Union[bytearray, bytes, memoryview]], bytearray, bytes], stride: Optional[int] = None, multicast: bool = False, timeout_ms: int = 95) -> bytearray
+
+            Transmit a burst of payloads with a single function call. The radio's TX FIFO is
+            kept as full as possible (using `start_fast_write()`) until all payloads have been
+            transmitted. Afterward, the radio is put in Standby-I mode (like `tx_standby()`).
+
+            :param list,tuple,bytes,bytearray,memoryview buffers: The payloads to transmit. This can be
+
+                - a sequence of `bytes` or `bytearray` objects. Each is truncated to 32 bytes.
+                - a single `bytes` or `bytearray` object that is split into payloads of ``stride``
+                  bytes. The last payload will be shorter if the buffer's length is not a multiple
+                  of ``stride``.
+            :param int stride: The length of each payload in ``buffers``. This parameter is only
+                used (and required) when ``buffers`` is a single `bytes` or `bytearray` object.
+                This value should be in range [1, 32].
+            :param bool multicast: Set this parameter to `True` to flag all payloads for
+                no acknowledgement. See the ``multicast`` parameter in `write_fast()`.
+            :param int timeout_ms: The time (in milliseconds) to keep re-transmitting a payload
+                that was not acknowledged (using `reuse_tx()`) before discarding it and moving on
+                to the next payload. Defaults to 95.
+
+            :Returns: A `bytearray` that has 1 byte for each payload. Each byte is either
+
+                - the number of auto-retries (see `get_arc()`) observed while the payload was
+                  in flight, if the payload was transmitted successfully.
+                - ``0xFF`` if the payload could not be transmitted.
+
+            .. note:: The radio does not report how many payloads left the TX FIFO, so it is
+                inferred from the TX FIFO's occupancy and the ``TX_DS`` flag. This is accurate
+                unless the calling thread is preempted for more than a couple of transmissions.
+                In that case, a payload could be re-transmitted after it was already
+                acknowledged.
         )docstr",
-             py::arg("address"))
+             py::arg("buffers"), py::arg("stride"), py::arg("multicast") = false, py::arg("timeout_ms") = 95)
 
-        .def("openWritingPipe", static_cast<void (RF24Wrapper::*)(uint64_t)>(&RF24Wrapper::openWritingPipe), R"docstr(
-            openWritingPipe(address: int)
+        .def("write_many", static_cast<py::bytearray (RF24Wrapper::*)(py::sequence, const bool, uint32_t)>(&RF24Wrapper::write_many), R"docstr(
+            Pass a sequence of payloads as ``buffers`` (and omit the ``stride`` parameter).
         )docstr",
-             py::arg("address"))
+             py::arg("buffers"), py::arg("multicast") = false, py::arg("timeout_ms") = 95)
 
         // *****************************************************************************
 
-        .def("set_auto_ack", static_cast<void (RF24Wrapper::*)(bool)>(&RF24Wrapper::setAutoAck), R"docstr(
-            set_auto_ack(enable: bool) \
-            set_auto_ack(pipe_number: int, enable: bool)
+        .def("scan", &RF24Wrapper::scan, R"docstr(
+            scan(channels: Iterable[int] = range(126), dwell_us: int = 130, sweeps: int = 1, history: bool = False) -> array.array | tuple[array.array, memoryview]
 
-            Configure the radio's automatic acknowledgement feature for all data pipes or a specific data pipe.
+            Survey the given channels for ambient signals using the radio's Received Power
+            Detector (see `rpd`). The whole survey runs natively with the GIL released, so each
+            channel hop only costs a few SPI transactions.
 
-            :param bool enable: Enable/disable (`True`/`False`) the radio's auto-ack feature for all data pipes or for the specified
-                ``pipe_number``.
-            :param int pipe_number: The pipe number for which the ``enable`` parameter is about. This value must be in range [0, 5].
-        )docstr",
-             py::arg("enable"))
+            :param Iterable[int] channels: The channels to survey (in the given order). Each
+                channel must be in range [0, 125]. A channel may be listed more than once.
+            :param int dwell_us: The time (in microseconds) to listen on each channel.
+            :param int sweeps: The number of times that all ``channels`` are surveyed.
+            :param bool history: Also return which channels had a signal in each sweep.
 
-        .def("setAutoAck", static_cast<void (RF24Wrapper::*)(bool)>(&RF24Wrapper::setAutoAck), R"docstr(
-            setAutoAck(enable: bool) \
-            setAutoAck(pipe_number: int, enable: bool)
+            :Returns:
+                An `array.array` of unsigned integers (type code ``"I"``) that holds the number
+                of sweeps in which a signal was detected on each channel (in the same order as
+                ``channels``).
+
+                If ``history`` is `True`, a `tuple` is returned instead, in which
+
+                - index 0 is the `array.array` described above
+                - index 1 is a 2-dimensional `memoryview` of bytes with a row per sweep and
+                  a column per channel. Each byte is ``1`` if a signal was detected, or ``0``
+                  otherwise.
+
+                Both objects support the buffer protocol, so they can be wrapped by
+                ``numpy.asarray()`` without copying any data.
+
+            The radio should already be configured for scanning (see the scanner example).
+            The radio's channel and RX mode are restored afterward. Any payloads in the RX
+            FIFO (including those received before the survey) are discarded.
         )docstr",
-             py::arg("enable"))
+             py::arg("channels") = py::module_::import("builtins").attr("range")(126), py::arg("dwell_us") = 130, py::arg("sweeps") = 1, py::arg("history") = false)
 
         // *****************************************************************************
 
-        .def("set_auto_ack", static_cast<void (RF24Wrapper::*)(uint8_t, bool)>(&RF24Wrapper::setAutoAck),
-             py::arg("pipe_number"), py::arg("enable"))
+        .def("send_stream", &RF24Wrapper::send_stream, R"docstr(
+            send_stream(source: Union[ReadableBuffer, BinaryIO, Iterable[ReadableBuffer]], timeout_ms: int = 1000) -> bool
 
-        .def("setAutoAck", static_cast<void (RF24Wrapper::*)(uint8_t, bool)>(&RF24Wrapper::setAutoAck),
-             py::arg("pipe_number"), py::arg("enable"))
+            Send a stream of data (of any length) to a radio that calls `recv_stream()`.
 
-        // *****************************************************************************
+            The data is split into payloads of 30 bytes, each prefixed with a 2 byte sequence
+            number. The TX FIFO is kept full, and the receiver reports which payloads it is
+            missing in ACK payloads, so only the missing payloads are sent again. The whole
+            transfer runs natively with the GIL released.
 
-        .def("setPayloadSize", &RF24Wrapper::setPayloadSize, R"docstr(
-            setPayloadSize(length: int)
+            :param source: The data to send. This can be
 
-            Configure the radio's static payload size (outgoing and incoming) for all data pipes.
+                - an object that supports the buffer protocol (like `bytes` or a `mmap.mmap`),
+                  which is sent without copying the data.
+                - a binary file object (anything with a ``read()`` method).
+                - an iterable of objects that support the buffer protocol.
 
-            :param int length: The length of static payloads used for all data pipes.
+                The GIL is only acquired to read the next 4 KB from a file object or to get the
+                next item from an iterable.
+            :param int timeout_ms: The maximum time (in milliseconds) to wait for the receiver
+                to report any progress.
+
+            :Returns: `True` if the receiver confirmed that it received the whole stream, or
+                `False` if the transfer timed out.
+
+            Both radios must have `dynamic_payloads` and `ack_payloads` enabled, and the
+            receiving radio's reading pipe must use the address given to `open_tx_pipe()`.
+            If the radio is listening, it stops listening to send the stream and resumes
+            listening afterward. Any ACK payloads waiting in the radio's FIFOs are discarded.
         )docstr",
-             py::arg("length"))
+             py::arg("source"), py::arg("timeout_ms") = 1000)
 
         // *****************************************************************************
 
-        .def("tx_standby", static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::txStandBy), R"docstr(
-            tx_standby() -> bool \
-            tx_standby(timeout: int, start_tx: bool = True) -> bool
-
-            When using `write_fast()` to fill the radio's TX FIFO, call this blocking function to allow the radio time to transmit.
+        .def("recv_stream", &RF24Wrapper::recv_stream, R"docstr(
+            recv_stream(sink: Union[WriteableBuffer, BinaryIO], timeout_ms: int = 1000) -> Optional[int]
 
-            The default timeout value is 95 milliseconds. Any failed transmissions will be re-attempted until successfully
-            transmitted or timeout occurs.
-        )docstr")
+            Receive a stream of data sent by a radio that calls `send_stream()`.
 
-        .def("txStandBy", static_cast<bool (RF24Wrapper::*)()>(&RF24Wrapper::txStandBy), R"docstr(
-            txStandBy() -> bool
-        )docstr")
+            :param sink: Where the received data is written. This can be
 
-        // *****************************************************************************
+                - a writable object that supports the buffer protocol (like a `bytearray` or a
+                  `mmap.mmap`). The data is written directly into it (without holding the GIL),
+                  so it must be preallocated to fit the whole stream.
+                - a binary file object (anything with a ``write()`` method). The data is written
+                  in order, in blocks of about 4 KB. The GIL is only acquired to write a block.
+            :param int timeout_ms: The maximum time (in milliseconds) to wait for the next
+                payload of the stream (or for the stream to start).
 
-        .def("tx_standby", static_cast<bool (RF24Wrapper::*)(uint32_t, bool)>(&RF24Wrapper::txStandBy), R"docstr(
-            Optionally, a timeout value can be supplied to augment how long the function will block during transmission.
+            :Returns: The length (in bytes) of the stream, or `None` if the transfer timed out.
+                Any data received before a timeout was already written to the ``sink``.
 
-            :param int timeout: The maximum time (in milliseconds) to allow for transmission. This value is added to the
-                default 95 milliseconds.
-            :param bool start_tx: Set this parameter to `False` if the radio's CE pin is already active. This parameter is optional.
-        )docstr",
-             py::arg("timeout"), py::arg("start_tx") = true)
+            :raises ValueError: if the stream does not fit in a ``sink`` buffer.
 
-        .def("txStandBy", static_cast<bool (RF24Wrapper::*)(uint32_t, bool)>(&RF24Wrapper::txStandBy), R"docstr(
-            txStandBy(timeout: int, start_tx: bool = True) -> bool
+            Both radios must have `dynamic_payloads` and `ack_payloads` enabled. The radio
+            starts listening (if it is not already listening). If another stream starts while
+            a stream is received, the first stream is abandoned and the new stream is
+            written from the start of the ``sink``.
         )docstr",
-             py::arg("timeout"), py::arg("start_tx") = true)
+             py::arg("sink"), py::arg("timeout_ms") = 1000)
 
         // *****************************************************************************
 
-        .def("is_fifo", static_cast<bool (RF24Wrapper::*)(bool, bool)>(&RF24Wrapper::isFifo), R"docstr(
-            is_fifo(about_tx: bool, check_empty: bool) -> bool \
-            is_fifo(about_tx: bool) -> int
+        .def(
+            "start_rx_worker", [](RF24Wrapper& self, size_t capacity) { return new RxWorker(self, capacity); }, R"docstr(
+            start_rx_worker(capacity: int = 256) -> RxWorker
 
+            Start a native thread that continuously drains the radio's RX FIFO into a ring buffer.
+            Unlike polling the radio from python, the thread keeps running during garbage
+            collection pauses and while other python threads hold the GIL.
 
-            Get information about a specified FIFO buffers.
+            :param int capacity: The maximum number of payloads that the ring buffer can hold.
 
-            :param bool about_tx: Ensure the returned data is about the TX FIFO. Set this to `False`
-                to make returned data describe the RX FIFO.
-            :param bool check_empty: Check if the specified FIFO is empty. Set this to `False` to
-                check if the specified FIFO is full.
-        )docstr",
-             py::arg("about_tx"), py::arg("check_empty"))
+            :Returns: An `RxWorker` object to fetch the received payloads from.
 
-        .def("isFifo", static_cast<bool (RF24Wrapper::*)(bool, bool)>(&RF24Wrapper::isFifo), R"docstr(
-            isFifo(about_tx: bool, check_empty: bool) -> bool
+            :raises RuntimeError: If an `RxWorker` or a `Multiceiver` is already running for
+                this radio.
+
+            .. important::
+                Do not read payloads from the radio (using `read()`, `read_into()` or
+                `read_all()`) while the `RxWorker` is running. Other methods can be used
+                as usual.
+
+            .. seealso:: `attach_irq()` lets the thread sleep until the radio asserts its IRQ pin.
+                Otherwise, the thread polls the radio like `wait_for_irq()` does.
         )docstr",
-             py::arg("about_tx"), py::arg("check_empty"))
+            py::arg("capacity") = 256, py::keep_alive<0, 1>())
 
         // *****************************************************************************
 
-        .def("is_fifo", static_cast<uint8_t (RF24Wrapper::*)(bool)>(&RF24Wrapper::isFifo), R"docstr(
-            :Returns:
-                - A `bool` describing if the specified FIFO is empty or full.
-                - An `int` if the ``check_empty`` parameter was unspecified. In which case, the return integer is
+        .def(
+            "start_multiceiver", [](RF24Wrapper& self, size_t capacity) { return new Multiceiver(self, capacity); }, R"docstr(
+            start_multiceiver(capacity: int = 64) -> Multiceiver
 
-                  - ``0`` if the specified FIFO is neither full nor empty.
-                  - ``1`` if the specified FIFO is empty.
-                  - ``2`` if the specified FIFO is full.
+            Start a native thread that continuously drains the radio's RX FIFO into a separate
+            queue for each pipe. This is like `start_rx_worker()`, but a pipe that receives many
+            payloads cannot fill the queues of the other pipes.
+
+            :param int capacity: The maximum number of payloads that each pipe's queue can hold.
+
+            :Returns: A `Multiceiver` object to fetch the received payloads from.
+
+            :raises RuntimeError: If an `RxWorker` or a `Multiceiver` is already running for
+                this radio.
+
+            .. important::
+                Do not read payloads from the radio (using `read()`, `read_into()` or
+                `read_all()`) while the `Multiceiver` is running. Other methods can be used
+                as usual.
         )docstr",
-             py::arg("about_tx"))
+            py::arg("capacity") = 64, py::keep_alive<0, 1>());
 
-        .def("isFifo", static_cast<uint8_t (RF24Wrapper::*)(bool)>(&RF24Wrapper::isFifo), R"docstr(
-            isFifo(about_tx: bool) -> int
+    // ******************** RxWorker class  **************************
+    py::class_<RxWorker>(m, "RxWorker", R"docstr(
+        A native thread that drains a radio's RX FIFO into a ring buffer.
+        Use `RF24.start_rx_worker()` to create an `RxWorker` object.
+    )docstr")
+
+        .def("take", &RxWorker::take, R"docstr(
+            take(max_n: int = 0) -> bytearray
+
+            Fetch (and remove) received payloads from the ring buffer.
+
+            :param int max_n: The maximum number of payloads to fetch. ``0`` fetches all
+                payloads in the ring buffer.
+
+            :Returns: A `bytearray` of records (`RX_RECORD_SIZE` bytes each). The records
+                are laid out as described in `RF24.read_all()`. The timestamp of each record
+                is the time that the payload was first observed in the RX FIFO (see
+                `RF24.rx_timestamp`).
         )docstr",
-             py::arg("about_tx"))
+             py::arg("max_n") = 0)
 
         // *****************************************************************************
-        // *********************************** functions wrapped into python object's properties
 
-        .def_property("channel", &RF24Wrapper::getChannel, &RF24Wrapper::setChannel, R"docstr(
-            This `int` attribute represents the radio's configured channel (AKA frequency). This roughly translates to frequency (in Hz).
-            So, channel 76 (the default setting) is
+        .def("stop", &RxWorker::stop, R"docstr(
+            stop() -> None
 
-            | 2400 MHz + 76 = 2.4076 GHz
+            Stop the thread. Payloads left in the ring buffer can still be fetched with `take()`.
+            This is also done when the `RxWorker` object is destroyed.
+
+            :raises RuntimeError: If the thread was stopped by an error (like a failed SPI
+                transaction). In this case, `running` is already `False`.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property("pa_level", &RF24Wrapper::get_pa_level, &RF24Wrapper::set_pa_level, R"docstr(
-            This attribute represents the radio's configured Power Amplitude level.
+        .def(
+            "__enter__", [](RxWorker& self) -> RxWorker& { return self; }, py::return_value_policy::reference)
 
-            .. seealso:: Accepted values are defined in the `rf24_pa_dbm_e` enum struct.
-        )docstr")
+        .def("__exit__", [](RxWorker& self, py::args) { self.stop(); })
 
         // *****************************************************************************
 
-        .def_property("payload_size", &RF24Wrapper::getPayloadSize, &RF24Wrapper::setPayloadSize, R"docstr(
-            This `int` attribute represents the radio's static payload lengths. Maximum length is 32 bytes; minimum is 1 byte.
+        .def("__len__", &RxWorker::pending)
 
-            .. note:: This attribute is only used when the radio's `dynamic_payloads` feature is disabled
-                (which is disabled by default).
+        .def_property_readonly("pending", &RxWorker::pending, R"docstr(
+            The number of payloads in the ring buffer that have not been fetched with `take()`.
+            This is also what ``len()`` returns.
         )docstr")
 
-        .def_property("payloadSize", &RF24Wrapper::getPayloadSize, &RF24Wrapper::setPayloadSize)
-
         // *****************************************************************************
 
-        .def_property("data_rate", &RF24Wrapper::get_data_rate, &RF24Wrapper::setDataRate, R"docstr(
-            This attribute represents the radio's OTA data rate.
-
-            .. hint:: The units "BPS" stand for "Bits Per Second" (not Bytes per second).
-            .. seealso:: Accepted values are pre-defined in the `rf24_datarate_e` enum struct.
+        .def_property_readonly("capacity", &RxWorker::get_capacity, R"docstr(
+            The maximum number of payloads that the ring buffer can hold.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property("crc_length", &RF24Wrapper::getCRCLength, &RF24Wrapper::setCRCLength, R"docstr(
-            This attribute represents the radio's CRC checksum length (in bits).
+        .def_property_readonly("running", &RxWorker::is_running, R"docstr(
+            Is the thread running? See `stop()`.
+        )docstr")
 
-            .. seealso:: Accepted values are predefined in the `rf24_crclength_e` enum struct.
-            .. note::
-                The radio automatically uses CRC checksums when the auto-ack feature is enabled.
-                This attribute may not reflect this situation if CRC is disabled when auto-ack is enabled.
+        // *****************************************************************************
+
+        .def_property_readonly("received", &RxWorker::get_received, R"docstr(
+            The number of payloads that the thread put in the ring buffer.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property("power", &RF24Wrapper::isPowerUp, &RF24Wrapper::power, R"docstr(
-            This `bool` attribute represents the radio's power status. `False` means the radio
-            is powered down.
+        .def_property_readonly("ring_overruns", &RxWorker::get_ring_overruns, R"docstr(
+            The number of payloads that the thread discarded because the ring buffer was full.
+            If this keeps increasing, then call `take()` more often or use a larger ``capacity``.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property("listen", &RF24Wrapper::isListening, &RF24Wrapper::listen, R"docstr(
-            This `bool` attribute represents the radio's primary mode (RX/TX).
+        .def_property_readonly("fifo_full", &RxWorker::get_fifo_full, R"docstr(
+            The number of times the thread found the radio's RX FIFO full. The radio discards
+            payloads that are received while its RX FIFO is full, so this counts possible
+            losses that happened before the thread could fetch the payloads.
+        )docstr");
 
-            .. hint::
+    // ******************** Multiceiver class  **************************
+    py::class_<Multiceiver>(m, "Multiceiver", R"docstr(
+        A native thread that drains a radio's RX FIFO into a separate queue for each of the
+        6 pipes. Use `RF24.start_multiceiver()` to create a `Multiceiver` object.
 
-                1. Be sure to call :py:meth:`~pyrf24.rf24.RF24.open_rx_pipe()` before
-                   setting :py:attr:`~pyrf24.rf24.RF24.listen` to `True`.
-                2. Do not call :py:meth:`~pyrf24.rf24.RF24.write()` while in RX mode, without
-                   first setting :py:attr:`~pyrf24.rf24.RF24.listen` to `False`.
-                3. Call :py:meth:`~pyrf24.rf24.RF24.available()` to check for incoming traffic,
-                   and use :py:meth:`~pyrf24.rf24.RF24.read()` to get it.
+        Each queue holds records (`RX_RECORD_SIZE` bytes each) laid out as described in
+        `RF24.read_all()`. The timestamp of each record is the time that the payload was first
+        observed in the RX FIFO (see `RF24.rx_timestamp`). Payloads are either fetched in batches (see `take()` and
+        `take_all()`) or passed to callbacks (see `set_callback()` and `dispatch()`).
 
-            .. important::
-                If there was a call to :py:meth:`~pyrf24.rf24.RF24.open_rx_pipe()`
-                about pipe 0 prior to setting this attribute to `False`, then this attribute
-                will re-write the address that was last set to RX pipe 0.
-                This is because :py:meth:`~pyrf24.rf24.RF24.open_tx_pipe()`
-                will overwrite the address to RX pipe 0 for proper auto-ack
-                functionality.
-            .. note::
-                When the ACK payloads feature is enabled, the TX FIFO buffers are
-                flushed when changing this attribute to `True` (RX mode). This is meant to
-                discard any ACK payloads that were not appended to acknowledgment packets
-                during TX mode.
-        )docstr")
+        .. code-block:: python
+
+            def on_sensor(records: bytearray):
+                for offset in range(0, len(records), RX_RECORD_SIZE):
+                    length = records[offset + 1]
+                    payload = records[offset + 16 : offset + 16 + length]
+                    ...
+
+            with radio.start_multiceiver() as base_station:
+                for pipe in range(1, 6):
+                    base_station.set_callback(pipe, on_sensor)
+                while True:
+                    if base_station.wait(1000):
+                        base_station.dispatch(max_per_pipe=8)
+    )docstr")
+
+        .def("take", &Multiceiver::take, R"docstr(
+            take(pipe: int, max_n: int = 0) -> bytearray
+
+            Fetch (and remove) received payloads from a pipe's queue.
+
+            :param int pipe: The pipe number (in range [0, 5]).
+            :param int max_n: The maximum number of payloads to fetch. ``0`` fetches all
+                payloads in the pipe's queue.
+
+            :Returns: A `bytearray` of records (`RX_RECORD_SIZE` bytes each).
+        )docstr",
+             py::arg("pipe"), py::arg("max_n") = 0)
 
         // *****************************************************************************
 
-        .def_property("dynamic_payloads", &RF24Wrapper::is_dynamic_payloads_enabled, &RF24Wrapper::dynamic_payloads, R"docstr(
-            This `bool` attribute represents the radio's dynamic payload length feature for all data pipes.
+        .def("take_all", &Multiceiver::take_all, R"docstr(
+            take_all(max_per_pipe: int = 0) -> bytearray
 
-            .. note::
-                Since `ack_payloads` requires Dynamic Payload lengths,
-                `ack_payloads` are also disabled when setting this attribute is set to `False`.
-        )docstr")
+            Fetch (and remove) received payloads from all pipes' queues.
+
+            :param int max_per_pipe: The maximum number of payloads to fetch from each pipe's
+                queue. ``0`` fetches all payloads.
+
+            :Returns: A `bytearray` of records (`RX_RECORD_SIZE` bytes each). The pipes take
+                turns (in ascending order), one record at a time, so the first records
+                represent every pipe that has pending payloads. The records of each pipe stay
+                in the order they were received.
+        )docstr",
+             py::arg("max_per_pipe") = 0)
 
         // *****************************************************************************
 
-        .def_property("ack_payloads", &RF24Wrapper::is_ack_payloads_enabled, &RF24Wrapper::toggle_ack_payloads, R"docstr(
-            This `bool` attribute represents the status of the radio's acknowledgement payload
-            feature for appending data to automatic acknowledgement packets.
+        .def("set_callback", &Multiceiver::set_callback, R"docstr(
+            set_callback(pipe: int, callback: Optional[Callable[[bytearray], Any]]) -> None
 
-            .. important::
-                To use acknowledgement payloads, the `dynamic_payloads` and auto-ack features must be enabled.
+            Set the function that `dispatch()` calls with a pipe's received payloads.
 
-                This attribute does not automatically enable the auto-ack feature
-                on pipe 0 because the auto-ack feature is enabled for all pipes by default.
-            .. seealso::
-                Review `write_ack_payload()` and `set_auto_ack()`. Use :meth:`~RF24.available()` and
-                :meth:`~RF24.read()` to fetch a received acknowledgement payload.
-        )docstr")
+            :param int pipe: The pipe number (in range [0, 5]).
+            :param Callable callback: A function that takes 1 positional argument: a
+                `bytearray` of records (`RX_RECORD_SIZE` bytes each). ``None`` removes the
+                pipe's callback, so its payloads are left in its queue.
+        )docstr",
+             py::arg("pipe"), py::arg("callback"))
 
         // *****************************************************************************
 
-        .def_property("address_width", &RF24Wrapper::get_address_width, &RF24Wrapper::setAddressWidth, R"docstr(
-            This `int` attribute represents length of addresses used on the radio's data pipes.
-            Accepted values range [2, 5].
+        .def("dispatch", &Multiceiver::dispatch, R"docstr(
+            dispatch(max_per_pipe: int = 0) -> int
 
-            .. warning::
-                Using an address width of 2 bytes is not officially supported by the nRF24L01.
-                This ability is exposed for advanced reverse engineering purposes.
-        )docstr")
+            Call each pipe's callback (see `set_callback()`) once with a batch of the pipe's
+            received payloads. Pipes without pending payloads (or without a callback) are
+            skipped.
+
+            :param int max_per_pipe: The maximum number of payloads passed to each callback.
+                ``0`` passes all payloads in the pipe's queue. A small value keeps a busy pipe
+                from delaying the callbacks of other pipes.
+
+            :Returns: The number of payloads that were dispatched.
+
+            If a callback raises an exception, then it is propagated and the remaining pipes
+            are not dispatched. The payloads passed to the failed callback are not put back
+            in the pipe's queue.
+        )docstr",
+             py::arg("max_per_pipe") = 0)
 
-#if defined(FAILURE_HANDLING)
         // *****************************************************************************
 
-        .def_readwrite("failure_detected", &RF24Wrapper::failureDetected, R"docstr(
-            The number of accumulative transmission failures specific to the life
-            cycle of the `RF24` object.
-        )docstr")
+        .def("wait", &Multiceiver::wait, R"docstr(
+            wait(timeout_ms: int) -> bool
 
-        .def_readwrite("failureDetected", &RF24Wrapper::failureDetected, R"docstr(
-            The number of accumulative transmission failures specific to the life
-            cycle of the `RF24` object.
-        )docstr")
-#endif // defined (FAILURE_HANDLING)
+            Wait until any pipe's queue has pending payloads. Other python threads can run
+            while waiting.
+
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
+
+            :Returns: `True` if any pipe's queue has pending payloads, otherwise `False` (the
+                timeout elapsed or the thread was stopped).
+        )docstr",
+             py::arg("timeout_ms"))
 
         // *****************************************************************************
 
-        .def_property_readonly("is_valid", &RF24Wrapper::isValid, R"docstr(
-            This read-only attribute represents if the radio's CE & CSN pins are configured properly.
+        .def("stop", &Multiceiver::stop, R"docstr(
+            stop() -> None
+
+            Stop the thread. Payloads left in the queues can still be fetched with `take()`
+            or `take_all()`. This is also done when the `Multiceiver` object is destroyed.
+
+            :raises RuntimeError: If the thread was stopped by an error (like a failed SPI
+                transaction). In this case, `running` is already `False`.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property_readonly("is_plus_variant", &RF24Wrapper::isPVariant, R"docstr(
-            This read-only `bool` attribute represents if the detected radio is a nRF24L01+ model.
-        )docstr")
+        .def(
+            "__enter__", [](Multiceiver& self) -> Multiceiver& { return self; }, py::return_value_policy::reference)
+
+        .def("__exit__", [](Multiceiver& self, py::args) { self.stop(); })
 
         // *****************************************************************************
 
-        .def_property_readonly("rpd", &RF24Wrapper::testRPD, R"docstr(
-            This read-only `bool` attribute represents if the radio detected a signal above -64 dbm in RX mode.
+        .def("__len__", &Multiceiver::pending_total)
 
-            .. hint::
-                RPD stands for "Received Power Detection". Non-plus variants of nRF24L01
-                call this attribute CD (short for "Carrier Detection") because this feature
-                was originally made available for government mandated hardware tests.
+        .def_property_readonly("pending", &Multiceiver::get_pending, R"docstr(
+            A `list` of the number of payloads in each pipe's queue (indexed by pipe number)
+            that have not been fetched. ``len()`` returns the total of all pipes.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property_readonly("rx_fifo_full", &RF24Wrapper::rxFifoFull, R"docstr(
-            This `bool` attribute represents if all 3 levels of the radio's RX FIFO are occupied.
+        .def_property_readonly("capacity", &Multiceiver::get_capacity, R"docstr(
+            The maximum number of payloads that each pipe's queue can hold.
         )docstr")
 
         // *****************************************************************************
 
-        .def_readwrite("cs_delay", &RF24Wrapper::csDelay, R"docstr(
-            The `int` number of microseconds used as a delay when the radio's CSN pin is made active.
+        .def_property_readonly("running", &Multiceiver::is_running, R"docstr(
+            Is the thread running? See `stop()`.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property_readonly("is_chip_connected", &RF24Wrapper::isChipConnected, R"docstr(
-            Check if the SPI bus is working with the radio. This read-only `bool` attribute assumes that
-            :py:meth:`~pyrf24.rf24.RF24.begin()` returned `True`.
+        .def_property_readonly("received", &Multiceiver::get_received, R"docstr(
+            A `list` of the number of payloads that the thread put in each pipe's queue
+            (indexed by pipe number).
         )docstr")
 
-        .def("isChipConnected", &RF24Wrapper::isChipConnected, R"docstr(
-            isChipConnected() -> bool
+        // *****************************************************************************
+
+        .def_property_readonly("dropped", &Multiceiver::get_dropped, R"docstr(
+            A `list` of the number of payloads that the thread discarded because a pipe's
+            queue was full (indexed by pipe number). If a pipe's count keeps increasing, then
+            fetch its payloads more often or use a larger ``capacity``.
         )docstr")
 
         // *****************************************************************************
 
-        .def_readwrite("tx_delay", &RF24Wrapper::txDelay, R"docstr(
-            The driver will delay for this duration (`int` in microseconds) when `listen` is set to `False`.
+        .def_property_readonly("fifo_full", &Multiceiver::get_fifo_full, R"docstr(
+            The number of times the thread found the radio's RX FIFO full. See
+            `RxWorker.fifo_full`.
+        )docstr");
+
+    // ******************** RadioGroup class  **************************
+    py::class_<RadioGroup>(m, "RadioGroup", R"docstr(
+        Services several radios, each with its own native thread. The threads run without
+        the GIL, so the radios receive and transmit in parallel with each other (and with
+        python code).
+
+        Received payloads of all radios are delivered together (see `take()`). Each radio
+        has its own TX queue; payloads sent without naming a radio go to the radio with the
+        fewest queued payloads (see `send()`).
+
+        .. code-block:: python
+
+            radios = [RF24(22, 0), RF24(24, 10)]
+            for radio in radios:
+                radio.begin()
+                radio.open_tx_pipe(b"1Node")
+                radio.listen = True
+            with RadioGroup(radios) as group:
+                group.send_many(payloads)
+                if group.wait(1000):
+                    records = group.take()
+                    radio_index = records[2]  # of the first record
+                group.flush(1000)
+    )docstr")
+
+        .def(py::init<py::sequence, size_t, size_t, uint32_t>(), R"docstr(
+            __init__(radios: Sequence[RF24], capacity: int = 256, tx_capacity: int = 64, timeout_ms: int = 95)
+
+            Start a thread for each radio. The radios should be configured (and listening, if
+            they should receive) before the group is created. A radio that is listening stops
+            listening while it transmits queued payloads, then resumes listening.
+
+            :param Sequence[RF24] radios: The radios to service (1 to 256 of them). Each
+                radio's index in this sequence identifies it in the group.
+            :param int capacity: The maximum number of received payloads that each radio's
+                ring buffer can hold.
+            :param int tx_capacity: The maximum number of payloads that each radio's TX queue
+                can hold.
+            :param int timeout_ms: The time after which an unacknowledged payload is given
+                up on (like the ``timeout_ms`` parameter of `RF24.write_many()`).
+
+            :raises RuntimeError: If an `RxWorker`, a `Multiceiver` or another `RadioGroup`
+                is already running for any of the radios.
 
-            When responding to payloads, faster devices like ARM(RPi) are much faster than Arduino:
+            .. important::
+                While the group is running, do not read payloads from its radios or transmit
+                with them directly. Transmitting also flushes a radio's TX FIFO, so do not use
+                ACK payloads with the group's radios.
+        )docstr",
+             py::arg("radios"), py::arg("capacity") = 256, py::arg("tx_capacity") = 64, py::arg("timeout_ms") = 95)
 
-            1. Arduino sends data to RPi, switches to RX mode
-            2. The RPi receives the data, switches to TX mode and sends before the Arduino radio is in RX mode
-            3. If AutoACK is disabled, this can be set as low as 0. If AutoACK enabled, set to 100uS minimum on RPi
+        // *****************************************************************************
 
-            .. warning::
-                If set to 0, ensure 130uS delay after `listen` is set to `False` before any transmitting.
-        )docstr")
+        .def("send", &RadioGroup::send, R"docstr(
+            send(buf: Union[bytes, bytearray, memoryview], radio: Optional[int] = None) -> int
 
-        .def_readwrite("txDelay", &RF24Wrapper::txDelay)
+            Put a payload in a radio's TX queue. The payload is copied, so ``buf`` can be
+            reused immediately.
 
-        // *****************************************************************************
-        // **************** functions that accept python's buffer protocol objects (bytes, bytearray)
+            :param bytes,bytearray,memoryview buf: The payload (up to 32 bytes).
+            :param int radio: The index of the radio to transmit with. `None` picks the radio
+                with the fewest queued payloads (radios take turns when there is a tie).
 
-        .def("start_fast_write", &RF24Wrapper::startFastWrite, R"docstr(
-            start_fast_write(buf: Union[bytearray, bytes], multicast: bool = False, start_tx: bool = True) -> None
+            :Returns: The index of the radio that will transmit the payload, or ``-1`` if the
+                payload was not queued because the radio's TX queue is full.
 
-            Write a payload to the radio's TX FIFO.
+            :raises IndexError: If ``radio`` is out of range.
+        )docstr",
+             py::arg("buf"), py::arg("radio") = py::none())
 
-            .. seealso::
-                Use `tx_standby()` to ensure the radio has had time to transmit the payload(s) from the TX FIFO.
+        // *****************************************************************************
 
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
-            :param bool multicast: Set this parameter to `True` to flag the payload for
-                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
-                for the individual payload. Defaults to `False`.
+        .def("send_many", &RadioGroup::send_many, R"docstr(
+            send_many(buffers: Sequence[Union[bytes, bytearray, memoryview]], radio: Optional[int] = None) -> int
 
-                .. important:: This parameter requires that the `enable_dynamic_ack()` function
-                    is called at least once prior to calling this function.
-            :param bool start_tx: Set this parameter to `True` to activate transmission. By
-                default this parameter is set to `True`. Notice this parameter controls the radio's
-                CE pin as required. Setting this parameter to `False` will only leave the radio's
-                CE pin unchanged.
-        )docstr",
-             py::arg("buf"), py::arg("multicast") = false, py::arg("start_tx") = true)
+            Call `send()` for each payload in ``buffers`` (so each payload is balanced
+            separately), until a TX queue is full.
 
-        .def("startFastWrite", &RF24Wrapper::startFastWrite, R"docstr(
-            startFastWrite(buf: Union[bytearray, bytes], multicast: bool = False, start_tx: bool = True) -> None
+            :Returns: The number of payloads that were queued (from the start of ``buffers``).
         )docstr",
-             py::arg("buf"), py::arg("multicast") = false, py::arg("start_tx") = true)
+             py::arg("buffers"), py::arg("radio") = py::none())
 
         // *****************************************************************************
 
-        .def("start_write", &RF24Wrapper::startWrite, R"docstr(
-            start_write(buf: Union[bytearray, bytes], multicast: bool = False) -> bool
-
-            For backward compatibility, this function is similar to `start_fast_write()`.
-
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
-            :param bool multicast: Set this parameter to `True` to flag the payload for
-                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
-                for the individual payload. Defaults to `False`.
+        .def("take", &RadioGroup::take, R"docstr(
+            take(max_per_radio: int = 0) -> bytearray
 
-                .. important:: This parameter requires that the `enable_dynamic_ack()` function
-                    is called at least once prior to calling this function.
+            Fetch (and remove) the payloads received by all radios.
 
-            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
-        )docstr",
-             py::arg("buf"), py::arg("multicast") = false)
+            :param int max_per_radio: The maximum number of payloads to fetch from each
+                radio's ring buffer. ``0`` fetches all payloads.
 
-        .def("startWrite", &RF24Wrapper::startWrite, R"docstr(
-            startWrite(buf: Union[bytearray, bytes], multicast: bool = False) -> bool
+            :Returns: A `bytearray` of records (`RX_RECORD_SIZE` bytes each) laid out as
+                described in `RF24.read_all()`. The byte at offset 2 of each record is the
+                index of the radio that received the payload. The radios take turns (in
+                ascending order), one record at a time. The records of each radio stay in
+                the order they were received.
         )docstr",
-             py::arg("buf"), py::arg("multicast") = false)
+             py::arg("max_per_radio") = 0)
 
         // *****************************************************************************
 
-        .def("write", &RF24Wrapper::write, R"docstr(
-            write(buf: Union[bytearray, bytes], multicast: bool = False) -> bool
-
-            Transmit a single payload.
+        .def("wait", &RadioGroup::wait, R"docstr(
+            wait(timeout_ms: int) -> bool
 
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
-            :param bool multicast: Set this parameter to `True` to flag the payload for
-                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
-                for the individual payload. Defaults to `False`.
+            Wait until any radio has received payloads. Other python threads can run while
+            waiting.
 
-                .. important:: This parameter requires that the `enable_dynamic_ack()` function
-                    is called at least once prior to calling this function.
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
 
-            :Returns: `True` if the payload was successfully transmitted, otherwise `False`.
+            :Returns: `True` if any received payloads are pending, otherwise `False` (the
+                timeout elapsed or a thread was stopped).
         )docstr",
-             py::arg("buf"), py::arg("multicast") = false)
+             py::arg("timeout_ms"))
 
         // *****************************************************************************
 
-        .def("write_ack_payload", &RF24Wrapper::writeAckPayload, R"docstr(
-            write_ack_payload(pipe: int, buf: Union[bytearray, bytes]) -> bool
-
-            Load a payload into the TX FIFO to be used in the ACK packet of automatic acknowledgements.
+        .def("flush", &RadioGroup::flush, R"docstr(
+            flush(timeout_ms: int) -> bool
 
-            :param int pipe: The pipe number to use for the acknowledging payload.
+            Wait until all TX queues are empty (every queued payload was delivered or given up
+            on). Other python threads can run while waiting.
 
-                .. seealso:: Set the pipe's assigned address using `open_rx_pipe()`
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
 
-            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
+            :Returns: `True` if all TX queues are empty, otherwise `False` (the timeout
+                elapsed or a thread was stopped).
         )docstr",
-             py::arg("pipe"), py::arg("buf"))
+             py::arg("timeout_ms"))
 
-        .def("writeAckPayload", &RF24Wrapper::writeAckPayload, R"docstr(
-            writeAckPayload(pipe: int, buf: Union[bytearray, bytes]) -> bool
-        )docstr",
-             py::arg("pipe"), py::arg("buf"))
+        // *****************************************************************************
+
+        .def("stop", &RadioGroup::stop, R"docstr(
+            stop() -> None
+
+            Stop the threads. Received payloads can still be fetched with `take()`, but
+            payloads left in the TX queues are not transmitted. This is also done when the
+            `RadioGroup` object is destroyed.
+
+            :raises RuntimeError: If a thread was stopped by an error (like a failed SPI
+                transaction).
+        )docstr")
 
         // *****************************************************************************
 
-        .def("write_blocking", &RF24Wrapper::writeBlocking, R"docstr(
-            write_blocking(buf: Union[bytearray, bytes], timeout: int) -> bool
+        .def(
+            "__enter__", [](RadioGroup& self) -> RadioGroup& { return self; }, py::return_value_policy::reference)
 
-            A blocking function to load a payload into the radio's TX FIFO. If there is no un-occupied
-            level of the TX FIFO, this function waits until a level becomes available or the specified
-            timeout is reached.
+        .def("__exit__", [](RadioGroup& self, py::args) { self.stop(); })
 
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
-            :param int timeout: The amount of time (in milliseconds) to wait while there is no
-                available level in the TX FIFO.
+        // *****************************************************************************
 
-            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
-        )docstr",
-             py::arg("buf"), py::arg("timeout"))
+        .def("__len__", &RadioGroup::size)
 
-        .def("writeBlocking", &RF24Wrapper::writeBlocking, R"docstr(
-            writeBlocking(buf: Union[bytearray, bytes], timeout: int) -> bool
-        )docstr",
-             py::arg("buf"), py::arg("timeout"))
+        .def_property_readonly("radios", &RadioGroup::get_objects, R"docstr(
+            A `list` of the group's radios (indexed like the records' radio index). ``len()``
+            returns the number of radios.
+        )docstr")
 
         // *****************************************************************************
 
-        .def("write_fast", &RF24Wrapper::writeFast, R"docstr(
-            write_fast(buf: Union[bytearray, bytes], multicast: bool = False) -> bool
+        .def_property_readonly("pending", &RadioGroup::rx_pending, R"docstr(
+            The number of received payloads (of all radios) that have not been fetched with
+            `take()`.
+        )docstr")
 
-            Simply load a payload into the radio's TX FIFO and assert the radio's CE pin to activate transmission.
+        // *****************************************************************************
 
-            .. seealso::
-                Use `tx_standby()` to ensure the radio has had time to transmit the payload(s) from the TX FIFO.
+        .def_property_readonly("tx_pending", &RadioGroup::tx_pending, R"docstr(
+            The number of payloads (in all TX queues) that are not yet transmitted.
+        )docstr")
 
-            :param bytes,bytearray buf: The payload to load into the TX FIFO.
-            :param bool multicast: Set this parameter to `True` to flag the payload for
-                no acknowledgement. This parameter makes use of the radio's ``NO_ACK`` flag
-                for the individual payload. Defaults to `False`.
+        // *****************************************************************************
 
-                .. important:: This parameter requires that the `enable_dynamic_ack()` function
-                    is called at least once prior to calling this function.
+        .def_property_readonly("running", &RadioGroup::is_running, R"docstr(
+            Are all threads running? See `stop()`.
+        )docstr")
 
-            :Returns: `True` if the payload was loaded into the radio's TX FIFO, otherwise `False`.
-        )docstr",
-             py::arg("buf"), py::arg("multicast") = false)
+        // *****************************************************************************
 
-        .def("writeFast", &RF24Wrapper::writeFast, R"docstr(
-            writeFast(buf: Union[bytearray, bytes], multicast: bool = False) -> bool
-        )docstr",
-             py::arg("buf"), py::arg("multicast") = false);
+        .def_property_readonly("stats", &RadioGroup::get_stats, R"docstr(
+            A `list` of each radio's statistics (indexed like `radios`). Each radio's
+            statistics are a `dict` with the following keys:
+
+            - ``"received"``: The number of payloads put in the radio's ring buffer.
+            - ``"dropped"``: The number of payloads discarded because the ring buffer was full.
+            - ``"fifo_full"``: The number of times the radio's RX FIFO was found full (see
+              `RxWorker.fifo_full`).
+            - ``"sent"``: The number of queued payloads that were delivered.
+            - ``"failed"``: The number of queued payloads that were given up on.
+            - ``"rx_pending"``: The number of payloads in the radio's ring buffer.
+            - ``"tx_pending"``: The number of payloads in the radio's TX queue.
+        )docstr");
 }
@@ -8,29 +8,40 @@ class RF24MeshWrapper : public RF24Mesh
 {
 public:
     RF24MeshWrapper(RF24Wrapper& _radio, RF24NetworkWrapper& _network)
-        : RF24Mesh(static_cast<RF24&>(_radio), static_cast<RF24Network&>(_network))
+        : RF24Mesh(static_cast<RF24&>(_radio), static_cast<RF24Network&>(_network)), radio_wrapper(_radio), network_wrapper(_network)
     {
     }
 
     // needed for polymorphic recognition
     virtual ~RF24MeshWrapper() = default;
 
+    std::mutex& get_spi_mutex() const
+    {
+        return radio_wrapper.get_spi_mutex();
+    }
+
+    RF24Wrapper& get_radio()
+    {
+        return radio_wrapper;
+    }
+
+    uint8_t update()
+    {
+        return network_wrapper.timestamped_update([this]() { return RF24Mesh::update(); });
+    }
+
     bool write(py::buffer buf, uint8_t msg_type, uint8_t nodeID = 0)
     {
-        return RF24Mesh::write(
-            get_bytes_or_bytearray_str(buf),
-            msg_type,
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            nodeID);
+        py::buffer_info info = get_buffer(buf);
+        ConfigTransaction transaction(radio_wrapper);
+        return radio_wrapper.stamp_tx(RF24Mesh::write(info.ptr, msg_type, get_message_len(info), nodeID), true);
     }
 
     bool write(uint16_t to_node, py::buffer buf, uint8_t msg_type)
     {
-        return RF24Mesh::write(
-            to_node,
-            get_bytes_or_bytearray_str(buf),
-            msg_type,
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)));
+        py::buffer_info info = get_buffer(buf);
+        ConfigTransaction transaction(radio_wrapper);
+        return radio_wrapper.stamp_tx(RF24Mesh::write(to_node, info.ptr, msg_type, get_message_len(info)), true);
     }
 
     uint8_t get_node_id()
@@ -46,11 +57,18 @@ public:
         }
         return list;
     }
+
+private:
+    /** The radio object (& its lock) that this mesh layer uses. */
+    RF24Wrapper& radio_wrapper;
+    /** The network layer that timestamps the frames queued by `update()`. */
+    RF24NetworkWrapper& network_wrapper;
 };
 
 PYBIND11_MODULE(rf24_mesh, m)
 {
     m.doc() = "A Python module that wraps the RF24Mesh C++ library's API";
+    share_sim_air();
     py::options options;
     options.disable_function_signatures();
 
@@ -87,7 +105,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("begin", &RF24MeshWrapper::begin, R"docstr(
+        .def("begin", config_call<RF24MeshWrapper>(&RF24MeshWrapper::begin), R"docstr(
             begin(channel: int = 97, data_rate: pyrf24.rf24.rf24_datarate_e = RF24_1MBPS, timeout: int = 7500) -> bool
 
             :param int channel: The :py:attr:`~pyrf24.rf24.RF24.channel` to use for the network.
@@ -106,7 +124,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("update", &RF24MeshWrapper::update, R"docstr(
+        .def("update", config_call<RF24MeshWrapper>(&RF24MeshWrapper::update), R"docstr(
             update() -> int
 
             Keep the mesh network layer current. This function should be called regularly in the application.
@@ -118,10 +136,10 @@ PYBIND11_MODULE(rf24_mesh, m)
         // *****************************************************************************
 
         .def("write", static_cast<bool (RF24MeshWrapper::*)(py::buffer, uint8_t, uint8_t)>(&RF24MeshWrapper::write), R"docstr(
-            write(buf: Union[bytes, bytearray], message_type: int, to_node_id: int = 0) -> bool \
-            write(to_node_address: int, buf: Union[bytes, bytearray], message_type: int) -> bool
+            write(buf: Union[bytes, bytearray, memoryview], message_type: int, to_node_id: int = 0) -> bool \
+            write(to_node_address: int, buf: Union[bytes, bytearray, memoryview], message_type: int) -> bool
 
-            :param bytes,bytearray buf: The message to transmit.
+            :param bytes,bytearray,memoryview buf: The message to transmit.
             :param int message_type: The :py:attr:`~pyrf24.rf24_network.RF24NetworkHeader.type` to
                 be used in the frame's header.
             :Returns: `True` if the message was successfully sent, otherwise `False`
@@ -146,7 +164,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("set_address", &RF24MeshWrapper::setAddress, R"docstr(
+        .def("set_address", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setAddress), R"docstr(
             set_address(node_id: int, address: int, search_by_address: bool = False)
 
             Only call this function on a mesh network's master node to manually assign a logical
@@ -173,14 +191,14 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("node_id"), py::arg("address"), py::arg("search_by_address") = false)
 
-        .def("setAddress", &RF24MeshWrapper::setAddress, R"docstr(
+        .def("setAddress", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setAddress), R"docstr(
             setAddress(node_id: int, address: int, search_by_address: bool = False)
         )docstr",
              py::arg("node_id"), py::arg("address"), py::arg("search_by_address") = false)
 
         // *****************************************************************************
 
-        .def("setStaticAddress", &RF24MeshWrapper::setStaticAddress, R"docstr(
+        .def("setStaticAddress", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setStaticAddress), R"docstr(
             setStaticAddress(node_id: int, address: int)
 
             For backwards compatiblity only, this function is similar to the `set_address()` function.
@@ -189,7 +207,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("save_dhcp", &RF24MeshWrapper::saveDHCP, R"docstr(
+        .def("save_dhcp", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::saveDHCP), R"docstr(
             save_dhcp()
 
             Call this function on the mesh network's master node to save the current list of
@@ -197,13 +215,13 @@ PYBIND11_MODULE(rf24_mesh, m)
             master node needs to go offline.
         )docstr")
 
-        .def("saveDHCP", &RF24MeshWrapper::saveDHCP, R"docstr(
+        .def("saveDHCP", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::saveDHCP), R"docstr(
             saveDHCP()
         )docstr")
 
         // *****************************************************************************
 
-        .def("load_dhcp", &RF24MeshWrapper::loadDHCP, R"docstr(
+        .def("load_dhcp", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::loadDHCP), R"docstr(
             load_dhcp()
 
             Call this function on the mesh network's master node to read and load the saved list of
@@ -211,13 +229,13 @@ PYBIND11_MODULE(rf24_mesh, m)
             master node resumes operation after being offline.
         )docstr")
 
-        .def("loadDHCP", &RF24MeshWrapper::loadDHCP, R"docstr(
+        .def("loadDHCP", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::loadDHCP), R"docstr(
             loadDHCP()
         )docstr")
 
         // *****************************************************************************
 
-        .def("dhcp", &RF24MeshWrapper::DHCP, R"docstr(
+        .def("dhcp", config_call<RF24MeshWrapper>(&RF24MeshWrapper::DHCP), R"docstr(
             dhcp()
 
             Keep the master node's list of assigned addresses up-to-date.
@@ -226,7 +244,7 @@ PYBIND11_MODULE(rf24_mesh, m)
                 after calling :py:meth:`~pyrf24.rf24_mesh.RF24Mesh.update()`.
         )docstr")
 
-        .def("DHCP", &RF24MeshWrapper::DHCP, R"docstr(
+        .def("DHCP", config_call<RF24MeshWrapper>(&RF24MeshWrapper::DHCP), R"docstr(
             DHCP()
         )docstr")
 
@@ -247,11 +265,11 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def_property("node_id", &RF24MeshWrapper::get_node_id, &RF24MeshWrapper::setNodeID, R"docstr(
+        .def_property("node_id", &RF24MeshWrapper::get_node_id, spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setNodeID), R"docstr(
             The instantiated RF24Mesh object's unique identifying number. This value must range [0, 255].
         )docstr")
 
-        .def_property("_nodeID", &RF24MeshWrapper::get_node_id, &RF24MeshWrapper::setNodeID)
+        .def_property("_nodeID", &RF24MeshWrapper::get_node_id, spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setNodeID))
 
         // *****************************************************************************
 
@@ -261,7 +279,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("setNodeID", &RF24MeshWrapper::setNodeID, R"docstr(
+        .def("setNodeID", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setNodeID), R"docstr(
             setNodeID(nodeID: int)
 
             Configure the `node_id` attribute.
@@ -270,7 +288,7 @@ PYBIND11_MODULE(rf24_mesh, m)
 
         // *****************************************************************************
 
-        .def("get_node_id", &RF24MeshWrapper::getNodeID, R"docstr(
+        .def("get_node_id", config_call<RF24MeshWrapper>(&RF24MeshWrapper::getNodeID), R"docstr(
             get_node_id(address: int = 0xFFFF) -> int
 
             Translates a `node_id` into the corresponding `mesh_address`
@@ -287,14 +305,14 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("address") = 0xFFFF)
 
-        .def("getNodeID", &RF24MeshWrapper::getNodeID, R"docstr(
+        .def("getNodeID", config_call<RF24MeshWrapper>(&RF24MeshWrapper::getNodeID), R"docstr(
             getNodeID(address: int = 0xFFFF) -> int
         )docstr",
              py::arg("address") = 0xFFFF)
 
         // *****************************************************************************
 
-        .def("check_connection", &RF24MeshWrapper::checkConnection, R"docstr(
+        .def("check_connection", config_call<RF24MeshWrapper>(&RF24MeshWrapper::checkConnection), R"docstr(
             check_connection() -> bool
 
             Check for connectivity with the mesh network.
@@ -304,13 +322,13 @@ PYBIND11_MODULE(rf24_mesh, m)
             :Returns: `True` if connected, otherwise `False`
         )docstr")
 
-        .def("checkConnection", &RF24MeshWrapper::checkConnection, R"docstr(
+        .def("checkConnection", config_call<RF24MeshWrapper>(&RF24MeshWrapper::checkConnection), R"docstr(
             checkConnection() -> bool
         )docstr")
 
         // *****************************************************************************
 
-        .def("renew_address", &RF24MeshWrapper::renewAddress, R"docstr(
+        .def("renew_address", config_call<RF24MeshWrapper>(&RF24MeshWrapper::renewAddress), R"docstr(
             renew_address(timeout: int = 7500) -> int
 
             Attempt to get a new `Logical Address <logical_address>` assigned from the mesh network's master node.
@@ -326,14 +344,14 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("timeout") = 7500)
 
-        .def("renewAddress", &RF24MeshWrapper::renewAddress, R"docstr(
+        .def("renewAddress", config_call<RF24MeshWrapper>(&RF24MeshWrapper::renewAddress), R"docstr(
             renewAddress(timeout: int = 7500) -> int
         )docstr",
              py::arg("timeout") = 7500)
 
         // *****************************************************************************
 
-        .def("release_address", &RF24MeshWrapper::releaseAddress, R"docstr(
+        .def("release_address", config_call<RF24MeshWrapper>(&RF24MeshWrapper::releaseAddress), R"docstr(
             release_address() -> bool
 
             Use this function to manually expire a leased `Logical Address <logical_address>` from the mesh network's master node.
@@ -345,13 +363,13 @@ PYBIND11_MODULE(rf24_mesh, m)
                 the assigned address. `False` means the wireless transaction did not complete.
         )docstr")
 
-        .def("releaseAddress", &RF24MeshWrapper::releaseAddress, R"docstr(
+        .def("releaseAddress", config_call<RF24MeshWrapper>(&RF24MeshWrapper::releaseAddress), R"docstr(
             releaseAddress() -> bool
         )docstr")
 
         // *****************************************************************************
 
-        .def("get_address", &RF24MeshWrapper::getAddress, R"docstr(
+        .def("get_address", config_call<RF24MeshWrapper>(&RF24MeshWrapper::getAddress), R"docstr(
             get_address(node_id: int) -> int
 
             Translates a `node_id` into the corresponding `mesh_address`
@@ -369,14 +387,14 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("node_id"))
 
-        .def("getAddress", &RF24MeshWrapper::getAddress, R"docstr(
+        .def("getAddress", config_call<RF24MeshWrapper>(&RF24MeshWrapper::getAddress), R"docstr(
             getAddress(node_id: int) -> int
         )docstr",
              py::arg("node_id"))
 
         // *****************************************************************************
 
-        .def("set_channel", &RF24MeshWrapper::setChannel, R"docstr(
+        .def("set_channel", config_call<RF24MeshWrapper>(&RF24MeshWrapper::setChannel), R"docstr(
             set_channel(channel: int)
             This function controls the radio's configured `channel` (AKA frequency).
 
@@ -384,14 +402,14 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("channel"))
 
-        .def("setChannel", &RF24MeshWrapper::setChannel, R"docstr(
+        .def("setChannel", config_call<RF24MeshWrapper>(&RF24MeshWrapper::setChannel), R"docstr(
             setChannel(channel: int)
         )docstr",
              py::arg("channel"))
 
         // *****************************************************************************
 
-        .def("set_child", &RF24MeshWrapper::setChild, R"docstr(
+        .def("set_child", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setChild), R"docstr(
             set_child(allow: bool)
 
             Control the node's ability to have child nodes connect to it.
@@ -401,7 +419,7 @@ PYBIND11_MODULE(rf24_mesh, m)
         )docstr",
              py::arg("allow"))
 
-        .def("setChild", &RF24MeshWrapper::setChild, R"docstr(
+        .def("setChild", spi_call<RF24MeshWrapper>(&RF24MeshWrapper::setChild), R"docstr(
             setChild(allow: bool)
         )docstr",
              py::arg("allow"));
@@ -23,7 +23,7 @@ struct RF24NetworkFrameWrapper : public RF24NetworkFrame
     {
     }
 
-    RF24NetworkFrameWrapper(RF24NetworkHeader& header, py::object message)
+    RF24NetworkFrameWrapper(RF24NetworkHeader& header, py::buffer message)
     {
         RF24NetworkFrame::header = header;
         set_message(message);
@@ -38,23 +38,69 @@ struct RF24NetworkFrameWrapper : public RF24NetworkFrame
         return py_ba;
     }
 
-    void set_message(py::object message)
+    void set_message(py::buffer message)
     {
-        RF24NetworkFrame::message_size = static_cast<uint16_t>(get_bytes_or_bytearray_ln(message));
-        memcpy(RF24NetworkFrame::message_buffer, reinterpret_cast<uint8_t*>(get_bytes_or_bytearray_str(message)), RF24NetworkFrame::message_size);
+        py::buffer_info info = get_buffer(message);
+        RF24NetworkFrame::message_size = static_cast<uint16_t>(rf24_min(get_buffer_len(info), static_cast<size_t>(MAX_PAYLOAD_SIZE)));
+        memcpy(RF24NetworkFrame::message_buffer, info.ptr, RF24NetworkFrame::message_size);
     }
 };
 */
+/**
+ * The length (in bytes) of a buffer's data, truncated to one more than the maximum message
+ * length (so that RF24Network rejects messages that are too long instead of truncating them).
+ */
+uint16_t get_message_len(const py::buffer_info& info)
+{
+    return static_cast<uint16_t>(rf24_min(get_buffer_len(info), static_cast<size_t>(MAX_PAYLOAD_SIZE + 1)));
+}
+
 class RF24NetworkWrapper : public RF24Network
 {
 public:
-    RF24NetworkWrapper(RF24Wrapper& _radio) : RF24Network(static_cast<RF24&>(_radio))
+    RF24NetworkWrapper(RF24Wrapper& _radio) : RF24Network(static_cast<RF24&>(_radio)), radio_wrapper(_radio)
     {
     }
 
     // needed for polymorphic recognition
     virtual ~RF24NetworkWrapper() = default;
 
+    std::mutex& get_spi_mutex() const
+    {
+        return radio_wrapper.get_spi_mutex();
+    }
+
+    RF24Wrapper& get_radio()
+    {
+        return radio_wrapper;
+    }
+
+    uint8_t update()
+    {
+        return timestamped_update([this]() { return RF24Network::update(); });
+    }
+
+    /**
+     * Call ``update`` (a function that calls `RF24Network::update()`) and timestamp the frames
+     * that it queues with the time that the radio's RX FIFO was observed holding payloads. The
+     * SPI mutex must be locked.
+     */
+    template<typename Update>
+    uint8_t timestamped_update(Update update)
+    {
+        bool queued = RF24Network::available();
+        uint64_t seen = radio_wrapper.take_rx_timestamp();
+        uint8_t result = update();
+        if (!queued && RF24Network::available())
+            frames_ns = seen;
+        return result;
+    }
+
+    uint64_t get_rx_timestamp()
+    {
+        return rx_timestamp;
+    }
+
     uint16_t peek_header(RF24NetworkHeader& header)
     {
         return RF24Network::peek(header);
@@ -63,9 +109,12 @@ public:
     std::tuple<RF24NetworkHeader, py::bytearray> peek_frame(uint16_t maxlen = MAX_PAYLOAD_SIZE)
     {
         RF24NetworkHeader header;
-        maxlen = static_cast<uint16_t>(rf24_min(maxlen, RF24Network::peek(header)));
         char* buf = new char[maxlen + 1];
-        RF24Network::peek(header, buf, maxlen);
+        {
+            SpiTransaction transaction(get_spi_mutex());
+            maxlen = static_cast<uint16_t>(rf24_min(maxlen, RF24Network::peek(header)));
+            RF24Network::peek(header, buf, maxlen);
+        }
         py::bytearray py_ba = py::bytearray(buf, maxlen);
         delete[] buf;
         return std::tuple<RF24NetworkHeader, py::bytearray>(header, py_ba);
@@ -74,11 +123,9 @@ public:
 #if defined(RF24NetworkMulticast)
     bool multicast(RF24NetworkHeader header, py::buffer buf, uint8_t level = 7)
     {
-        return RF24Network::multicast(
-            header,
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint16_t>(get_bytes_or_bytearray_ln(buf)),
-            level);
+        py::buffer_info info = get_buffer(buf);
+        ConfigTransaction transaction(radio_wrapper);
+        return radio_wrapper.stamp_tx(RF24Network::multicast(header, info.ptr, get_message_len(info), level), true);
     }
 
     void set_multicast_level(uint8_t level)
@@ -96,30 +143,292 @@ public:
     {
         char* buf = new char[maxlen + 1];
         RF24NetworkHeader header;
-        uint16_t len = RF24Network::read(header, buf, maxlen);
+        uint16_t len;
+        {
+            SpiTransaction transaction(get_spi_mutex());
+            len = read_frame(header, buf, maxlen);
+        }
         py::bytearray py_ba = py::bytearray(buf, len);
         delete[] buf;
         return std::tuple<RF24NetworkHeader, py::bytearray>(header, py_ba);
     }
 
+    std::tuple<RF24NetworkHeader, uint16_t> read_into(py::buffer buf)
+    {
+        py::buffer_info info = get_buffer(buf, true);
+        RF24NetworkHeader header;
+        uint16_t len;
+        {
+            SpiTransaction transaction(get_spi_mutex());
+            len = read_frame(header, info.ptr, static_cast<uint16_t>(rf24_min(get_buffer_len(info), static_cast<size_t>(0xFFFF))));
+        }
+        return std::tuple<RF24NetworkHeader, uint16_t>(header, len);
+    }
+
     bool write(RF24NetworkHeader& header, py::buffer buf, uint16_t writeDirect = NETWORK_AUTO_ROUTING)
     {
-        return RF24Network::write(
-            header,
-            get_bytes_or_bytearray_str(buf),
-            static_cast<uint8_t>(get_bytes_or_bytearray_ln(buf)),
-            writeDirect);
+        py::buffer_info info = get_buffer(buf);
+        ConfigTransaction transaction(radio_wrapper);
+        return radio_wrapper.stamp_tx(RF24Network::write(header, info.ptr, get_message_len(info), writeDirect), true);
     }
 
     uint16_t get_node_address()
     {
         return RF24Network::node_address;
     }
+
+    /** Fetch the next frame (and update `rx_timestamp`). The SPI mutex must be locked. */
+    uint16_t read_frame(RF24NetworkHeader& header, void* message, uint16_t maxlen)
+    {
+        rx_timestamp = frames_ns;
+        return RF24Network::read(header, message, maxlen);
+    }
+
+private:
+    /** The radio object (& its lock) that this network layer uses. */
+    RF24Wrapper& radio_wrapper;
+    /** The timestamp of the queued frames (see `timestamped_update()`). */
+    uint64_t frames_ns = 0;
+    /** The timestamp of the last frame fetched by `read()` or `read_into()`. */
+    std::atomic<uint64_t> rx_timestamp {0};
+};
+
+/** A message received (or queued for transmission) by a `GroupNetwork`. */
+struct GroupMessage
+{
+    RF24NetworkHeader header;
+    std::vector<uint8_t> message;
+    uint64_t timestamp;
+};
+
+/**
+ * A network node of a `NetworkGroup`: a native thread that keeps the node's network layer
+ * current (see `RF24Network::update()`), fetches the received messages into a queue, and
+ * transmits the messages put in its TX queue by `queue()`.
+ *
+ * Messages are longer than the records of a `RecordRing`, so both queues are protected by a
+ * mutex (which is never held while the GIL is awaited).
+ */
+class GroupNetwork : public RxDrainer
+{
+public:
+    GroupNetwork(RF24NetworkWrapper& _network, uint8_t _index, size_t _capacity, size_t _tx_capacity, WakeSignal& _signal)
+        : RxDrainer(_network.get_radio()), network(_network), index(_index), capacity(_capacity), tx_capacity(_tx_capacity), signal(_signal), buffer(MAX_PAYLOAD_SIZE), received(0), dropped(0), sent(0), failed(0), in_flight(0)
+    {
+        start();
+    }
+
+    ~GroupNetwork()
+    {
+        join();
+    }
+
+    size_t rx_pending()
+    {
+        std::lock_guard<std::mutex> lock(queue_mutex);
+        return rx_queue.size();
+    }
+
+    /** The number of messages that are queued (or being transmitted). */
+    size_t tx_pending()
+    {
+        std::lock_guard<std::mutex> lock(queue_mutex);
+        return tx_queue.size() + in_flight;
+    }
+
+    /** Put a message in the TX queue. Returns false if the TX queue is full. */
+    bool queue(const RF24NetworkHeader& header, const uint8_t* message, uint16_t length)
+    {
+        {
+            std::lock_guard<std::mutex> lock(queue_mutex);
+            if (tx_queue.size() >= tx_capacity)
+                return false;
+            tx_queue.push_back(GroupMessage {header, std::vector<uint8_t>(message, message + length), 0});
+        }
+        wake();
+        return true;
+    }
+
+    /** Move up to ``max_n`` received messages (``0`` means all) to the end of ``out``. */
+    size_t take_into(std::deque<GroupMessage>& out, size_t max_n = 0)
+    {
+        std::lock_guard<std::mutex> lock(queue_mutex);
+        size_t count = max_n ? rf24_min(max_n, rx_queue.size()) : rx_queue.size();
+        for (size_t i = 0; i < count; ++i) {
+            out.push_back(std::move(rx_queue.front()));
+            rx_queue.pop_front();
+        }
+        return count;
+    }
+
+    py::dict get_stats()
+    {
+        py::dict stats;
+        stats["received"] = received.load();
+        stats["dropped"] = dropped.load();
+        stats["fifo_full"] = get_fifo_full();
+        stats["sent"] = sent.load();
+        stats["failed"] = failed.load();
+        stats["rx_pending"] = rx_pending();
+        stats["tx_pending"] = tx_pending();
+        return stats;
+    }
+
+protected:
+    bool drain() override
+    {
+        network.update();
+        bool fetched = false;
+        while (network.available()) {
+            RF24NetworkHeader header;
+            uint16_t length = network.read_frame(header, buffer.data(), MAX_PAYLOAD_SIZE);
+            fetched = true;
+            std::lock_guard<std::mutex> lock(queue_mutex);
+            if (rx_queue.size() >= capacity) {
+                dropped++;
+                continue;
+            }
+            rx_queue.push_back(GroupMessage {header, std::vector<uint8_t>(buffer.begin(), buffer.begin() + length), network.get_rx_timestamp()});
+            received++;
+        }
+        radio.invalidate_registers();
+        return fetched;
+    }
+
+    bool transmit() override
+    {
+        std::vector<GroupMessage> batch;
+        {
+            std::lock_guard<std::mutex> lock(queue_mutex);
+            while (!tx_queue.empty() && batch.size() < GROUP_TX_BATCH) {
+                batch.push_back(std::move(tx_queue.front()));
+                tx_queue.pop_front();
+            }
+            in_flight = batch.size();
+        }
+        if (batch.empty())
+            return false;
+        for (GroupMessage& frame : batch) {
+            if (radio.stamp_tx(network.RF24Network::write(frame.header, frame.message.data(), static_cast<uint16_t>(frame.message.size())), true))
+                sent++;
+            else
+                failed++;
+        }
+        radio.invalidate_registers();
+        std::lock_guard<std::mutex> lock(queue_mutex);
+        in_flight = 0;
+        signal.notify();
+        return !tx_queue.empty();
+    }
+
+    void drained() override
+    {
+        signal.notify();
+    }
+
+    void stopped() override
+    {
+        signal.notify();
+    }
+
+private:
+    RF24NetworkWrapper& network;
+    /** The node's index in its `NetworkGroup`. */
+    const uint8_t index;
+    const size_t capacity;
+    const size_t tx_capacity;
+    WakeSignal& signal;
+    /** The message of the frame fetched by `drain()`. */
+    std::vector<uint8_t> buffer;
+    std::mutex queue_mutex;
+    std::deque<GroupMessage> rx_queue;
+    std::deque<GroupMessage> tx_queue;
+    std::atomic<uint64_t> received;
+    std::atomic<uint64_t> dropped;
+    std::atomic<uint64_t> sent;
+    std::atomic<uint64_t> failed;
+    /** The number of messages taken from `tx_queue` that `transmit()` has not finished. */
+    size_t in_flight;
+};
+
+/**
+ * Services several network nodes (each using a different radio), each with its own
+ * `GroupNetwork` thread. This is the network layer's counterpart of `RadioGroup`.
+ */
+class NetworkGroup : public MemberGroup<GroupNetwork>
+{
+public:
+    NetworkGroup(py::sequence networks, size_t capacity, size_t tx_capacity)
+    {
+        if (!networks.size() || networks.size() > 256)
+            throw py::value_error("a NetworkGroup needs 1 to 256 network nodes");
+        if (!capacity || !tx_capacity)
+            throw py::value_error("capacity and tx_capacity must be greater than 0");
+        for (size_t i = 0; i < networks.size(); ++i) {
+            RF24NetworkWrapper& network = networks[i].cast<RF24NetworkWrapper&>();
+            objects.append(networks[i]);
+            members.emplace_back(new GroupNetwork(network, static_cast<uint8_t>(i), capacity, tx_capacity, signal));
+        }
+    }
+
+    size_t rx_pending()
+    {
+        size_t total = 0;
+        for (const std::unique_ptr<GroupNetwork>& member : members)
+            total += member->rx_pending();
+        return total;
+    }
+
+    /** Queue a message. Returns the index of the node that will transmit it, or -1 if its TX queue is full. */
+    int send(const RF24NetworkHeader& header, py::buffer buf, py::object node)
+    {
+        py::buffer_info info = get_buffer(buf);
+        uint16_t length = get_message_len(info);
+        if (length > MAX_PAYLOAD_SIZE)
+            throw py::value_error("message is longer than MAX_PAYLOAD_SIZE");
+        size_t chosen = pick(node);
+        if (!members[chosen]->queue(header, static_cast<const uint8_t*>(info.ptr), length))
+            return -1;
+        return static_cast<int>(chosen);
+    }
+
+    /**
+     * Move up to ``max_per_node`` messages (``0`` means all) from every node into a list of
+     * ``(index, header, message, timestamp)`` tuples. The nodes take turns, one message at a
+     * time, until each node's quota is exhausted.
+     */
+    py::list take(size_t max_per_node = 0)
+    {
+        std::vector<std::deque<GroupMessage>> taken(members.size());
+        size_t count = 0;
+        for (size_t i = 0; i < members.size(); ++i)
+            count += members[i]->take_into(taken[i], max_per_node);
+        py::list result;
+        while (count) {
+            for (size_t i = 0; i < members.size(); ++i) {
+                if (taken[i].empty())
+                    continue;
+                GroupMessage& frame = taken[i].front();
+                py::bytearray message(reinterpret_cast<const char*>(frame.message.data()), frame.message.size());
+                result.append(py::make_tuple(i, frame.header, message, frame.timestamp));
+                taken[i].pop_front();
+                count--;
+            }
+        }
+        return result;
+    }
+
+    /** Wait (with the GIL released) until a message is pending or a thread stops. */
+    bool wait(uint32_t timeout_ms)
+    {
+        return signal.wait(timeout_ms, [this] { return rx_pending() || !is_running(); }) && rx_pending();
+    }
 };
 
 PYBIND11_MODULE(rf24_network, m)
 {
     m.doc() = "A Python module that wraps the RF24Network C++ library's API";
+    share_sim_air();
     py::options options;
     options.disable_function_signatures();
 
@@ -226,11 +535,11 @@ PYBIND11_MODULE(rf24_network, m)
     // *********************** RF24NetworkFrame exposed ******************
     /*
     py::class_<RF24NetworkFrameWrapper>(m, "RF24NetworkFrame")
-        .def(py::init<RF24NetworkHeader&, py::object>(), R"docstr(
-            __init__(header: RF24NetworkHeader = None, message: Union[bytes, bytearray] = None)
+        .def(py::init<RF24NetworkHeader&, py::buffer>(), R"docstr(
+            __init__(header: RF24NetworkHeader = None, message: Union[bytes, bytearray, memoryview] = None)
 
             :param RF24NetworkHeader header: The RF24NetworkHeader associated with the frame.
-            :param bytes,bytearray message: The 'message' or data.
+            :param bytes,bytearray,memoryview message: The 'message' or data.
         )docstr")
 
         // *****************************************************************************
@@ -275,7 +584,7 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def("available", &RF24NetworkWrapper::available, R"docstr(
+        .def("available", spi_call<RF24NetworkWrapper>(&RF24NetworkWrapper::available), R"docstr(
             available() -> bool
 
             :Returns: `True` if there is a frame in the queue, otherwise `False`.
@@ -283,7 +592,7 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def("begin", static_cast<void (RF24NetworkWrapper::*)(uint16_t)>(&RF24NetworkWrapper::begin), R"docstr(
+        .def("begin", config_call<RF24NetworkWrapper>(static_cast<void (RF24NetworkWrapper::*)(uint16_t)>(&RF24NetworkWrapper::begin)), R"docstr(
             begin(node_address: int) \
             begin(channel: int, node_address: int)
 
@@ -295,7 +604,7 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def("begin", static_cast<void (RF24NetworkWrapper::*)(uint8_t, uint16_t)>(&RF24NetworkWrapper::begin), R"docstr(
+        .def("begin", config_call<RF24NetworkWrapper>(static_cast<void (RF24NetworkWrapper::*)(uint8_t, uint16_t)>(&RF24NetworkWrapper::begin)), R"docstr(
             :param int channel: The desired channel used by the network.
                 Using this parameter is the deprecated form of this function.
 
@@ -306,13 +615,13 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def_property("node_address", &RF24NetworkWrapper::get_node_address, static_cast<void (RF24NetworkWrapper::*)(uint16_t)>(&RF24NetworkWrapper::begin), R"docstr(
+        .def_property("node_address", &RF24NetworkWrapper::get_node_address, config_call<RF24NetworkWrapper>(static_cast<void (RF24NetworkWrapper::*)(uint16_t)>(&RF24NetworkWrapper::begin)), R"docstr(
             The instantiated network node's `Logical Address <logical_address>`. This is a 2-byte integer in octal format.
         )docstr")
 
         // *****************************************************************************
 
-        .def_property_readonly("parent", &RF24NetworkWrapper::parent, R"docstr(
+        .def_property_readonly("parent", spi_call<RF24NetworkWrapper>(&RF24NetworkWrapper::parent), R"docstr(
             The `Logical Address <logical_address>` (in octal) of the parent to the instantiated network node.
 
             :Returns:
@@ -343,7 +652,28 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def("peek", &RF24NetworkWrapper::peek_header, R"docstr(
+        .def("read_into", &RF24NetworkWrapper::read_into, R"docstr(
+            read_into(buf: Union[bytearray, memoryview]) -> Tuple[RF24NetworkHeader, int]
+
+            Fetch the next available frame received by the network node into a preallocated buffer.
+            This is like `read()`, but the frame's message is copied directly into ``buf``
+            (instead of a new `bytearray` object).
+
+            :param bytearray,memoryview buf: A writable, C-contiguous buffer that the frame's
+                message is written to. If the frame's message is longer than ``buf``, then the
+                message is truncated. Any object that supports python's buffer protocol (like a
+                ``numpy.ndarray``) can be used.
+
+            :Returns: A `tuple` in which
+
+                - index 0 is the frame's `RF24NetworkHeader`
+                - index 1 is the number of bytes written to ``buf``
+        )docstr",
+             py::arg("buf"))
+
+        // *****************************************************************************
+
+        .def("peek", spi_call<RF24NetworkWrapper>(&RF24NetworkWrapper::peek_header), R"docstr(
             peek(header: RF24NetworkHeader) -> int \
             peek(maxlen: int = MAX_PAYLOAD_SIZE) -> Tuple[RF24NetworkHeader, bytearray]
             To fetch the next available frame's header received by the network node, the parameter and return type is as follows:
@@ -368,7 +698,7 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
-        .def("update", &RF24NetworkWrapper::update, R"docstr(
+        .def("update", config_call<RF24NetworkWrapper>(&RF24NetworkWrapper::update), R"docstr(
             update() -> int
 
             Keep the network layer current. This function should be called regularly in the application.
@@ -379,13 +709,25 @@ PYBIND11_MODULE(rf24_network, m)
 
         // *****************************************************************************
 
+        .def_property_readonly("rx_timestamp", &RF24NetworkWrapper::get_rx_timestamp, R"docstr(
+            The time (in nanoseconds) that the radio's RX FIFO was observed holding the payloads of the frame last
+            fetched by `read()` or `read_into()` (see :py:attr:`~pyrf24.rf24.RF24.rx_timestamp`). This uses the same
+            clock as `time.monotonic_ns()`. ``0`` means no frame was fetched yet.
+
+            All frames queued by the same call to `update()` (or :py:meth:`~pyrf24.rf24_mesh.RF24Mesh.update()`)
+            share the same timestamp. Frames are only timestamped by a call to `update()` that finds the queue
+            empty, so fetch all queued frames (while `available()` returns `True`) after each call to `update()`.
+        )docstr")
+
+        // *****************************************************************************
+
         .def("write", &RF24NetworkWrapper::write, R"docstr(
-            write(header: RF24NetworkHeader, buf: Union[bytes, bytearray], write_direct: int = 0o70) -> bool
+            write(header: RF24NetworkHeader, buf: Union[bytes, bytearray, memoryview], write_direct: int = 0o70) -> bool
 
             Send an outgoing frame over the network.
 
             :param RF24NetworkHeader header: The outgoing frame's `RF24NetworkHeader` about the outgoing message.
-            :param bytes,bytearray buf: The outgoing frame's message (AKA buffer).
+            :param bytes,bytearray,memoryview buf: The outgoing frame's message (AKA buffer).
             :param int write_direct: An optional parameter to route the message directly to a specified node.
                 The default value will invoke automatic routing.
 
@@ -396,12 +738,12 @@ PYBIND11_MODULE(rf24_network, m)
 #if defined RF24NetworkMulticast
         // *****************************************************************************
 
-        .def_property("multicast_level", &RF24NetworkWrapper::get_multicast_level, &RF24NetworkWrapper::set_multicast_level, R"docstr(
+        .def_property("multicast_level", &RF24NetworkWrapper::get_multicast_level, config_call<RF24NetworkWrapper>(&RF24NetworkWrapper::set_multicast_level), R"docstr(
             The network level of the instantiated network node used for multicasted frames. Setting this attribute will override the
             default value set by `begin()` or `node_address`.
         )docstr")
 
-        .def("multicastLevel", &RF24NetworkWrapper::multicastLevel, R"docstr(
+        .def("multicastLevel", config_call<RF24NetworkWrapper>(&RF24NetworkWrapper::multicastLevel), R"docstr(
             multicastLevel(level: int)
 
             Set the network level of the instantiated network node used for multicasted frames. This will override the
@@ -418,13 +760,13 @@ PYBIND11_MODULE(rf24_network, m)
         // *****************************************************************************
 
         .def("multicast", &RF24NetworkWrapper::multicast, R"docstr(
-            multicast(header: RF24NetworkHeader, buf: Union[bytes, bytearray], level: int = 7) -> bool
+            multicast(header: RF24NetworkHeader, buf: Union[bytes, bytearray, memoryview], level: int = 7) -> bool
 
             Broadcast a message to all nodes in a network level.
 
             :param RF24NetworkHeader header: The outgoing frame's header. The only value of this
                 object that is not overridden by this function is the `RF24NetworkHeader.type` attribute.
-            :param bytes,bytearray buf: The outgoing frame's message (AKA buffer).
+            :param bytes,bytearray,memoryview buf: The outgoing frame's message (AKA buffer).
             :param int level: The network level to broadcast the message to. If this parameter is not specified,
                 then the current network level of the instantiated node is used (see `multicast_level`).
 
@@ -524,4 +866,167 @@ PYBIND11_MODULE(rf24_network, m)
         )docstr")
 
         .def_readwrite("networkFlags", &RF24Network::networkFlags);
+
+    // ******************** NetworkGroup class  **************************
+    py::class_<NetworkGroup>(m, "NetworkGroup", R"docstr(
+        Services several network nodes (each using a different radio), each with its own native
+        thread. This is the network layer's counterpart of :py:class:`~pyrf24.rf24.RadioGroup`:
+        the threads keep the nodes current (see `RF24Network.update()`) without the GIL, received
+        messages of all nodes are delivered together (see `take()`), and each node has its own
+        TX queue.
+
+        .. code-block:: python
+
+            with NetworkGroup([network_a, network_b]) as group:
+                group.send(RF24NetworkHeader(0o0), b"hello")
+                if group.wait(1000):
+                    for index, header, message, timestamp in group.take():
+                        ...
+    )docstr")
+
+        .def(py::init<py::sequence, size_t, size_t>(), R"docstr(
+            __init__(networks: Sequence[RF24Network], capacity: int = 64, tx_capacity: int = 64)
+
+            Start a thread for each network node. The nodes should be started (see
+            `RF24Network.begin()`) before the group is created.
+
+            :param Sequence[RF24Network] networks: The network nodes to service (1 to 256 of
+                them). Each node's index in this sequence identifies it in the group.
+            :param int capacity: The maximum number of received messages that each node's queue
+                can hold.
+            :param int tx_capacity: The maximum number of messages that each node's TX queue can
+                hold.
+
+            :raises RuntimeError: If a :py:class:`~pyrf24.rf24.RxWorker` (or any other group or
+                thread) is already running for any of the nodes' radios.
+
+            .. important::
+                While the group is running, do not call `RF24Network.update()`, read messages
+                or transmit with its nodes directly.
+        )docstr",
+             py::arg("networks"), py::arg("capacity") = 64, py::arg("tx_capacity") = 64)
+
+        // *****************************************************************************
+
+        .def("send", &NetworkGroup::send, R"docstr(
+            send(header: RF24NetworkHeader, buf: Union[bytes, bytearray, memoryview], node: Optional[int] = None) -> int
+
+            Put a message in a node's TX queue (to be sent like `RF24Network.write()` does). The
+            header and message are copied, so they can be reused immediately.
+
+            :param RF24NetworkHeader header: The message's header.
+            :param bytes,bytearray,memoryview buf: The message (up to
+                :py:attr:`~pyrf24.rf24_network.MAX_PAYLOAD_SIZE` bytes).
+            :param int node: The index of the node to transmit with. `None` picks the node with
+                the fewest queued messages (nodes take turns when there is a tie).
+
+            :Returns: The index of the node that will transmit the message, or ``-1`` if the
+                message was not queued because the node's TX queue is full.
+
+            :raises ValueError: If the message is too long.
+            :raises IndexError: If ``node`` is out of range.
+        )docstr",
+             py::arg("header"), py::arg("buf"), py::arg("node") = py::none())
+
+        // *****************************************************************************
+
+        .def("take", &NetworkGroup::take, R"docstr(
+            take(max_per_node: int = 0) -> List[Tuple[int, RF24NetworkHeader, bytearray, int]]
+
+            Fetch (and remove) the messages received by all nodes.
+
+            :param int max_per_node: The maximum number of messages to fetch from each node's
+                queue. ``0`` fetches all messages.
+
+            :Returns: A `list` of 4-tuples: the index of the node that received the message, the
+                message's header, the message, and the time (in nanoseconds) that the message
+                was observed (see `RF24Network.rx_timestamp`). The nodes take turns (in
+                ascending order), one message at a time. The messages of each node stay in the
+                order they were received.
+        )docstr",
+             py::arg("max_per_node") = 0)
+
+        // *****************************************************************************
+
+        .def("wait", &NetworkGroup::wait, R"docstr(
+            wait(timeout_ms: int) -> bool
+
+            Wait until any node has received messages. Other python threads can run while
+            waiting.
+
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
+
+            :Returns: `True` if any received messages are pending, otherwise `False` (the
+                timeout elapsed or a thread was stopped).
+        )docstr",
+             py::arg("timeout_ms"))
+
+        // *****************************************************************************
+
+        .def("flush", &NetworkGroup::flush, R"docstr(
+            flush(timeout_ms: int) -> bool
+
+            Wait until all TX queues are empty. Other python threads can run while waiting.
+
+            :param int timeout_ms: The maximum time (in milliseconds) to wait.
+
+            :Returns: `True` if all TX queues are empty, otherwise `False` (the timeout
+                elapsed or a thread was stopped).
+        )docstr",
+             py::arg("timeout_ms"))
+
+        // *****************************************************************************
+
+        .def("stop", &NetworkGroup::stop, R"docstr(
+            stop() -> None
+
+            Stop the threads. Received messages can still be fetched with `take()`, but
+            messages left in the TX queues are not transmitted. This is also done when the
+            `NetworkGroup` object is destroyed.
+
+            :raises RuntimeError: If a thread was stopped by an error.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def(
+            "__enter__", [](NetworkGroup& self) -> NetworkGroup& { return self; }, py::return_value_policy::reference)
+
+        .def("__exit__", [](NetworkGroup& self, py::args) { self.stop(); })
+
+        // *****************************************************************************
+
+        .def("__len__", &NetworkGroup::size)
+
+        .def_property_readonly("networks", &NetworkGroup::get_objects, R"docstr(
+            A `list` of the group's network nodes (indexed like the indices returned by
+            `take()`). ``len()`` returns the number of nodes.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def_property_readonly("pending", &NetworkGroup::rx_pending, R"docstr(
+            The number of received messages (of all nodes) that have not been fetched with
+            `take()`.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def_property_readonly("tx_pending", &NetworkGroup::tx_pending, R"docstr(
+            The number of messages (in all TX queues) that are not yet transmitted.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def_property_readonly("running", &NetworkGroup::is_running, R"docstr(
+            Are all threads running? See `stop()`.
+        )docstr")
+
+        // *****************************************************************************
+
+        .def_property_readonly("stats", &NetworkGroup::get_stats, R"docstr(
+            A `list` of each node's statistics (indexed like `networks`). The keys of each
+            node's `dict` are described in :py:attr:`~pyrf24.rf24.RadioGroup.stats` (counting
+            messages instead of payloads).
+        )docstr");
 }
@@ -1,6 +1,9 @@
 # pylint: disable=import-error,missing-module-docstring
 from .rf24 import (
     RF24,
+    RxWorker,
+    Multiceiver,
+    RadioGroup,
     RF24_CRC_DISABLED,
     RF24_CRC_8,
     RF24_CRC_16,
@@ -11,10 +14,13 @@ from .rf24 import (
     RF24_PA_LOW,
     RF24_PA_HIGH,
     RF24_PA_MAX,
+    RX_RECORD_SIZE,
+    CONFIG_SNAPSHOT_SIZE,
 )
 from .rf24_network import (
     RF24Network,
     RF24NetworkHeader,
+    NetworkGroup,
     # RF24NetworkFrame,
     MAX_USER_DEFINED_HEADER_TYPE,
     MAX_PAYLOAD_SIZE,
@@ -56,3 +62,5 @@ from .fake_ble import (
     BatteryServiceData,
     TemperatureServiceData,
 )
+from .async_rf24 import AsyncRF24
+from .link_adapter import LinkAdapter
@@ -0,0 +1,285 @@
+"""This module provides an `asyncio` front-end for the `RF24` class.
+
+All calls to the radio are made from a dedicated worker thread (one per `AsyncRF24`
+object), so the event loop is never blocked while the radio is busy. Any number of
+coroutines can share the same radio; their requests are executed in the order they
+were made.
+
+Received payloads are collected in the background.
+
+- If the radio's IRQ pin is monitored (see :py:meth:`~pyrf24.rf24.RF24.attach_irq()`
+  or :py:attr:`~pyrf24.rf24.RF24.irq_fd`), the file descriptor is registered with the
+  event loop, and the radio's RX FIFO is only read when the radio asserts its IRQ pin.
+- Otherwise, the worker thread waits for payloads using
+  :py:meth:`~pyrf24.rf24.RF24.wait_available()`. The worker thread can only service
+  other requests (like `AsyncRF24.send()`) between waits, so the
+  ``poll_interval_ms`` parameter limits the latency of those requests.
+
+.. code-block:: python
+
+    import asyncio
+    from pyrf24 import RF24, AsyncRF24
+
+    radio = RF24(22, 0)
+    radio.begin()
+    radio.open_rx_pipe(1, b"1Node")
+    radio.listen = True
+    radio.attach_irq(24)  # optional
+
+    async def main():
+        async with AsyncRF24(radio) as async_radio:
+            async for pipe, payload in async_radio:
+                print(f"received {payload} on pipe {pipe}")
+
+    asyncio.run(main())
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Any, Callable, Deque, List, Optional, Tuple, Union
+from .rf24 import RF24  # pylint: disable=import-error
+
+
+class AsyncRF24:  # pylint: disable=too-many-instance-attributes
+    """An adapter that makes the `RF24` class usable from `asyncio` coroutines.
+
+    :param RF24 radio: The `RF24` object to use. It should already be configured (see
+        :py:meth:`~pyrf24.rf24.RF24.begin()`). The radio should be listening (see
+        :py:attr:`~pyrf24.rf24.RF24.listen`) to receive payloads.
+    :param int poll_interval_ms: The maximum time (in milliseconds) that the worker
+        thread waits for a payload before servicing other requests. This is only used
+        if the radio's IRQ pin is not monitored.
+    :param int max_queued: The maximum number of received payloads that are buffered.
+        If this many payloads are already buffered, then the radio's RX FIFO is not read
+        until `recv()` is called. ``0`` means unbounded.
+    """
+
+    def __init__(self, radio: RF24, poll_interval_ms: int = 10, max_queued: int = 0):
+        self._radio = radio
+        self._poll_interval_ms = poll_interval_ms
+        self._max_queued = max_queued
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._irq_fd = -1
+        self._received: Deque[Tuple[int, bytearray]] = deque()
+        self._receivers: Deque["asyncio.Future[None]"] = deque()
+        self._error: Optional[BaseException] = None
+        self._draining = False
+        self._drain_again = False
+        self._poller: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def radio(self) -> RF24:
+        """The `RF24` object that this adapter uses."""
+        return self._radio
+
+    @property
+    def running(self) -> bool:
+        """Is the adapter collecting received payloads? See `start()` and `close()`."""
+        return self._loop is not None
+
+    def start(self):
+        """Start collecting received payloads in the background.
+
+        This is called automatically by `recv()` and `send()` (or when the object is
+        used as an asynchronous context manager), but it must be called from a
+        coroutine (or a callback) running in the event loop.
+        """
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="AsyncRF24")
+        self._irq_fd = self._radio.irq_fd
+        if self._irq_fd >= 0:
+            self._loop.add_reader(self._irq_fd, self._on_irq)
+            self._drain()  # the RX FIFO might already have payloads
+        else:
+            self._poller = self._loop.create_task(self._poll())
+
+    async def close(self):
+        """Stop collecting received payloads and shut down the worker thread.
+
+        Any coroutine waiting in `recv()` is cancelled.
+        """
+        if self._loop is None:
+            return
+        if self._irq_fd >= 0:
+            self._loop.remove_reader(self._irq_fd)
+            self._irq_fd = -1
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+        while self._receivers:
+            self._receivers.popleft().cancel()
+        executor, self._executor, self._loop = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncRF24":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        """Call ``func(*args)`` from the worker thread."""
+        self.start()
+        assert self._loop is not None and self._executor is not None
+        return await self._loop.run_in_executor(self._executor, func, *args)
+
+    async def send(
+        self, buf: Union[bytes, bytearray, memoryview], multicast: bool = False
+    ) -> bool:
+        """Transmit a payload.
+
+        If the radio is listening, it stops listening to transmit the payload and
+        resumes listening afterward.
+
+        :param bytes,bytearray,memoryview buf: The payload to transmit.
+        :param bool multicast: See :py:meth:`~pyrf24.rf24.RF24.write()`.
+
+        :Returns: The same as :py:meth:`~pyrf24.rf24.RF24.write()`.
+        """
+        result = await self._run(self._send, buf, multicast)
+        # RF24.write() clears all IRQ flags, including the RX_DR flag of any payload
+        # received meanwhile. So, the RX FIFO won't trigger a new IRQ event.
+        if self._irq_fd >= 0:
+            self._drain()
+        return result
+
+    def _send(self, buf: Union[bytes, bytearray, memoryview], multicast: bool) -> bool:
+        listening = self._radio.listen
+        if listening:
+            self._radio.listen = False
+        try:
+            return self._radio.write(buf, multicast)
+        finally:
+            if listening:
+                self._radio.listen = True
+
+    async def recv(self) -> Tuple[int, bytearray]:
+        """Wait for the next received payload.
+
+        :Returns: A `tuple` in which
+
+            - index 0 is the pipe number that received the payload
+            - index 1 is the payload (as a `bytearray`)
+        """
+        self.start()
+        assert self._loop is not None
+        while not self._received:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            waiter = self._loop.create_future()
+            self._receivers.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._receivers:
+                    self._receivers.remove(waiter)
+        result = self._received.popleft()
+        if (
+            self._irq_fd >= 0
+            and self._max_queued
+            and len(self._received) + 1 == self._max_queued
+        ):
+            self._drain()  # the RX FIFO may have been left unread while the buffer was full
+        return result
+
+    def __aiter__(self) -> "AsyncRF24":
+        return self
+
+    async def __anext__(self) -> Tuple[int, bytearray]:
+        try:
+            return await self.recv()
+        except asyncio.CancelledError:
+            if self._loop is None:  # close() was called
+                raise StopAsyncIteration  # pylint: disable=raise-missing-from
+            raise
+
+    def _on_irq(self):
+        """Consume the IRQ file descriptor's event and read the radio's RX FIFO."""
+        try:
+            os.read(self._irq_fd, 16)  # a struct gpioevent_data or an eventfd's counter
+        except BlockingIOError:
+            pass
+        self._drain()
+
+    def _drain(self):
+        """Read the radio's RX FIFO from the worker thread."""
+        if self._loop is None or self._executor is None:
+            return
+        if self._draining:
+            # an event may have occurred after the worker thread checked the RX FIFO
+            self._drain_again = True
+            return
+        self._draining = True
+        future = self._loop.run_in_executor(
+            self._executor, self._read_fifo, self._room()
+        )
+        future.add_done_callback(self._on_drained)
+
+    def _room(self) -> int:
+        """The number of payloads that can be buffered (-1 means unbounded)."""
+        if not self._max_queued:
+            return -1
+        return max(self._max_queued - len(self._received), 0)
+
+    def _read_fifo(self, room: int) -> List[Tuple[int, bytearray]]:
+        """Read payloads from the radio's RX FIFO (called from the worker thread)."""
+        received: List[Tuple[int, bytearray]] = []
+        while room < 0 or len(received) < room:
+            has_payload, pipe = self._radio.available_pipe()
+            if not has_payload:
+                break
+            received.append((pipe, self._radio.read()))
+        return received
+
+    def _on_drained(self, future: "asyncio.Future[List[Tuple[int, bytearray]]]"):
+        self._draining = False
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._error = error
+        else:
+            self._received.extend(future.result())
+        self._wake_receivers()
+        if self._drain_again:
+            self._drain_again = False
+            self._drain()
+
+    def _wake_receivers(self):
+        count = len(self._receivers) if self._error is not None else len(self._received)
+        while self._receivers and count > 0:
+            waiter = self._receivers.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    async def _poll(self):
+        """Wait for payloads from the worker thread (used when no IRQ fd is available)."""
+        while True:
+            if self._max_queued and len(self._received) >= self._max_queued:
+                # wait for the buffered payloads to be consumed
+                await asyncio.sleep(self._poll_interval_ms / 1000)
+                continue
+            try:
+                if await self._run(self._radio.wait_available, self._poll_interval_ms):
+                    self._received.extend(
+                        await self._run(self._read_fifo, self._room())
+                    )
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # a subclass of Exception in python v3.7
+            except Exception as error:  # pylint: disable=broad-except
+                self._error = error
+                await asyncio.sleep(self._poll_interval_ms / 1000)
+            self._wake_receivers()
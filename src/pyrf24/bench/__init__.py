@@ -0,0 +1,39 @@
+"""Reproducible benchmarks for comparing pyrf24 releases and radio configurations.
+
+The benchmarks can be run from python or from the command line:
+
+.. code-block:: shell
+
+    pyrf24-bench latency --payload-sizes 1,16,32 --data-rates 1M,2M --json latency.json
+    pyrf24-bench throughput --methods write,write_many,network --json throughput.json
+    pyrf24-bench ble --sizes 8,32
+
+Use ``pyrf24-bench --help`` (or ``python -m pyrf24.bench --help``) for a list of the
+benchmarks and their options.
+"""
+
+from .common import summarize
+from .latency import (
+    LatencyCase,
+    latency_cases,
+    measure,
+    run_loopback,
+    run_ping,
+    serve_pong,
+)
+from .throughput import ThroughputCase, throughput_cases, measure_overhead
+from .ble import check_equivalence
+
+__all__ = [
+    "summarize",
+    "LatencyCase",
+    "latency_cases",
+    "measure",
+    "run_loopback",
+    "run_ping",
+    "serve_pong",
+    "ThroughputCase",
+    "throughput_cases",
+    "measure_overhead",
+    "check_equivalence",
+]
@@ -0,0 +1,387 @@
+"""The command line interface of the `pyrf24.bench` package (``pyrf24-bench``)."""
+
+import argparse
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from .. import rf24  # pylint: disable=no-name-in-module
+from .common import (
+    DATA_RATES,
+    create_radio,
+    environment,
+    format_table,
+    is_simulated,
+    parse_bool,
+    parse_list,
+    parse_pins,
+    write_report,
+)
+from .ble import FUNCTIONS, check_equivalence
+from .ble import measure as measure_ble
+from .latency import latency_cases, run_loopback, run_ping, serve_pong
+from .throughput import METHODS, measure_overhead, run, throughput_cases
+
+LATENCY_COLUMNS = [
+    "payload_size",
+    "data_rate",
+    "retries",
+    "dynamic_payloads",
+    "ack_payloads",
+    "sent",
+    "lost",
+    "p50",
+    "p90",
+    "p99",
+    "max",
+]
+
+THROUGHPUT_COLUMNS = [
+    "payload_size",
+    "data_rate",
+    "sent",
+    "delivered",
+    "payloads_per_s",
+    "goodput_kbps",
+    "cpu_us_per_payload",
+    "method",  # last, because its values are longer than the other columns'
+]
+
+BLE_COLUMNS = ["size", "ns_per_call", "reference_ns", "speedup", "function"]
+
+
+def _retries(text: str) -> Tuple[int, int]:
+    values = [int(value) for value in text.split(":")]
+    if len(values) != 2:
+        raise ValueError(f"{text!r} is not in the form 'DELAY:COUNT'")
+    return values[0], values[1]
+
+
+def _data_rate(text: str) -> str:
+    name = text.upper().replace("BPS", "")
+    if name not in DATA_RATES:
+        raise ValueError(f"{text!r} is not one of {', '.join(DATA_RATES)}")
+    return name
+
+
+def _add_radio_options(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("radio options")
+    group.add_argument(
+        "--radio",
+        type=parse_pins,
+        default=(22, 0),
+        metavar="CE,CSN",
+        help="the pins of the (first) radio (default: %(default)s)",
+    )
+    group.add_argument("--channel", type=int, default=76, help="default: %(default)s")
+    group.add_argument(
+        "--sim-loss",
+        type=float,
+        default=0.0,
+        help="the probability that a simulated transmission is lost (RF24_DRIVER=sim only)",
+    )
+    group.add_argument(
+        "--sim-latency-us",
+        type=int,
+        default=0,
+        help="the extra delay of simulated transmissions (RF24_DRIVER=sim only)",
+    )
+    group.add_argument(
+        "--json",
+        metavar="PATH",
+        help="write the results as JSON to PATH ('-' means stdout)",
+    )
+
+
+def _add_latency_parser(commands):
+    parser = commands.add_parser(
+        "latency",
+        help="measure round-trip (ping/pong) latencies",
+        description="Measure round-trip latencies between a ping radio and a pong radio. "
+        "Every combination of the given settings is measured. List options take "
+        "comma-separated values.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["loopback", "ping", "pong"],
+        default="loopback",
+        help="'loopback' uses 2 radios attached to this machine (or simulated radios); "
+        "'ping' and 'pong' are run on different machines (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--peer",
+        type=parse_pins,
+        default=(24, 10),
+        metavar="CE,CSN",
+        help="the pins of the pong radio in loopback mode (default: %(default)s)",
+    )
+    sweep = parser.add_argument_group("sweep options (ignored in pong mode)")
+    sweep.add_argument(
+        "--payload-sizes",
+        type=lambda x: parse_list(x, int),
+        default=[32],
+        metavar="SIZE,...",
+        help="the lengths of the pings (default: 32)",
+    )
+    sweep.add_argument(
+        "--data-rates",
+        type=lambda x: parse_list(x, _data_rate),
+        default=["1M"],
+        help=f"any of {', '.join(DATA_RATES)} (default: 1M)",
+    )
+    sweep.add_argument(
+        "--retries",
+        type=lambda x: parse_list(x, _retries),
+        default=[(5, 15)],
+        metavar="DELAY:COUNT,...",
+        help="arguments of RF24.set_retries() (default: 5:15)",
+    )
+    sweep.add_argument(
+        "--dynamic-payloads",
+        type=lambda x: parse_list(x, parse_bool),
+        default=[True],
+        metavar="on,off",
+    )
+    sweep.add_argument(
+        "--ack-payloads",
+        type=lambda x: parse_list(x, parse_bool),
+        default=[False],
+        metavar="off,on",
+        help="reply with ACK payloads instead of transmitting the pings back",
+    )
+    sweep.add_argument("--count", type=int, default=200, help="pings per case")
+    sweep.add_argument("--warmup", type=int, default=10, help="ignored pings per case")
+    sweep.add_argument(
+        "--timeout-ms",
+        type=int,
+        default=100,
+        help="the maximum time to wait for a reply",
+    )
+    _add_radio_options(parser)
+    parser.set_defaults(run=_run_latency)
+
+
+def _method(text: str) -> str:
+    if text not in METHODS:
+        raise ValueError(f"{text!r} is not one of {', '.join(METHODS)}")
+    return text
+
+
+def _add_throughput_parser(commands):
+    parser = commands.add_parser(
+        "throughput",
+        help="measure the throughput of different ways to transmit",
+        description="Measure the throughput of different ways to transmit payloads from a "
+        "radio to another radio (both attached to this machine, or simulated radios). "
+        "Every combination of the given settings is measured. List options take "
+        "comma-separated values. With the simulated driver (RF24_DRIVER=sim), the overhead "
+        "of the Python bindings is also measured.",
+    )
+    parser.add_argument(
+        "--peer",
+        type=parse_pins,
+        default=(24, 10),
+        metavar="CE,CSN",
+        help="the pins of the receiving radio (default: %(default)s)",
+    )
+    sweep = parser.add_argument_group("sweep options")
+    sweep.add_argument(
+        "--methods",
+        type=lambda x: parse_list(x, _method),
+        default=list(METHODS),
+        metavar="METHOD,...",
+        help=f"any of {', '.join(METHODS)} (default: all)",
+    )
+    sweep.add_argument(
+        "--payload-sizes",
+        type=lambda x: parse_list(x, int),
+        default=[32],
+        metavar="SIZE,...",
+        help="the lengths of the payloads; sizes larger than 32 are only used for "
+        "network messages (default: 32)",
+    )
+    sweep.add_argument(
+        "--data-rates",
+        type=lambda x: parse_list(x, _data_rate),
+        default=["1M"],
+        help=f"any of {', '.join(DATA_RATES)} (default: 1M)",
+    )
+    sweep.add_argument(
+        "--count", type=int, default=1000, help="payloads (or messages) per case"
+    )
+    sweep.add_argument(
+        "--timeout-ms",
+        type=int,
+        default=100,
+        help="the time after which an unacknowledged payload is given up on",
+    )
+    sweep.add_argument(
+        "--overhead-calls",
+        type=int,
+        default=10000,
+        help="calls per method when measuring the bindings' overhead; 0 skips it "
+        "(default: %(default)s)",
+    )
+    _add_radio_options(parser)
+    parser.set_defaults(run=_run_throughput)
+
+
+def _function(text: str) -> str:
+    if text not in FUNCTIONS:
+        raise ValueError(f"{text!r} is not one of {', '.join(FUNCTIONS)}")
+    return text
+
+
+def _add_ble_parser(commands):
+    parser = commands.add_parser(
+        "ble",
+        help="measure the helpers that process every BLE frame",
+        description="Measure the time per call of the fake_ble helpers that process every "
+        "BLE frame, compared with reference (bit-by-bit) implementations. The results of "
+        "both are checked for equality first. No radio is needed.",
+    )
+    parser.add_argument(
+        "--functions",
+        type=lambda x: parse_list(x, _function),
+        default=list(FUNCTIONS),
+        metavar="FUNCTION,...",
+        help=f"any of {', '.join(FUNCTIONS)} (default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda x: parse_list(x, int),
+        default=[32],
+        metavar="SIZE,...",
+        help="the lengths of the data (default: 32)",
+    )
+    parser.add_argument("--calls", type=int, default=2000, help="calls per round")
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="write the results as JSON to PATH ('-' means stdout)",
+    )
+    parser.set_defaults(run=_run_ble)
+
+
+def _print_latency(result: Dict[str, Any]):
+    row = dict(result, **result["rtt_us"])
+    row["retries"] = ":".join(str(x) for x in result["retries"])
+    print(format_table([row], LATENCY_COLUMNS, 9).splitlines()[1], flush=True)
+
+
+def _run_latency(args: argparse.Namespace) -> Dict[str, Any]:
+    radio = create_radio(args.radio, args.channel)
+    if args.mode == "pong":
+        print("serving pings (press Ctrl+C to stop)", file=sys.stderr)
+        serve_pong(radio, on_case=lambda case: print(case, file=sys.stderr))
+        return {}
+    cases = latency_cases(
+        args.payload_sizes,
+        args.data_rates,
+        args.retries,
+        args.dynamic_payloads,
+        args.ack_payloads,
+    )
+    print(format_table([], LATENCY_COLUMNS, 9) + "  (rtt in us)")
+    results: List[Dict[str, Any]]
+    if args.mode == "ping":
+        results = run_ping(
+            radio,
+            cases,
+            args.count,
+            warmup=args.warmup,
+            timeout_ms=args.timeout_ms,
+            on_result=_print_latency,
+        )
+    else:
+        peer = create_radio(args.peer, args.channel)
+        results = run_loopback(
+            radio,
+            peer,
+            cases,
+            args.count,
+            warmup=args.warmup,
+            timeout_ms=args.timeout_ms,
+            on_result=_print_latency,
+        )
+    return {"benchmark": "latency", "mode": args.mode, "results": results}
+
+
+def _print_throughput(result: Dict[str, Any]):
+    print(format_table([result], THROUGHPUT_COLUMNS, 9).splitlines()[1], flush=True)
+
+
+def _run_throughput(args: argparse.Namespace) -> Dict[str, Any]:
+    radio = create_radio(args.radio, args.channel)
+    peer = create_radio(args.peer, args.channel)
+    report: Dict[str, Any] = {"benchmark": "throughput"}
+    if args.overhead_calls and is_simulated():
+        report["overhead_ns"] = measure_overhead(radio, args.overhead_calls)
+        print("binding overhead (ns per call):")
+        for name, value in report["overhead_ns"].items():
+            print(f"{name:>12}  {value}")
+    cases = throughput_cases(args.methods, args.payload_sizes, args.data_rates)
+    print(format_table([], THROUGHPUT_COLUMNS, 9))
+    report["results"] = run(
+        radio,
+        peer,
+        cases,
+        args.count,
+        timeout_ms=args.timeout_ms,
+        on_result=_print_throughput,
+    )
+    return report
+
+
+def _run_ble(args: argparse.Namespace) -> Dict[str, Any]:
+    check_equivalence()
+    results = measure_ble(args.functions, args.sizes, args.calls)
+    print(format_table(results, BLE_COLUMNS))
+    return {"benchmark": "ble", "results": results}
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="pyrf24-bench",
+        description="Run reproducible benchmarks of the pyrf24 package.",
+    )
+    commands = parser.add_subparsers(title="benchmarks", dest="benchmark")
+    commands.required = True
+    _add_latency_parser(commands)
+    _add_throughput_parser(commands)
+    _add_ble_parser(commands)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a benchmark from the command line."""
+    args = create_parser().parse_args(argv)
+    if getattr(args, "sim_loss", 0) or getattr(args, "sim_latency_us", 0):
+        if not is_simulated():
+            print(
+                "--sim-* options require the simulated driver (RF24_DRIVER=sim)",
+                file=sys.stderr,
+            )
+            return 2
+        rf24.sim_configure(  # type: ignore[attr-defined]
+            loss=args.sim_loss, latency_us=args.sim_latency_us
+        )
+    try:
+        report = args.run(args)
+    except KeyboardInterrupt:
+        return 130
+    except (OSError, TimeoutError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if report and args.json:
+        report["environment"] = environment()
+        report["options"] = {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("run", "json")
+        }
+        write_report(report, args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""A micro-benchmark of the `pyrf24.fake_ble` helpers that process every BLE frame.
+
+:py:class:`~pyrf24.fake_ble.FakeBLE` runs these helpers on every advertisement that it
+transmits and on every payload that it receives. Each helper is compared with a reference
+implementation (the straightforward bit-by-bit algorithm), after checking that both give
+identical results. No radio is needed.
+"""
+
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from ..fake_ble import crc24_ble, reverse_bits, whitener
+from .common import time_calls
+
+#: The helpers that can be benchmarked (by name).
+FUNCTIONS = ("crc24_ble", "reverse_bits", "whitener")
+
+
+def reference_swap_bits(original: int) -> int:
+    """Reverse the bit order of a single byte, one bit at a time."""
+    original &= 0xFF
+    reverse = 0
+    for _ in range(8):
+        reverse <<= 1
+        reverse |= original & 1
+        original >>= 1
+    return reverse
+
+
+def reference_reverse_bits(original: Iterable[int]) -> bytearray:
+    """The reference implementation of :py:func:`~pyrf24.fake_ble.reverse_bits()`."""
+    return bytearray(reference_swap_bits(byte) for byte in original)
+
+
+def reference_crc24_ble(
+    data: Iterable[int], deg_poly: int = 0x65B, init_val: int = 0x555555
+) -> bytearray:
+    """The reference implementation of :py:func:`~pyrf24.fake_ble.crc24_ble()`."""
+    crc = init_val
+    for byte in data:
+        crc ^= reference_swap_bits(byte) << 16
+        for _ in range(8):
+            if crc & 0x800000:
+                crc = (crc << 1) ^ deg_poly
+            else:
+                crc <<= 1
+        crc &= 0xFFFFFF
+    return reference_reverse_bits(crc.to_bytes(3, "big"))
+
+
+def reference_whitener(buf: Iterable[int], coefficient: int) -> bytearray:
+    """The reference implementation of :py:func:`~pyrf24.fake_ble.whitener()`."""
+    data = bytearray(buf)
+    for i, byte in enumerate(data):
+        mask = 1
+        for _ in range(8):
+            if coefficient & 1:
+                coefficient ^= 0x88
+                byte ^= mask
+            mask <<= 1
+            coefficient >>= 1
+        data[i] = byte
+    return data
+
+
+def _calls(name: str, data: bytes, coefficient: int):
+    """The helper and its reference implementation (as functions without arguments)."""
+    pairs: Dict[str, List[Callable[[], Any]]] = {
+        "crc24_ble": [lambda: crc24_ble(data), lambda: reference_crc24_ble(data)],
+        "reverse_bits": [
+            lambda: reverse_bits(data),
+            lambda: reference_reverse_bits(data),
+        ],
+        "whitener": [
+            lambda: whitener(data, coefficient),
+            lambda: reference_whitener(data, coefficient),
+        ],
+    }
+    return pairs[name]
+
+
+def check_equivalence(samples: int = 500, seed: Optional[int] = None):
+    """Check that each helper gives the same results as its reference implementation.
+
+    :param int samples: The number of random inputs (of random lengths up to 64 bytes)
+        given to each helper. Every BLE channel's whitening coefficient and some random
+        CRC polynomials are also covered.
+    :param int seed: The seed of the random inputs (`None` uses a random seed).
+
+    :raises ValueError: If any result differs (the message names the helper and input).
+    """
+    rand = random.Random(seed)
+    for _ in range(samples):
+        data = bytes(rand.getrandbits(8) for _ in range(rand.randint(0, 64)))
+        coefficient = rand.choice((37, 38, 39, rand.getrandbits(7))) | 0x40
+        poly, init = rand.getrandbits(24), rand.getrandbits(24)
+        checks = {
+            "crc24_ble": (crc24_ble(data), reference_crc24_ble(data)),
+            "crc24_ble (custom)": (
+                crc24_ble(data, poly, init),
+                reference_crc24_ble(data, poly, init),
+            ),
+            "reverse_bits": (reverse_bits(data), reference_reverse_bits(data)),
+            "whitener": (
+                whitener(data, coefficient),
+                reference_whitener(data, coefficient),
+            ),
+        }
+        for name, (result, expected) in checks.items():
+            if result != expected:
+                raise ValueError(
+                    f"{name} differs from its reference for {data.hex()} "
+                    f"(coefficient={coefficient}, poly={poly}, init={init})"
+                )
+
+
+def measure(
+    functions: Iterable[str] = FUNCTIONS,
+    sizes: Iterable[int] = (32,),
+    calls: int = 2000,
+) -> List[Dict[str, Any]]:
+    """Measure the time that each helper takes per call.
+
+    :param Iterable[str] functions: The names of the helpers to measure (see `FUNCTIONS`).
+    :param Iterable[int] sizes: The lengths of the data (in bytes) given to the helpers.
+    :param int calls: The number of calls (per round) of each helper.
+
+    :Returns: A `list` of results (one per helper and size). Each result is a `dict` with
+        the keys ``"function"``, ``"size"``, ``"ns_per_call"``, ``"reference_ns"`` (the
+        reference implementation's time per call) and ``"speedup"``.
+    """
+    results = []
+    for size in sizes:
+        data = bytes(i & 0xFF for i in range(size))
+        for name in functions:
+            function, reference = _calls(name, data, 37 | 0x40)
+            elapsed = time_calls(function, calls)
+            reference_ns = time_calls(reference, calls)
+            results.append(
+                {
+                    "function": name,
+                    "size": size,
+                    "ns_per_call": elapsed,
+                    "reference_ns": reference_ns,
+                    "speedup": round(reference_ns / elapsed, 1) if elapsed else None,
+                }
+            )
+    return results
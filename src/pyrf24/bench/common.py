@@ -0,0 +1,157 @@
+"""Helpers shared by the benchmarks of the `pyrf24.bench` package."""
+
+import json
+import math
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+from .. import rf24  # pylint: disable=no-name-in-module
+from ..rf24 import (  # pylint: disable=import-error
+    RF24,
+    RF24_1MBPS,
+    RF24_2MBPS,
+    RF24_250KBPS,
+    rf24_datarate_e,
+)
+
+#: The data rates that can be given to the benchmarks (by name).
+DATA_RATES: Dict[str, rf24_datarate_e] = {
+    "250K": RF24_250KBPS,
+    "1M": RF24_1MBPS,
+    "2M": RF24_2MBPS,
+}
+
+_T = TypeVar("_T")
+
+
+def summarize(
+    samples: Sequence[float], scale: float = 1.0
+) -> Dict[str, Optional[float]]:
+    """Summarize a sequence of measurements.
+
+    :param Sequence[float] samples: The measurements.
+    :param float scale: A factor that each statistic is multiplied by (to convert units).
+
+    :Returns: A `dict` with the keys ``"p50"``, ``"p90"``, ``"p99"`` (nearest-rank
+        percentiles), ``"max"``, ``"mean"`` and ``"stdev"``. The values are `None` if
+        there are no ``samples``.
+    """
+    keys = ("p50", "p90", "p99", "max", "mean", "stdev")
+    if not samples:
+        return dict.fromkeys(keys)
+    ordered = sorted(samples)
+    count = len(ordered)
+    mean = sum(ordered) / count
+    stats = {
+        f"p{point}": ordered[max(math.ceil(point / 100 * count) - 1, 0)]
+        for point in (50, 90, 99)
+    }
+    stats["max"] = ordered[-1]
+    stats["mean"] = mean
+    stats["stdev"] = math.sqrt(sum((x - mean) ** 2 for x in ordered) / count)
+    return {key: round(stats[key] * scale, 3) for key in keys}
+
+
+def time_calls(function: Callable[[], Any], calls: int) -> float:
+    """The time (in nanoseconds) that calling ``function`` takes, averaged over ``calls``
+    calls. The best of 3 rounds is used, because it is the least disturbed by other
+    threads and processes."""
+    best = math.inf
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter_ns() - start)
+    return round(best / calls, 1)
+
+
+def parse_list(text: str, convert: Callable[[str], _T]) -> List[_T]:
+    """Parse a comma-separated command line option (like ``"1,16,32"``)."""
+    return [convert(item.strip()) for item in text.split(",") if item.strip()]
+
+
+def parse_bool(text: str) -> bool:
+    """Parse ``on``/``off`` (or ``1``/``0``, ``true``/``false``, ``yes``/``no``)."""
+    value = text.lower()
+    if value in ("on", "1", "true", "yes"):
+        return True
+    if value in ("off", "0", "false", "no"):
+        return False
+    raise ValueError(f"{text!r} is not 'on' or 'off'")
+
+
+def parse_pins(text: str) -> Tuple[int, int]:
+    """Parse a radio's ``CE,CSN`` pin numbers (as given to :py:class:`~pyrf24.rf24.RF24`)."""
+    pins = parse_list(text, int)
+    if len(pins) != 2:
+        raise ValueError(f"{text!r} is not in the form 'CE,CSN'")
+    return pins[0], pins[1]
+
+
+def create_radio(pins: Tuple[int, int], channel: int) -> RF24:
+    """Create and initialize a radio for a benchmark.
+
+    :raises OSError: If the radio's hardware isn't responding.
+    """
+    radio = RF24(*pins)
+    if not radio.begin():
+        raise OSError(
+            f"nRF24L01 hardware (CE={pins[0]}, CSN={pins[1]}) isn't responding"
+        )
+    radio.channel = channel
+    return radio
+
+
+def is_simulated() -> bool:
+    """Was the package built with the simulated radio driver (``RF24_DRIVER=sim``)?"""
+    return hasattr(rf24, "sim_configure")
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the environment that a benchmark runs in (for its JSON report)."""
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from importlib.metadata import version
+
+        package_version = version("pyrf24")
+    except Exception:  # pylint: disable=broad-except
+        package_version = "unknown"
+    return {
+        "pyrf24": package_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "driver": "sim" if is_simulated() else "hardware",
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_report(report: Dict[str, Any], path: str):
+    """Write a benchmark's report as JSON to a file (``"-"`` means stdout)."""
+    if path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+
+
+def format_table(
+    rows: Sequence[Dict[str, Any]], columns: Sequence[str], min_width: int = 0
+) -> str:
+    """Format ``rows`` (of flat `dict` objects) as a plain text table.
+
+    Use ``min_width`` to align tables that are printed one row at a time.
+    """
+    cells = [[str(column) for column in columns]]
+    for row in rows:
+        cells.append(["-" if row[col] is None else str(row[col]) for col in columns])
+    widths = [
+        max(min_width, *(len(line[i]) for line in cells)) for i in range(len(columns))
+    ]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in cells
+    )
@@ -0,0 +1,354 @@
+"""A round-trip latency benchmark.
+
+A "ping" radio sends numbered payloads to a "pong" radio, which sends each payload back.
+The round-trip time of a ping is measured from just before it is written to the moment
+its reply is observed by the ping radio (see :py:attr:`~pyrf24.rf24.RF24.rx_timestamp`
+and :py:attr:`~pyrf24.rf24.RF24.tx_timestamp`).
+
+- Without ACK payloads, the pong radio reads the ping and transmits it back, so a round
+  trip includes 2 transmissions and 2 switches between RX and TX modes.
+- With ACK payloads, the pong radio keeps an ACK payload (of the same size as the pings)
+  loaded (see :py:meth:`~pyrf24.rf24.RF24.set_ack_payload_source()`). So, a round trip
+  is 1 transmission and its acknowledgement.
+
+Both radios can be attached to the same machine (see `run_loopback()`). This also works
+with the simulated radio driver (``RF24_DRIVER=sim``). Otherwise, `run_ping()` and
+`serve_pong()` are run on different machines. Then the pong radio is told which settings
+to use before each case, so only the ping radio's command line selects the cases.
+"""
+
+import itertools
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from ..rf24 import RF24  # pylint: disable=import-error
+from .common import DATA_RATES, summarize
+
+#: The address that the pong radio listens on.
+PING_ADDRESS = b"BPing"
+#: The address that the ping radio listens on.
+PONG_ADDRESS = b"BPong"
+#: The first bytes of the payloads that tell the pong radio to start (or end) a case.
+CONTROL_PREFIX = b"\xa5BEN"
+
+_START = CONTROL_PREFIX + b"S"
+_END = CONTROL_PREFIX + b"E"
+
+
+class LatencyCase(NamedTuple):
+    """The radio settings that a round-trip latency is measured with."""
+
+    #: The length of the pings (in range [1, 32]).
+    payload_size: int = 32
+    #: The data rate (a key of `DATA_RATES`).
+    data_rate: str = "1M"
+    #: The arguments given to :py:meth:`~pyrf24.rf24.RF24.set_retries()`.
+    retries: Tuple[int, int] = (5, 15)
+    #: Use dynamic payload lengths?
+    dynamic_payloads: bool = True
+    #: Reply with ACK payloads (instead of transmitting the pings back)?
+    ack_payloads: bool = False
+
+    def configure(self, radio: RF24):
+        """Apply the settings to a radio (the ping or the pong radio)."""
+        radio.listen = False
+        radio.set_auto_ack(True)
+        radio.data_rate = DATA_RATES[self.data_rate]
+        radio.set_retries(*self.retries)
+        radio.dynamic_payloads = self.dynamic_payloads or self.ack_payloads
+        radio.ack_payloads = self.ack_payloads
+        if not radio.dynamic_payloads:
+            radio.payload_size = self.payload_size
+        radio.flush_rx()
+        radio.flush_tx()
+
+    def encode(self) -> bytes:
+        """Encode the settings as the payload that starts the case (see `serve_pong()`)."""
+        flags = self.dynamic_payloads | self.ack_payloads << 1
+        return _START + bytes(
+            [
+                self.payload_size,
+                list(DATA_RATES).index(self.data_rate),
+                *self.retries,
+                flags,
+            ]
+        )
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "LatencyCase":
+        """The inverse of `encode()`."""
+        size, rate, delay, count, flags = payload[len(_START) : len(_START) + 5]
+        return cls(
+            size,
+            list(DATA_RATES)[rate],
+            (delay, count),
+            bool(flags & 1),
+            bool(flags & 2),
+        )
+
+
+#: The settings that control payloads are sent with (between cases).
+BASE_CASE = LatencyCase(retries=(5, 15))
+
+
+def latency_cases(
+    payload_sizes: Iterable[int] = (32,),
+    data_rates: Iterable[str] = ("1M",),
+    retries: Iterable[Tuple[int, int]] = ((5, 15),),
+    dynamic_payloads: Iterable[bool] = (True,),
+    ack_payloads: Iterable[bool] = (False,),
+) -> List[LatencyCase]:
+    """Create every combination of the given settings.
+
+    Combinations that use ACK payloads without dynamic payloads are skipped (ACK
+    payloads require dynamic payload lengths).
+    """
+    return [
+        LatencyCase(*combination)
+        for combination in itertools.product(
+            payload_sizes, data_rates, retries, dynamic_payloads, ack_payloads
+        )
+        if combination[3] or not combination[4]
+    ]
+
+
+def _open_pipes(radio: RF24, address: bytes, peer: bytes):
+    radio.open_tx_pipe(peer)
+    radio.open_rx_pipe(1, address)
+
+
+def _ping_payload(sequence: int, size: int) -> bytes:
+    # the first byte is even, so a ping never starts with CONTROL_PREFIX
+    return (struct.pack("<I", (sequence << 1) & 0xFFFFFFFF) + bytes(28))[:size]
+
+
+def ping(
+    radio: RF24, case: LatencyCase, sequence: int, timeout_ms: int
+) -> Optional[int]:
+    """Send 1 ping and wait for its reply.
+
+    :param RF24 radio: The ping radio (already configured with ``case``).
+    :param LatencyCase case: The settings that the radios use.
+    :param int sequence: The ping's number (used to recognize its reply).
+    :param int timeout_ms: The maximum time (in milliseconds) to wait for the reply.
+
+    :Returns: The round-trip time (in nanoseconds), or `None` if the ping (or its reply)
+        was lost.
+    """
+    payload = _ping_payload(sequence, case.payload_size)
+    start = time.monotonic_ns()
+    if not radio.write(payload):
+        return None
+    if case.ack_payloads:
+        if not radio.available():
+            return None
+        while radio.available():
+            radio.read()
+        return radio.tx_timestamp - start
+    radio.listen = True
+    try:
+        deadline = start + timeout_ms * 1000000
+        while True:
+            remaining = (deadline - time.monotonic_ns()) // 1000000
+            if remaining <= 0 or not radio.wait_available(remaining):
+                return None
+            if radio.read(case.payload_size) == payload:
+                return radio.rx_timestamp - start
+            # a reply to an earlier ping that timed out
+    finally:
+        radio.listen = False
+
+
+def pong(
+    radio: RF24, case: LatencyCase, until: Callable[[bytes], bool], idle_ms: int = 0
+):
+    """Reply to pings until ``until(payload)`` returns `True` (or no payload is received for
+    ``idle_ms``).
+
+    :param RF24 radio: The pong radio (already configured with ``case``).
+    :param LatencyCase case: The settings that the radios use.
+    :param Callable until: A function that is called with each received payload (or with
+        an empty `bytes` object every 10 milliseconds while no payload is received).
+    :param int idle_ms: The maximum time (in milliseconds) without received payloads.
+        ``0`` means no limit.
+    """
+    radio.listen = True  # this flushes the TX FIFO if ACK payloads are enabled
+    if case.ack_payloads:
+        radio.set_ack_payload_source(1, itertools.repeat(bytes(case.payload_size)))
+    try:
+        last = time.monotonic_ns()
+        while True:
+            if not radio.wait_available(10):
+                if until(b"") or (
+                    idle_ms and time.monotonic_ns() - last > idle_ms * 1000000
+                ):
+                    return
+                continue
+            last = time.monotonic_ns()
+            payload = radio.read(0 if radio.dynamic_payloads else case.payload_size)
+            if until(bytes(payload)):
+                return
+            if not case.ack_payloads:
+                radio.listen = False
+                radio.write(payload)
+                radio.listen = True
+    finally:
+        radio.listen = False
+        if case.ack_payloads:
+            radio.set_ack_payload_source(1, None)
+
+
+def measure(
+    radio: RF24, case: LatencyCase, count: int, warmup: int = 10, timeout_ms: int = 100
+) -> Dict[str, Any]:
+    """Send pings with the ping radio and summarize their round-trip times.
+
+    :Returns: A `dict` with the case's settings, the number of pings ``"sent"`` (excluding
+        the ``warmup`` pings), the number of pings ``"lost"``, and the round-trip time
+        statistics (in microseconds) under ``"rtt_us"`` (see
+        :py:func:`~pyrf24.bench.common.summarize()`).
+    """
+    samples: List[int] = []
+    for sequence in range(warmup + count):
+        rtt = ping(radio, case, sequence, timeout_ms)
+        if sequence >= warmup and rtt is not None:
+            samples.append(rtt)
+    result: Dict[str, Any] = case._asdict()
+    result["retries"] = list(case.retries)
+    result["sent"] = count
+    result["lost"] = count - len(samples)
+    result["rtt_us"] = summarize(samples, 0.001)
+    return result
+
+
+def run_loopback(  # pylint: disable=too-many-arguments
+    ping_radio: RF24,
+    pong_radio: RF24,
+    cases: Iterable[LatencyCase],
+    count: int,
+    *,
+    warmup: int = 10,
+    timeout_ms: int = 100,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Measure the round-trip latency between 2 radios attached to this machine.
+
+    The pong radio is served from a separate thread.
+
+    :param RF24 ping_radio: The radio that sends the pings.
+    :param RF24 pong_radio: The radio that replies to the pings.
+    :param Iterable[LatencyCase] cases: The settings to measure.
+    :param int count: The number of pings to send for each case.
+    :param int warmup: The number of pings to send (and ignore) before measuring.
+    :param int timeout_ms: The maximum time (in milliseconds) to wait for each reply.
+    :param Callable on_result: A function that is called with each case's result.
+
+    :Returns: A `list` of results (as returned by `measure()`).
+    """
+    _open_pipes(ping_radio, PONG_ADDRESS, PING_ADDRESS)
+    _open_pipes(pong_radio, PING_ADDRESS, PONG_ADDRESS)
+    results = []
+    for case in cases:
+        case.configure(ping_radio)
+        case.configure(pong_radio)
+        done = threading.Event()
+        server = threading.Thread(
+            target=pong,
+            args=(pong_radio, case, lambda _, done=done: done.is_set()),
+            daemon=True,
+        )
+        server.start()
+        time.sleep(0.01)  # let the pong radio start listening
+        try:
+            result = measure(ping_radio, case, count, warmup, timeout_ms)
+        finally:
+            done.set()
+            server.join()
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def _send_control(radio: RF24, payload: bytes, timeout_ms: int) -> bool:
+    deadline = time.monotonic_ns() + timeout_ms * 1000000
+    while time.monotonic_ns() < deadline:
+        if radio.write(payload):
+            return True
+    return False
+
+
+def run_ping(  # pylint: disable=too-many-arguments
+    radio: RF24,
+    cases: Iterable[LatencyCase],
+    count: int,
+    *,
+    warmup: int = 10,
+    timeout_ms: int = 100,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    idle_ms: int = 500,
+) -> List[Dict[str, Any]]:
+    """Measure the round-trip latency to a radio that runs `serve_pong()` (on another
+    machine).
+
+    The parameters are the same as `run_loopback()`'s. ``idle_ms`` must not be smaller than
+    the pong radio's.
+
+    :raises TimeoutError: If the pong radio doesn't acknowledge the start of a case.
+    """
+    _open_pipes(radio, PONG_ADDRESS, PING_ADDRESS)
+    results = []
+    for case in cases:
+        BASE_CASE.configure(radio)
+        if not _send_control(radio, case.encode(), 2000):
+            raise TimeoutError("the pong radio is not responding")
+        case.configure(radio)
+        time.sleep(0.01)  # let the pong radio apply the case's settings
+        result = measure(radio, case, count, warmup, timeout_ms)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+        ended = False
+        if case.dynamic_payloads or case.payload_size >= len(_END):
+            ended = _send_control(radio, _END, 100)
+        if not ended:
+            time.sleep(idle_ms / 1000)  # wait for the pong radio to give up on the case
+    BASE_CASE.configure(radio)
+    return results
+
+
+def serve_pong(
+    radio: RF24,
+    idle_ms: int = 500,
+    on_case: Optional[Callable[[LatencyCase], None]] = None,
+    until: Optional[Callable[[], bool]] = None,
+):
+    """Reply to the pings of a radio that runs `run_ping()` (on another machine).
+
+    :param RF24 radio: The pong radio.
+    :param int idle_ms: The time (in milliseconds) without pings after which a case is
+        assumed to be finished.
+    :param Callable on_case: A function that is called with each case that is started.
+    :param Callable until: A function that returns `True` to stop serving. By default,
+        this function never returns.
+    """
+    _open_pipes(radio, PING_ADDRESS, PONG_ADDRESS)
+    while until is None or not until():
+        BASE_CASE.configure(radio)
+        radio.listen = True
+        if not radio.wait_available(100):
+            continue
+        payload = bytes(radio.read())
+        if not payload.startswith(_START):
+            continue
+        case = LatencyCase.decode(payload)
+        if on_case is not None:
+            on_case(case)
+        case.configure(radio)
+        pong(
+            radio,
+            case,
+            lambda data: data.startswith(_END) or (until is not None and until()),
+            idle_ms,
+        )
@@ -0,0 +1,337 @@
+"""A throughput benchmark that compares the ways of transmitting payloads.
+
+A transmitting radio sends a number of payloads (or messages) to a receiving radio as fast
+as the tested method allows. The methods are
+
+- ``"write"``: :py:meth:`~pyrf24.rf24.RF24.write()` for each payload. Each call waits for
+  the payload's acknowledgement.
+- ``"write_fast"``: :py:meth:`~pyrf24.rf24.RF24.write_fast()` for each payload, which only
+  waits for space in the TX FIFO. A payload that reaches the maximum number of retries is
+  transmitted again with :py:meth:`~pyrf24.rf24.RF24.reuse_tx()`.
+- ``"start_fast_write"``: bursts of 3 payloads (the TX FIFO's depth) uploaded with
+  :py:meth:`~pyrf24.rf24.RF24.start_fast_write()`, each burst followed by
+  :py:meth:`~pyrf24.rf24.RF24.tx_standby()`.
+- ``"write_many"``: all payloads given to :py:meth:`~pyrf24.rf24.RF24.write_many()` at
+  once.
+- ``"network"``: :py:meth:`~pyrf24.rf24_network.RF24Network.write()` for each message.
+  Messages longer than a frame's payload (24 bytes) are fragmented into several frames.
+
+The receiving radio is drained by an :py:class:`~pyrf24.rf24.RxWorker` (or by
+:py:meth:`~pyrf24.rf24_network.RF24Network.update()` for the ``"network"`` method), so it
+counts every payload that was delivered. Both radios must be attached to this machine (or
+be simulated radios).
+
+The overhead of the Python bindings can be measured separately with `measure_overhead()`.
+"""
+
+import itertools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .. import rf24  # pylint: disable=no-name-in-module
+from ..rf24 import RF24, RX_RECORD_SIZE  # pylint: disable=import-error
+from ..rf24_network import (  # pylint: disable=import-error
+    RF24Network,
+    RF24NetworkHeader,
+    MAX_PAYLOAD_SIZE,
+)
+from .common import DATA_RATES, is_simulated, time_calls
+
+#: The address that the receiving radio listens on.
+RX_ADDRESS = b"BThru"
+
+#: The methods that `measure()` can use (in the order that they are measured by default).
+METHODS = ("write", "write_fast", "start_fast_write", "write_many", "network")
+
+#: The maximum number of message bytes carried by each frame of a network message.
+FRAME_PAYLOAD_SIZE = 24
+
+_TX_NODE = 0o1
+_RX_NODE = 0o0
+
+# numbers the payloads of all cases, so the first payload of a case is never mistaken for
+# a retransmission of the previous case's first payload (if their PIDs match)
+_SEQUENCE = itertools.count()
+
+
+class ThroughputCase(NamedTuple):
+    """The method and radio settings that a throughput is measured with."""
+
+    #: One of `METHODS`.
+    method: str = "write"
+    #: The length of each payload (or network message).
+    payload_size: int = 32
+    #: The data rate (a key of `DATA_RATES`).
+    data_rate: str = "1M"
+
+    def configure(self, radio: RF24):
+        """Apply the settings to a radio (the transmitting or the receiving radio)."""
+        radio.listen = False
+        radio.set_auto_ack(True)
+        radio.data_rate = DATA_RATES[self.data_rate]
+        radio.set_retries(5, 15)
+        radio.ack_payloads = False
+        radio.dynamic_payloads = True
+        radio.flush_rx()
+        radio.flush_tx()
+
+    @property
+    def frames(self) -> int:
+        """The number of payloads that the radio transmits for each message."""
+        if self.method != "network":
+            return 1
+        return max(math.ceil(self.payload_size / FRAME_PAYLOAD_SIZE), 1)
+
+
+def throughput_cases(
+    methods: Iterable[str] = METHODS,
+    payload_sizes: Iterable[int] = (32,),
+    data_rates: Iterable[str] = ("1M",),
+) -> List[ThroughputCase]:
+    """Create every combination of the given settings.
+
+    Payload sizes larger than 32 bytes are only used with the ``"network"`` method.
+
+    :raises ValueError: If a method is not one of `METHODS`.
+    """
+    for method in methods:
+        if method not in METHODS:
+            raise ValueError(f"{method!r} is not one of {', '.join(METHODS)}")
+    return [
+        ThroughputCase(*combination)
+        for combination in itertools.product(methods, payload_sizes, data_rates)
+        if combination[1] <= 32 or combination[0] == "network"
+    ]
+
+
+def _send_write(radio: RF24, payloads: List[bytes], timeout_ms: int) -> int:
+    del timeout_ms  # write() gives up after the automatic retries
+    return sum(radio.write(payload) for payload in payloads)
+
+
+def _send_write_fast(radio: RF24, payloads: List[bytes], timeout_ms: int) -> int:
+    uploaded = 0
+    deadline = time.monotonic_ns() + timeout_ms * 1000000
+    for payload in payloads:
+        while not radio.write_fast(payload):
+            if time.monotonic_ns() > deadline:
+                radio.flush_tx()
+                return uploaded
+            radio.reuse_tx()  # MAX_RT was asserted; retransmit the stalled payload
+        uploaded += 1
+        deadline = time.monotonic_ns() + timeout_ms * 1000000
+    if not radio.tx_standby(timeout_ms):
+        uploaded = max(uploaded - 3, 0)  # at most a full TX FIFO was discarded
+    return uploaded
+
+
+def _send_start_fast_write(radio: RF24, payloads: List[bytes], timeout_ms: int) -> int:
+    sent = 0
+    for start in range(0, len(payloads), 3):
+        burst = payloads[start : start + 3]
+        for payload in burst:
+            radio.start_fast_write(payload)
+        if radio.tx_standby(timeout_ms):
+            sent += len(burst)
+    return sent
+
+
+def _send_write_many(radio: RF24, payloads: List[bytes], timeout_ms: int) -> int:
+    return sum(arc != 0xFF for arc in radio.write_many(payloads, timeout_ms=timeout_ms))
+
+
+_SENDERS: Dict[str, Callable[[RF24, List[bytes], int], int]] = {
+    "write": _send_write,
+    "write_fast": _send_write_fast,
+    "start_fast_write": _send_start_fast_write,
+    "write_many": _send_write_many,
+}
+
+
+def _result(
+    case: ThroughputCase, count: int, stats: Tuple[int, int, int, int]
+) -> Dict[str, Any]:
+    sent, delivered, elapsed, cpu = stats
+    payloads = delivered * case.frames
+    result: Dict[str, Any] = case._asdict()
+    result["sent"] = count
+    result["acknowledged"] = sent
+    result["delivered"] = delivered
+    result["elapsed_s"] = round(elapsed / 1e9, 6)
+    result["payloads_per_s"] = round(payloads * 1e9 / elapsed, 1) if elapsed else None
+    result["goodput_kbps"] = (
+        round(delivered * case.payload_size * 8e6 / elapsed, 3) if elapsed else None
+    )
+    result["cpu_us_per_payload"] = (
+        round(cpu / 1000 / (count * case.frames), 3) if count else None
+    )
+    return result
+
+
+def _measure_radio(
+    tx_radio: RF24, rx_radio: RF24, case: ThroughputCase, count: int, timeout_ms: int
+) -> Tuple[int, int, int, int]:
+    payloads = [
+        ((next(_SEQUENCE) & 0xFFFFFFFF).to_bytes(4, "little") * 8)[: case.payload_size]
+        for _ in range(count)
+    ]
+    tx_radio.open_tx_pipe(RX_ADDRESS)
+    rx_radio.open_rx_pipe(1, RX_ADDRESS)
+    rx_radio.listen = True
+    worker = rx_radio.start_rx_worker(min(max(count, 16), 4096))
+    try:
+        start, cpu_start = time.monotonic_ns(), time.thread_time_ns()
+        sent = _SENDERS[case.method](tx_radio, payloads, timeout_ms)
+        elapsed = time.monotonic_ns() - start
+        cpu = time.thread_time_ns() - cpu_start
+        time.sleep(0.01)  # let the worker drain the RX FIFO
+    finally:
+        worker.stop()
+        rx_radio.listen = False
+    return sent, worker.received + worker.ring_overruns, elapsed, cpu
+
+
+def _measure_network(  # pylint: disable=too-many-locals
+    tx_radio: RF24, rx_radio: RF24, case: ThroughputCase, count: int, timeout_ms: int
+) -> Tuple[int, int, int, int]:
+    if case.payload_size > MAX_PAYLOAD_SIZE:
+        raise ValueError(f"network messages are limited to {MAX_PAYLOAD_SIZE} bytes")
+    tx_network, rx_network = RF24Network(tx_radio), RF24Network(rx_radio)
+    rx_network.begin(rx_radio.channel, _RX_NODE)
+    tx_network.begin(tx_radio.channel, _TX_NODE)
+    delivered = [0]
+    done = threading.Event()
+
+    def receive():
+        # after the transmissions end, wait up to timeout_ms for the last frames
+        last = time.monotonic_ns()
+        while not done.is_set() or time.monotonic_ns() - last < timeout_ms * 1000000:
+            rx_network.update()
+            while rx_network.available():
+                rx_network.read()
+                delivered[0] += 1
+                last = time.monotonic_ns()
+
+    message = bytes(case.payload_size)
+    receiver = threading.Thread(target=receive, daemon=True)
+    receiver.start()
+    try:
+        start, cpu_start = time.monotonic_ns(), time.thread_time_ns()
+        sent = sum(
+            tx_network.write(RF24NetworkHeader(_RX_NODE, ord("T")), message)
+            for _ in range(count)
+        )
+        elapsed = time.monotonic_ns() - start
+        cpu = time.thread_time_ns() - cpu_start
+    finally:
+        done.set()
+        receiver.join()
+    return sent, delivered[0], elapsed, cpu
+
+
+def measure(
+    tx_radio: RF24,
+    rx_radio: RF24,
+    case: ThroughputCase,
+    count: int,
+    timeout_ms: int = 100,
+) -> Dict[str, Any]:
+    """Transmit ``count`` payloads (or messages) and measure the throughput.
+
+    :param RF24 tx_radio: The transmitting radio.
+    :param RF24 rx_radio: The receiving radio.
+    :param ThroughputCase case: The method and settings to use.
+    :param int count: The number of payloads (or network messages) to transmit.
+    :param int timeout_ms: The time (in milliseconds) after which a payload that isn't
+        acknowledged is given up on.
+
+    :Returns: A `dict` with the case's settings and
+
+        - ``"sent"``: ``count``.
+        - ``"acknowledged"``: the payloads (or messages) that the transmitting side
+          reported as successfully transmitted.
+        - ``"delivered"``: the payloads (or messages) that the receiving radio received.
+        - ``"elapsed_s"``: the time (in seconds) that transmitting took.
+        - ``"payloads_per_s"``: the delivered payloads (or network frames) per second.
+        - ``"goodput_kbps"``: the delivered payload (or message) bytes per second, in
+          kilobits per second (excluding network headers).
+        - ``"cpu_us_per_payload"``: the CPU time (in microseconds) that the transmitting
+          thread spent per payload (or network frame).
+    """
+    case.configure(tx_radio)
+    case.configure(rx_radio)
+    if case.method == "network":
+        stats = _measure_network(tx_radio, rx_radio, case, count, timeout_ms)
+    else:
+        stats = _measure_radio(tx_radio, rx_radio, case, count, timeout_ms)
+    return _result(case, count, stats)
+
+
+def run(  # pylint: disable=too-many-arguments
+    tx_radio: RF24,
+    rx_radio: RF24,
+    cases: Iterable[ThroughputCase],
+    count: int,
+    *,
+    timeout_ms: int = 100,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Measure the throughput of each case (see `measure()`).
+
+    :param Callable on_result: A function that is called with each case's result.
+
+    :Returns: A `list` of results (as returned by `measure()`).
+    """
+    results = []
+    for case in cases:
+        result = measure(tx_radio, rx_radio, case, count, timeout_ms)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def measure_overhead(radio: RF24, calls: int = 10000) -> Dict[str, float]:
+    """Measure the time that calling some methods takes when the driver does nothing.
+
+    This requires the simulated driver (``RF24_DRIVER=sim``), which is switched to a no-op
+    mode (see :py:func:`~pyrf24.rf24.sim_noop()`) while measuring. So, the measured times
+    are the overhead of the Python bindings and the RF24 C++ library (without any SPI
+    transactions).
+
+    :param RF24 radio: An initialized radio. Its settings are not changed, but it should
+        be reconfigured afterward, because anything written to the radio is lost.
+    :param int calls: The number of calls of each method.
+
+    :Returns: A `dict` of the time (in nanoseconds) per call of each method, excluding
+        the time that calling an empty Python function takes (which is given by the
+        ``"python_call"`` key, for reference).
+
+    :raises RuntimeError: If the package wasn't built with the simulated driver.
+    """
+    if not is_simulated():
+        raise RuntimeError("measuring the overhead requires the simulated driver")
+    payload = bytes(32)
+    buf = bytearray(32)
+    records = bytearray(RX_RECORD_SIZE * 3)
+    functions: Dict[str, Callable[[], Any]] = {
+        "python_call": lambda: None,
+        "available": lambda: radio.available(),  # pylint: disable=unnecessary-lambda
+        "channel": lambda: radio.channel,
+        "write_fast": lambda: radio.write_fast(payload),
+        "read": lambda: radio.read(32),
+        "read_into": lambda: radio.read_into(buf),
+        "read_all": lambda: radio.read_all(records),
+    }
+    rf24.sim_noop(True)  # type: ignore[attr-defined]
+    try:
+        times = {
+            name: time_calls(function, calls) for name, function in functions.items()
+        }
+    finally:
+        rf24.sim_noop(False)  # type: ignore[attr-defined]
+    return {
+        name: value if name == "python_call" else round(value - times["python_call"], 1)
+        for name, value in times.items()
+    }
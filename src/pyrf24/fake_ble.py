@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
+# pylint: disable=too-many-lines
 """This module uses the `RF24` class to make the nRF24L01 imitate a
 Bluetooth-Low-Emissions (BLE) beacon. A BLE beacon can send data (referred to as
 advertisements) to any BLE compatible device (ie smart devices with Bluetooth
@@ -73,10 +74,13 @@ here has been adapted to work with Python.
        triggered because auto-ack feature is disabled. Keep this in mind when using
        `mask_irq()`.
 """
+
 # pylint: disable=too-few-public-methods,missing-docstring,too-many-instance-attributes
+from collections import deque
+from functools import lru_cache
 from os import urandom
 import struct
-from typing import Union, List, Optional
+from typing import Any, Deque, Dict, Union, List, Optional, Tuple
 from .rf24 import (  # pylint: disable=import-error
     RF24,
     RF24_CRC_DISABLED,
@@ -116,6 +120,10 @@ def address_repr(buf, reverse: bool = True, delimit: str = "") -> str:
     # pylint: enable=consider-using-f-string
 
 
+# each byte value with its bit order reversed (a table for `bytes.translate()`)
+_REVERSED_BITS = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
 def swap_bits(original: int) -> int:
     """This function reverses the bit order for a single byte.
 
@@ -125,13 +133,7 @@ def swap_bits(original: int) -> int:
     :param int original: This is truncated to a single unsigned byte,
         meaning this parameter's value can only range from 0 to 255.
     """
-    original &= 0xFF
-    reverse = 0
-    for _ in range(8):
-        reverse <<= 1
-        reverse |= original & 1
-        original >>= 1
-    return reverse
+    return _REVERSED_BITS[original & 0xFF]
 
 
 def reverse_bits(original: Union[bytes, bytearray]) -> bytearray:
@@ -143,10 +145,7 @@ def reverse_bits(original: Union[bytes, bytearray]) -> bytearray:
     :param bytearray,bytes original: The original buffer whose bits are to be
        reversed.
     """
-    ret = bytearray(len(original))
-    for i, byte in enumerate(original):
-        ret[i] = swap_bits(byte)
-    return ret
+    return bytearray(original).translate(_REVERSED_BITS)
 
 
 def chunk(buf: Union[bytes, bytearray], data_type: int = 0x16) -> bytearray:
@@ -185,6 +184,9 @@ def whitener(buf: Union[bytes, bytearray], coefficient: int) -> bytearray:
     `FakeBLE` class to allow whitening and dewhitening a BLE payload without the
     hardcoded coefficient.
 
+    The whitening sequence only depends on the ``coefficient``, so it is computed once
+    (for each coefficient) and cached. Whitening is then a single XOR of the whole buffer.
+
     :param bytes,bytearray buf: The BLE payloads data. This data should include the
         CRC24 checksum.
     :param int coefficient: The whitening coefficient used to avoid repeating binary patterns.
@@ -202,17 +204,27 @@ def whitener(buf: Union[bytes, bytearray], coefficient: int) -> bytearray:
             If currently used nRF24L01 channel is different from the channel in which
             the payload was received, then set this parameter accordingly.
     """
-    data = bytearray(buf)
-    for i, byte in enumerate(data):
-        res, mask = (0, 1)
+    length = len(buf)
+    # the keystream only depends on the coefficient, so whitening is a single XOR
+    keystream = _whitening_keystream(coefficient, -(-length // 32) * 32)
+    data = int.from_bytes(buf, "little") ^ int.from_bytes(keystream[:length], "little")
+    return bytearray(data.to_bytes(length, "little"))
+
+
+@lru_cache(maxsize=16)
+def _whitening_keystream(coefficient: int, length: int) -> bytes:
+    """The bytes that `whitener()` XORs with the first ``length`` bytes of data."""
+    keystream = bytearray(length)
+    for i in range(length):
+        byte, mask = (0, 1)
         for _ in range(8):
             if coefficient & 1:
                 coefficient ^= 0x88
-                byte ^= mask
+                byte |= mask
             mask <<= 1
             coefficient >>= 1
-        data[i] = byte ^ res
-    return data
+        keystream[i] = byte
+    return bytes(keystream)
 
 
 def crc24_ble(
@@ -233,18 +245,39 @@ def crc24_ble(
     :returns: A 24-bit `bytearray` representing the checksum of the data (in
         proper little endian).
     """
-    crc = init_val
+    # BLE transmits the least significant bit first, so the CRC is computed on the
+    # bit-reversed register (which spares reversing each byte of data)
+    crc = _reverse_crc24(init_val)
+    table = _crc24_table(deg_poly & 0xFFFFFF)
     for byte in data:
-        crc ^= swap_bits(byte) << 16
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return bytearray(crc.to_bytes(3, "little"))
+
+
+def _reverse_crc24(value: int) -> int:
+    """Reverse the bit order of a 24-bit value."""
+    return int.from_bytes(reverse_bits(value.to_bytes(3, "big")), "little")
+
+
+@lru_cache(maxsize=4)
+def _crc24_table(deg_poly: int) -> List[int]:
+    """The CRC of each byte value for the bit-reversed register of `crc24_ble()`."""
+    poly = _reverse_crc24(deg_poly)
+    table = []
+    for byte in range(256):
+        crc = byte
         for _ in range(8):
-            if crc & 0x800000:
-                crc = (crc << 1) ^ deg_poly
-            else:
-                crc <<= 1
-        crc &= 0xFFFFFF
-    return reverse_bits((crc).to_bytes(3, "big"))
+            crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
 
 
+# the ways that FakeBLE.available() can handle a full rx_queue
+_OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+# the maximum number of on-air frames that a FakeBLE object caches (see FakeBLE.advertise())
+_FRAME_CACHE_SIZE = 16
+
 BLE_FREQ = (2, 26, 80)
 """The BLE channel number is different from the nRF channel number.
 
@@ -269,73 +302,119 @@ class QueueElement:
 
     :param bytes,bytearray buffer: the validated BLE payload (not including
         the CRC checksum). The buffer passed here is decoded into this class's
-        properties.
+        properties when any of `name`, `pa_level` or `data` is first accessed.
     """
 
+    __slots__ = ("mac", "_buffer", "_name", "_pa_level", "_data")
+
     def __init__(self, buffer: Union[bytes, bytearray]):
         #: The transmitting BLE device's MAC address as a `bytes` object.
         self.mac: bytes = bytes(buffer[2:8])
-        self.name: Optional[Union[bytes, str]] = None
+        self._buffer = buffer
+        self._name: Optional[Union[bytes, str]] = None
+        self._pa_level: Optional[int] = None
+        # None until the buffer is decoded
+        self._data: Optional[List[Union[bytearray, bytes, ServiceDataType]]] = None
+
+    @property
+    def buffer(self) -> Union[bytes, bytearray]:
+        """The validated BLE payload that this element was created from (read-only)."""
+        return self._buffer
+
+    @property
+    def name(self) -> Optional[Union[bytes, str]]:
         """The transmitting BLE device's name. This will be a `str`, `bytes` object (if
         a `UnicodeError` was caught), or `None` (if not included in the received
         payload)."""
-        self.pa_level: Optional[int] = None
+        self._decode()
+        return self._name
+
+    @name.setter
+    def name(self, value: Optional[Union[bytes, str]]):
+        self._decode()
+        self._name = value
+
+    @property
+    def pa_level(self) -> Optional[int]:
         """The transmitting device's PA Level (if included in the received payload)
         as an `int`.
 
         .. note:: This value does not represent the received signal strength.
             The nRF24L01 will receive anything over a -64 dbm threshold."""
-        self.data: List[Union[bytearray, bytes, ServiceDataType]] = []
+        self._decode()
+        return self._pa_level
+
+    @pa_level.setter
+    def pa_level(self, value: Optional[int]):
+        self._decode()
+        self._pa_level = value
+
+    @property
+    def data(self) -> List[Union[bytearray, bytes, "ServiceDataType"]]:
         """A `list` of the transmitting device's data structures (if any).
         If an element in this `list` is not an instance (or descendant) of the
         `ServiceData` class, then it is likely a custom, user-defined, or unsupported
         specification - in which case it will be a `bytearray` object."""
+        self._decode()
+        return self._data  # type: ignore[return-value]
 
+    @data.setter
+    def data(self, value: List[Union[bytearray, bytes, "ServiceDataType"]]):
+        self._decode()
+        self._data = value
+
+    def _decode(self):
+        """Decode the buffer's data structures (only the first time this is called)."""
+        if self._data is not None:
+            return
+        self._data = []
+        buffer = self._buffer
         end = buffer[1] + 2
         i = 8
         while i < end:
             size = buffer[i]
             if size + i + 1 > end or i + 1 > end or not size:
                 # data seems malformed. just append the buffer & move on
-                self.data.append(buffer[i:end])
+                self._data.append(buffer[i:end])
                 break
             result = self._decode_data_struct(buffer[i + 1 : i + 1 + size])
             if not result:  # decoding failed
-                self.data.append(buffer[i : i + 1 + size])
+                self._data.append(buffer[i : i + 1 + size])
             i += 1 + size
 
     def _decode_data_struct(self, buf: Union[bytes, bytearray]) -> bool:
         """Decode a data structure in a received BLE payload."""
         # print("decoding", address_repr(buf, 0, " "))
+        assert self._data is not None
         if buf[0] not in (0x16, 0x0A, 0x08, 0x09):
             return False  # unknown/unsupported "chunk" of data
         if buf[0] == 0x0A and len(buf) == 2:  # if data is the device's TX-ing PA Level
-            self.pa_level = struct.unpack("b", buf[1:2])[0]
+            self._pa_level = struct.unpack("b", buf[1:2])[0]
         if buf[0] in (0x08, 0x09):  # if data is a BLE device name
             try:
-                self.name = buf[1:].decode()
+                self._name = buf[1:].decode()
             except UnicodeError:
-                self.name = bytes(buf[1:])
+                self._name = bytes(buf[1:])
         if buf[0] == 0xFF:  # if it is a custom/user-defined data format
-            self.data.append(buf)  # return the raw buffer as a value
+            self._data.append(buf)  # return the raw buffer as a value
         if buf[0] == 0x16:  # if it is service data
             service_data_uuid = struct.unpack("<H", buf[1:3])[0]
             service: ServiceDataType
             if service_data_uuid == TEMPERATURE_UUID:
                 service = TemperatureServiceData()
                 service.data = buf[3:]  # type: ignore
-                self.data.append(service)
+                self._data.append(service)
             elif service_data_uuid == BATTERY_UUID:
                 service = BatteryServiceData()
                 service.data = buf[3:]  # type: ignore
-                self.data.append(service)
+                self._data.append(service)
             elif service_data_uuid == EDDYSTONE_UUID:
                 service = UrlServiceData()
                 service.pa_level_at_1_meter = buf[4:5]  # type: ignore
                 service.data = buf[5:]  # type: ignore
-                self.data.append(service)
+                self._data.append(service)
             else:
-                self.data.append(buf)
+                self._data.append(buf)
         return True
 
 
@@ -352,21 +431,37 @@ class FakeBLE:
 
         .. seealso::
             See the :py:class:`~pyrf24.rf24.RF24` class' constructor documentation.
+    :param int max_queued: The maximum number of received payloads that the `rx_queue`
+        holds. ``0`` means unbounded.
+    :param str overflow: What `available()` does with a received payload when the
+        `rx_queue` is full: ``"drop_oldest"`` discards the oldest element in the
+        `rx_queue` to make room, ``"drop_newest"`` discards the received payload. Either
+        way, it is counted as ``"dropped"`` (see `counters`).
     """
 
-    def __init__(self, radio: RF24):
+    def __init__(
+        self, radio: RF24, max_queued: int = 64, overflow: str = "drop_oldest"
+    ):
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(_OVERFLOW_POLICIES)}")
         self._radio = radio
+        self._max_queued = max_queued
+        self._overflow = overflow
+        self._counters: Dict[str, int] = {"received": 0, "invalid": 0, "dropped": 0}
         self._curr_freq = 2
         self._show_dbm = False
         self._ble_name: Optional[Union[bytes, bytearray]] = None
         self._mac = urandom(6)
-        self.rx_queue: List[QueueElement] = []
-        """The internal queue of received BLE payloads' data.
+        # the on-air frames of advertise(), keyed by (payload, channel index, PA level)
+        self._frames: Dict[Tuple[bytes, int, Any], bytes] = {}
+        self.rx_queue: Deque[QueueElement] = deque()
+        """The internal queue (a `collections.deque`) of received BLE payloads' data.
 
         Each Element in this queue is a `QueueElement` object whose members are set
         according to the its internal decoding algorithm. The
         :meth:`~pyrf24.fake_ble.FakeBLE.read()` function will remove & return the first
-        element in this queue.
+        element in this queue. The queue's length is limited by the ``max_queued``
+        parameter of the constructor.
 
         .. hint::
             This attribute is exposed for debugging purposes, but it can also be used
@@ -416,6 +511,18 @@ class FakeBLE:
         self._radio.listen = True
         return success
 
+    @property
+    def counters(self) -> Dict[str, int]:
+        """A `dict` of the receiver's counters (a copy).
+
+        - ``"received"``: the payloads that `available()` validated (including dropped ones).
+        - ``"invalid"``: the payloads that `available()` discarded because their length or
+          CRC checksum was invalid.
+        - ``"dropped"``: the validated payloads discarded because the `rx_queue` was full
+          (see the ``overflow`` parameter of the constructor).
+        """
+        return dict(self._counters)
+
     @property
     def mac(self):
         """This attribute returns a 6-byte buffer that is used as the
@@ -436,6 +543,7 @@ class FakeBLE:
             self._mac = address
         if len(self._mac) < 6:
             self._mac += urandom(6 - len(self._mac))
+        self._frames.clear()
 
     @property
     def name(self):
@@ -464,6 +572,7 @@ class FakeBLE:
             if len(_name) > (18 - self._show_dbm * 3):
                 raise ValueError("name length exceeds maximum.")
         self._ble_name = _name
+        self._frames.clear()
 
     @property
     def show_pa_level(self) -> bool:
@@ -484,6 +593,7 @@ class FakeBLE:
         if enable and len(self.name) > 16:
             raise ValueError("there is not enough room to show the pa_level.")
         self._show_dbm = bool(enable)
+        self._frames.clear()
 
     def hop_channel(self):
         """Trigger an automatic change of BLE compliant channels."""
@@ -523,20 +633,20 @@ class FakeBLE:
         # print("whitened: 0x" + address_repr(data, 0))
         return data
 
-    def _make_payload(self, payload) -> bytes:
+    def _make_payload(self, payload, pa_level=None) -> bytearray:
         """Assemble the entire packet to be transmitted as a payload."""
-        if self.len_available(payload) < 0:
+        available = self.len_available(payload)
+        if available < 0:
             raise ValueError(
-                "Payload length exceeds maximum buffer size by "
-                + f"{abs(self.len_available(payload))} bytes"
+                f"Payload length exceeds maximum buffer size by {-available} bytes"
             )
         name_length = (len(self.name) + 2) if self.name is not None else 0
         pl_size = 9 + len(payload) + name_length + self._show_dbm * 3
-        buf = bytes([0x42, pl_size]) + self.mac
+        buf = bytearray([0x42, pl_size])
+        buf += self.mac
         buf += chunk(b"\x05", 1)
-        pa_level = b""
         if self._show_dbm:
-            lvl = self._radio.pa_level
+            lvl = self._radio.pa_level if pa_level is None else pa_level
             # assume this radio is an actual nRF24L01 (& not a clone)
             nordic_lvl = 0  # default to RF24_PA_MAX
             if lvl == RF24_PA_HIGH:
@@ -545,8 +655,7 @@ class FakeBLE:
                 nordic_lvl = -12
             elif lvl == RF24_PA_MIN:
                 nordic_lvl = -18
-            pa_level = chunk(struct.pack(">b", nordic_lvl), 0x0A)
-        buf += pa_level
+            buf += chunk(struct.pack(">b", nordic_lvl), 0x0A)
         if name_length:
             buf += chunk(self.name, 0x08)
         buf += payload
@@ -556,6 +665,22 @@ class FakeBLE:
         buf += crc24_ble(buf)
         return buf
 
+    def _make_frame(self, payload: bytes, index: Optional[int] = None) -> bytes:
+        """Get the on-air frame (whitened & bit-reversed) of a payload for the channel
+        at ``index`` of `BLE_FREQ` (the current channel if `None`), from the cache if
+        possible."""
+        index = self._curr_freq if index is None else index
+        pa_level = self._radio.pa_level if self._show_dbm else None
+        key = (payload, index, pa_level)
+        frame = self._frames.get(key)
+        if frame is None:
+            packet = self._make_payload(payload, pa_level)
+            frame = bytes(reverse_bits(whitener(packet, (index + 37) | 0x40)))
+            if len(self._frames) >= _FRAME_CACHE_SIZE:
+                del self._frames[next(iter(self._frames))]  # the oldest frame
+            self._frames[key] = frame
+        return frame
+
     def len_available(self, hypothetical=b"") -> int:
         """This function will calculates how much length (in bytes) is
         available in the next payload.
@@ -622,19 +747,59 @@ class FakeBLE:
             # let `ble` be the instantiated object of the FakeBLE class
             ble.advertise(buffers)
             ble.hop_channel()
+
+        .. note:: The on-air frame (including its CRC and whitening) of the last few
+            advertised payloads is cached for each channel. So, repeatedly advertising the
+            same data (even while hopping channels) only costs the transmission. Changing
+            `mac`, `name` or `show_pa_level` clears the cache.
         """
+        self._radio.write(self._make_frame(self._join_payload(buf, data_type)))
+
+    def advertise_all_channels(
+        self, buf: Union[bytes, bytearray] = b"", data_type: int = 0xFF
+    ) -> List[int]:
+        """Broadcast a payload on all 3 BLE channels in quick succession.
+
+        BLE scanners listen on one channel at a time, so this is more likely to be
+        received than an `advertise()` call. The frames are sent in the order that
+        `hop_channel()` visits the channels (starting with the current channel). Each
+        frame is uploaded with :py:meth:`~pyrf24.rf24.RF24.write_fast()` and sent with
+        :py:meth:`~pyrf24.rf24.RF24.tx_standby()`, so the only gap between frames is
+        the time it takes to change the channel and upload the next (cached) frame.
+
+        :param bytearray,bytes,list,tuple buf: The payload to transmit (like the ``buf``
+            parameter of `advertise()`).
+        :param int data_type: Describes the data in ``buf`` (like the ``data_type``
+            parameter of `advertise()`).
+
+        :Returns: A `list` of the 2 intervals (in nanoseconds) between the completion of
+            consecutive frames (see :py:attr:`~pyrf24.rf24.RF24.tx_timestamp`).
+
+        .. note:: Like `advertise()`, this requires the radio to be in TX mode
+            (:py:attr:`~pyrf24.rf24.RF24.listen` is `False`). Afterward, the current
+            channel is the last channel that was used.
+        """
+        payload = self._join_payload(buf, data_type)
+        order = [(self._curr_freq + i) % 3 for i in range(3)]
+        frames = [self._make_frame(payload, index) for index in order]
+        completed = []
+        for index, frame in zip(order, frames):
+            if index != self._curr_freq:
+                self._radio.channel = BLE_FREQ[index]
+                self._curr_freq = index
+            self._radio.write_fast(frame)
+            self._radio.tx_standby()
+            completed.append(self._radio.tx_timestamp)
+        return [later - earlier for earlier, later in zip(completed, completed[1:])]
+
+    @staticmethod
+    def _join_payload(buf, data_type: int) -> bytes:
+        """Pack the ``buf`` given to `advertise()` into the advertised payload."""
         if not isinstance(buf, (bytearray, bytes, list, tuple)):
             raise ValueError("buffer is an invalid format")
-        payload = b""
         if isinstance(buf, (list, tuple)):
-            for byte in buf:
-                payload += byte
-        else:
-            payload = chunk(buf, data_type) if buf else b""
-        payload = self.whiten(self._make_payload(payload))
-        # print("original: 0x{}".format(address_repr(payload)))
-        # print("reversed: 0x{}".format(address_repr(reverse_bits(payload))))
-        self._radio.write(reverse_bits(payload))
+            return b"".join(buf)
+        return bytes(chunk(buf, data_type)) if buf else b""
 
     def print_pretty_details(self):
         self._radio.print_pretty_details()
@@ -668,9 +833,21 @@ class FakeBLE:
             ):
                 # print("recv'd:", self.rx_cache)
                 # print("crc:", self.rx_cache[end: end + 3])
-                self.rx_queue.append(QueueElement(self.rx_cache))
+                self._enqueue(QueueElement(self.rx_cache))
+            else:
+                self._counters["invalid"] += 1
         return bool(self.rx_queue)
 
+    def _enqueue(self, element: QueueElement):
+        """Append a received payload to the `rx_queue` (according to the overflow policy)."""
+        self._counters["received"] += 1
+        if self._max_queued and len(self.rx_queue) >= self._max_queued:
+            self._counters["dropped"] += 1
+            if self._overflow == "drop_newest":
+                return
+            self.rx_queue.popleft()
+        self.rx_queue.append(element)
+
     def read(self) -> Optional[QueueElement]:
         """Get the First Out element from the queue.
 
@@ -680,9 +857,7 @@ class FakeBLE:
               (like a FIFO buffer).
         """
         if self.rx_queue:
-            ret_val = self.rx_queue[0]
-            del self.rx_queue[0]
-            return ret_val
+            return self.rx_queue.popleft()
         return None
 
 
@@ -0,0 +1,396 @@
+"""This module provides automatic link adaptation for the `RF24` class.
+
+A `LinkAdapter` wraps the transmitting radio's `~LinkAdapter.write()` calls. It keeps a
+sliding window of the outcomes (success and the number of automatic retransmissions). When
+a window is full, it takes at most one step:
+
+- If the link is degraded (too many failures or retransmissions), the link is made more
+  robust. First the retry count and delay are raised, then the PA level, and lastly the
+  data rate is lowered.
+- If the link is clean (no failures and few retransmissions), the steps are undone in
+  reverse order. First the data rate is raised, then the PA level is lowered, and lastly
+  the retry count and delay are lowered.
+
+The retry settings and PA level only affect the transmitting radio. A data rate change must
+be made by both radios, so it is negotiated with the receiving radio's `LinkAdapter`. The
+receiving radio must pass its received payloads to `LinkAdapter.handle()` and call
+`LinkAdapter.poll()` regularly. Both radios must have
+:py:attr:`~pyrf24.rf24.RF24.ack_payloads` enabled for data rates to be negotiated;
+otherwise the data rate is never changed. If the peer rejects a data rate (for example, a
+peer without a `LinkAdapter`), that data rate is not proposed again for a few windows, and
+the number of windows doubles with each consecutive rejection.
+
+.. code-block:: python
+
+    from pyrf24 import RF24, LinkAdapter
+
+    radio = RF24(22, 0)
+    radio.begin()
+    radio.dynamic_payloads = True
+    radio.ack_payloads = True
+    radio.open_tx_pipe(b"1Node")
+    adapter = LinkAdapter(radio, on_change=print)
+
+    while True:
+        adapter.write(b"Hello")
+
+The receiving radio:
+
+.. code-block:: python
+
+    adapter = LinkAdapter(radio)
+    radio.listen = True
+    while True:
+        adapter.poll()
+        has_payload, pipe = radio.available_pipe()
+        if has_payload:
+            payload = radio.read()
+            if not adapter.handle(pipe, payload):
+                print(f"received {payload} on pipe {pipe}")
+"""
+
+from collections import deque
+import time
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+from .rf24 import (  # pylint: disable=import-error
+    RF24,
+    RF24_1MBPS,
+    RF24_2MBPS,
+    RF24_250KBPS,
+    RF24_PA_MIN,
+    RF24_PA_LOW,
+    RF24_PA_HIGH,
+    RF24_PA_MAX,
+    rf24_pa_dbm_e,
+)
+
+#: The prefix of the payloads used to negotiate data rates. Application payloads must not
+#: start with these bytes.
+CONTROL_PREFIX = b"\xa5LNK"
+
+_PROPOSE = 1
+_COMMIT = 2
+_CONFIRM = 3
+_PING = 4
+
+#: The data rates (from fastest to slowest).
+_RATES = (RF24_2MBPS, RF24_1MBPS, RF24_250KBPS)
+#: The PA levels (from lowest to highest).
+_PA_LEVELS = (RF24_PA_MIN, RF24_PA_LOW, RF24_PA_HIGH, RF24_PA_MAX)
+#: The shortest retry delay (in steps of 250 microseconds) that fits an ACK payload at each
+#: data rate (in the order of `_RATES`).
+_MIN_DELAY = (1, 2, 6)
+#: The number of windows to wait before proposing a rejected data rate again (doubled with
+#: each consecutive rejection, up to `_MAX_BACKOFF`).
+_BACKOFF = 4
+_MAX_BACKOFF = 256
+
+
+def _index(values: tuple, value) -> int:
+    """Find an enum value (or its `int` equivalent) in a `tuple` of enum values."""
+    return [int(v) for v in values].index(int(value))
+
+
+class LinkAdapter:  # pylint: disable=too-many-instance-attributes
+    """Adapt a radio's retry settings, data rate and PA level to the link's quality.
+
+    :param RF24 radio: The `RF24` object to control. It should already be configured
+        (see :py:meth:`~pyrf24.rf24.RF24.begin()`). Its retry settings are overwritten
+        with ``min_retries``.
+    :param int window: The number of `write()` outcomes evaluated for each decision.
+    :param float degrade_ratio: The portion of failed writes in a window that makes the
+        link more robust.
+    :param float degrade_arc: The average number of retransmissions per successful write
+        that makes the link more robust.
+    :param float improve_arc: The average number of retransmissions per successful write
+        under which (with no failures) the link is made faster.
+    :param tuple min_retries: The least robust retry settings, as a ``(delay, count)``
+        `tuple` (see :py:meth:`~pyrf24.rf24.RF24.set_retries()`).
+    :param tuple max_retries: The most robust retry settings.
+    :param rf24_pa_dbm_e min_pa_level: The lowest PA level that may be used.
+    :param rf24_pa_dbm_e max_pa_level: The highest PA level that may be used.
+    :param int fallback_ms: The time (in milliseconds) that a receiving radio waits for a
+        payload after changing its data rate. If nothing is received, the previous data rate
+        is restored.
+    :param on_change: A function called with each event (see `events`) when it happens.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        radio: RF24,
+        window: int = 32,
+        *,
+        degrade_ratio: float = 0.1,
+        degrade_arc: float = 3.0,
+        improve_arc: float = 0.5,
+        min_retries: Tuple[int, int] = (1, 5),
+        max_retries: Tuple[int, int] = (5, 15),
+        min_pa_level: rf24_pa_dbm_e = RF24_PA_LOW,
+        max_pa_level: rf24_pa_dbm_e = RF24_PA_MAX,
+        fallback_ms: int = 1000,
+        on_change: Optional[Callable[[Tuple[float, str, int, int]], None]] = None,
+    ):
+        if window < 1:
+            raise ValueError("window must be greater than 0")
+        self._radio = radio
+        self._window: Deque[Tuple[bool, int]] = deque(maxlen=window)
+        self._degrade_ratio = degrade_ratio
+        self._degrade_arc = degrade_arc
+        self._improve_arc = improve_arc
+        self._min_retries = min_retries
+        self._max_retries = max_retries
+        self._min_pa = _index(_PA_LEVELS, min_pa_level)
+        self._max_pa = _index(_PA_LEVELS, max_pa_level)
+        self._fallback_ms = fallback_ms
+        self.on_change = on_change
+        #: A `collections.deque` of the last 64 decisions. Each decision is a `tuple` of
+        #: ``(time.monotonic(), kind, old, new)`` in which ``kind`` is ``"retries"`` (``old``
+        #: and ``new`` are ``delay << 4 | count``), ``"pa_level"``, ``"data_rate"`` or
+        #: ``"rate_rejected"`` (the peer did not accept the data rate ``new``).
+        self.events: Deque[Tuple[float, str, int, int]] = deque(maxlen=64)
+        self._counters: Dict[str, int] = {
+            "writes": 0,
+            "failures": 0,
+            "retransmits": 0,
+            "radio_failures": 0,
+            "retries_changes": 0,
+            "pa_level_changes": 0,
+            "data_rate_changes": 0,
+            "rate_rejections": 0,
+        }
+        self._retries = min_retries
+        radio.set_retries(*min_retries)
+        pa_level = _index(_PA_LEVELS, radio.pa_level)
+        self._pa = min(max(pa_level, self._min_pa), self._max_pa)
+        if self._pa != pa_level:
+            radio.pa_level = _PA_LEVELS[self._pa]
+        self._rate = _index(_RATES, radio.data_rate)
+        self._failure_detected = getattr(radio, "failure_detected", 0)
+        self._token = int(time.monotonic() * 1000) & 0xFF
+        # the state of a receiving radio
+        self._pending: Optional[Tuple[int, int]] = None  # (token, rate index)
+        self._previous_rate: Optional[int] = None
+        self._switched_at = 0.0
+        # rate index -> (the writes count before which it is not proposed again,
+        # the number of consecutive rejections)
+        self._backoff: Dict[int, Tuple[int, int]] = {}
+
+    @property
+    def radio(self) -> RF24:
+        """The `RF24` object that this adapter controls."""
+        return self._radio
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """A `dict` of the adapter's counters (a copy).
+
+        - ``"writes"``, ``"failures"`` and ``"retransmits"``: the outcomes of `write()`.
+        - ``"radio_failures"``: the increase of the radio's
+          :py:attr:`~pyrf24.rf24.RF24.failure_detected` (only if the package was built with
+          ``FAILURE_HANDLING``). Each counts as a failed write.
+        - ``"retries_changes"``, ``"pa_level_changes"`` and ``"data_rate_changes"``: the
+          decisions taken.
+        - ``"rate_rejections"``: the data rate changes that the peer did not accept.
+        """
+        return dict(self._counters)
+
+    @property
+    def retries(self) -> Tuple[int, int]:
+        """The current retry settings as a ``(delay, count)`` `tuple`."""
+        return self._retries
+
+    def write(self, buf: Union[bytes, bytearray, memoryview], multicast: bool = False):
+        """Transmit a payload and record its outcome.
+
+        :param bytes,bytearray,memoryview buf: The payload to transmit.
+        :param bool multicast: See :py:meth:`~pyrf24.rf24.RF24.write()`. Multicast
+            payloads are not acknowledged, so their outcomes are not recorded.
+
+        :Returns: The same as :py:meth:`~pyrf24.rf24.RF24.write()`.
+        """
+        result = self._radio.write(buf, multicast)
+        if not multicast:
+            self.record(result, self._radio.get_arc())
+        return result
+
+    def record(self, success: bool, arc: int):
+        """Record the outcome of a payload that was transmitted without `write()`.
+
+        :param bool success: Was the payload acknowledged?
+        :param int arc: The number of retransmissions (see
+            :py:meth:`~pyrf24.rf24.RF24.get_arc()`).
+        """
+        failure_detected = getattr(self._radio, "failure_detected", 0)
+        if failure_detected > self._failure_detected:
+            self._counters["radio_failures"] += (
+                failure_detected - self._failure_detected
+            )
+            success = False
+        self._failure_detected = failure_detected
+        self._counters["writes"] += 1
+        self._counters["failures"] += not success
+        self._counters["retransmits"] += arc
+        self._window.append((success, arc))
+        if len(self._window) == self._window.maxlen:
+            self._decide()
+
+    def _decide(self):
+        failures = sum(not success for success, _ in self._window)
+        acknowledged = len(self._window) - failures
+        arc = sum(arc for success, arc in self._window if success)
+        mean_arc = arc / acknowledged if acknowledged else float("inf")
+        if (
+            failures / len(self._window) > self._degrade_ratio
+            or mean_arc > self._degrade_arc
+        ):
+            changed = self._degrade()
+        elif not failures and mean_arc < self._improve_arc:
+            changed = self._improve()
+        else:
+            changed = False
+        if changed:
+            self._window.clear()  # evaluate the new settings with new outcomes
+
+    def _degrade(self) -> bool:
+        if self._retries != self._fit_retries(self._max_retries):
+            return self._set_retries(self._max_retries)
+        if self._pa < self._max_pa:
+            return self._set_pa_level(self._pa + 1)
+        return self._rate < len(_RATES) - 1 and self._negotiate(self._rate + 1)
+
+    def _improve(self) -> bool:
+        if self._rate > 0 and self._negotiate(self._rate - 1):
+            return True
+        if self._pa > self._min_pa:
+            return self._set_pa_level(self._pa - 1)
+        if self._retries != self._fit_retries(self._min_retries):
+            return self._set_retries(self._min_retries)
+        return False
+
+    def _event(self, kind: str, old: int, new: int):
+        event = (time.monotonic(), kind, old, new)
+        self.events.append(event)
+        if self.on_change is not None:
+            self.on_change(event)
+
+    def _fit_retries(self, retries: Tuple[int, int]) -> Tuple[int, int]:
+        """Lengthen the delay of some retry settings to fit the current data rate."""
+        return (max(retries[0], self._min_delay()), retries[1])
+
+    def _set_retries(self, retries: Tuple[int, int]) -> bool:
+        old, self._retries = self._retries, self._fit_retries(retries)
+        self._radio.set_retries(*self._retries)
+        self._counters["retries_changes"] += 1
+        self._event(
+            "retries", old[0] << 4 | old[1], self._retries[0] << 4 | self._retries[1]
+        )
+        return True
+
+    def _set_pa_level(self, index: int) -> bool:
+        old = self._pa
+        self._pa = index
+        self._radio.pa_level = _PA_LEVELS[index]
+        self._counters["pa_level_changes"] += 1
+        self._event("pa_level", int(_PA_LEVELS[old]), int(_PA_LEVELS[index]))
+        return True
+
+    def _min_delay(self) -> int:
+        return _MIN_DELAY[self._rate] if self._radio.ack_payloads else 0
+
+    def _control(self, command: int, rate: int) -> bytes:
+        return CONTROL_PREFIX + bytes([command, rate, self._token])
+
+    def _set_rate(self, index: int):
+        self._rate = index
+        self._radio.data_rate = _RATES[index]
+        if self._retries != self._fit_retries(self._retries):
+            self._retries = self._fit_retries(self._retries)
+            self._radio.set_retries(*self._retries)
+
+    def _negotiate(self, index: int) -> bool:
+        """Change the data rate of both radios. Returns True if the data rate changed."""
+        if not self._radio.ack_payloads or (
+            self._counters["writes"] < self._backoff.get(index, (0, 0))[0]
+        ):
+            return False
+        old, retries = self._rate, self._retries
+        self._token = (self._token + 1) & 0xFF
+        rate = int(_RATES[index])
+        confirmed = False
+        if self._radio.write(self._control(_PROPOSE, rate)):
+            # the ACK of the commit carries the peer's confirmation
+            if self._radio.write(self._control(_COMMIT, rate)):
+                confirm = self._control(_CONFIRM, rate)
+                while self._radio.available():  # other ACK payloads are discarded
+                    confirmed = self._radio.read() == confirm or confirmed
+            if not confirmed:
+                # the confirmation may have been lost after the peer switched
+                self._set_rate(index)
+                confirmed = self._radio.write(self._control(_PING, rate))
+        if confirmed:
+            self._set_rate(index)
+            self._backoff.pop(index, None)
+            self._counters["data_rate_changes"] += 1
+            self._event("data_rate", int(_RATES[old]), rate)
+            return True
+        self._set_rate(old)
+        if self._retries != retries:  # undo the delay that fit the rejected data rate
+            self._retries = retries
+            self._radio.set_retries(*retries)
+        rejections = self._backoff.get(index, (0, 0))[1] + 1
+        windows = min(_BACKOFF << (rejections - 1), _MAX_BACKOFF)
+        self._backoff[index] = (
+            self._counters["writes"] + windows * (self._window.maxlen or 1),
+            rejections,
+        )
+        self._window.clear()  # the outcomes of the next window decide again
+        self._counters["rate_rejections"] += 1
+        self._event("rate_rejected", int(_RATES[old]), rate)
+        return False
+
+    def handle(self, pipe: int, payload: Union[bytes, bytearray]) -> bool:
+        """Handle a payload received by the radio (used by the receiving radio).
+
+        :param int pipe: The pipe that received the payload (see
+            :py:meth:`~pyrf24.rf24.RF24.available_pipe()`).
+        :param bytes,bytearray payload: The payload.
+
+        :Returns: `True` if the payload was a control payload of a `LinkAdapter` (which
+            should not be processed by the application), otherwise `False`.
+        """
+        self._previous_rate = None  # the current data rate works
+        if len(payload) != len(CONTROL_PREFIX) + 3 or not payload.startswith(
+            CONTROL_PREFIX
+        ):
+            return False
+        command, rate, token = payload[len(CONTROL_PREFIX) :]
+        if rate not in [int(r) for r in _RATES]:
+            return True
+        index = _index(_RATES, rate)
+        if command == _PROPOSE:
+            self._radio.flush_tx()  # discard stale ACK payloads
+            confirm = CONTROL_PREFIX + bytes([_CONFIRM, rate, token])
+            self._radio.write_ack_payload(pipe, confirm)
+            self._pending = (token, index)
+        elif command == _COMMIT and self._pending == (token, index):
+            # the ACK (with the confirmation) was already sent
+            self._pending = None
+            self._previous_rate = self._rate
+            self._switched_at = time.monotonic()
+            self._set_rate(index)
+            self._counters["data_rate_changes"] += 1
+            self._event("data_rate", int(_RATES[self._previous_rate]), rate)
+        return True
+
+    def poll(self):
+        """Restore the previous data rate if nothing was received since it was changed
+        (used by the receiving radio)."""
+        if self._previous_rate is None:
+            return
+        if (time.monotonic() - self._switched_at) * 1000 < self._fallback_ms:
+            return
+        old = self._rate
+        self._set_rate(self._previous_rate)
+        self._previous_rate = None
+        self._counters["data_rate_changes"] += 1
+        self._event("data_rate", int(_RATES[old]), int(_RATES[self._rate]))
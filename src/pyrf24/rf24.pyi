@@ -1,10 +1,27 @@
 # pylint: skip-file
-from typing import Tuple, Union, overload, Optional
+from array import array
+import queue
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+    Optional,
+)
+from _typeshed import ReadableBuffer, WriteableBuffer
 
 class rf24_crclength_e:
     RF24_CRC_DISABLED: "rf24_crclength_e"
     RF24_CRC_8: "rf24_crclength_e"
     RF24_CRC_16: "rf24_crclength_e"
+    def __int__(self) -> int: ...
 
 RF24_CRC_DISABLED: rf24_crclength_e = rf24_crclength_e.RF24_CRC_DISABLED
 RF24_CRC_8: rf24_crclength_e = rf24_crclength_e.RF24_CRC_8
@@ -14,6 +31,7 @@ class rf24_datarate_e:
     RF24_1MBPS: rf24_datarate_e
     RF24_2MBPS: rf24_datarate_e
     RF24_250KBPS: rf24_datarate_e
+    def __int__(self) -> int: ...
 
 RF24_1MBPS: rf24_datarate_e = rf24_datarate_e.RF24_1MBPS
 RF24_2MBPS: rf24_datarate_e = rf24_datarate_e.RF24_2MBPS
@@ -24,12 +42,19 @@ class rf24_pa_dbm_e:
     RF24_PA_LOW: rf24_pa_dbm_e
     RF24_PA_HIGH: rf24_pa_dbm_e
     RF24_PA_MAX: rf24_pa_dbm_e
+    def __int__(self) -> int: ...
 
 RF24_PA_MIN: rf24_pa_dbm_e = rf24_pa_dbm_e.RF24_PA_MIN
 RF24_PA_LOW: rf24_pa_dbm_e = rf24_pa_dbm_e.RF24_PA_LOW
 RF24_PA_HIGH: rf24_pa_dbm_e = rf24_pa_dbm_e.RF24_PA_HIGH
 RF24_PA_MAX: rf24_pa_dbm_e = rf24_pa_dbm_e.RF24_PA_MAX
 
+RX_RECORD_SIZE: int = 48
+CONFIG_SNAPSHOT_SIZE: int = 34
+
+def sim_configure(loss: float = 0.0, latency_us: int = 0, seed: int = 0) -> None: ...
+def sim_noop(enable: bool) -> None: ...
+
 class RF24:
     @overload
     def __init__(
@@ -39,6 +64,8 @@ class RF24:
     def __init__(self, spi_speed: int = 10000000) -> None: ...
     def available(self) -> bool: ...
     def available_pipe(self) -> Tuple[bool, int]: ...
+    def attach_irq(self, pin: int, chip: str = "/dev/gpiochip0") -> None: ...
+    def detach_irq(self) -> None: ...
     @overload
     def begin(self) -> bool: ...
     @overload
@@ -54,9 +81,11 @@ class RF24:
     def enableAckPayload(self) -> None: ...
     def flush_rx(self) -> None: ...
     def flush_tx(self) -> None: ...
+    def apply_config(self, snapshot: ReadableBuffer) -> int: ...
     def get_arc(self) -> int: ...
     def getARC(self) -> int: ...
     def getChannel(self) -> int: ...
+    def get_config(self) -> bytes: ...
     def getCRCLength(self) -> rf24_crclength_e: ...
     def getDataRate(self) -> rf24_datarate_e: ...
     def get_dynamic_payload_size(self) -> int: ...
@@ -74,13 +103,13 @@ class RF24:
     ) -> Union[bool, int]: ...
     def mask_irq(self, tx_ok: bool, tx_fail: bool, rx_ready: bool) -> None: ...
     def maskIRQ(self, tx_ok: bool, tx_fail: bool, rx_ready: bool) -> None: ...
-    def open_tx_pipe(self, address: Union[bytes, bytearray, int]) -> None: ...
-    def openWritingPipe(self, address: Union[bytes, bytearray, int]) -> None: ...
+    def open_tx_pipe(self, address: Union[ReadableBuffer, int]) -> None: ...
+    def openWritingPipe(self, address: Union[ReadableBuffer, int]) -> None: ...
     def open_rx_pipe(
-        self, number: int, address: Union[bytes, bytearray, int]
+        self, number: int, address: Union[ReadableBuffer, int]
     ) -> None: ...
     def openReadingPipe(
-        self, number: int, address: Union[bytes, bytearray, int]
+        self, number: int, address: Union[ReadableBuffer, int]
     ) -> None: ...
     def powerUp(self) -> None: ...
     def powerDown(self) -> None: ...
@@ -88,11 +117,30 @@ class RF24:
     def printDetails(self) -> None: ...
     def print_pretty_details(self) -> None: ...
     def printPrettyDetails(self) -> None: ...
-    def read(self, length: int) -> bytearray: ...
+    def read(self, length: int = 0) -> bytearray: ...
+    def read_all(self, buf: WriteableBuffer) -> int: ...
+    def read_into(self, buf: WriteableBuffer) -> int: ...
     def reuse_tx(self) -> None: ...
+    def scan(
+        self,
+        channels: Iterable[int] = range(126),
+        dwell_us: int = 130,
+        sweeps: int = 1,
+        history: bool = False,
+    ) -> Union[array[int], Tuple[array[int], memoryview]]: ...
     def reUseTX(self) -> None: ...
     def rxFifoFull(self) -> bool: ...
     def setAddressWidth(self, width: int) -> None: ...
+    def set_ack_payload_source(
+        self,
+        pipe: int,
+        source: Union[
+            "queue.Queue[ReadableBuffer]",
+            Deque[ReadableBuffer],
+            Iterable[ReadableBuffer],
+            None,
+        ],
+    ) -> None: ...
     @overload
     def set_auto_ack(self, number: int, enable: bool) -> None: ...
     @overload
@@ -123,22 +171,30 @@ class RF24:
     def startConstCarrier(self, level: rf24_pa_dbm_e, channel: int) -> None: ...
     def start_fast_write(
         self,
-        buf: Union[bytearray, bytes],
+        buf: ReadableBuffer,
         multicast: bool = False,
         start_tx: bool = True,
     ) -> None: ...
     def startFastWrite(
         self,
-        buf: Union[bytearray, bytes],
+        buf: ReadableBuffer,
         multicast: bool = False,
         start_tx: bool = True,
     ) -> None: ...
-    def start_write(
-        self, buf: Union[bytearray, bytes], multicast: bool = False
-    ) -> bool: ...
-    def startWrite(
-        self, buf: Union[bytearray, bytes], multicast: bool = False
+    def start_write(self, buf: ReadableBuffer, multicast: bool = False) -> bool: ...
+    def startWrite(self, buf: ReadableBuffer, multicast: bool = False) -> bool: ...
+    def resync(self) -> None: ...
+    def send_stream(
+        self,
+        source: Union[ReadableBuffer, BinaryIO, Iterable[ReadableBuffer]],
+        timeout_ms: int = 1000,
     ) -> bool: ...
+    def recv_stream(
+        self, sink: Union[WriteableBuffer, BinaryIO], timeout_ms: int = 1000
+    ) -> Optional[int]: ...
+    def start_rx_worker(self, capacity: int = 256) -> RxWorker: ...
+    def start_multiceiver(self, capacity: int = 64) -> Multiceiver: ...
+    def stats(self, reset: bool = False) -> Dict[str, Any]: ...
     def stop_const_carrier(self) -> None: ...
     def stopConstCarrier(self) -> None: ...
     def testRPD(self) -> bool: ...
@@ -150,28 +206,49 @@ class RF24:
     def txStandBy(
         self, timeout: Optional[int] = None, start_tx: bool = True
     ) -> bool: ...
+    def wait_available(self, timeout_ms: int) -> bool: ...
+    def wait_for_irq(self, timeout_ms: int) -> Tuple[bool, bool, bool]: ...
     def what_happened(self) -> Tuple[bool, bool, bool]: ...
     def whatHappened(self) -> Tuple[bool, bool, bool]: ...
-    def write(self, buf: Union[bytearray, bytes], multicast: bool = False) -> bool: ...
-    def write_ack_payload(self, pipe: int, buf: Union[bytearray, bytes]) -> bool: ...
-    def writeAckPayload(self, pipe: int, buf: Union[bytearray, bytes]) -> bool: ...
-    def write_blocking(self, buf: Union[bytearray, bytes], timeout: int) -> bool: ...
-    def writeBlocking(self, buf: Union[bytearray, bytes], timeout: int) -> bool: ...
-    def write_fast(
-        self, buf: Union[bytearray, bytes], multicast: bool = False
-    ) -> bool: ...
-    def writeFast(
-        self, buf: Union[bytearray, bytes], multicast: bool = False
-    ) -> bool: ...
+    def write(self, buf: ReadableBuffer, multicast: bool = False) -> bool: ...
+    def write_ack_payload(self, pipe: int, buf: ReadableBuffer) -> bool: ...
+    def writeAckPayload(self, pipe: int, buf: ReadableBuffer) -> bool: ...
+    def write_blocking(self, buf: ReadableBuffer, timeout: int) -> bool: ...
+    def writeBlocking(self, buf: ReadableBuffer, timeout: int) -> bool: ...
+    def write_fast(self, buf: ReadableBuffer, multicast: bool = False) -> bool: ...
+    def writeFast(self, buf: ReadableBuffer, multicast: bool = False) -> bool: ...
+    @overload
+    def write_many(
+        self,
+        buffers: ReadableBuffer,
+        stride: int,
+        multicast: bool = False,
+        timeout_ms: int = 95,
+    ) -> bytearray: ...
+    @overload
+    def write_many(
+        self,
+        buffers: Sequence[ReadableBuffer],
+        multicast: bool = False,
+        timeout_ms: int = 95,
+    ) -> bytearray: ...
     @property
     def ack_payloads(self) -> bool: ...
     @ack_payloads.setter
     def ack_payloads(self, enable: bool) -> None: ...
     @property
+    def ack_payloads_sent(self) -> List[int]: ...
+    @property
+    def ack_payload_underruns(self) -> List[int]: ...
+    @property
     def address_width(self) -> int: ...
     @address_width.setter
     def address_width(self, length: int) -> None: ...
     @property
+    def irq_fd(self) -> int: ...
+    @irq_fd.setter
+    def irq_fd(self, fd: int) -> None: ...
+    @property
     def channel(self) -> int: ...
     @channel.setter
     def channel(self, value: int) -> None: ...
@@ -230,6 +307,94 @@ class RF24:
     @power.setter
     def power(self, is_on: bool) -> None: ...
     @property
+    def register_cache(self) -> bool: ...
+    @register_cache.setter
+    def register_cache(self, enable: bool) -> None: ...
+    @property
     def rpd(self) -> bool: ...
     @property
     def rx_fifo_full(self) -> bool: ...
+    @property
+    def rx_timestamp(self) -> int: ...
+    @property
+    def spi_reads_saved(self) -> int: ...
+    @property
+    def stats_enabled(self) -> bool: ...
+    @stats_enabled.setter
+    def stats_enabled(self, enable: bool) -> None: ...
+    @property
+    def tx_timestamp(self) -> int: ...
+
+class RxWorker:
+    def take(self, max_n: int = 0) -> bytearray: ...
+    def stop(self) -> None: ...
+    def __enter__(self) -> RxWorker: ...
+    def __exit__(self, *args) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def pending(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def running(self) -> bool: ...
+    @property
+    def received(self) -> int: ...
+    @property
+    def ring_overruns(self) -> int: ...
+    @property
+    def fifo_full(self) -> int: ...
+
+class Multiceiver:
+    def take(self, pipe: int, max_n: int = 0) -> bytearray: ...
+    def take_all(self, max_per_pipe: int = 0) -> bytearray: ...
+    def set_callback(
+        self, pipe: int, callback: Optional[Callable[[bytearray], Any]]
+    ) -> None: ...
+    def dispatch(self, max_per_pipe: int = 0) -> int: ...
+    def wait(self, timeout_ms: int) -> bool: ...
+    def stop(self) -> None: ...
+    def __enter__(self) -> Multiceiver: ...
+    def __exit__(self, *args) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def pending(self) -> List[int]: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def running(self) -> bool: ...
+    @property
+    def received(self) -> List[int]: ...
+    @property
+    def dropped(self) -> List[int]: ...
+    @property
+    def fifo_full(self) -> int: ...
+
+class RadioGroup:
+    def __init__(
+        self,
+        radios: Sequence[RF24],
+        capacity: int = 256,
+        tx_capacity: int = 64,
+        timeout_ms: int = 95,
+    ) -> None: ...
+    def send(self, buf: ReadableBuffer, radio: Optional[int] = None) -> int: ...
+    def send_many(
+        self, buffers: Sequence[ReadableBuffer], radio: Optional[int] = None
+    ) -> int: ...
+    def take(self, max_per_radio: int = 0) -> bytearray: ...
+    def wait(self, timeout_ms: int) -> bool: ...
+    def flush(self, timeout_ms: int) -> bool: ...
+    def stop(self) -> None: ...
+    def __enter__(self) -> RadioGroup: ...
+    def __exit__(self, *args) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def radios(self) -> List[RF24]: ...
+    @property
+    def pending(self) -> int: ...
+    @property
+    def tx_pending(self) -> int: ...
+    @property
+    def running(self) -> bool: ...
+    @property
+    def stats(self) -> List[Dict[str, int]]: ...
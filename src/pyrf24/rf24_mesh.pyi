@@ -1,5 +1,6 @@
 # pylint: skip-file
 from typing import Union, overload, List
+from _typeshed import ReadableBuffer
 from .rf24 import RF24, rf24_datarate_e
 from .rf24_network import RF24Network
 
@@ -55,12 +56,10 @@ class RF24Mesh:
     def update(self) -> int: ...
     @overload
     def write(
-        self, buf: Union[bytes, bytearray], message_type: int, to_node_id: int = 0
+        self, buf: ReadableBuffer, message_type: int, to_node_id: int = 0
     ) -> bool: ...
     @overload
-    def write(
-        self, to_node: int, buf: Union[bytes, bytearray], message_type: int
-    ) -> bool: ...
+    def write(self, to_node: int, buf: ReadableBuffer, message_type: int) -> bool: ...
     @property
     def mesh_address(self) -> int: ...
     @property
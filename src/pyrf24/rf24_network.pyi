@@ -1,5 +1,6 @@
 # pylint: skip-file
-from typing import Tuple, Union, List, overload, Optional
+from typing import Dict, Sequence, Tuple, Union, List, overload, Optional
+from _typeshed import ReadableBuffer, WriteableBuffer
 from .rf24 import RF24
 
 MAX_USER_DEFINED_HEADER_TYPE: int = 127
@@ -71,7 +72,7 @@ class RF24Network:
     def is_address_valid(self, address: int) -> bool: ...
     def is_valid_address(self, address: int) -> bool: ...
     def multicast(
-        self, header: RF24NetworkHeader, buf: Union[bytes, bytearray], level: int = 7
+        self, header: RF24NetworkHeader, buf: ReadableBuffer, level: int = 7
     ) -> bool: ...
     def multicastLevel(self, level: int) -> None: ...
     # @overload
@@ -85,12 +86,11 @@ class RF24Network:
     def read(
         self, maxlen: int = MAX_PAYLOAD_SIZE
     ) -> Tuple[RF24NetworkHeader, bytearray]: ...
+    def read_into(self, buf: WriteableBuffer) -> Tuple[RF24NetworkHeader, int]: ...
     def set_multicast_level(self, level: int) -> None: ...
     def update(self) -> int: ...
     def available(self) -> int: ...
-    def write(
-        self, header: RF24NetworkHeader, buf: Union[bytearray, bytes]
-    ) -> bool: ...
+    def write(self, header: RF24NetworkHeader, buf: ReadableBuffer) -> bool: ...
     @property
     def multicast_relay(self) -> bool: ...
     @multicast_relay.setter
@@ -134,6 +134,8 @@ class RF24Network:
     @routeTimeout.setter
     def routeTimeout(self, timeout: int) -> None: ...
     @property
+    def rx_timestamp(self) -> int: ...
+    @property
     def tx_timeout(self) -> int: ...
     @tx_timeout.setter
     def tx_timeout(self, timeout: int) -> int: ...
@@ -143,3 +145,36 @@ class RF24Network:
     def txTimeout(self, timeout: int) -> int: ...
     # @property
     # def external_queue(self) -> List[RF24NetworkFrame]: ...
+
+class NetworkGroup:
+    def __init__(
+        self,
+        networks: Sequence[RF24Network],
+        capacity: int = 64,
+        tx_capacity: int = 64,
+    ) -> None: ...
+    def send(
+        self,
+        header: RF24NetworkHeader,
+        buf: ReadableBuffer,
+        node: Optional[int] = None,
+    ) -> int: ...
+    def take(
+        self, max_per_node: int = 0
+    ) -> List[Tuple[int, RF24NetworkHeader, bytearray, int]]: ...
+    def wait(self, timeout_ms: int) -> bool: ...
+    def flush(self, timeout_ms: int) -> bool: ...
+    def stop(self) -> None: ...
+    def __enter__(self) -> NetworkGroup: ...
+    def __exit__(self, *args) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def networks(self) -> List[RF24Network]: ...
+    @property
+    def pending(self) -> int: ...
+    @property
+    def tx_pending(self) -> int: ...
+    @property
+    def running(self) -> bool: ...
+    @property
+    def stats(self) -> List[Dict[str, int]]: ...
@@ -0,0 +1,55 @@
+/**
+ * Architecture configuration for the simulated radio driver (``RF24_DRIVER=sim``).
+ *
+ * This mirrors the SPIDEV driver's configuration, but no hardware is used. Every `SPI` object
+ * talks to a `SimRadio` that lives in the process-wide `SimAir` (see air.h).
+ */
+#ifndef RF24_UTILITY_SIM_RF24_ARCH_CONFIG_H_
+#define RF24_UTILITY_SIM_RF24_ARCH_CONFIG_H_
+
+#define RF24_LINUX
+
+#include <stddef.h>
+#include "spi.h"
+#include "gpio.h"
+#include "compatibility.h"
+#include <stdint.h>
+#include <stdio.h>
+#include <time.h>
+#include <string.h>
+#include <sys/time.h>
+
+#define _BV(x) (1 << (x))
+#define _SPI   spi
+
+#ifdef SERIAL_DEBUG
+    #define IF_SERIAL_DEBUG(x) ({ x; })
+#else
+    #define IF_SERIAL_DEBUG(x)
+#endif
+
+typedef uint16_t prog_uint16_t;
+typedef uint16_t rf24_gpio_pin_t;
+#define RF24_PIN_INVALID 0xFFFF
+
+#define PSTR(x)  (x)
+#define printf_P printf
+#define strlen_P strlen
+#define PROGMEM
+#define pgm_read_word(p) (*(const unsigned short*)(p))
+#define PRIPSTR          "%s"
+#define pgm_read_byte(p) (*(const unsigned char*)(p))
+#define pgm_read_ptr(p)  (*(void* const*)(p))
+
+// Function, constant map as a result of migrating from Arduino
+#define LOW                      GPIO::OUTPUT_LOW
+#define HIGH                     GPIO::OUTPUT_HIGH
+#define INPUT                    GPIO::DIRECTION_IN
+#define OUTPUT                   GPIO::DIRECTION_OUT
+#define digitalWrite(pin, value) GPIO::write(pin, value)
+#define pinMode(pin, direction)  GPIO::open(pin, direction)
+#define delay(milisec)           __msleep(milisec)
+#define delayMicroseconds(usec)  __usleep(usec)
+#define millis()                 __millis()
+
+#endif // RF24_UTILITY_SIM_RF24_ARCH_CONFIG_H_
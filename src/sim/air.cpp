@@ -0,0 +1,537 @@
+#include <chrono>
+#include <string.h>
+#include "nRF24L01.h"
+#include "air.h"
+
+#ifndef _BV
+    #define _BV(x) (1 << (x))
+#endif
+
+/** The time (in microseconds) that the radio's PLL needs to settle before it can TX or RX. */
+#define SIM_SETTLING_US 130
+/** The number of payloads that each FIFO can hold. */
+#define SIM_FIFO_DEPTH 3
+
+/** The radio most recently attached (by `SimAir::attach()`) from this thread. */
+static thread_local SimRadio* last_attached = nullptr;
+
+/** The medium returned by `SimAir::instance()`. */
+static SimAir* shared_air = nullptr;
+
+/****************************************************************************/
+
+SimRadio::SimRadio(SimAir& _air)
+    : air(_air), flags(0), ce(false), rpd(false), reuse(false), tx_busy(false), pid(0), arc(0), plos(0), rx_ready_at(0)
+{
+    // reset values (as documented in the nRF24L01+ datasheet)
+    memset(registers, 0, sizeof(registers));
+    registers[NRF_CONFIG] = 0x08;
+    registers[EN_AA] = 0x3F;
+    registers[EN_RXADDR] = 0x03;
+    registers[SETUP_AW] = 0x03;
+    registers[SETUP_RETR] = 0x03;
+    registers[RF_CH] = 0x02;
+    registers[RF_SETUP] = 0x0E;
+    registers[RX_ADDR_P2] = 0xC3;
+    registers[RX_ADDR_P3] = 0xC4;
+    registers[RX_ADDR_P4] = 0xC5;
+    registers[RX_ADDR_P5] = 0xC6;
+    memset(rx_addr_p0, 0xE7, sizeof(rx_addr_p0));
+    memset(rx_addr_p1, 0xC2, sizeof(rx_addr_p1));
+    memset(tx_addr, 0xE7, sizeof(tx_addr));
+}
+
+/****************************************************************************/
+
+void SimRadio::transfer(const uint8_t* tx, uint8_t* rx, size_t len, uint64_t now)
+{
+    if (!len)
+        return;
+    const uint8_t command = tx[0];
+    // copy the data first, because rx may be the same buffer as tx
+    const std::vector<uint8_t> data(tx + 1, tx + len);
+    const size_t payload_len = data.size() < 32 ? data.size() : 32;
+    rx[0] = status();
+    memset(rx + 1, 0, len - 1);
+
+    if (command < W_REGISTER) {
+        for (size_t i = 1; i < len; ++i)
+            rx[i] = read_register(command & REGISTER_MASK, i - 1);
+    }
+    else if (command < W_REGISTER + 0x20) {
+        write_register(command & REGISTER_MASK, data.data(), data.size(), now);
+    }
+    else if (command == R_RX_PAYLOAD) {
+        if (!rx_fifo.empty()) {
+            const std::vector<uint8_t>& payload = rx_fifo.front().data;
+            memcpy(rx + 1, payload.data(), payload.size() < len - 1 ? payload.size() : len - 1);
+            rx_fifo.pop_front();
+        }
+    }
+    else if (command == R_RX_PL_WID) {
+        if (len > 1 && !rx_fifo.empty())
+            rx[1] = static_cast<uint8_t>(rx_fifo.front().data.size());
+    }
+    else if (command == W_TX_PAYLOAD || command == W_TX_PAYLOAD_NO_ACK) {
+        if (tx_fifo.size() < SIM_FIFO_DEPTH) {
+            bool no_ack = command == W_TX_PAYLOAD_NO_ACK && (registers[FEATURE] & _BV(EN_DYN_ACK));
+            tx_fifo.push_back({std::vector<uint8_t>(data.begin(), data.begin() + payload_len), 0xFF, no_ack});
+            reuse = false;
+        }
+    }
+    else if (command >= W_ACK_PAYLOAD && command <= W_ACK_PAYLOAD + 5) {
+        if (tx_fifo.size() < SIM_FIFO_DEPTH && (registers[FEATURE] & _BV(EN_ACK_PAY)))
+            tx_fifo.push_back({std::vector<uint8_t>(data.begin(), data.begin() + payload_len), static_cast<uint8_t>(command & 7), false});
+    }
+    else if (command == FLUSH_TX) {
+        tx_fifo.clear();
+        reuse = false;
+    }
+    else if (command == FLUSH_RX) {
+        rx_fifo.clear();
+    }
+    else if (command == REUSE_TX_PL) {
+        reuse = true;
+    }
+    // other commands (NOP, ACTIVATE, ...) only return the STATUS byte
+
+    start_tx(now);
+}
+
+/****************************************************************************/
+
+void SimRadio::set_ce(bool level, uint64_t now)
+{
+    bool was_rx = is_rx();
+    ce = level;
+    update_rx(was_rx, now);
+    start_tx(now);
+}
+
+/****************************************************************************/
+
+bool SimRadio::receive(const SimPacket& packet, uint64_t now, std::vector<uint8_t>& ack)
+{
+    if (!is_rx() || now < rx_ready_at || packet.channel != registers[RF_CH])
+        return false;
+    rpd = true; // any carrier on the channel is detected
+    if (packet.data_rate != data_rate() || packet.address_width != address_width() || packet.crc_length != crc_length())
+        return false;
+    uint8_t pipe = match_pipe(packet.address);
+    if (pipe > 5 || air.lost())
+        return false;
+    bool dynamic = (registers[FEATURE] & _BV(EN_DPL)) && (registers[DYNPD] & _BV(pipe));
+    if (dynamic != packet.dynamic || (!dynamic && packet.payload.size() != registers[RX_PW_P0 + pipe]))
+        return false; // the packet cannot be decoded (its CRC would not match)
+    if (rx_fifo.size() >= SIM_FIFO_DEPTH)
+        return false; // discarded and not acknowledged
+
+    bool auto_ack = !packet.no_ack && (registers[EN_AA] & _BV(pipe));
+    std::pair<uint8_t, std::vector<uint8_t>>& last = last_received[packet.sender];
+    bool duplicate = auto_ack && last.first == packet.pid && last.second == packet.payload;
+    last.first = packet.pid;
+    last.second = packet.payload;
+    if (!duplicate) {
+        rx_fifo.push_back({packet.payload, pipe, false});
+        flags |= _BV(RX_DR);
+    }
+    if (!auto_ack)
+        return false;
+
+    if (registers[FEATURE] & _BV(EN_ACK_PAY)) {
+        for (std::deque<SimPayload>::iterator it = tx_fifo.begin(); it != tx_fifo.end(); ++it) {
+            if (it->pipe == pipe) {
+                ack = it->data;
+                tx_fifo.erase(it);
+                flags |= _BV(TX_DS);
+                break;
+            }
+        }
+    }
+    return true;
+}
+
+/****************************************************************************/
+
+uint8_t SimRadio::status() const
+{
+    uint8_t pipe = rx_fifo.empty() ? 7 : rx_fifo.front().pipe;
+    return static_cast<uint8_t>(flags | (pipe << RX_P_NO) | (tx_fifo.size() >= SIM_FIFO_DEPTH ? _BV(TX_FULL) : 0));
+}
+
+/****************************************************************************/
+
+uint8_t SimRadio::read_register(uint8_t reg, size_t index) const
+{
+    switch (reg) {
+        case NRF_STATUS:
+            return status();
+        case OBSERVE_TX:
+            return static_cast<uint8_t>((plos << PLOS_CNT) | (arc & 0x0F));
+        case RPD:
+            return rpd;
+        case RX_ADDR_P0:
+            return index < 5 ? rx_addr_p0[index] : 0;
+        case RX_ADDR_P1:
+            return index < 5 ? rx_addr_p1[index] : 0;
+        case TX_ADDR:
+            return index < 5 ? tx_addr[index] : 0;
+        case FIFO_STATUS:
+            return static_cast<uint8_t>((reuse ? _BV(TX_REUSE) : 0)
+                                        | (tx_fifo.size() >= SIM_FIFO_DEPTH ? _BV(FIFO_FULL) : 0)
+                                        | (tx_fifo.empty() ? _BV(TX_EMPTY) : 0)
+                                        | (rx_fifo.size() >= SIM_FIFO_DEPTH ? _BV(RX_FULL) : 0)
+                                        | (rx_fifo.empty() ? _BV(RX_EMPTY) : 0));
+        default:
+            return index ? 0 : registers[reg];
+    }
+}
+
+/****************************************************************************/
+
+void SimRadio::write_register(uint8_t reg, const uint8_t* data, size_t len, uint64_t now)
+{
+    if (!len)
+        return;
+    bool was_rx = is_rx();
+    size_t addr_len = len < 5 ? len : 5;
+    switch (reg) {
+        case NRF_CONFIG:
+            registers[reg] = data[0] & 0x7F;
+            break;
+        case EN_AA:
+        case EN_RXADDR:
+        case DYNPD:
+            registers[reg] = data[0] & 0x3F;
+            break;
+        case SETUP_AW:
+            registers[reg] = data[0] & 0x03;
+            break;
+        case SETUP_RETR:
+            registers[reg] = data[0];
+            break;
+        case RF_CH:
+            registers[reg] = data[0] & 0x7F;
+            plos = 0;
+            break;
+        case RF_SETUP:
+            registers[reg] = data[0] & 0xBF;
+            break;
+        case NRF_STATUS:
+            flags = static_cast<uint8_t>(flags & ~(data[0] & (_BV(RX_DR) | _BV(TX_DS) | _BV(MAX_RT))));
+            break;
+        case RX_ADDR_P0:
+            memcpy(rx_addr_p0, data, addr_len);
+            break;
+        case RX_ADDR_P1:
+            memcpy(rx_addr_p1, data, addr_len);
+            break;
+        case TX_ADDR:
+            memcpy(tx_addr, data, addr_len);
+            break;
+        case RX_ADDR_P2:
+        case RX_ADDR_P3:
+        case RX_ADDR_P4:
+        case RX_ADDR_P5:
+            registers[reg] = data[0];
+            break;
+        case RX_PW_P0:
+        case RX_PW_P1:
+        case RX_PW_P2:
+        case RX_PW_P3:
+        case RX_PW_P4:
+        case RX_PW_P5:
+            registers[reg] = data[0] & 0x3F;
+            break;
+        case FEATURE:
+            registers[reg] = data[0] & 0x07;
+            break;
+        default:
+            break; // read-only or reserved
+    }
+    update_rx(was_rx, now);
+}
+
+/****************************************************************************/
+
+bool SimRadio::is_powered() const
+{
+    return registers[NRF_CONFIG] & _BV(PWR_UP);
+}
+
+bool SimRadio::is_rx() const
+{
+    return is_powered() && (registers[NRF_CONFIG] & _BV(PRIM_RX)) && ce;
+}
+
+bool SimRadio::is_tx() const
+{
+    return is_powered() && !(registers[NRF_CONFIG] & _BV(PRIM_RX)) && ce;
+}
+
+uint8_t SimRadio::address_width() const
+{
+    // 0 is an illegal setting, but RF24 uses it for 2 byte addresses
+    return static_cast<uint8_t>(registers[SETUP_AW] + 2);
+}
+
+uint8_t SimRadio::crc_length() const
+{
+    // the CRC is forced on if any pipe has auto-ack enabled
+    if (!(registers[NRF_CONFIG] & _BV(EN_CRC)) && !registers[EN_AA])
+        return 0;
+    return registers[NRF_CONFIG] & _BV(CRCO) ? 2 : 1;
+}
+
+uint8_t SimRadio::data_rate() const
+{
+    return registers[RF_SETUP] & (_BV(RF_DR_LOW) | _BV(RF_DR_HIGH));
+}
+
+uint32_t SimRadio::air_time(size_t payload_len) const
+{
+    // preamble, address, 9 bit packet control field, payload and CRC
+    uint32_t bits = static_cast<uint32_t>(8 * (1 + address_width() + payload_len + crc_length()) + 9);
+    if (data_rate() == _BV(RF_DR_LOW))
+        return bits * 4; // 250 kbps
+    if (data_rate() == _BV(RF_DR_HIGH))
+        return (bits + 1) / 2; // 2 Mbps
+    return bits;               // 1 Mbps
+}
+
+uint8_t SimRadio::match_pipe(const uint8_t* address) const
+{
+    uint8_t width = address_width();
+    for (uint8_t pipe = 0; pipe < 6; ++pipe) {
+        if (!(registers[EN_RXADDR] & _BV(pipe)))
+            continue;
+        if (pipe == 0) {
+            if (!memcmp(address, rx_addr_p0, width))
+                return pipe;
+        }
+        // pipes 2-5 share the upper bytes of pipe 1's address
+        else if (address[0] == (pipe == 1 ? rx_addr_p1[0] : registers[RX_ADDR_P0 + pipe]) && !memcmp(address + 1, rx_addr_p1 + 1, width - 1)) {
+            return pipe;
+        }
+    }
+    return 0xFF;
+}
+
+/****************************************************************************/
+
+void SimRadio::update_rx(bool was_rx, uint64_t now)
+{
+    if (!was_rx && is_rx()) {
+        rx_ready_at = now + SIM_SETTLING_US;
+        rpd = false;
+    }
+}
+
+/****************************************************************************/
+
+void SimRadio::start_tx(uint64_t now, bool settled)
+{
+    if (tx_busy || !is_tx() || tx_fifo.empty() || (flags & _BV(MAX_RT)))
+        return;
+    tx_busy = true;
+    arc = 0;
+    if (!reuse)
+        pid = (pid + 1) & 3;
+    air.schedule(settled ? now : now + SIM_SETTLING_US, [this](uint64_t at) { transmit(at); });
+}
+
+/****************************************************************************/
+
+void SimRadio::transmit(uint64_t now)
+{
+    // the payload may have been flushed; a payload in progress is finished even if CE is LOW
+    if (tx_fifo.empty()) {
+        tx_busy = false;
+        return;
+    }
+    const SimPayload& payload = tx_fifo.front();
+    SimPacket packet;
+    packet.sender = this;
+    packet.pid = pid;
+    packet.channel = registers[RF_CH];
+    packet.data_rate = data_rate();
+    packet.address_width = address_width();
+    packet.crc_length = crc_length();
+    memcpy(packet.address, tx_addr, sizeof(packet.address));
+    packet.dynamic = (registers[FEATURE] & _BV(EN_DPL)) && (registers[DYNPD] & _BV(DPL_P0));
+    packet.no_ack = payload.no_ack;
+    packet.payload = payload.data;
+    uint64_t arrival = now + air_time(payload.data.size()) + air.get_latency();
+    air.schedule(arrival, [this, packet](uint64_t at) { deliver(packet, at); });
+}
+
+/****************************************************************************/
+
+void SimRadio::deliver(const SimPacket& packet, uint64_t now)
+{
+    std::vector<uint8_t> ack;
+    bool acknowledged = air.broadcast(packet, now, ack);
+    bool expects_ack = !packet.no_ack && (registers[EN_AA] & _BV(ENAA_P0)) && !memcmp(rx_addr_p0, tx_addr, address_width());
+    if (!expects_ack) {
+        finish(std::vector<uint8_t>(), now);
+        return;
+    }
+    if (acknowledged && !air.lost()) {
+        uint64_t done = now + SIM_SETTLING_US + air_time(ack.size()) + air.get_latency();
+        air.schedule(done, [this, ack](uint64_t at) { finish(ack, at); });
+        return;
+    }
+    if (arc < (registers[SETUP_RETR] & 0x0F)) {
+        arc++;
+        uint64_t delay = ((registers[SETUP_RETR] >> ARD) + 1) * 250;
+        air.schedule(now + delay, [this](uint64_t at) { transmit(at); });
+        return;
+    }
+    // the payload stays in the TX FIFO, and nothing is sent until MAX_RT is cleared
+    flags |= _BV(MAX_RT);
+    if (plos < 15)
+        plos++;
+    tx_busy = false;
+}
+
+/****************************************************************************/
+
+void SimRadio::finish(const std::vector<uint8_t>& ack, uint64_t now)
+{
+    flags |= _BV(TX_DS);
+    if (!ack.empty() && rx_fifo.size() < SIM_FIFO_DEPTH) {
+        rx_fifo.push_back({ack, 0, false});
+        flags |= _BV(RX_DR);
+    }
+    if (!reuse && !tx_fifo.empty())
+        tx_fifo.pop_front();
+    tx_busy = false;
+    start_tx(now, true); // the next payload is sent without settling again
+}
+
+/****************************************************************************/
+
+SimAir::SimAir() : loss_rate(0.0), latency_us(0), random(0), noop(false)
+{
+}
+
+SimAir& SimAir::instance()
+{
+    if (!shared_air)
+        shared_air = new SimAir();
+    return *shared_air;
+}
+
+void SimAir::use(SimAir* air)
+{
+    shared_air = air;
+}
+
+/****************************************************************************/
+
+SimRadio* SimAir::attach(int bus)
+{
+    std::lock_guard<std::mutex> lock(mutex);
+    std::unique_ptr<SimRadio>& radio = radios[bus];
+    if (!radio)
+        radio.reset(new SimRadio(*this));
+    last_attached = radio.get();
+    return last_attached;
+}
+
+void SimAir::connect_pin(int pin)
+{
+    std::lock_guard<std::mutex> lock(mutex);
+    if (last_attached)
+        pins[pin] = last_attached;
+}
+
+void SimAir::transfer(SimRadio* radio, const uint8_t* tx, uint8_t* rx, size_t len)
+{
+    if (noop.load(std::memory_order_relaxed)) {
+        if (len) {
+            memset(rx, 0, len);
+            rx[0] = 0x0E;
+        }
+        return;
+    }
+    std::lock_guard<std::mutex> lock(mutex);
+    uint64_t current = now();
+    advance(current);
+    radio->transfer(tx, rx, len, current);
+}
+
+void SimAir::write_pin(int pin, int value)
+{
+    if (noop.load(std::memory_order_relaxed))
+        return;
+    std::lock_guard<std::mutex> lock(mutex);
+    std::map<int, SimRadio*>::iterator connected = pins.find(pin);
+    if (connected == pins.end())
+        return;
+    uint64_t current = now();
+    advance(current);
+    connected->second->set_ce(value != 0, current);
+}
+
+void SimAir::configure(double loss, uint32_t latency, uint32_t seed)
+{
+    std::lock_guard<std::mutex> lock(mutex);
+    loss_rate = loss;
+    latency_us = latency;
+    random.seed(seed);
+}
+
+void SimAir::set_noop(bool enable)
+{
+    noop.store(enable, std::memory_order_relaxed);
+}
+
+/****************************************************************************/
+
+void SimAir::schedule(uint64_t at, std::function<void(uint64_t)> event)
+{
+    events.emplace(at, std::move(event));
+}
+
+bool SimAir::broadcast(const SimPacket& packet, uint64_t now, std::vector<uint8_t>& ack)
+{
+    bool acknowledged = false;
+    for (std::map<int, std::unique_ptr<SimRadio>>::iterator it = radios.begin(); it != radios.end(); ++it) {
+        if (it->second.get() == packet.sender)
+            continue;
+        std::vector<uint8_t> payload;
+        // only the first acknowledgement is heard
+        if (it->second->receive(packet, now, payload) && !acknowledged) {
+            acknowledged = true;
+            ack = payload;
+        }
+    }
+    return acknowledged;
+}
+
+bool SimAir::lost()
+{
+    return loss_rate > 0 && std::uniform_real_distribution<double>(0.0, 1.0)(random) < loss_rate;
+}
+
+uint32_t SimAir::get_latency() const
+{
+    return latency_us;
+}
+
+uint64_t SimAir::now()
+{
+    return static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::steady_clock::now().time_since_epoch()).count());
+}
+
+void SimAir::advance(uint64_t now)
+{
+    while (!events.empty() && events.begin()->first <= now) {
+        std::multimap<uint64_t, std::function<void(uint64_t)>>::iterator next = events.begin();
+        uint64_t at = next->first;
+        std::function<void(uint64_t)> event = std::move(next->second);
+        events.erase(next);
+        event(at);
+    }
+}
@@ -0,0 +1,198 @@
+/**
+ * A software model of nRF24L01+ radios that share an in-process "air" medium.
+ *
+ * The model is event driven. Transmissions (and their acknowledgements) are scheduled at the
+ * times they would happen on real hardware, and the schedule is caught up to the current
+ * time before any radio is accessed (see `SimAir::advance()`). So, no background thread is
+ * needed, and timing only depends on how fast the simulated radios are driven.
+ */
+#ifndef RF24_UTILITY_SIM_AIR_H_
+#define RF24_UTILITY_SIM_AIR_H_
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <random>
+#include <vector>
+
+/** A payload in a FIFO of a `SimRadio`. */
+struct SimPayload
+{
+    std::vector<uint8_t> data;
+    /** The receiving pipe (RX FIFO), the pipe of an ACK payload (TX FIFO), or 0xFF. */
+    uint8_t pipe;
+    /** Was the payload uploaded with W_TX_PAYLOAD_NO_ACK? */
+    bool no_ack;
+};
+
+/** A packet transmitted on the air. */
+struct SimPacket
+{
+    /** Identifies the transmitter (used to detect retransmitted duplicates). */
+    const void* sender;
+    uint8_t pid;
+    uint8_t channel;
+    uint8_t data_rate;
+    uint8_t address_width;
+    uint8_t crc_length;
+    uint8_t address[5];
+    bool dynamic;
+    bool no_ack;
+    std::vector<uint8_t> payload;
+};
+
+class SimAir;
+
+/** The register file, FIFOs and Enhanced ShockBurst state machine of one simulated radio. */
+class SimRadio
+{
+public:
+    explicit SimRadio(SimAir& _air);
+
+    /** Handle a whole SPI transaction of ``len`` bytes. ``rx`` may be the same buffer as ``tx``. */
+    void transfer(const uint8_t* tx, uint8_t* rx, size_t len, uint64_t now);
+
+    /** Drive the CE pin. */
+    void set_ce(bool level, uint64_t now);
+
+    /**
+     * Hear a packet transmitted by another radio.
+     *
+     * Returns true if the packet is acknowledged. An ACK payload (if any) is written to ``ack``.
+     */
+    bool receive(const SimPacket& packet, uint64_t now, std::vector<uint8_t>& ack);
+
+private:
+    SimAir& air;
+    /** The single byte registers (indexed by address). */
+    uint8_t registers[0x20];
+    uint8_t rx_addr_p0[5];
+    uint8_t rx_addr_p1[5];
+    uint8_t tx_addr[5];
+    /** The RX_DR, TX_DS and MAX_RT flags. */
+    uint8_t flags;
+    bool ce;
+    bool rpd;
+    /** Is REUSE_TX_PL active? */
+    bool reuse;
+    /** Is a payload being transmitted (or waiting for its ACK)? */
+    bool tx_busy;
+    uint8_t pid;
+    /** The retransmissions of the current payload (OBSERVE_TX's ARC_CNT). */
+    uint8_t arc;
+    /** The number of payloads that reached the maximum retransmissions (OBSERVE_TX's PLOS_CNT). */
+    uint8_t plos;
+    /** When the RX settling time ends (after entering RX mode). */
+    uint64_t rx_ready_at;
+    std::deque<SimPayload> rx_fifo;
+    std::deque<SimPayload> tx_fifo;
+    /** The last PID & payload received from each transmitter. */
+    std::map<const void*, std::pair<uint8_t, std::vector<uint8_t>>> last_received;
+
+    uint8_t status() const;
+    uint8_t read_register(uint8_t reg, size_t index) const;
+    void write_register(uint8_t reg, const uint8_t* data, size_t len, uint64_t now);
+
+    bool is_powered() const;
+    bool is_rx() const;
+    bool is_tx() const;
+    uint8_t address_width() const;
+    uint8_t crc_length() const;
+    uint8_t data_rate() const;
+    uint32_t air_time(size_t payload_len) const;
+    uint8_t match_pipe(const uint8_t* address) const;
+
+    /** Start the RX settling time if RX mode was just entered. */
+    void update_rx(bool was_rx, uint64_t now);
+
+    /** Start transmitting the top of the TX FIFO, if possible. */
+    void start_tx(uint64_t now, bool settled = false);
+    void transmit(uint64_t now);
+    void deliver(const SimPacket& packet, uint64_t now);
+    void finish(const std::vector<uint8_t>& ack, uint64_t now);
+};
+
+/**
+ * The air medium shared by all simulated radios in the process.
+ *
+ * Radios are identified by their SPI bus number (the RF24 object's CSN pin). All methods that
+ * take a lock are safe to call from any thread.
+ */
+class SimAir
+{
+public:
+    /** The medium used by the simulated driver. */
+    static SimAir& instance();
+
+    /**
+     * Use another medium instead of `instance()`. This is needed when several copies of the
+     * driver are loaded (in different shared libraries) and must share one medium.
+     */
+    static void use(SimAir* air);
+
+    /** Get the radio connected to an SPI bus (created on first use). */
+    SimRadio* attach(int bus);
+
+    /** Connect a GPIO pin to the radio most recently attached from the calling thread. */
+    void connect_pin(int pin);
+
+    /** Handle a whole SPI transaction with a radio. */
+    void transfer(SimRadio* radio, const uint8_t* tx, uint8_t* rx, size_t len);
+
+    /** Drive a GPIO pin (the pin is ignored if it is not connected to a radio). */
+    void write_pin(int pin, int value);
+
+    /**
+     * Configure the medium.
+     *
+     * :param loss: The probability that any packet (or ACK) is lost, in range [0, 1].
+     * :param latency_us: An extra delay (in microseconds) added to every packet and ACK.
+     * :param seed: The seed of the pseudo-random generator that decides which packets are lost.
+     */
+    void configure(double loss, uint32_t latency_us, uint32_t seed);
+
+    /**
+     * Make every SPI transaction and GPIO write do nothing (for measuring the overhead of the
+     * code that drives the radios). Every SPI transaction reads an idle radio's STATUS byte
+     * (``0x0E``) followed by zeros.
+     */
+    void set_noop(bool enable);
+
+    /* The following methods must only be called while `mutex` is locked. */
+
+    void schedule(uint64_t at, std::function<void(uint64_t)> event);
+
+    /** Deliver a packet to all radios (except the sender). Returns true if it was acknowledged. */
+    bool broadcast(const SimPacket& packet, uint64_t now, std::vector<uint8_t>& ack);
+
+    /** Decide if a packet (or ACK) is lost. */
+    bool lost();
+
+    uint32_t get_latency() const;
+
+private:
+    SimAir();
+
+    std::mutex mutex;
+    std::map<int, std::unique_ptr<SimRadio>> radios;
+    std::map<int, SimRadio*> pins;
+    /** Pending events (ordered by time; events of the same time keep their order). */
+    std::multimap<uint64_t, std::function<void(uint64_t)>> events;
+    double loss_rate;
+    uint32_t latency_us;
+    std::mt19937 random;
+    std::atomic<bool> noop;
+
+    /** The current time (in microseconds). */
+    static uint64_t now();
+
+    /** Run all events that are due at ``now``. */
+    void advance(uint64_t now);
+};
+
+#endif // RF24_UTILITY_SIM_AIR_H_
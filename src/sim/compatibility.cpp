@@ -0,0 +1,28 @@
+#include <chrono>
+#include "compatibility.h"
+
+void __msleep(int milisec)
+{
+    __usleep(milisec * 1000);
+}
+
+void __usleep(int microsec)
+{
+    struct timespec req;
+    req.tv_sec = static_cast<time_t>(microsec / 1000000);
+    req.tv_nsec = static_cast<long>(microsec % 1000000) * 1000;
+    clock_nanosleep(CLOCK_MONOTONIC, 0, &req, NULL);
+}
+
+void __start_timer()
+{
+}
+
+auto start = std::chrono::steady_clock::now();
+
+uint32_t __millis()
+{
+    auto end = std::chrono::steady_clock::now();
+
+    return std::chrono::duration_cast<std::chrono::milliseconds>(end - start).count();
+}
@@ -0,0 +1,25 @@
+#ifndef RF24_UTILITY_SIM_COMPATIBLITY_H_
+#define RF24_UTILITY_SIM_COMPATIBLITY_H_
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <stdint.h> // for uintXX_t types
+#include <stddef.h>
+#include <time.h>
+#include <sys/time.h>
+
+void __msleep(int milisec);
+
+void __usleep(int microsec);
+
+void __start_timer();
+
+uint32_t __millis();
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // RF24_UTILITY_SIM_COMPATIBLITY_H_
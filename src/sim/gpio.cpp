@@ -0,0 +1,32 @@
+#include "air.h"
+#include "gpio.h"
+
+GPIO::GPIO()
+{
+}
+
+void GPIO::open(int port, int DDR)
+{
+    if (DDR == DIRECTION_OUT)
+        SimAir::instance().connect_pin(port);
+}
+
+void GPIO::close(int port)
+{
+    static_cast<void>(port); // ignore -Wunused-parameter
+}
+
+int GPIO::read(int port)
+{
+    static_cast<void>(port); // ignore -Wunused-parameter
+    return 0;
+}
+
+void GPIO::write(int port, int value)
+{
+    SimAir::instance().write_pin(port, value);
+}
+
+GPIO::~GPIO()
+{
+}
@@ -0,0 +1,44 @@
+#ifndef RF24_UTILITY_SIM_GPIO_H_
+#define RF24_UTILITY_SIM_GPIO_H_
+
+#include <stdexcept>
+
+/** Specific exception for GPIO errors */
+class GPIOException : public std::runtime_error
+{
+public:
+    explicit GPIOException(const std::string& msg)
+        : std::runtime_error(msg)
+    {
+    }
+};
+
+/**
+ * Simulated GPIO pins. The only pin that RF24 drives is the CE pin. An output pin is connected
+ * to the simulated radio that was most recently attached (by `SPI::begin()`) from the calling
+ * thread, because `RF24::begin()` configures its CE pin right after starting its SPI bus.
+ */
+class GPIO
+{
+public:
+    /* Constants */
+    static const int DIRECTION_OUT = 1;
+    static const int DIRECTION_IN = 0;
+
+    static const int OUTPUT_HIGH = 1;
+    static const int OUTPUT_LOW = 0;
+
+    GPIO();
+
+    static void open(int port, int DDR);
+
+    static void close(int port);
+
+    static int read(int port);
+
+    static void write(int port, int value);
+
+    virtual ~GPIO();
+};
+
+#endif // RF24_UTILITY_SIM_GPIO_H_
@@ -0,0 +1,8 @@
+#ifndef RF24_UTILITY_INCLUDES_H_
+#define RF24_UTILITY_INCLUDES_H_
+
+#define RF24_SIM
+
+#include "sim/RF24_arch_config.h"
+
+#endif // RF24_UTILITY_INCLUDES_H_
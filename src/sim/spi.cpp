@@ -0,0 +1,36 @@
+#include "air.h"
+#include "spi.h"
+
+SPI::SPI()
+    : radio(nullptr)
+{
+}
+
+void SPI::begin(int busNo, uint32_t spi_speed)
+{
+    static_cast<void>(spi_speed); // ignore -Wunused-parameter
+    radio = SimAir::instance().attach(busNo);
+}
+
+uint8_t SPI::transfer(uint8_t tx)
+{
+    uint8_t rx = 0;
+    transfernb(reinterpret_cast<char*>(&tx), reinterpret_cast<char*>(&rx), 1);
+    return rx;
+}
+
+void SPI::transfernb(char* tbuf, char* rbuf, uint32_t len)
+{
+    if (!radio)
+        throw SPIException("can't send spi message (SPI bus is not initialized)");
+    SimAir::instance().transfer(radio, reinterpret_cast<uint8_t*>(tbuf), reinterpret_cast<uint8_t*>(rbuf), len);
+}
+
+void SPI::transfern(char* buf, uint32_t len)
+{
+    transfernb(buf, buf, len);
+}
+
+SPI::~SPI()
+{
+}
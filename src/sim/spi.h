@@ -0,0 +1,47 @@
+#ifndef RF24_UTILITY_SIM_SPI_H_
+#define RF24_UTILITY_SIM_SPI_H_
+
+#include <inttypes.h>
+#include <stdexcept>
+
+class SimRadio;
+
+/** Specific exception for SPI errors */
+class SPIException : public std::runtime_error
+{
+public:
+    explicit SPIException(const std::string& msg)
+        : std::runtime_error(msg)
+    {
+    }
+};
+
+/**
+ * An SPI bus that is connected to a simulated radio.
+ *
+ * The ``busNo`` given to `begin()` (the RF24 object's CSN pin) identifies the simulated radio.
+ * RF24 objects using the same ``busNo`` talk to the same simulated radio.
+ */
+class SPI
+{
+public:
+    SPI();
+
+    void begin(int busNo, uint32_t spi_speed = 10000000);
+
+    /** Transfer a command byte (a whole transaction). Returns the radio's STATUS byte. */
+    uint8_t transfer(uint8_t tx);
+
+    /** Transfer a whole transaction (``len`` bytes). */
+    void transfernb(char* tbuf, char* rbuf, uint32_t len);
+
+    /** Transfer a whole transaction (``len`` bytes) in place. */
+    void transfern(char* buf, uint32_t len);
+
+    virtual ~SPI();
+
+private:
+    SimRadio* radio;
+};
+
+#endif // RF24_UTILITY_SIM_SPI_H_
@@ -0,0 +1,42 @@
+"""Tests of the native RX threads' ring buffers (these need the simulated radio driver)."""
+
+import threading
+import pytest
+from pyrf24 import rf24  # pylint: disable=no-name-in-module
+from pyrf24.rf24 import RF24, RX_RECORD_SIZE  # pylint: disable=import-error
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(rf24, "sim_configure"),
+    reason="needs the simulated radio driver (RF24_DRIVER=sim)",
+)
+
+
+def test_take_from_empty_ring_while_receiving():
+    """Taking from an empty ring must not move records that arrive meanwhile."""
+    tx_radio, rx_radio = RF24(22, 0), RF24(24, 10)
+    for radio in (tx_radio, rx_radio):
+        assert radio.begin()
+    tx_radio.open_tx_pipe(b"1Node")
+    rx_radio.open_rx_pipe(1, b"1Node")
+    rx_radio.listen = True
+
+    done = threading.Event()
+
+    def transmit():
+        for _ in range(100):
+            tx_radio.write_many([bytes([i]) * 32 for i in range(32)])
+        done.set()
+
+    taken = 0
+    with rx_radio.start_rx_worker(capacity=4) as worker:
+        producer = threading.Thread(target=transmit)
+        producer.start()
+        while not done.is_set():
+            records = worker.take()
+            assert len(records) % RX_RECORD_SIZE == 0
+            taken += len(records) // RX_RECORD_SIZE
+        producer.join()
+        worker.stop()
+        taken += len(worker.take()) // RX_RECORD_SIZE
+        assert worker.received > 0
+        assert taken == worker.received